@@ -31,6 +31,7 @@
 #include "ssd1306.h"
 #include "ssd1306_fonts.h"
 #include "ws2812.h"
+#include "oled_stream.h"
 // #include "ssd1306_bmp.h"
 // #include "chiikawa.h"
 // #include "test.h"
@@ -123,6 +124,10 @@ int main(void)
   // ssd1306_DrawBitmap(0, 0, demo, 128, 64, White);
   ssd1306_UpdateScreen();
   ws2812_update();
+#if OLED_STREAM_ENABLE
+  // Frames pushed by the image tool (串口推流) replace the screen content
+  oled_stream_init(&huart1);
+#endif
 
   /* USER CODE END 2 */
 
@@ -137,6 +142,10 @@ int main(void)
     //   HAL_Delay(FRAME_DELAY);
     // }
     
+#if OLED_STREAM_ENABLE
+    oled_stream_poll();
+#endif
+
     y = triangle_wave(t, T, A);
     t += Ts;
 
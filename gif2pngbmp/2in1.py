@@ -3,18 +3,58 @@
 
 import tkinter as tk
 from tkinter import filedialog, ttk, messagebox, simpledialog
-from PIL import Image, ImageTk, ImageSequence
-import numpy as np
+import tkinter.font as tkfont
 import os
+import functools
 import glob
-import re
+import json
+import sys
 import threading
 import time
-from datetime import datetime
 
-def natural_sort_key(s):
-    """用于自然排序的键函数，确保文件按照人类直觉的顺序排序（如1, 2, 10而不是1, 10, 2）"""
-    return [int(text) if text.isdigit() else text.lower() for text in re.split(r'(\d+)', s)]
+import oled_defaults
+import oled_timing
+from lazy_import import LazyModule, warm_up
+
+# numpy/PIL 和依赖它们的模块在第一次使用时导入，窗口显示后在后台预热
+np = LazyModule("numpy")
+Image = LazyModule("PIL.Image")
+ImageTk = LazyModule("PIL.ImageTk")
+ImageSequence = LazyModule("PIL.ImageSequence")
+oled_core = LazyModule("oled_core")
+oled_budget = LazyModule("oled_budget")
+oled_export = LazyModule("oled_export")
+oled_import = LazyModule("oled_import")
+oled_profiles = LazyModule("oled_profiles")
+oled_grey = LazyModule("oled_grey")
+oled_watch = LazyModule("oled_watch")
+oled_emulator = LazyModule("oled_emulator")
+oled_stream = LazyModule("oled_stream")
+oled_store = LazyModule("oled_store")
+oled_video = LazyModule("oled_video")
+oled_sprite = LazyModule("oled_sprite")
+font_gen = LazyModule("font_gen")
+ws2812_gen = LazyModule("ws2812_gen")
+
+# 预热顺序: 预览和导出最先用到的在前
+WARM_UP_MODULES = (np, Image, ImageTk, oled_core, oled_budget, oled_export, oled_emulator, ImageSequence,
+                   oled_import, oled_watch, oled_profiles, oled_store, oled_video, oled_stream, oled_grey,
+                   oled_sprite, font_gen, ws2812_gen)
+
+def timed_job(name, title):
+    """工作线程方法的装饰器: 整个方法作为一个计时任务，结束后显示各阶段耗时并写出 JSON"""
+    def decorate(method):
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            timer = None
+            try:
+                with oled_timing.job(name, title, self.cprofile_var.get()) as timer:
+                    return method(self, *args, **kwargs)
+            finally:
+                if timer is not None:
+                    self.report_timing(timer)
+        return wrapper
+    return decorate
 
 class EditableLabel(ttk.Frame):
     """可编辑的标签组件，双击可编辑"""
@@ -76,6 +116,88 @@ class EditableLabel(ttk.Frame):
         self.entry.pack_forget()
         self.label.pack(fill=tk.BOTH, expand=True)
 
+class VirtualCodeView:
+    """虚拟化的代码预览: tk.Text 中只放可见的行和前后各 margin 行
+    
+    source 需要提供 len() (总行数) 和 lines(start, stop) (例如 oled_core.CArrayText)。
+    纵向滚动条按全文行数换算; 滚动到已放入的行的边缘附近时重新取一段行。
+    """
+    def __init__(self, text, scrollbar, margin=200):
+        self.text = text
+        self.scrollbar = scrollbar
+        self.margin = margin
+        self.source = None
+        self.start = 0
+        self.stop = 0
+        self.pending = False
+        text.config(yscrollcommand=self.on_text_scroll)
+        scrollbar.config(command=self.yview)
+    
+    def total(self):
+        return len(self.source) if self.source is not None else 0
+    
+    def visible_lines(self):
+        """文本框能显示的行数"""
+        linespace = tkfont.Font(font=self.text.cget("font")).metrics("linespace")
+        return max(int(self.text.cget("height")), self.text.winfo_height() // max(linespace, 1))
+    
+    def top_line(self):
+        """当前显示在最上面的是全文的第几行"""
+        first = float(self.text.yview()[0])
+        return self.start + int(round(first * max(self.stop - self.start, 1)))
+    
+    def set_source(self, source, keep_position=True):
+        """换成新的文本 (切换帧、拖动阈值时保持滚动位置)"""
+        top = self.top_line() if keep_position and self.source is not None else 0
+        self.source = source
+        self.render(top)
+    
+    def clear(self):
+        self.source = None
+        self.start = self.stop = 0
+        self.text.delete(1.0, tk.END)
+        self.scrollbar.set(0, 1)
+    
+    def render(self, top):
+        """把 top 行附近的一段行放进文本框，并让 top 行显示在最上面"""
+        self.pending = False
+        total = self.total()
+        top = min(max(0, top), max(total - self.visible_lines(), 0))
+        self.start = max(0, top - self.margin)
+        self.stop = min(total, top + self.visible_lines() + self.margin)
+        self.text.delete(1.0, tk.END)
+        self.text.insert(tk.END, "\n".join(self.source.lines(self.start, self.stop)) if total else "")
+        self.text.yview(f"{top - self.start + 1}.0")
+    
+    def on_text_scroll(self, first, last):
+        """文本框滚动时换算成全文位置更新滚动条，接近边缘时重新取行"""
+        total = self.total()
+        if not total:
+            self.scrollbar.set(first, last)
+            return
+        count = self.stop - self.start
+        top = self.start + float(first) * count
+        bottom = self.start + float(last) * count
+        self.scrollbar.set(top / total, bottom / total)
+        near_start = self.start > 0 and top - self.start < self.margin / 2
+        near_end = self.stop < total and self.stop - bottom < self.margin / 2
+        if (near_start or near_end) and not self.pending:
+            self.pending = True
+            self.text.after_idle(lambda: self.render(int(round(top))))
+    
+    def yview(self, *args):
+        """纵向滚动条的命令 (moveto / scroll)"""
+        total = self.total()
+        if not total:
+            self.text.yview(*args)
+            return
+        if args[0] == "moveto":
+            top = int(float(args[1]) * total)
+        else:
+            step = self.visible_lines() if args[2] == "pages" else 1
+            top = self.top_line() + int(args[1]) * step
+        self.render(top)
+
 class EnhancedImageConverterApp:
     def __init__(self, root):
         self.root = root
@@ -95,11 +217,17 @@ class EnhancedImageConverterApp:
         self.processing_thread = None
         self.animation_thread = None
         self.animation_running = False
+        self._frame_cache = None
+        self.emulator = None
+        self.spi_clock_mhz = oled_defaults.DEFAULT_SPI_HZ / 1e6
+        self.stream_port = "COM3" if os.name == "nt" else "/dev/ttyUSB0"
+        self.stream_baud = oled_defaults.DEFAULT_BAUD
+        self.stream_stop = None
+        self.watch_stop = None
+        self.cprofile_var = tk.BooleanVar(value=False)
+        # 临时目录在提取GIF帧时才创建
         self.temp_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "temp")
         
-        # 确保临时目录存在
-        os.makedirs(self.temp_dir, exist_ok=True)
-        
         # 创建界面
         self.create_widgets()
         self.create_menu()
@@ -107,6 +235,49 @@ class EnhancedImageConverterApp:
         # 设置主题
         self.set_theme()
     
+    @property
+    def frame_cache(self):
+        """帧缓存 (第一次使用时创建，这时才导入 numpy/PIL)"""
+        if self._frame_cache is None:
+            self._frame_cache = oled_core.FrameCache()
+        return self._frame_cache
+    
+    def start_warm_up(self, on_ready=None):
+        """窗口显示后在后台导入 numpy/PIL 和取模模块，完成后在主线程调用 on_ready(耗时秒数)"""
+        self.status_var.set("正在加载 numpy/PIL...")
+        
+        def done(elapsed):
+            self.root.after(0, lambda: self.status_var.set("就绪"))
+            if on_ready:
+                self.root.after(0, lambda: on_ready(elapsed))
+        
+        def failed(e):
+            self.root.after(0, lambda: self.status_var.set(f"加载模块出错: {e}"))
+        
+        warm_up(WARM_UP_MODULES, done, failed)
+    
+    def timing_dir(self):
+        """各任务阶段耗时 JSON 和 cProfile 记录 (.prof) 的保存位置"""
+        return os.path.join(self.temp_dir, "timing")
+    
+    def report_timing(self, timer):
+        """在状态栏末尾追加任务各阶段耗时，并写出 JSON (勾选性能分析时还有 .prof)"""
+        summary = timer.summary()
+        try:
+            timer.dump(self.timing_dir())
+        except OSError as e:
+            summary += f" (计时记录写入失败: {e})"
+        self.root.after(0, lambda: self.status_var.set(f"{self.status_var.get()} | {summary}"))
+    
+    def open_timing_dir(self):
+        """显示计时记录文件夹的位置 (Windows 下直接打开)"""
+        directory = self.timing_dir()
+        os.makedirs(directory, exist_ok=True)
+        if hasattr(os, "startfile"):
+            os.startfile(directory)
+        else:
+            messagebox.showinfo("计时记录", f"计时记录保存在:\n{directory}")
+    
     def set_theme(self):
         """设置应用程序主题"""
         style = ttk.Style()
@@ -131,6 +302,10 @@ class EnhancedImageConverterApp:
         file_menu.add_command(label="选择图像文件", command=self.select_images)
         file_menu.add_command(label="选择文件夹", command=self.select_folder)
         file_menu.add_command(label="选择GIF文件", command=self.select_gif)
+        file_menu.add_command(label="选择视频 (Y4M/原始灰度)", command=self.select_video)
+        file_menu.add_command(label="导入C数组 (.h/.c)", command=self.import_c_arrays)
+        file_menu.add_command(label="打开帧存储 (.oledfrm)", command=self.open_frame_store)
+        file_menu.add_command(label="多目标导出 (导出配置)", command=self.show_export_profiles)
         file_menu.add_separator()
         file_menu.add_command(label="保存设置", command=self.save_settings)
         file_menu.add_command(label="加载设置", command=self.load_settings)
@@ -146,21 +321,42 @@ class EnhancedImageConverterApp:
         edit_menu.add_command(label="设置", command=self.show_settings)
         menubar.add_cascade(label="编辑", menu=edit_menu)
         
-        # 工具菜单
-        tools_menu = tk.Menu(menubar, tearoff=0)
-        tools_menu.add_command(label="批量调整图像大小", command=self.batch_resize)
-        tools_menu.add_command(label="批量转换为黑白", command=self.batch_convert_bw)
-        tools_menu.add_command(label="提取GIF帧", command=self.extract_gif_frames)
-        menubar.add_cascade(label="工具", menu=tools_menu)
+        # 工具菜单: 第一次展开时才填充
+        self.tools_menu = tk.Menu(menubar, tearoff=0, postcommand=self.build_tools_menu)
+        menubar.add_cascade(label="工具", menu=self.tools_menu)
         
         # 帮助菜单
         help_menu = tk.Menu(menubar, tearoff=0)
         help_menu.add_command(label="使用说明", command=self.show_help)
+        help_menu.add_separator()
+        help_menu.add_checkbutton(label="记录性能分析 (cProfile)", variable=self.cprofile_var)
+        help_menu.add_command(label="打开计时记录文件夹", command=self.open_timing_dir)
+        help_menu.add_separator()
         help_menu.add_command(label="关于", command=self.show_about)
         menubar.add_cascade(label="帮助", menu=help_menu)
         
         self.root.config(menu=menubar)
     
+    def build_tools_menu(self):
+        """填充工具菜单 (批量工具等不常用的菜单项在第一次展开时才创建)"""
+        tools_menu = self.tools_menu
+        if tools_menu.index(tk.END) is not None:
+            return
+        tools_menu.add_command(label="批量调整图像大小", command=self.batch_resize)
+        tools_menu.add_command(label="批量转换为黑白", command=self.batch_convert_bw)
+        tools_menu.add_command(label="提取GIF帧", command=self.extract_gif_frames)
+        tools_menu.add_command(label="生成帧存储 (长序列)", command=self.build_frame_store)
+        tools_menu.add_separator()
+        tools_menu.add_command(label="字体取模 (TTF/OTF)", command=self.generate_font)
+        tools_menu.add_command(label="中文字库子集 (扫描源文件)", command=self.generate_unicode_font)
+        tools_menu.add_command(label="LED灯带取模 (WS2812)", command=self.generate_led_frames)
+        tools_menu.add_command(label="灰度取模 (位平面)", command=self.generate_greyscale)
+        tools_menu.add_command(label="精灵取模 (透明遮罩)", command=self.generate_sprites)
+        tools_menu.add_separator()
+        tools_menu.add_command(label="帧率估算 (屏幕仿真)", command=self.estimate_frame_rate)
+        tools_menu.add_command(label="串口推流 (USART1)", command=self.toggle_streaming)
+        tools_menu.add_command(label="监视文件夹 (自动导出)", command=self.toggle_watch)
+    
     def create_widgets(self):
         """创建主界面控件"""
         # 创建主框架
@@ -259,6 +455,27 @@ class EnhancedImageConverterApp:
         threshold_slider.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
         ttk.Label(threshold_frame, textvariable=self.threshold_var, width=3).pack(side=tk.LEFT, padx=5)
         
+        # 阈值模式 (手动 / Otsu / 百分位 / 自适应)
+        threshold_mode_frame = ttk.Frame(settings_frame)
+        threshold_mode_frame.pack(fill=tk.X, pady=5)
+        
+        ttk.Label(threshold_mode_frame, text="阈值模式:").pack(side=tk.LEFT, padx=5)
+        self.threshold_mode_var = tk.StringVar(value="manual")
+        self.threshold_mode_combo = ttk.Combobox(threshold_mode_frame, state="readonly", width=14,
+                                                 values=[oled_defaults.THRESHOLD_MODE_NAMES[m] for m in oled_defaults.THRESHOLD_MODES])
+        self.threshold_mode_combo.current(0)
+        self.threshold_mode_combo.bind("<<ComboboxSelected>>", self.on_threshold_mode_change)
+        self.threshold_mode_combo.pack(side=tk.LEFT, padx=5)
+        
+        self.threshold_per_frame_var = tk.BooleanVar(value=True)
+        ttk.Checkbutton(threshold_mode_frame, text="逐帧计算", variable=self.threshold_per_frame_var,
+                        command=self.update_preview).pack(side=tk.LEFT, padx=5)
+        
+        ttk.Label(threshold_mode_frame, text="百分位:").pack(side=tk.LEFT, padx=5)
+        self.threshold_percent_var = tk.IntVar(value=50)
+        ttk.Spinbox(threshold_mode_frame, from_=1, to=99, textvariable=self.threshold_percent_var, width=4,
+                    command=self.update_preview).pack(side=tk.LEFT, padx=2)
+        
         # 图像处理选项
         options_frame = ttk.Frame(settings_frame)
         options_frame.pack(fill=tk.X, pady=5)
@@ -305,13 +522,39 @@ class EnhancedImageConverterApp:
         file_type_frame.pack(fill=tk.X, pady=5)
         
         self.header_var = tk.BooleanVar(value=False)
-        ttk.Checkbutton(file_type_frame, text="生成头文件 (.h)", 
+        ttk.Checkbutton(file_type_frame, text="生成头文件+源文件 (.h/.c)", 
                          variable=self.header_var).pack(side=tk.LEFT, padx=5)
         
         self.array_var = tk.BooleanVar(value=True)
         ttk.Checkbutton(file_type_frame, text="生成指针数组", 
                          variable=self.array_var).pack(side=tk.LEFT, padx=5)
         
+        self.blob_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(file_type_frame, text="连续存放 (偏移表)", 
+                         variable=self.blob_var).pack(side=tk.LEFT, padx=5)
+        
+        # 帧编码和 Flash/RAM 预算 (容量来自链接脚本)
+        budget_frame = ttk.Frame(output_frame)
+        budget_frame.pack(fill=tk.X, pady=5)
+        
+        ttk.Label(budget_frame, text="帧编码:").pack(side=tk.LEFT, padx=5)
+        self.encoding_var = tk.StringVar(value="auto")
+        self.encoding_modes = ("auto",) + oled_defaults.ENCODINGS
+        self.encoding_combo = ttk.Combobox(budget_frame, state="readonly", width=8,
+                                           values=[oled_defaults.ENCODING_NAMES[e] for e in self.encoding_modes])
+        self.encoding_combo.current(0)
+        self.encoding_combo.bind("<<ComboboxSelected>>",
+                                 lambda e: self.encoding_var.set(self.encoding_modes[self.encoding_combo.current()]))
+        self.encoding_combo.pack(side=tk.LEFT, padx=5)
+        
+        ttk.Label(budget_frame, text="代码预留(KB):").pack(side=tk.LEFT, padx=5)
+        self.flash_reserve_var = tk.IntVar(value=oled_defaults.DEFAULT_FLASH_RESERVE_KB)
+        ttk.Spinbox(budget_frame, from_=0, to=1024, textvariable=self.flash_reserve_var, width=4).pack(side=tk.LEFT, padx=2)
+        
+        ttk.Label(budget_frame, text="RAM预留(KB):").pack(side=tk.LEFT, padx=5)
+        self.ram_reserve_var = tk.IntVar(value=oled_defaults.DEFAULT_RAM_RESERVE_KB)
+        ttk.Spinbox(budget_frame, from_=0, to=512, textvariable=self.ram_reserve_var, width=4).pack(side=tk.LEFT, padx=2)
+        
         # 转换按钮
         convert_frame = ttk.Frame(parent)
         convert_frame.pack(fill=tk.X, pady=10)
@@ -338,6 +581,11 @@ class EnhancedImageConverterApp:
         ttk.Checkbutton(nav_frame, text="动画预览", variable=self.animation_var, 
                         command=self.toggle_animation).pack(side=tk.LEFT, padx=20)
         
+        # 按驱动字节流仿真屏幕显示
+        self.emulate_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(nav_frame, text="屏幕仿真", variable=self.emulate_var,
+                        command=self.update_preview).pack(side=tk.LEFT, padx=5)
+        
         # 速度控制
         speed_frame = ttk.Frame(nav_frame)
         speed_frame.pack(side=tk.LEFT, padx=5)
@@ -370,6 +618,17 @@ class EnhancedImageConverterApp:
         self.image_info_var = tk.StringVar(value="")
         ttk.Label(preview_frame, textvariable=self.image_info_var).pack(anchor=tk.W, pady=5)
         
+        # 灰度直方图与位密度统计
+        stats_frame = ttk.Frame(preview_frame)
+        stats_frame.pack(fill=tk.X, pady=5)
+        
+        self.histogram_canvas = tk.Canvas(stats_frame, bg="white", width=256, height=64,
+                                          highlightthickness=1, highlightbackground="gray")
+        self.histogram_canvas.pack(side=tk.LEFT, padx=5)
+        
+        self.frame_stats_var = tk.StringVar(value="")
+        ttk.Label(stats_frame, textvariable=self.frame_stats_var, justify=tk.LEFT).pack(side=tk.LEFT, anchor=tk.NW, padx=10)
+        
         # 代码预览区域
         code_frame = ttk.LabelFrame(parent, text="代码预览", padding="5")
         code_frame.pack(fill=tk.BOTH, expand=True)
@@ -382,13 +641,58 @@ class EnhancedImageConverterApp:
         self.code_preview.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         
         # 添加滚动条
-        code_scrolly = ttk.Scrollbar(code_text_frame, orient="vertical", command=self.code_preview.yview)
+        code_scrolly = ttk.Scrollbar(code_text_frame, orient="vertical")
         code_scrolly.pack(side=tk.RIGHT, fill=tk.Y)
-        self.code_preview.config(yscrollcommand=code_scrolly.set)
         
         code_scrollx = ttk.Scrollbar(code_frame, orient="horizontal", command=self.code_preview.xview)
         code_scrollx.pack(side=tk.BOTTOM, fill=tk.X)
         self.code_preview.config(xscrollcommand=code_scrollx.set)
+        
+        # 大图的数组有上万行，文本框中只放可见的部分，纵向滚动条按全文换算
+        self.code_view = VirtualCodeView(self.code_preview, code_scrolly)
+        self.code_text = None
+        
+        code_button_frame = ttk.Frame(code_frame)
+        code_button_frame.pack(side=tk.BOTTOM, fill=tk.X, before=code_scrollx)
+        ttk.Button(code_button_frame, text="复制全部", command=self.copy_code).pack(side=tk.LEFT, padx=2)
+        ttk.Button(code_button_frame, text="保存代码", command=self.save_code).pack(side=tk.LEFT, padx=2)
+    
+    def on_threshold_mode_change(self, event=None):
+        """阈值模式切换"""
+        self.threshold_mode_var.set(oled_core.THRESHOLD_MODES[self.threshold_mode_combo.current()])
+        self.update_preview()
+    
+    def get_target_size(self):
+        """返回当前目标尺寸 (不调整大小时为 None, None)"""
+        if self.resize_var.get():
+            return self.width_var.get(), self.height_var.get()
+        return None, None
+    
+    def compute_thresholds(self, indices=None):
+        """按当前阈值设置计算指定帧的阈值 (直方图来自帧缓存)
+        
+        全局模式需要所有帧的直方图，已缓存的帧不会重复解码。
+        返回 {索引: 阈值或阈值图}
+        """
+        mode = self.threshold_mode_var.get()
+        per_frame = self.threshold_per_frame_var.get()
+        target_width, target_height = self.get_target_size()
+        
+        if indices is None:
+            indices = range(len(self.image_files))
+        indices = list(indices)
+        
+        # 手动/逐帧模式只需要目标帧，全局模式需要全部帧
+        needed = indices if (per_frame or mode in ("manual", "adaptive")) else range(len(self.image_files))
+        needed = list(needed)
+        frames = [self.frame_cache.get(self.image_files[i], target_width, target_height) for i in needed]
+        
+        values = oled_core.frame_thresholds(
+            frames, mode, self.threshold_var.get(), self.threshold_percent_var.get(),
+            per_frame, adaptive_offset=self.threshold_var.get() - 128
+        )
+        by_index = dict(zip(needed, values))
+        return {i: by_index[i] for i in indices}
     
     def select_images(self):
         """选择多个图像文件"""
@@ -419,7 +723,7 @@ class EnhancedImageConverterApp:
                 new_files.extend(glob.glob(os.path.join(folder_path, f"*{ext.upper()}")))
             
             # 按自然顺序排序
-            new_files.sort(key=natural_sort_key)
+            new_files.sort(key=oled_core.natural_sort_key)
             
             # 添加到列表中
             added_count = 0
@@ -467,52 +771,55 @@ class EnhancedImageConverterApp:
             daemon=True
         ).start()
     
+    def select_video(self):
+        """打开 Y4M 或原始灰度帧视频，每帧的亮度平面按需从内存映射读取，加入文件列表"""
+        video_path = filedialog.askopenfilename(
+            title="选择视频文件",
+            filetypes=[("视频 (Y4M/原始灰度)", "*.y4m;*.gray;*.raw;*.y"), ("所有文件", "*.*")]
+        )
+        if not video_path:
+            return
+        
+        width = height = None
+        if not video_path.lower().endswith(oled_video.Y4M_EXTENSIONS):
+            target_width, target_height = self.get_target_size()
+            size = simpledialog.askstring("原始灰度帧", "帧尺寸 (宽x高):",
+                                          initialvalue=f"{target_width or 128}x{target_height or 64}")
+            if not size:
+                return
+            try:
+                width, height = (int(v) for v in size.lower().split("x"))
+            except ValueError:
+                messagebox.showerror("错误", f"尺寸格式应为 宽x高: {size}")
+                return
+        
+        try:
+            reader = oled_video.open_video(video_path, width, height)
+        except (OSError, ValueError) as e:
+            messagebox.showerror("错误", f"打开视频时出错: {e}")
+            return
+        if not len(reader):
+            messagebox.showwarning("警告", "视频中没有完整的帧")
+            return
+        
+        names = [oled_store.store_frame_name(video_path, i) for i in range(len(reader))]
+        self.frame_cache.add_store(reader, names)
+        self.image_files.extend(names)
+        if reader.frame_delay:
+            self.speed_var.set(max(10, min(1000, int(round(reader.frame_delay)))))
+        self.update_file_list()
+        self.status_var.set(f"已打开 {reader.describe()}")
+    
+    @timed_job("gif", "提取GIF帧")
     def process_gif_thread(self, gif_path, output_dir, resize=True, convert_bw=False, threshold=128):
         """在单独的线程中处理GIF文件"""
         try:
-            # 打开GIF文件
-            with Image.open(gif_path) as gif:
-                frame_count = 0
-                frames = []
-                
-                # 获取GIF的持续时间
-                duration = gif.info.get('duration', 100)
-                
-                # 遍历每一帧
-                while True:
-                    try:
-                        # 复制当前帧
-                        frame = gif.copy()
-                        
-                        # 调整图像大小
-                        if resize:
-                            frame = frame.resize((128, 64), Image.LANCZOS)
-                        
-                        # 转换为黑白模式
-                        if convert_bw:
-                            frame = frame.convert("L")
-                            frame = frame.point(lambda x: 255 if x > threshold else 0, '1')
-                        
-                        # 保存帧
-                        frame_path = os.path.join(output_dir, f"frame_{frame_count:03d}.png")
-                        frame.save(frame_path, "PNG")
-                        frames.append(frame_path)
-                        
-                        # 更新进度
-                        self.root.after(0, lambda p=(frame_count+1)/gif.n_frames*100: self.progress_var.set(p))
-                        self.root.after(0, lambda msg=f"处理GIF帧 {frame_count+1}/{gif.n_frames}": 
-                                       self.status_var.set(msg))
-                        
-                        frame_count += 1
-                        gif.seek(frame_count)
-                        
-                    except EOFError:
-                        break
+            def progress(count, total):
+                self.root.after(0, lambda p=count/total*100: self.progress_var.set(p))
+                self.root.after(0, lambda msg=f"处理GIF帧 {count}/{total}": self.status_var.set(msg))
             
-            # 保存帧信息
-            with open(os.path.join(output_dir, "frame_info.txt"), 'w') as f:
-                f.write(f"总帧数: {frame_count}\n")
-                f.write(f"每帧持续时间: {duration}ms\n")
+            frames, duration = oled_core.extract_gif_frames(
+                gif_path, output_dir, resize, convert_bw, threshold, progress)
             
             # 设置默认动画速度为GIF的帧速率
             if duration > 0:
@@ -529,6 +836,62 @@ class EnhancedImageConverterApp:
             self.root.after(0, self.enable_controls)
             self.root.after(0, lambda: self.progress_var.set(0))
     
+    def import_c_arrays(self):
+        """导入已生成的C数组文件，还原的帧作为内存帧序列加入文件列表"""
+        file_paths = filedialog.askopenfilenames(
+            title="导入C数组",
+            filetypes=[("C文件", "*.h;*.c"), ("所有文件", "*.*")]
+        )
+        
+        if not file_paths:
+            return
+        
+        # 按当前取模方式解析字节
+        mode = self.mode_var.get()
+        added = 0
+        try:
+            for c_path in file_paths:
+                for frame in oled_import.parse_c_file(c_path, mode):
+                    name = oled_import.frame_path(c_path, frame)
+                    self.frame_cache.add_memory_frame(name, frame.bits.astype(np.uint8) * 255,
+                                                      "C数组", frame.data.size)
+                    self.image_files.append(name)
+                    added += 1
+        except Exception as e:
+            messagebox.showerror("错误", f"导入C数组时出错: {e}")
+            return
+        
+        if not added:
+            messagebox.showwarning("警告", "没有找到可导入的位图数组")
+            return
+        
+        self.update_file_list()
+        self.status_var.set(f"已从 {len(file_paths)} 个文件导入 {added} 帧")
+    
+    def open_frame_store(self):
+        """打开帧存储，其中的帧按需从内存映射读取，加入文件列表"""
+        path = filedialog.askopenfilename(
+            title="打开帧存储",
+            filetypes=[("帧存储", "*.oledfrm;*.oledgray"), ("所有文件", "*.*")]
+        )
+        if not path:
+            return
+        
+        try:
+            store = oled_store.FrameStore.open(path)
+        except (OSError, ValueError) as e:
+            messagebox.showerror("错误", f"打开帧存储时出错: {e}")
+            return
+        if not len(store):
+            messagebox.showwarning("警告", "帧存储中没有帧")
+            return
+        
+        names = [oled_store.store_frame_name(path, i) for i in range(len(store))]
+        self.frame_cache.add_store(store, names)
+        self.image_files.extend(names)
+        self.update_file_list()
+        self.status_var.set(f"已打开 {store.describe()}")
+    
     def add_gif_frames(self, frames):
         """添加GIF帧到文件列表"""
         added_count = 0
@@ -610,11 +973,15 @@ class EnhancedImageConverterApp:
         """清空所有文件"""
         if messagebox.askyesno("确认", "确定要清空所有文件吗?"):
             self.image_files = []
+            self.frame_cache.clear()
             self.update_file_list()
-            self.code_preview.delete(1.0, tk.END)
+            self.code_text = None
+            self.code_view.clear()
             self.preview_canvas.delete("all")
             self.preview_label.config(text="预览 0/0")
             self.image_info_var.set("")
+            self.frame_stats_var.set("")
+            self.histogram_canvas.delete("all")
     
     def reverse_files(self):
         """反转文件顺序"""
@@ -687,67 +1054,283 @@ class EnhancedImageConverterApp:
         if not self.image_files:
             self.preview_label.config(text="预览 0/0")
             self.image_info_var.set("")
+            self.frame_stats_var.set("")
+            self.histogram_canvas.delete("all")
             return
         
         self.preview_label.config(text=f"预览 {self.current_preview_index + 1}/{len(self.image_files)}")
         
         try:
-            # 加载当前选择的图像
-            image_path = self.image_files[self.current_preview_index]
-            img = Image.open(image_path)
-            
-            # 显示图像信息
-            width, height = img.size
-            file_size = os.path.getsize(image_path) / 1024  # KB
-            self.image_info_var.set(f"文件: {os.path.basename(image_path)} | 尺寸: {width}x{height} | 格式: {img.format} | 大小: {file_size:.1f} KB")
-            
-            # 调整大小
-            if self.resize_var.get():
-                target_width = self.width_var.get()
-                target_height = self.height_var.get()
-                img = img.resize((target_width, target_height), Image.LANCZOS)
-            
-            # 转换为灰度图
-            if img.mode != 'L':
-                img = img.convert('L')
+            # 预览也按阶段计时，耗时显示在帧统计下方 (不写 JSON，拖动阈值时不会产生大量记录)
+            with oled_timing.job("preview", "预览") as timer:
+                # 加载当前选择的图像 (解码结果和直方图来自帧缓存)
+                index = self.current_preview_index
+                image_path = self.image_files[index]
+                target_width, target_height = self.get_target_size()
+                frame = self.frame_cache.get(image_path, target_width, target_height)
+                
+                # 按当前模式计算阈值
+                threshold = self.compute_thresholds([index])[index]
+                invert = self.invert_var.get()
+                
+                # 显示图像信息
+                width, height = frame.source_size
+                file_size = frame.file_size / 1024  # KB
+                threshold_text = oled_core.describe_threshold(self.threshold_mode_var.get(), threshold)
+                self.image_info_var.set(f"文件: {os.path.basename(image_path)} | 尺寸: {width}x{height} | 格式: {frame.source_format} | 大小: {file_size:.1f} KB | 阈值: {threshold_text}")
+                
+                # 二值化处理
+                binary_array = oled_core.binarize(frame.gray, threshold, invert)
+                
+                # 更新直方图和位密度统计
+                self.update_frame_stats(index, frame, threshold, binary_array)
+                
+                # 屏幕仿真: 显示 ssd1306_UpdateScreen 字节流回放后的面板内容
+                if self.emulate_var.get():
+                    binary_array = self.emulate_frame(binary_array)
+                
+                # 创建预览图像
+                preview_img = Image.fromarray(binary_array.astype(np.uint8) * 255)
+                
+                # 调整预览图像大小以适应画布
+                canvas_width = self.preview_canvas.winfo_width()
+                canvas_height = self.preview_canvas.winfo_height()
+                
+                if canvas_width > 1 and canvas_height > 1:
+                    scale = min(canvas_width / preview_img.width, canvas_height / preview_img.height)
+                    new_width = int(preview_img.width * scale)
+                    new_height = int(preview_img.height * scale)
+                    with oled_timing.span("resize"):
+                        preview_img = preview_img.resize((new_width, new_height), Image.NEAREST)
+                
+                # 显示预览图像
+                self.preview_photo = ImageTk.PhotoImage(preview_img)
+                self.preview_canvas.config(width=preview_img.width, height=preview_img.height)
+                self.preview_canvas.delete("all")
+                self.preview_canvas.create_image(0, 0, anchor=tk.NW, image=self.preview_photo)
+                
+                # 生成并显示代码预览
+                if not skip_code:
+                    self.generate_code_preview()
+            self.frame_stats_var.set(f"{self.frame_stats_var.get()}\n{timer.summary()}")
             
-            # 获取当前设置
-            threshold = self.threshold_var.get()
+        except Exception as e:
+            self.status_var.set(f"预览错误: {e}")
+    
+    def update_frame_stats(self, index, frame, threshold, binary_array):
+        """更新直方图、点亮像素比例以及与上一帧相比每页变化的字节数
+        
+        所有数据来自帧缓存，不会额外读取文件。
+        """
+        # 直方图和阈值标记 (自适应模式标记平均阈值)
+        hist_img = Image.fromarray(oled_core.render_histogram(frame.hist, 64))
+        self.histogram_photo = ImageTk.PhotoImage(hist_img)
+        self.histogram_canvas.delete("all")
+        self.histogram_canvas.create_image(0, 0, anchor=tk.NW, image=self.histogram_photo)
+        marker = int(round(float(np.mean(threshold))))
+        self.histogram_canvas.create_line(marker, 0, marker, 64, fill="red")
+        
+        # 点亮像素比例
+        lit = float(np.count_nonzero(binary_array)) / max(binary_array.size, 1) * 100
+        
+        # 与上一帧 (动画中循环的前一帧) 比较显存每页的变化字节数
+        pages = oled_core.pack_pages(binary_array)
+        if len(self.image_files) > 1:
+            prev_index = (index - 1) % len(self.image_files)
+            target_width, target_height = self.get_target_size()
+            prev_frame = self.frame_cache.get(self.image_files[prev_index], target_width, target_height)
+            prev_threshold = self.compute_thresholds([prev_index])[prev_index]
+            prev_pages = oled_core.pack_pages(
+                oled_core.binarize(prev_frame.gray, prev_threshold, self.invert_var.get()))
+            changes = oled_core.page_changes(prev_pages, pages)
+            changes_text = f"每页变化字节 (对比第 {prev_index + 1} 帧): {' '.join(str(c) for c in changes)}"
+            changes_text += f"\n合计 {int(changes.sum())}/{pages.size} 字节"
+        else:
+            changes_text = "每页变化字节: -"
+        
+        self.frame_stats_var.set(f"点亮像素: {lit:.1f}%\n{changes_text}")
+    
+    def get_emulator(self):
+        """返回屏幕仿真器 (按工程中的 ssd1306_conf.h 配置，首次使用时创建并执行初始化序列)"""
+        if self.emulator is None:
+            conf_path = oled_emulator.find_conf(os.path.dirname(os.path.abspath(__file__)))
+            conf = oled_emulator.parse_conf(conf_path) if conf_path else oled_emulator.DriverConfig()
+            self.emulator = oled_emulator.make_emulator(conf, clock_hz=self.spi_clock_mhz * 1e6)
+        return self.emulator
+    
+    def emulate_frame(self, binary_array):
+        """回放一帧的刷新字节流，返回面板显示的图像，并在统计中显示总线时间"""
+        emulator = self.get_emulator()
+        conf = emulator.conf
+        transactions = oled_emulator.update_screen_transactions(
+            oled_emulator.bitmap_to_buffer(binary_array, conf), conf)
+        bus_ms = emulator.replay(transactions) * 1000
+        image = emulator.render()
+        
+        mismatch = int(np.count_nonzero(image != oled_emulator.expected_image(binary_array, conf)))
+        text = f"总线: {bus_ms:.3f} ms/帧 ({conf.bus.upper()} {self.spi_clock_mhz:g} MHz), 最高 {1000 / bus_ms:.0f} fps"
+        if mismatch:
+            text += f"\n仿真显示有 {mismatch} 个像素与位图不同"
+        self.frame_stats_var.set(f"{self.frame_stats_var.get()}\n{text}")
+        return image
+    
+    def estimate_frame_rate(self):
+        """用屏幕仿真回放所有帧，估算总线时间和帧率"""
+        if not self.image_files:
+            messagebox.showwarning("警告", "没有选择图像文件")
+            return
+        
+        clock = simpledialog.askfloat("总线时钟", "SPI 时钟 (MHz):", minvalue=0.1, maxvalue=100,
+                                      initialvalue=self.spi_clock_mhz)
+        if clock is None:
+            return
+        if clock != self.spi_clock_mhz:
+            self.spi_clock_mhz = clock
+            self.emulator = None
+        
+        self.disable_controls()
+        self.status_var.set("正在仿真...")
+        threading.Thread(target=self.estimate_frame_rate_thread, daemon=True).start()
+    
+    def estimate_frame_rate_thread(self):
+        """在单独的线程中仿真所有帧"""
+        try:
+            target_width, target_height = self.get_target_size()
+            thresholds = self.compute_thresholds()
             invert = self.invert_var.get()
+            frames = []
+            for i, image_path in enumerate(self.image_files):
+                frame = self.frame_cache.get(image_path, target_width, target_height)
+                frames.append(oled_core.binarize(frame.gray, thresholds[i], invert))
+                self.root.after(0, lambda v=(i + 1) / len(self.image_files) * 100: self.progress_var.set(v))
             
-            # 二值化处理
-            img_array = np.array(img)
-            binary_array = np.where(img_array < threshold, 0, 255)
-            
-            # 如果需要反转颜色
-            if invert:
-                binary_array = 255 - binary_array
-            
-            # 创建预览图像
-            preview_img = Image.fromarray(binary_array.astype(np.uint8))
-            
-            # 调整预览图像大小以适应画布
-            canvas_width = self.preview_canvas.winfo_width()
-            canvas_height = self.preview_canvas.winfo_height()
+            conf = self.get_emulator().conf
+            controller = self.emulator.controller
+            result = oled_emulator.simulate_frames(frames, conf, controller, self.spi_clock_mhz * 1e6)
+            report = oled_emulator.format_report(result, conf, controller, self.spi_clock_mhz * 1e6,
+                                                 self.speed_var.get())
             
-            if canvas_width > 1 and canvas_height > 1:
-                scale = min(canvas_width / preview_img.width, canvas_height / preview_img.height)
-                new_width = int(preview_img.width * scale)
-                new_height = int(preview_img.height * scale)
-                preview_img = preview_img.resize((new_width, new_height), Image.NEAREST)
-            
-            # 显示预览图像
-            self.preview_photo = ImageTk.PhotoImage(preview_img)
-            self.preview_canvas.config(width=preview_img.width, height=preview_img.height)
-            self.preview_canvas.delete("all")
-            self.preview_canvas.create_image(0, 0, anchor=tk.NW, image=self.preview_photo)
+            self.root.after(0, lambda: self.status_var.set(report.splitlines()[2]))
+            self.root.after(0, lambda: messagebox.showinfo("帧率估算", report))
+        
+        except Exception as e:
+            self.root.after(0, lambda: self.status_var.set(f"仿真出错: {e}"))
+            self.root.after(0, lambda: messagebox.showerror("错误", f"仿真时出错: {e}"))
+        
+        finally:
+            self.root.after(0, self.enable_controls)
+    
+    def toggle_streaming(self):
+        """开始/停止把当前帧序列推送到开发板"""
+        if self.stream_stop is not None:
+            self.stream_stop.set()
+            return
+        if not self.image_files:
+            messagebox.showwarning("警告", "没有选择图像文件")
+            return
+        
+        port = simpledialog.askstring("串口推流", "串口 (如 COM3、/dev/ttyUSB0):", initialvalue=self.stream_port)
+        if not port:
+            return
+        baud = simpledialog.askinteger("串口推流", "推流波特率 (握手使用 115200):", minvalue=9600,
+                                       maxvalue=4500000, initialvalue=self.stream_baud)
+        if baud is None:
+            return
+        self.stream_port, self.stream_baud = port, baud
+        
+        self.stream_stop = threading.Event()
+        self.tools_menu.entryconfig("串口推流 (USART1)", label="停止推流")
+        self.status_var.set(f"正在连接 {port}...")
+        threading.Thread(target=self.stream_thread, args=(port, baud, self.stream_stop), daemon=True).start()
+    
+    def stream_thread(self, port, baud, stop):
+        """在单独的线程中循环推流，直到停止"""
+        sender = None
+        try:
+            # 帧按 SSD1306_Buffer 的布局 (每页一行，LSB在上) 发送
+            target_width, target_height = self.get_target_size()
+            thresholds = self.compute_thresholds()
+            invert = self.invert_var.get()
+            conf = self.get_emulator().conf
+            buffers = []
+            for i, image_path in enumerate(self.image_files):
+                frame = self.frame_cache.get(image_path, target_width, target_height)
+                bits = oled_core.binarize(frame.gray, thresholds[i], invert)
+                buffers.append(oled_emulator.bitmap_to_buffer(bits, conf).ravel())
             
-            # 生成并显示代码预览
-            if not skip_code:
-                self.generate_code_preview()
+            sender = oled_stream.connect(port, baud)
+            self.root.after(0, lambda: self.status_var.set(f"正在推流到 {port} ({baud} 波特)..."))
+            while not stop.is_set():
+                stats = sender.stream(buffers, self.speed_var.get(), stop)
+                self.root.after(0, lambda text=stats.summary(): self.status_var.set(f"推流中: {text}"))
             
+            self.root.after(0, lambda: self.status_var.set(f"推流已停止: {sender.stats.summary()}"))
+        
         except Exception as e:
-            self.status_var.set(f"预览错误: {e}")
+            self.root.after(0, lambda: self.status_var.set(f"推流出错: {e}"))
+            self.root.after(0, lambda: messagebox.showerror("错误", f"推流时出错: {e}"))
+        
+        finally:
+            if sender is not None:
+                sender.port.close()
+            self.stream_stop = None
+            self.root.after(0, lambda: self.tools_menu.entryconfig("停止推流", label="串口推流 (USART1)"))
+    
+    def toggle_watch(self):
+        """开始/停止监视文件夹: 图像或设置文件变化时自动增量导出"""
+        if self.watch_stop is not None:
+            self.watch_stop.set()
+            return
+        
+        folder = filedialog.askdirectory(title="选择要监视的图像文件夹")
+        if not folder:
+            return
+        
+        # 不选设置文件时使用当前界面的设置
+        settings_path = filedialog.askopenfilename(
+            title="选择要监视的设置文件 (取消则使用当前设置)",
+            filetypes=[("设置文件", "*.ini"), ("所有文件", "*.*")]
+        ) or None
+        
+        default_ext = ".h" if self.header_var.get() else ".c"
+        output_path = filedialog.asksaveasfilename(
+            title="保存输出文件",
+            defaultextension=default_ext,
+            filetypes=[("头文件", "*.h"), ("C文件", "*.c"), ("所有文件", "*.*")]
+        )
+        if not output_path:
+            return
+        
+        settings = None if settings_path else self.settings_dict()
+        self.watch_stop = threading.Event()
+        self.tools_menu.entryconfig("监视文件夹 (自动导出)", label="停止监视")
+        self.status_var.set(f"正在监视 {folder}...")
+        threading.Thread(target=self.watch_thread, args=(folder, settings_path, settings, output_path, self.watch_stop),
+                         daemon=True).start()
+    
+    def watch_thread(self, folder, settings_path, settings, output_path, stop):
+        """在单独的线程中监视文件夹，直到停止"""
+        def on_result(result, paths):
+            def show():
+                self.image_files = list(paths)
+                self.update_file_list()
+                self.status_var.set(f"监视 {os.path.basename(folder)}: {oled_watch.describe_result(result)}")
+            self.root.after(0, show)
+        
+        def on_error(e):
+            self.root.after(0, lambda: self.status_var.set(f"监视导出出错 (文件变化时重试): {e}"))
+        
+        try:
+            oled_watch.watch(folder, output_path, settings_path, on_result, on_error, stop, settings)
+            self.root.after(0, lambda: self.status_var.set("已停止监视"))
+        
+        except Exception as e:
+            self.root.after(0, lambda: self.status_var.set(f"监视出错: {e}"))
+            self.root.after(0, lambda: messagebox.showerror("错误", f"监视文件夹时出错: {e}"))
+        
+        finally:
+            self.watch_stop = None
+            self.root.after(0, lambda: self.tools_menu.entryconfig("停止监视", label="监视文件夹 (自动导出)"))
     
     def generate_code_preview(self):
         """生成并显示代码预览"""
@@ -762,99 +1345,75 @@ class EnhancedImageConverterApp:
             var_name = f"{prefix}_{self.current_preview_index:03d}"
             
             # 获取当前设置
-            threshold = self.threshold_var.get()
+            threshold = self.compute_thresholds([self.current_preview_index])[self.current_preview_index]
             invert = self.invert_var.get()
             mode = self.mode_var.get()
-            resize = self.resize_var.get()
-            target_width = self.width_var.get() if resize else None
-            target_height = self.height_var.get() if resize else None
-            
-            # 转换图像
-            c_array, width, height = self.image_to_bitmap(
-                image_path, var_name, threshold, invert, mode, 
-                target_width, target_height
-            )
-            
-            if c_array:
-                # 显示代码预览
-                self.code_preview.delete(1.0, tk.END)
-                self.code_preview.insert(tk.END, f"// 图像: {os.path.basename(image_path)}, 尺寸: {width}x{height} 像素\n")
-                self.code_preview.insert(tk.END, c_array)
+            target_width, target_height = self.get_target_size()
+            
+            # 转换图像 (只打包，文本在显示时按可见的行格式化)
+            bytes_array, width, height = self.image_to_bytes(
+                image_path, threshold, invert, mode, target_width, target_height)
+            
+            # 显示代码预览
+            self.code_text = oled_core.CArrayText(
+                var_name, bytes_array,
+                comments=[f"// 图像: {os.path.basename(image_path)}, 尺寸: {width}x{height} 像素"])
+            with oled_timing.span("format"):
+                self.code_view.set_source(self.code_text)
         
         except Exception as e:
             self.status_var.set(f"代码生成错误: {e}")
     
+    def copy_code(self):
+        """把当前帧的完整数组文本复制到剪贴板 (不经过文本框)"""
+        if self.code_text is None:
+            return
+        self.root.clipboard_clear()
+        for chunk in self.code_text.chunks():
+            self.root.clipboard_append(chunk)
+        self.status_var.set(f"已复制 {len(self.code_text)} 行代码到剪贴板")
+    
+    def save_code(self):
+        """把当前帧的完整数组文本分段写入文件"""
+        if self.code_text is None:
+            return
+        path = filedialog.asksaveasfilename(
+            title="保存代码",
+            defaultextension=".h",
+            filetypes=[("头文件", "*.h"), ("C文件", "*.c"), ("所有文件", "*.*")]
+        )
+        if not path:
+            return
+        try:
+            with open(path, "w", encoding="utf-8") as f:
+                for chunk in self.code_text.chunks():
+                    f.write(chunk)
+                f.write("\n")
+            self.status_var.set(f"代码已保存到 {path}")
+        except OSError as e:
+            messagebox.showerror("错误", f"保存代码时出错: {e}")
+    
+    def image_to_bytes(self, image_path, threshold, invert, mode="horizontal",
+                       target_width=None, target_height=None):
+        """将图像二值化并打包为字节数组，返回 (字节数组, 宽, 高)"""
+        # 从帧缓存获取灰度图 (已调整大小)
+        frame = self.frame_cache.get(image_path, target_width, target_height)
+        height, width = frame.gray.shape
+        
+        # 二值化并打包 (水平: 每字节8个水平像素, MSB先; 垂直: 每字节8个垂直像素, LSB在上)
+        binary_array = oled_core.binarize(frame.gray, threshold, invert)
+        return oled_core.pack_bits(binary_array, mode), width, height
+    
     def image_to_bitmap(self, image_path, variable_name, threshold, invert, mode="horizontal", 
                         target_width=None, target_height=None):
-        """将图像转换为位图格式"""
+        """将图像转换为位图格式 (threshold 可以是标量或逐像素阈值图)"""
         try:
-            # 打开图像
-            img = Image.open(image_path)
-            
-            # 调整大小
-            if target_width and target_height:
-                img = img.resize((target_width, target_height), Image.LANCZOS)
-            
-            # 获取图像尺寸
-            width, height = img.size
-            
-            # 转换为灰度图
-            if img.mode != 'L':
-                img = img.convert('L')
-            
-            # 转换为NumPy数组以便处理
-            img_array = np.array(img)
-            
-            # 二值化处理
-            binary_array = np.where(img_array < threshold, 0, 1)
-            
-            # 如果需要反转颜色
-            if invert:
-                binary_array = 1 - binary_array
-            
-            # 创建字节数组
-            bytes_array = []
-            
-            if mode == "horizontal":
-                # 水平排列 (每个字节代表8个水平像素)
-                # 计算每行需要的字节数 (向上取整到8的倍数)
-                byte_width = (width + 7) // 8
-                
-                # 按行处理图像
-                for y in range(height):
-                    for x_byte in range(byte_width):
-                        byte_value = 0
-                        for bit in range(8):
-                            x = x_byte * 8 + bit
-                            if x < width:  # 确保在图像范围内
-                                # 设置对应位 (MSB先)
-                                if binary_array[y, x] == 1:
-                                    byte_value |= (0x80 >> bit)
-                        bytes_array.append(byte_value)
-            else:
-                # 垂直排列 (每个字节代表8个垂直像素)
-                # 计算每列需要的字节数 (向上取整到8的倍数)
-                byte_height = (height + 7) // 8
-                
-                # 按列处理图像
-                for x in range(width):
-                    for y_byte in range(byte_height):
-                        byte_value = 0
-                        for bit in range(8):
-                            y = y_byte * 8 + bit
-                            if y < height:  # 确保在图像范围内
-                                # 设置对应位
-                                if binary_array[y, x] == 1:
-                                    byte_value |= (1 << bit)
-                        bytes_array.append(byte_value)
+            bytes_array, width, height = self.image_to_bytes(
+                image_path, threshold, invert, mode, target_width, target_height)
             
             # 格式化为C数组
-            c_array = f"const unsigned char {variable_name}[] = {{\n\t"
-            for i, byte in enumerate(bytes_array):
-                c_array += f"0x{byte:02x}, "
-                if (i + 1) % 16 == 0 and i < len(bytes_array) - 1:
-                    c_array += "\n\t"
-            c_array = c_array.rstrip(", ") + "\n};"
+            with oled_timing.span("format"):
+                c_array = oled_core.format_c_array(variable_name, bytes_array)
             
             return c_array, width, height
         
@@ -888,123 +1447,77 @@ class EnhancedImageConverterApp:
         )
         self.processing_thread.start()
     
+    def stored_packed_frames(self, mode, target_width, target_height, invert):
+        """文件列表中的帧都来自二值帧存储，且取模方式、尺寸与当前设置相同 (不反色) 时，
+        返回 (映射中的打包帧视图列表, frames_info)，否则返回 None"""
+        stored = [self.frame_cache.stored_frame(p) for p in self.image_files]
+        if invert or not stored or any(s is None or s[0].kind != "bits" or s[0].mode != mode for s in stored):
+            return None
+        if target_width and any((store.width, store.height) != (target_width, target_height) for store, _ in stored):
+            return None
+        frames = [store.packed(index) for store, index in stored]
+        frames_info = [(os.path.basename(path), store.width, store.height, "生成帧存储时已二值化")
+                       for path, (store, _) in zip(self.image_files, stored)]
+        return frames, frames_info
+    
+    @timed_job("export", "导出")
     def process_images_thread(self):
         """在单独的线程中处理所有图像"""
         try:
-            # 准备输出内容
-            output_content = "// 此文件由OLED图像取模工具生成\n"
-            output_content += "// 生成时间: " + datetime.now().strftime("%Y-%m-%d %H:%M:%S") + "\n"
-            output_content += "// 编码: UTF-8\n\n"
-            
             # 获取设置
             prefix = self.prefix_var.get() or "frame"
-            threshold = self.threshold_var.get()
+            threshold_mode = self.threshold_mode_var.get()
             invert = self.invert_var.get()
             mode = self.mode_var.get()
-            resize = self.resize_var.get()
-            target_width = self.width_var.get() if resize else None
-            target_height = self.height_var.get() if resize else None
+            target_width, target_height = self.get_target_size()
             generate_header = self.header_var.get()
             generate_array = self.array_var.get()
+            blob = self.blob_var.get()
             
-            # 如果生成头文件，添加头文件保护
-            if generate_header:
-                header_guard = os.path.splitext(os.path.basename(self.output_path))[0].upper() + "_H"
-                output_content += f"#ifndef {header_guard}\n"
-                output_content += f"#define {header_guard}\n\n"
-                output_content += "#include <stdint.h>\n\n"
-            
-            # 处理所有图像
-            image_vars = []
-            image_sizes = []
             total_files = len(self.image_files)
             
-            for i, image_file in enumerate(self.image_files):
-                # 更新进度
-                progress = (i / total_files) * 100
-                self.root.after(0, lambda p=progress: self.progress_var.set(p))
-                self.root.after(0, lambda msg=f"处理 {i+1}/{total_files}: {os.path.basename(image_file)}": 
-                               self.status_var.set(msg))
-                
-                # 生成变量名
-                var_name = f"{prefix}_{i:03d}"
+            # 帧都来自二值帧存储时直接使用映射中的打包帧，不解码也不重新二值化
+            stored = self.stored_packed_frames(mode, target_width, target_height, invert)
+            if stored is not None:
+                frames, frames_info = stored
+                threshold_note = "// 阈值: 生成帧存储时已二值化"
+            else:
+                # 计算所有帧的阈值 (直方图来自帧缓存)
+                self.root.after(0, lambda: self.status_var.set("计算阈值..."))
+                threshold_note = oled_core.threshold_note(threshold_mode, self.threshold_per_frame_var.get())
                 
-                # 转换图像
-                c_array, width, height = self.image_to_bitmap(
-                    image_file, var_name, threshold, invert, mode,
-                    target_width, target_height
-                )
+                def progress(i, image_file):
+                    self.root.after(0, lambda p=(i / total_files) * 80: self.progress_var.set(p))
+                    self.root.after(0, lambda msg=f"处理 {i+1}/{total_files}: {os.path.basename(image_file)}": 
+                                   self.status_var.set(msg))
                 
-                if c_array:
-                    # 添加图像尺寸注释
-                    output_content += f"// 图像: {os.path.basename(image_file)}, 尺寸: {width}x{height} 像素\n"
-                    
-                    # 如果是头文件，添加extern声明
-                    if generate_header:
-                        output_content += f"extern const unsigned char {var_name}[];\n"
-                    else:
-                        output_content += c_array + "\n\n"
-                    
-                    image_vars.append(var_name)
-                    image_sizes.append((width, height))
-            
-            # 如果需要生成指针数组
-            if generate_array and image_vars:
-                if generate_header:
-                    output_content += f"\n// 所有图像的指针数组\n"
-                    output_content += f"extern const unsigned char* const image_array[{len(image_vars)}];\n"
-                    output_content += f"\n// 图像尺寸数组\n"
-                    output_content += f"extern const uint16_t image_widths[{len(image_vars)}];\n"
-                    output_content += f"extern const uint16_t image_heights[{len(image_vars)}];\n"
-                    output_content += f"\n// 图像总数\n"
-                    output_content += f"#define IMAGE_COUNT {len(image_vars)}\n"
-                    
-                    # 添加帧速率信息
-                    output_content += f"\n// 动画帧速率 (毫秒/帧)\n"
-                    output_content += f"#define FRAME_DELAY {self.speed_var.get()}\n"
-                else:
-                    output_content += f"\n// 所有图像的指针数组\n"
-                    output_content += f"const unsigned char* const image_array[{len(image_vars)}] = {{\n\t"
-                    for i, var in enumerate(image_vars):
-                        output_content += var + ", "
-                        if (i + 1) % 5 == 0 and i < len(image_vars) - 1:
-                            output_content += "\n\t"
-                    output_content += "\n};\n"
-                    
-                    output_content += f"\n// 图像尺寸数组\n"
-                    output_content += f"const uint16_t image_widths[{len(image_vars)}] = {{\n\t"
-                    for i, (width, _) in enumerate(image_sizes):
-                        output_content += f"{width}, "
-                        if (i + 1) % 8 == 0 and i < len(image_sizes) - 1:
-                            output_content += "\n\t"
-                    output_content += "\n};\n"
-                    
-                    output_content += f"const uint16_t image_heights[{len(image_vars)}] = {{\n\t"
-                    for i, (_, height) in enumerate(image_sizes):
-                        output_content += f"{height}, "
-                        if (i + 1) % 8 == 0 and i < len(image_sizes) - 1:
-                            output_content += "\n\t"
-                    output_content += "\n};\n"
-                    
-                    output_content += f"\n// 图像总数\n"
-                    output_content += f"#define IMAGE_COUNT {len(image_vars)}\n"
-                    
-                    # 添加帧速率信息
-                    output_content += f"\n// 动画帧速率 (毫秒/帧)\n"
-                    output_content += f"#define FRAME_DELAY {self.speed_var.get()}\n"
-            
-            # 如果是头文件，添加结束的保护
-            if generate_header:
-                output_content += f"\n#endif // {header_guard}\n"
-            
-            # 写入输出文件
-            with open(self.output_path, 'w', encoding='utf-8') as f:
-                f.write(output_content)
+                # 先打包所有帧，做完 Flash/RAM 预算再写文件
+                frames, frames_info = oled_core.convert_frames(
+                    self.frame_cache, self.image_files, target_width, target_height, threshold_mode,
+                    self.threshold_var.get(), self.threshold_percent_var.get(), self.threshold_per_frame_var.get(),
+                    invert, mode, progress)
+            
+            # 所有帧尺寸相同时才能按图块编码
+            plan = self.plan_budget(frames, generate_array, blob, oled_budget.tile_shape_for(frames_info, mode),
+                                    oled_budget.frame_sizes_for(frames_info))
+            self.root.after(0, lambda: self.status_var.set(plan.summary()))
+            if not plan.fits and not self.ask_yes_no_from_thread(
+                    "超出预算", plan.report() + "\n\n仍然写入文件吗?"):
+                self.root.after(0, lambda: self.progress_var.set(0))
+                self.root.after(0, lambda: self.status_var.set("已取消: 帧数据超出 Flash/RAM 预算"))
+                return
+            
+            self.root.after(0, lambda: self.progress_var.set(90))
+            
+            # 按编码准备数组并写入输出文件 (内容不变的文件不重写)
+            saved = oled_export.write_frames(
+                self.output_path, frames, frames_info, plan, prefix, [threshold_note],
+                generate_header, generate_array, self.speed_var.get(), blob)
             
             # 更新UI
             self.root.after(0, lambda: self.progress_var.set(100))
-            self.root.after(0, lambda: self.status_var.set(f"已成功保存到 {os.path.basename(self.output_path)}"))
-            self.root.after(0, lambda: messagebox.showinfo("完成", f"已成功处理 {total_files} 个图像文件"))
+            self.root.after(0, lambda: self.status_var.set(f"已成功保存到 {saved}"))
+            self.root.after(0, lambda: messagebox.showinfo("完成", f"已成功处理 {total_files} 个图像文件\n\n{plan.report()}"))
             
         except Exception as e:
             self.root.after(0, lambda: self.status_var.set(f"处理出错: {e}"))
@@ -1014,6 +1527,250 @@ class EnhancedImageConverterApp:
             # 重新启用界面控件
             self.root.after(0, self.enable_controls)
     
+    def show_export_profiles(self):
+        """管理命名的导出配置，并把当前帧序列一次导出到选中的多个配置"""
+        try:
+            profiles = oled_profiles.load_profiles()
+        except Exception as e:
+            messagebox.showerror("错误", f"读取导出配置时出错: {e}")
+            return
+        
+        window = tk.Toplevel(self.root)
+        window.title("多目标导出")
+        window.geometry("620x320")
+        window.transient(self.root)
+        
+        frame = ttk.Frame(window, padding="10")
+        frame.pack(fill=tk.BOTH, expand=True)
+        ttk.Label(frame, text="选择要导出的配置 (可多选，源图像只解码一次):").pack(anchor=tk.W)
+        
+        listbox = tk.Listbox(frame, selectmode=tk.EXTENDED, height=10)
+        listbox.pack(fill=tk.BOTH, expand=True, pady=5)
+        
+        def refresh(select=None):
+            listbox.delete(0, tk.END)
+            for profile in profiles:
+                listbox.insert(tk.END, profile.describe())
+            if select is not None:
+                listbox.selection_set(select)
+        
+        def save():
+            try:
+                oled_profiles.save_profiles(profiles)
+            except Exception as e:
+                messagebox.showerror("错误", f"保存导出配置时出错: {e}", parent=window)
+        
+        def edit(index=None):
+            def done(profile):
+                if any(p.name == profile.name for i, p in enumerate(profiles) if i != index):
+                    messagebox.showwarning("警告", f"配置名称 {profile.name} 已存在", parent=window)
+                    return False
+                if index is None:
+                    profiles.append(profile)
+                else:
+                    profiles[index] = profile
+                save()
+                refresh(len(profiles) - 1 if index is None else index)
+                return True
+            self.edit_export_profile(window, profiles[index] if index is not None else None, done)
+        
+        def edit_selected():
+            selection = listbox.curselection()
+            if selection:
+                edit(selection[0])
+        
+        def remove():
+            for index in reversed(listbox.curselection()):
+                del profiles[index]
+            save()
+            refresh()
+        
+        def export():
+            selected = [profiles[i] for i in listbox.curselection()]
+            if not selected:
+                messagebox.showwarning("警告", "请先选择要导出的配置", parent=window)
+                return
+            if self.export_profiles(selected):
+                window.destroy()
+        
+        listbox.bind("<Double-Button-1>", lambda e: edit_selected())
+        
+        button_frame = ttk.Frame(frame)
+        button_frame.pack(fill=tk.X)
+        ttk.Button(button_frame, text="新建", command=edit).pack(side=tk.LEFT, padx=2)
+        ttk.Button(button_frame, text="编辑", command=edit_selected).pack(side=tk.LEFT, padx=2)
+        ttk.Button(button_frame, text="删除", command=remove).pack(side=tk.LEFT, padx=2)
+        ttk.Button(button_frame, text="关闭", command=window.destroy).pack(side=tk.RIGHT, padx=2)
+        ttk.Button(button_frame, text="导出所选", command=export).pack(side=tk.RIGHT, padx=2)
+        
+        refresh(0 if profiles else None)
+    
+    def edit_export_profile(self, parent, profile, on_done):
+        """编辑一个导出配置 (profile 为 None 时新建，默认取当前界面设置)"""
+        if profile is None:
+            width, height = self.get_target_size()
+            profile = oled_profiles.ExportProfile(
+                f"profile_{width or 128}x{height or 64}", width or 128, height or 64, self.mode_var.get(),
+                self.invert_var.get(), "none", self.encoding_var.get(), "", self.header_var.get(), self.blob_var.get())
+        
+        window = tk.Toplevel(parent)
+        window.title("导出配置")
+        window.transient(parent)
+        frame = ttk.Frame(window, padding="10")
+        frame.pack(fill=tk.BOTH, expand=True)
+        
+        name_var = tk.StringVar(value=profile.name)
+        width_var = tk.IntVar(value=profile.width)
+        height_var = tk.IntVar(value=profile.height)
+        invert_var = tk.BooleanVar(value=profile.invert)
+        header_var = tk.BooleanVar(value=profile.header)
+        blob_var = tk.BooleanVar(value=profile.blob)
+        output_var = tk.StringVar(value=profile.output_path)
+        
+        def combo(row, label, keys, names, current):
+            ttk.Label(frame, text=label).grid(row=row, column=0, sticky=tk.W, pady=3)
+            box = ttk.Combobox(frame, state="readonly", values=[names[k] for k in keys])
+            box.current(keys.index(current))
+            box.grid(row=row, column=1, columnspan=2, sticky=tk.EW, padx=5)
+            return lambda: keys[box.current()]
+        
+        ttk.Label(frame, text="名称:").grid(row=0, column=0, sticky=tk.W, pady=3)
+        ttk.Entry(frame, textvariable=name_var).grid(row=0, column=1, columnspan=2, sticky=tk.EW, padx=5)
+        
+        ttk.Label(frame, text="尺寸:").grid(row=1, column=0, sticky=tk.W, pady=3)
+        size_frame = ttk.Frame(frame)
+        size_frame.grid(row=1, column=1, columnspan=2, sticky=tk.W, padx=5)
+        ttk.Spinbox(size_frame, from_=1, to=1024, textvariable=width_var, width=6).pack(side=tk.LEFT)
+        ttk.Label(size_frame, text="x").pack(side=tk.LEFT, padx=3)
+        ttk.Spinbox(size_frame, from_=1, to=1024, textvariable=height_var, width=6).pack(side=tk.LEFT)
+        
+        get_mode = combo(2, "取模方式:", oled_profiles.PACK_MODES, oled_profiles.PACK_MODE_NAMES, profile.mode)
+        get_dither = combo(3, "抖动:", oled_core.DITHER_MODES, oled_core.DITHER_NAMES, profile.dither)
+        get_encoding = combo(4, "帧编码:", ("auto",) + oled_budget.ENCODINGS, oled_budget.ENCODING_NAMES,
+                             profile.encoding)
+        
+        options = ttk.Frame(frame)
+        options.grid(row=5, column=0, columnspan=3, sticky=tk.W, pady=3)
+        ttk.Checkbutton(options, text="反色", variable=invert_var).pack(side=tk.LEFT, padx=2)
+        ttk.Checkbutton(options, text="生成头文件 (.h + .c)", variable=header_var).pack(side=tk.LEFT, padx=2)
+        ttk.Checkbutton(options, text="连续存放", variable=blob_var).pack(side=tk.LEFT, padx=2)
+        
+        def browse():
+            path = filedialog.asksaveasfilename(
+                parent=window, title="输出文件", defaultextension=".h",
+                filetypes=[("头文件", "*.h"), ("C文件", "*.c"), ("所有文件", "*.*")])
+            if path:
+                output_var.set(path)
+        
+        ttk.Label(frame, text="输出文件:").grid(row=6, column=0, sticky=tk.W, pady=3)
+        ttk.Entry(frame, textvariable=output_var, width=40).grid(row=6, column=1, sticky=tk.EW, padx=5)
+        ttk.Button(frame, text="浏览", command=browse).grid(row=6, column=2)
+        frame.columnconfigure(1, weight=1)
+        
+        def apply():
+            try:
+                edited = oled_profiles.ExportProfile(
+                    name_var.get().strip(), width_var.get(), height_var.get(), get_mode(), invert_var.get(),
+                    get_dither(), get_encoding(), output_var.get().strip(), header_var.get(), blob_var.get())
+            except (ValueError, tk.TclError) as e:
+                messagebox.showwarning("警告", f"配置无效: {e}", parent=window)
+                return
+            if on_done(edited):
+                window.destroy()
+        
+        button_frame = ttk.Frame(frame)
+        button_frame.grid(row=10, column=0, columnspan=3, pady=10)
+        ttk.Button(button_frame, text="确定", command=apply).pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text="取消", command=window.destroy).pack(side=tk.LEFT, padx=5)
+    
+    def export_profiles(self, profiles):
+        """开始多目标导出，返回是否已启动"""
+        if not self.image_files:
+            messagebox.showwarning("警告", "没有选择任何图像文件")
+            return False
+        
+        # 没有设置或为相对路径的输出文件放到一个输出目录中
+        if any(not os.path.isabs(p.output_path) for p in profiles):
+            output_dir = filedialog.askdirectory(title="选择输出目录 (用于未设置绝对路径的配置)")
+            if not output_dir:
+                return False
+            for profile in profiles:
+                if not os.path.isabs(profile.output_path):
+                    profile.output_path = os.path.join(output_dir, profile.output_path or f"{profile.name}.h")
+        
+        self.disable_controls()
+        self.status_var.set(f"多目标导出: {len(profiles)} 个配置...")
+        self.processing_thread = threading.Thread(
+            target=self.export_profiles_thread,
+            args=(profiles,),
+            daemon=True
+        )
+        self.processing_thread.start()
+        return True
+    
+    @timed_job("profiles", "多目标导出")
+    def export_profiles_thread(self, profiles):
+        """在单独的线程中解码一次源图像，再并行导出到每个配置"""
+        try:
+            self.root.after(0, lambda: self.progress_var.set(0))
+            self.root.after(0, lambda: self.status_var.set(f"解码 {len(self.image_files)} 个源图像..."))
+            grays, names = oled_profiles.decode_sources(self.image_files, self.frame_cache)
+            self.root.after(0, lambda: self.progress_var.set(20))
+            
+            done = []
+            
+            def on_result(result):
+                done.append(result)
+                state = f"已保存到 {result['saved']}" if result["saved"] else "超出预算，未写入"
+                msg = f"[{len(done)}/{len(profiles)}] {result['name']}: {state}"
+                progress = 20 + 80 * len(done) / len(profiles)
+                self.root.after(0, lambda: self.progress_var.set(progress))
+                self.root.after(0, lambda: self.status_var.set(msg))
+            
+            # 工作线程中启动进程池时用 spawn，子进程不继承界面线程的状态
+            results = oled_profiles.export_profiles(
+                profiles, grays, names, on_result, mp_context="spawn",
+                threshold={"mode": self.threshold_mode_var.get(), "manual": self.threshold_var.get(),
+                           "percent": self.threshold_percent_var.get(),
+                           "per_frame": self.threshold_per_frame_var.get()},
+                prefix=self.prefix_var.get() or "frame", generate_array=self.array_var.get(),
+                frame_delay=self.speed_var.get(), flash_reserve_kb=self.flash_reserve_var.get(),
+                ram_reserve_kb=self.ram_reserve_var.get())
+            
+            lines = []
+            for result in results:
+                state = f"已保存到 {result['saved']}" if result["saved"] else "超出预算，未写入文件"
+                lines.append(f"[{result['name']}] {state}\n{result['report']}")
+            summary = f"{len(grays)} 帧只解码一次，导出 {len(results)} 个配置\n\n" + "\n\n".join(lines)
+            self.root.after(0, lambda: self.progress_var.set(100))
+            self.root.after(0, lambda: messagebox.showinfo("多目标导出完成", summary))
+            
+        except Exception as e:
+            self.root.after(0, lambda: self.status_var.set(f"多目标导出出错: {e}"))
+            self.root.after(0, lambda: messagebox.showerror("错误", f"多目标导出时出错: {e}"))
+        
+        finally:
+            self.root.after(0, self.enable_controls)
+    
+    def plan_budget(self, frames, with_tables=True, blob=False, tile_shape=None, frame_sizes=None):
+        """按链接脚本估算帧数据占用并选择编码 (在写文件之前调用)"""
+        return oled_budget.plan_export(
+            frames, oled_budget.linker_script_for(self.output_path), self.flash_reserve_var.get(), self.ram_reserve_var.get(),
+            self.encoding_var.get(), with_tables, blob, tile_shape, frame_sizes)
+    
+    def ask_yes_no_from_thread(self, title, message):
+        """在工作线程中询问是/否 (对话框在主线程显示)，返回用户的选择"""
+        answer = {}
+        done = threading.Event()
+        
+        def ask():
+            answer["yes"] = messagebox.askyesno(title, message)
+            done.set()
+        
+        self.root.after(0, ask)
+        done.wait()
+        return answer.get("yes", False)
+    
     def batch_resize(self):
         """批量调整图像大小"""
         if not self.image_files:
@@ -1046,6 +1803,7 @@ class EnhancedImageConverterApp:
             daemon=True
         ).start()
     
+    @timed_job("batch_resize", "批量调整大小")
     def batch_resize_thread(self, width, height, output_dir):
         """在单独的线程中批量调整图像大小"""
         try:
@@ -1060,14 +1818,18 @@ class EnhancedImageConverterApp:
                                self.status_var.set(msg))
                 
                 # 打开图像
-                img = Image.open(image_file)
+                with oled_timing.span("decode"):
+                    img = self.frame_cache.open_image(image_file)
+                    img.load()
                 
                 # 调整大小
-                img = img.resize((width, height), Image.LANCZOS)
+                with oled_timing.span("resize"):
+                    img = img.resize((width, height), Image.LANCZOS)
                 
                 # 保存图像
                 output_path = os.path.join(output_dir, os.path.basename(image_file))
-                img.save(output_path)
+                with oled_timing.span("write"):
+                    img.save(output_path)
                 
                 processed += 1
             
@@ -1111,6 +1873,7 @@ class EnhancedImageConverterApp:
             daemon=True
         ).start()
     
+    @timed_job("batch_bw", "批量转黑白")
     def batch_convert_bw_thread(self, threshold, output_dir):
         """在单独的线程中批量转换图像为黑白"""
         try:
@@ -1125,17 +1888,19 @@ class EnhancedImageConverterApp:
                                self.status_var.set(msg))
                 
                 # 打开图像
-                img = Image.open(image_file)
-                
-                # 转换为灰度图
-                img = img.convert('L')
+                with oled_timing.span("decode"):
+                    img = self.frame_cache.open_image(image_file)
+                    img.load()
                 
-                # 二值化处理
-                img = img.point(lambda x: 255 if x > threshold else 0, '1')
+                # 转换为灰度图并二值化
+                with oled_timing.span("binarize"):
+                    img = img.convert('L')
+                    img = img.point(lambda x: 255 if x > threshold else 0, '1')
                 
                 # 保存图像
                 output_path = os.path.join(output_dir, os.path.basename(image_file))
-                img.save(output_path)
+                with oled_timing.span("write"):
+                    img.save(output_path)
                 
                 processed += 1
             
@@ -1152,6 +1917,386 @@ class EnhancedImageConverterApp:
             # 重新启用界面控件
             self.root.after(0, self.enable_controls)
     
+    def build_frame_store(self):
+        """把当前帧序列按当前设置逐帧二值化打包，写入帧存储 (长序列不占用内存)"""
+        if not self.image_files:
+            messagebox.showwarning("警告", "没有选择图像文件")
+            return
+        
+        output_path = filedialog.asksaveasfilename(
+            title="保存帧存储",
+            defaultextension=".oledfrm",
+            filetypes=[("帧存储", "*.oledfrm"), ("所有文件", "*.*")]
+        )
+        if not output_path:
+            return
+        
+        gray_path = None
+        if messagebox.askyesno("帧存储", "同时保存灰度帧吗? (每像素 1 字节，可以之后换阈值重新生成)"):
+            gray_path = os.path.splitext(output_path)[0] + ".oledgray"
+        
+        self.disable_controls()
+        self.status_var.set("正在生成帧存储...")
+        
+        threading.Thread(
+            target=self.build_frame_store_thread,
+            args=(list(self.image_files), output_path, gray_path),
+            daemon=True
+        ).start()
+    
+    @timed_job("store", "生成帧存储")
+    def build_frame_store_thread(self, image_files, output_path, gray_path):
+        """在单独的线程中逐帧解码、二值化、打包并追加到帧存储"""
+        try:
+            target_width, target_height = self.get_target_size()
+            if not target_width:
+                target_height, target_width = self.frame_cache.get(image_files[0]).gray.shape
+            total = len(image_files)
+            step = max(1, total // 100)
+            
+            def sources():
+                # 磁盘上的图像逐个解码后即丢弃，不进入帧缓存
+                for path in image_files:
+                    stored = self.frame_cache.stored_frame(path)
+                    if stored:
+                        # 帧存储和视频的帧是映射中的视图
+                        store, index = stored
+                        gray = store.gray(index)
+                    elif self.frame_cache.is_memory_frame(path):
+                        gray = self.frame_cache.get(path).gray
+                    else:
+                        with oled_timing.span("decode"):
+                            gray = oled_core.decode_gray(path)
+                    yield gray
+            
+            def progress(done):
+                if done % step == 0 or done == total:
+                    self.root.after(0, lambda: self.progress_var.set(done / total * 100))
+                    self.root.after(0, lambda: self.status_var.set(f"生成帧存储 {done}/{total}"))
+            
+            store = oled_store.build_store(
+                sources(), output_path, target_width, target_height, self.mode_var.get(),
+                self.threshold_mode_var.get(), self.threshold_var.get(), self.threshold_percent_var.get(),
+                self.threshold_per_frame_var.get(), self.invert_var.get(), gray_path=gray_path,
+                on_progress=progress)
+            
+            msg = store.describe()
+            if gray_path:
+                msg += f"\n灰度帧: {oled_store.FrameStore.open(gray_path).describe()}"
+            self.root.after(0, lambda: self.status_var.set(f"已生成 {store.describe()}"))
+            self.root.after(0, lambda: messagebox.showinfo("完成", msg))
+            
+        except Exception as e:
+            self.root.after(0, lambda: self.status_var.set(f"生成帧存储出错: {e}"))
+            self.root.after(0, lambda: messagebox.showerror("错误", f"生成帧存储时出错: {e}"))
+        
+        finally:
+            self.root.after(0, self.enable_controls)
+            self.root.after(0, lambda: self.progress_var.set(0))
+    
+    def generate_font(self):
+        """将TTF/OTF字体转换为SSD1306_Font_t字模"""
+        font_path = filedialog.askopenfilename(
+            title="选择字体文件",
+            filetypes=[("字体文件", "*.ttf;*.otf;*.ttc"), ("所有文件", "*.*")]
+        )
+        if not font_path:
+            return
+        
+        size = simpledialog.askinteger("字号", "请输入字号 (像素):", minvalue=4, maxvalue=64, initialvalue=12)
+        if size is None:
+            return
+        
+        proportional = messagebox.askyesno("比例字宽", "是否生成比例字宽表 (char_width)?")
+        
+        output_path = filedialog.asksaveasfilename(
+            title="保存字体文件",
+            defaultextension=".c",
+            filetypes=[("C文件", "*.c"), ("所有文件", "*.*")]
+        )
+        if not output_path:
+            return
+        
+        self.disable_controls()
+        self.status_var.set(f"正在生成字体: {os.path.basename(font_path)} {size}px...")
+        
+        threading.Thread(
+            target=self.generate_font_thread,
+            args=(font_path, size, output_path, proportional, self.threshold_var.get()),
+            daemon=True
+        ).start()
+    
+    def generate_font_thread(self, font_path, size, output_path, proportional, threshold):
+        """在单独的线程中生成字体"""
+        try:
+            glyphs = font_gen.generate_font(font_path, size, output_path,
+                                            proportional=proportional, threshold=threshold)
+            
+            msg = f"已生成 {len(glyphs.chars)} 个字符, 单元格 {glyphs.cell_width}x{glyphs.cell_height}"
+            self.root.after(0, lambda: self.status_var.set(msg))
+            self.root.after(0, lambda: messagebox.showinfo("完成", msg))
+            
+        except Exception as e:
+            self.root.after(0, lambda: self.status_var.set(f"生成字体出错: {e}"))
+            self.root.after(0, lambda: messagebox.showerror("错误", f"生成字体时出错: {e}"))
+        
+        finally:
+            self.root.after(0, self.enable_controls)
+    
+    def generate_led_frames(self):
+        """将当前帧序列转换为 WS2812 灯带的 GRB 帧表"""
+        if not self.image_files:
+            messagebox.showwarning("警告", "没有选择图像文件")
+            return
+        
+        leds = simpledialog.askinteger("LED灯带", "每条灯带的LED数:", minvalue=1, maxvalue=1024,
+                                       initialvalue=ws2812_gen.DEFAULT_LEDS)
+        if leds is None:
+            return
+        
+        axis = "rows" if messagebox.askyesno("映射方式", "按行映射到灯带?\n(是: 每行一条灯带  否: 每列一条灯带)") else "columns"
+        
+        gamma = simpledialog.askfloat("伽马", "伽马校正 (1.0 为不校正):", minvalue=0.1, maxvalue=5.0,
+                                      initialvalue=ws2812_gen.DEFAULT_GAMMA[0])
+        if gamma is None:
+            return
+        
+        output_path = filedialog.asksaveasfilename(
+            title="保存LED帧表",
+            defaultextension=".h",
+            filetypes=[("头文件", "*.h"), ("所有文件", "*.*")]
+        )
+        if not output_path:
+            return
+        
+        self.disable_controls()
+        self.status_var.set("正在生成LED帧表...")
+        
+        threading.Thread(
+            target=self.generate_led_frames_thread,
+            args=(leds, axis, gamma, output_path),
+            daemon=True
+        ).start()
+    
+    def generate_led_frames_thread(self, leds, axis, gamma, output_path):
+        """在单独的线程中生成LED帧表"""
+        try:
+            images = [self.frame_cache.open_image(path) for path in self.image_files]
+            delays = [self.speed_var.get()] * len(images)
+            frames = ws2812_gen.generate_led_frames(
+                images, delays, output_path, leds=leds, axis=axis, gammas=gamma,
+                source_desc=f"{len(images)} 帧, 从 {os.path.basename(self.image_files[0])} 开始")
+            
+            msg = (f"已生成 {frames.shape[0]} 帧, {frames.shape[1]} 条灯带 x {leds} 个LED, {frames.nbytes} 字节\n"
+                   f"刷新一帧约 {ws2812_gen.frame_time_us(leds):.0f} us")
+            self.root.after(0, lambda: self.status_var.set(msg.replace("\n", ", ")))
+            self.root.after(0, lambda: messagebox.showinfo("完成", msg))
+            
+        except Exception as e:
+            self.root.after(0, lambda: self.status_var.set(f"生成LED帧表出错: {e}"))
+            self.root.after(0, lambda: messagebox.showerror("错误", f"生成LED帧表时出错: {e}"))
+        
+        finally:
+            self.root.after(0, self.enable_controls)
+    
+    def generate_greyscale(self):
+        """把当前帧序列导出为位平面灰度，先按总线时间和面板扫描帧率检查刷新计划是否会闪烁"""
+        if not self.image_files:
+            messagebox.showwarning("警告", "没有选择图像文件")
+            return
+        
+        bits = simpledialog.askinteger("灰度取模", "灰度位数 (2 或 3):", minvalue=min(oled_grey.GREY_BITS),
+                                       maxvalue=max(oled_grey.GREY_BITS), initialvalue=2)
+        if bits is None:
+            return
+        
+        clock = simpledialog.askfloat("总线时钟", "SPI 时钟 (MHz):", minvalue=0.1, maxvalue=100,
+                                      initialvalue=self.spi_clock_mhz)
+        if clock is None:
+            return
+        if clock != self.spi_clock_mhz:
+            self.spi_clock_mhz = clock
+            self.emulator = None
+        
+        # 面板扫描帧率限制了灰度周期 (128x64 时 2 位约 36 Hz)，默认阈值常常达不到
+        reachable = oled_grey.plan_schedule(bits, self.get_emulator().conf, clock * 1e6).cycle_hz
+        min_hz = simpledialog.askfloat("闪烁阈值", f"灰度周期不低于 (Hz)，当前最高约 {reachable:.0f} Hz:",
+                                       minvalue=1, maxvalue=1000, initialvalue=oled_grey.DEFAULT_MIN_CYCLE_HZ)
+        if min_hz is None:
+            return
+        
+        # 先检查刷新计划，会闪烁时不再选择输出文件
+        schedule = oled_grey.plan_schedule(bits, self.get_emulator().conf, clock * 1e6, min_cycle_hz=min_hz)
+        if not schedule.fits:
+            messagebox.showerror("刷新计划会闪烁", schedule.report())
+            return
+        
+        output_path = filedialog.asksaveasfilename(
+            title="保存灰度帧",
+            defaultextension=".h",
+            filetypes=[("头文件", "*.h"), ("所有文件", "*.*")]
+        )
+        if not output_path:
+            return
+        
+        self.disable_controls()
+        self.status_var.set("正在生成灰度帧...")
+        
+        threading.Thread(
+            target=self.generate_greyscale_thread,
+            args=(bits, output_path, min_hz),
+            daemon=True
+        ).start()
+    
+    def generate_greyscale_thread(self, bits, output_path, min_hz):
+        """在单独的线程中量化、拆位平面并写出灰度帧"""
+        try:
+            target_width, target_height = self.get_target_size()
+            grays, names = [], []
+            for i, image_path in enumerate(self.image_files):
+                grays.append(self.frame_cache.get(image_path, target_width, target_height).gray)
+                names.append(os.path.basename(image_path))
+                self.root.after(0, lambda v=(i + 1) / len(self.image_files) * 100: self.progress_var.set(v))
+            
+            schedule, written = oled_grey.export_greyscale(
+                grays, names, output_path, bits, self.get_emulator().conf, self.spi_clock_mhz * 1e6,
+                invert=self.invert_var.get(), min_cycle_hz=min_hz,
+                source_desc=f"{len(grays)} 帧, 从 {names[0]} 开始")
+            
+            msg = f"已生成 {len(grays)} 帧灰度, {schedule.summary()}"
+            if not written:
+                msg += "\n内容未变化，未重写"
+            self.root.after(0, lambda: self.status_var.set(msg.replace("\n", ", ")))
+            self.root.after(0, lambda: messagebox.showinfo("完成", msg + "\n\n" + schedule.report()))
+            
+        except Exception as e:
+            self.root.after(0, lambda: self.status_var.set(f"生成灰度帧出错: {e}"))
+            self.root.after(0, lambda: messagebox.showerror("错误", f"生成灰度帧时出错: {e}"))
+        
+        finally:
+            self.root.after(0, self.enable_controls)
+    
+    def generate_sprites(self):
+        """把带透明的 GIF/PNG 导出为精灵 (图像 + 遮罩平面)，固件中叠加到背景上"""
+        sources = filedialog.askopenfilenames(
+            title="选择带透明的 GIF/PNG",
+            filetypes=[("透明图像", "*.gif;*.png"), ("所有文件", "*.*")]
+        )
+        if not sources:
+            return
+        
+        size_text = simpledialog.askstring("精灵尺寸", "调整到 宽x高 (留空保持原尺寸):", initialvalue="")
+        if size_text is None:
+            return
+        size = None
+        if size_text.strip():
+            try:
+                size = oled_store.parse_size(size_text.strip())
+            except Exception as e:
+                messagebox.showerror("错误", str(e))
+                return
+        
+        output_path = filedialog.asksaveasfilename(
+            title="保存精灵",
+            defaultextension=".h",
+            filetypes=[("头文件", "*.h"), ("所有文件", "*.*")]
+        )
+        if not output_path:
+            return
+        
+        self.disable_controls()
+        self.status_var.set("正在生成精灵...")
+        
+        threading.Thread(
+            target=self.generate_sprites_thread,
+            args=(list(sources), size, output_path, self.threshold_var.get(), self.invert_var.get()),
+            daemon=True
+        ).start()
+    
+    @timed_job("sprite", "精灵取模")
+    def generate_sprites_thread(self, sources, size, output_path, threshold, invert):
+        """在单独的线程中解码 RGBA、生成遮罩并写出精灵头文件"""
+        try:
+            width, height = size or (None, None)
+            grays, alphas, names = oled_sprite.load_rgba(sources, width, height)
+            count, opaque, written = oled_sprite.export_sprites(
+                grays, alphas, names, output_path, threshold, invert,
+                source_desc=", ".join(os.path.basename(p) for p in sources))
+            
+            height, width = grays[0].shape
+            msg = f"已生成 {count} 个精灵 ({width}x{height}, 不透明像素 {opaque:.0%})"
+            if not written:
+                msg += "\n内容未变化，未重写"
+            self.root.after(0, lambda: self.status_var.set(msg.replace("\n", ", ")))
+            self.root.after(0, lambda: messagebox.showinfo("完成", msg + "\n\n固件中用 SPRITE_DRAW(i, x, y) 画到显存"))
+            
+        except Exception as e:
+            self.root.after(0, lambda: self.status_var.set(f"生成精灵出错: {e}"))
+            self.root.after(0, lambda: messagebox.showerror("错误", f"生成精灵时出错: {e}"))
+        
+        finally:
+            self.root.after(0, self.enable_controls)
+    
+    def generate_unicode_font(self):
+        """扫描源文件中用到的字符，生成稀疏Unicode字库 (配合 ssd1306_WriteUTF8)"""
+        font_path = filedialog.askopenfilename(
+            title="选择字体文件",
+            filetypes=[("字体文件", "*.ttf;*.otf;*.ttc"), ("所有文件", "*.*")]
+        )
+        if not font_path:
+            return
+        
+        scan_dir = filedialog.askdirectory(title="选择要扫描的源文件/字符串目录")
+        if not scan_dir:
+            return
+        
+        size = simpledialog.askinteger("字号", "请输入字号 (像素):", minvalue=4, maxvalue=64, initialvalue=12)
+        if size is None:
+            return
+        
+        output_path = filedialog.asksaveasfilename(
+            title="保存字库文件",
+            defaultextension=".c",
+            filetypes=[("C文件", "*.c"), ("所有文件", "*.*")]
+        )
+        if not output_path:
+            return
+        
+        self.disable_controls()
+        self.status_var.set(f"正在扫描 {scan_dir} 并生成字库...")
+        
+        threading.Thread(
+            target=self.generate_unicode_font_thread,
+            args=(font_path, size, scan_dir, output_path, self.threshold_var.get()),
+            daemon=True
+        ).start()
+    
+    def generate_unicode_font_thread(self, font_path, size, scan_dir, output_path, threshold):
+        """在单独的线程中生成稀疏Unicode字库"""
+        try:
+            glyphs, skipped = font_gen.generate_unicode_font(font_path, size, [scan_dir], output_path,
+                                                             threshold=threshold)
+            
+            msg = f"已生成 {len(glyphs.chars)} 个字符, 单元格 {glyphs.cell_width}x{glyphs.cell_height}"
+            if skipped:
+                msg += f", 跳过 {len(skipped)} 个超出BMP的字符"
+            self.root.after(0, lambda: self.status_var.set(msg))
+            self.root.after(0, lambda: messagebox.showinfo("完成", msg))
+            
+        except Exception as e:
+            self.root.after(0, lambda: self.status_var.set(f"生成字库出错: {e}"))
+            self.root.after(0, lambda: messagebox.showerror("错误", f"生成字库时出错: {e}"))
+        
+        finally:
+            self.root.after(0, self.enable_controls)
+    
+    def settings_dict(self):
+        """当前设置 (保存设置和监视模式使用)"""
+        settings = {key: getattr(self, f"{key}_var").get() for key in oled_watch.SETTINGS_SCHEMA}
+        settings["stream_port"] = self.stream_port
+        settings["stream_baud"] = self.stream_baud
+        return settings
+    
     def save_settings(self):
         """保存当前设置"""
         settings_path = filedialog.asksaveasfilename(
@@ -1164,18 +2309,7 @@ class EnhancedImageConverterApp:
             return
         
         try:
-            with open(settings_path, 'w', encoding='utf-8') as f:
-                f.write(f"[Settings]\n")
-                f.write(f"prefix={self.prefix_var.get()}\n")
-                f.write(f"threshold={self.threshold_var.get()}\n")
-                f.write(f"invert={1 if self.invert_var.get() else 0}\n")
-                f.write(f"resize={1 if self.resize_var.get() else 0}\n")
-                f.write(f"width={self.width_var.get()}\n")
-                f.write(f"height={self.height_var.get()}\n")
-                f.write(f"mode={self.mode_var.get()}\n")
-                f.write(f"header={1 if self.header_var.get() else 0}\n")
-                f.write(f"array={1 if self.array_var.get() else 0}\n")
-                f.write(f"speed={self.speed_var.get()}\n")
+            oled_watch.write_settings(settings_path, self.settings_dict())
             
             self.status_var.set(f"已保存设置到 {os.path.basename(settings_path)}")
             
@@ -1193,13 +2327,7 @@ class EnhancedImageConverterApp:
             return
         
         try:
-            settings = {}
-            with open(settings_path, 'r', encoding='utf-8') as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith('[') and '=' in line:
-                        key, value = line.split('=', 1)
-                        settings[key.strip()] = value.strip()
+            settings = oled_watch.read_settings(settings_path)
             
             # 应用设置
             if 'prefix' in settings:
@@ -1208,6 +2336,16 @@ class EnhancedImageConverterApp:
             if 'threshold' in settings:
                 self.threshold_var.set(int(settings['threshold']))
             
+            if settings.get('threshold_mode') in oled_core.THRESHOLD_MODES:
+                self.threshold_mode_var.set(settings['threshold_mode'])
+                self.threshold_mode_combo.current(oled_core.THRESHOLD_MODES.index(settings['threshold_mode']))
+            
+            if 'threshold_per_frame' in settings:
+                self.threshold_per_frame_var.set(bool(int(settings['threshold_per_frame'])))
+            
+            if 'threshold_percent' in settings:
+                self.threshold_percent_var.set(int(settings['threshold_percent']))
+            
             if 'invert' in settings:
                 self.invert_var.set(bool(int(settings['invert'])))
             
@@ -1228,10 +2366,29 @@ class EnhancedImageConverterApp:
             
             if 'array' in settings:
                 self.array_var.set(bool(int(settings['array'])))
+            
+            if 'blob' in settings:
+                self.blob_var.set(bool(int(settings['blob'])))
                 
             if 'speed' in settings:
                 self.speed_var.set(int(settings['speed']))
             
+            if settings.get('encoding') in self.encoding_modes:
+                self.encoding_var.set(settings['encoding'])
+                self.encoding_combo.current(self.encoding_modes.index(settings['encoding']))
+            
+            if 'flash_reserve' in settings:
+                self.flash_reserve_var.set(int(settings['flash_reserve']))
+            
+            if 'ram_reserve' in settings:
+                self.ram_reserve_var.set(int(settings['ram_reserve']))
+            
+            if 'stream_port' in settings:
+                self.stream_port = settings['stream_port']
+            
+            if 'stream_baud' in settings:
+                self.stream_baud = int(settings['stream_baud'])
+            
             self.status_var.set(f"已加载设置从 {os.path.basename(settings_path)}")
             
             # 更新预览
@@ -1318,7 +2475,10 @@ OLED 图像取模工具使用说明
    - 支持单个图像和批量图像处理
    - 支持GIF动画帧提取
    - 支持水平和垂直两种取模方式
-   - 可生成C源文件或头文件
+   - 可生成单个C文件，或成对的头文件(.h 声明)和源文件(.c 定义)
+   - 成对输出时 .c 自动登记到工程 CMakeLists.txt，内容不变时不重写
+   - 连续存放: 所有帧放在一个对齐的 image_data[] 中，用 uint16_t 偏移表
+     和 IMAGE_PTR(i)/IMAGE_WIDTH(i)/IMAGE_HEIGHT(i) 访问，省去指针数组
    - 可生成指针数组用于动画
 
 2. 使用步骤:
@@ -1332,16 +2492,95 @@ OLED 图像取模工具使用说明
    - 使用速度滑块调整动画播放速度
    - 双击速度数值可直接输入精确值
    - 动画预览仅在有多个图像文件时可用
+   - 代码预览只格式化看得见的几百行，大图也不会拖慢界面; "复制全部" 和
+     "保存代码" 输出当前帧完整的数组
 
 4. GIF处理:
    - 选择GIF文件后会自动提取所有帧
    - 可选择是否调整大小和转换为黑白
    - 提取的帧会添加到文件列表中
 
+   导入C数组:
+   - 文件 > 导入C数组，读取以前生成的 .h/.c (如 chiikawa.h、test4.h)
+   - 按当前取模方式还原位图，按指针数组的顺序加入文件列表
+   - 导入的帧只在内存中，可以重新选择编码/布局后再导出
+
+   视频 (Y4M / 原始灰度帧):
+   - 文件 > 选择视频，ffmpeg 可以直接输出: -pix_fmt gray clip.y4m 或
+     -pix_fmt gray -f rawvideo clip.gray (原始灰度帧需要输入尺寸)
+   - 文件用内存映射打开，每帧的亮度平面直接从映射中读取，不经过GIF或PNG;
+     Y4M 的帧率用作动画速度。长视频先用 "生成帧存储" 转换
+
+   帧存储 (长序列):
+   - 工具 > 生成帧存储，按当前尺寸、取模方式和阈值设置逐帧二值化，按 1 位/像素
+     追加写入 .oledfrm 文件 (可选同时保存 uint8 灰度帧 .oledgray)，内存占用与帧数无关
+   - 文件 > 打开帧存储，帧按需从内存映射读取，预览时不复制整个序列;
+     取模方式和尺寸与存储相同时 "转换并保存" 直接导出映射中的打包帧
+   - 无界面: python oled_store.py build/info/export
+
 5. 批量工具:
    - 批量调整图像大小
    - 批量转换为黑白
    - 提取GIF帧
+   - 字体取模: 将TTF/OTF字体转换为SSD1306_Font_t字模 (.c/.h)
+   - 中文字库子集: 扫描源文件中实际用到的字符，生成按码点排序的
+     SSD1306_UnicodeFont_t，固件中用 ssd1306_WriteUTF8 显示
+   - LED灯带取模: 把帧序列缩放到 2 x N 的LED网格 (按行或按列对应 TIM3 CH3/CH4
+     两条灯带)，伽马校正后输出每个LED 3 字节 (G, R, B) 的帧表，
+     固件中用 ws2812_show 显示 (DMA 环形缓冲边发边展开，帧表不占额外RAM)
+   - 灰度取模: 每帧量化为 4 级 (2 位) 或 8 级 (3 位) 灰度并拆成位平面，第 k 个
+     平面显示 2^k 次刷新; 一次刷新取 ssd1306_UpdateScreen 的总线时间 (按 SPI 时钟
+     估算) 和面板扫描周期 (按 ssd1306_Init 的 0xD5/0xD9 估算，128x64 约 107 Hz)
+     中较慢的一个，灰度周期低于闪烁阈值 (默认 60 Hz) 时拒绝导出。固件中每次刷新调用
+     GREY_SHOW(i, s) 再 ssd1306_UpdateScreen()，s 从 0 到 GREY_CYCLE_REFRESHES-1
+   - 精灵取模: 选择带透明的 GIF (透明色) 或 PNG (透明通道)，按当前阈值和反色
+     生成图像和遮罩两个按页存放的平面; 固件中用 SPRITE_DRAW(i, x, y) 按整字节
+     合成到显存，透明处保留背景，y 不必按页对齐。
+     无界面: python oled_sprite.py walk.gif -o sprite.h
+
+   Flash/RAM 预算:
+   - 保存前读取工程的 STM32F103XX_FLASH.ld，扣除代码预留后估算
+     原始/去重/差分RLE 三种帧编码的占用
+   - 帧编码选"自动"时原始编码放得下就保持原始 (输出 image_array[])，放不下时
+     才选放得下的最小编码; 超出预算时先询问再写文件
+   - 差分RLE 需要在固件中用 ssd1306_ApplyDeltaRLE 解码到RAM帧缓冲
+   - 多目标导出 (文件菜单): 命名的导出配置保存尺寸、取模方式、反色、抖动、
+     帧编码和输出路径，选中多个配置一次导出。源图像只解码一次，多个配置时
+     用进程池并行; 超出 Flash/RAM 预算的配置不写文件，结果中给出预算报告
+   - 图块: 按页切成 8x8 图块，整个序列去重后输出共用图块集和每帧索引表，
+     适合边框、图标、空白较多的界面; 固件中用 TILEMAP_DRAW(i, x, page)
+     直接拷贝到显存。报告中给出图块数、复用率和比原始少的 Flash。
+     输出没有 image_array[]，所以只在帧编码选"图块"时使用 (也只在这时切图块)，
+     "自动"不会选择; 不同图块超过 65536 个时不能用图块编码
+
+   屏幕仿真:
+   - 勾选"屏幕仿真"后，预览显示按 ssd1306_UpdateScreen 字节流回放到
+     CH1116 显存模型后的面板内容 (使用工程 ssd1306_conf.h 的 X 偏移、镜像和反色)
+   - 统计中显示每帧总线时间和总线限制的最高帧率
+   - 工具 > 帧率估算: 按输入的 SPI 时钟回放所有帧，给出加上帧延时后的实际帧率
+
+   串口推流:
+   - 固件默认不接收推流: 在 CMakeLists.txt 的 target_compile_definitions 中加上
+     OLED_STREAM_ENABLE=1 后重新编译
+   - 工具 > 串口推流，输入串口和波特率后，按动画速度循环推送当前帧序列，再点一次停止
+   - 先用 115200 (MX_USART1_UART_Init) 握手，再切换到设定的波特率
+   - 每帧只发送与上一帧的异或RLE差分，固件 oled_stream_poll 解码到屏幕缓冲
+   - 没有开发板时可运行 python oled_stream.py selftest 在 pty 上测试
+
+   监视文件夹:
+   - 工具 > 监视文件夹，选择图像文件夹、设置文件 (可取消，使用当前设置) 和输出文件，
+     再点一次停止
+   - 文件夹中的图像或设置文件变化后等 0.5 秒没有新变化再导出，只重新转换变化的帧
+   - 输出文件只在内容变化时原子替换，固件增量编译不会重新编译没变的资源;
+     超出 Flash/RAM 预算时不写文件
+   - 无界面: python oled_watch.py 文件夹 -o 输出.h --settings 设置.ini
+
+   性能计时:
+   - 导出、提取GIF帧、批量工具和多目标导出结束后，状态栏末尾显示各阶段耗时
+     (解码、缩放、二值化、打包、预算/编码、格式化、写文件)，同时在临时目录的
+     timing 文件夹写一个 JSON; 预览的耗时显示在帧统计下方
+   - 帮助 > 记录性能分析 (cProfile) 勾选后，每个任务另外写一个 .prof 文件，
+     用 python -m pstats 文件名 或 snakeviz 查看
 
 6. 快捷键:
    - Ctrl+O: 选择图像文件
@@ -1401,7 +2640,29 @@ OLED 图像取模工具
             if isinstance(child, (ttk.Button, ttk.Entry, ttk.Scale, ttk.Checkbutton)):
                 child.configure(state="normal")
 
-if __name__ == "__main__":
+def main():
+    """启动界面; --startup-trace 文件 时记录启动时间 (JSON) 并在可交互后退出 (startup_bench.py 使用)"""
+    trace_path = None
+    if "--startup-trace" in sys.argv:
+        trace_path = sys.argv[sys.argv.index("--startup-trace") + 1]
+    
     root = tk.Tk()
     app = EnhancedImageConverterApp(root)
-    root.mainloop()
\ No newline at end of file
+    
+    # 先把窗口画出来，再在后台导入 numpy/PIL
+    root.update()
+    first_paint = time.time()
+    
+    def ready(warm_up_s):
+        if not trace_path:
+            return
+        with open(trace_path, "w", encoding="utf-8") as f:
+            json.dump({"first_paint": first_paint, "interactive": time.time(), "warm_up_s": warm_up_s,
+                       "modules": [m._lazy_name for m in WARM_UP_MODULES]}, f)
+        root.destroy()
+    
+    app.start_warm_up(ready)
+    root.mainloop()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+取模流程性能基准 (无界面，可在 Linux 上直接运行)
+
+每个语料走界面导出的同一流程 (oled_core.convert_frames -> oled_budget.plan_export ->
+oled_export.write_frames)，用 oled_timing 的任务计时: decode(解码) / resize(缩放) /
+binarize(二值化) / pack(打包) / budget(预算/编码) / format(格式化) / write(写文件)，
+记录帧率和峰值内存，结果写入 JSON 并与保存的基准比较。
+
+语料:
+  - chiikawa.gif                    GIF 逐帧提取为 PNG (与界面打开 GIF 相同) 后导出，
+                                     write 阶段包含保存这些 PNG
+  - png_output/*.png                已导出的 PNG 帧
+  - 合成帧 (noise/gradient/text)     在 128x64、128x32、256x128 三种目标尺寸下生成，
+                                     源图为目标尺寸的2倍，保证 resize 阶段有实际工作量
+
+用法:
+  python benchmark.py                         运行并与 benchmark_baseline.json 比较
+  python benchmark.py -o result.json          同时保存结果
+  python benchmark.py --save-baseline         运行并更新基准
+"""
+
+import argparse
+import glob
+import json
+import os
+import platform
+import resource
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+from PIL import Image, ImageDraw, ImageFont
+
+import oled_budget
+import oled_core
+import oled_export
+import oled_timing
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_BASELINE = os.path.join(BASE_DIR, "benchmark_baseline.json")
+
+STAGES = oled_timing.STAGES
+SYNTHETIC_KINDS = ("noise", "gradient", "text")
+SYNTHETIC_SIZES = ((128, 64), (128, 32), (256, 128))
+
+
+def synthetic_frames(kind, width, height, count, seed=0):
+    """生成可复现的合成帧 (PIL 灰度图列表)"""
+    rng = np.random.default_rng(seed)
+    frames = []
+
+    if kind == "noise":
+        for _ in range(count):
+            frames.append(Image.fromarray(rng.integers(0, 256, (height, width), dtype=np.uint8)))
+
+    elif kind == "gradient":
+        x = np.linspace(0.0, 1.0, width)[None, :]
+        y = np.linspace(0.0, 1.0, height)[:, None]
+        for i in range(count):
+            phase = i / max(count, 1)
+            values = (np.sin((x + y + phase) * np.pi * 2) * 0.5 + 0.5) * 255
+            frames.append(Image.fromarray(values.astype(np.uint8)))
+
+    elif kind == "text":
+        font = ImageFont.load_default()
+        for i in range(count):
+            img = Image.new("L", (width, height), 0)
+            draw = ImageDraw.Draw(img)
+            for row in range(0, height, 12):
+                draw.text(((i * 3 + row) % 16, row), f"FRAME {i:03d} 0x{row:02X} OLED", font=font, fill=255)
+            frames.append(img)
+
+    else:
+        raise ValueError(f"未知的合成类型: {kind}")
+
+    return frames
+
+
+def write_synthetic_corpus(directory, kind, width, height, count):
+    """将合成帧保存为 PNG，使解码阶段与真实流程一致"""
+    paths = []
+    for i, frame in enumerate(synthetic_frames(kind, width, height, count)):
+        path = os.path.join(directory, f"{kind}_{width}x{height}_{i:03d}.png")
+        frame.save(path, "PNG")
+        paths.append(path)
+    return paths
+
+
+def export_frames(paths, width, height, workdir, encoding="auto", mode="horizontal", threshold=128):
+    """按界面导出的流程转换一组帧: 帧缓存 -> 阈值/二值化/打包 -> Flash/RAM 预算 -> 写文件
+
+    每次使用新的帧缓存，解码和调整大小计入耗时。先删除上一次的输出文件，否则
+    write_if_changed 发现内容相同就不写，write 阶段只剩读取和比较哈希。
+    """
+    output_path = os.path.join(workdir, "bench_output.h")
+    if os.path.exists(output_path):
+        os.remove(output_path)
+    frames, frames_info = oled_core.convert_frames(oled_core.FrameCache(), paths, width, height,
+                                                   manual=threshold, mode=mode)
+    plan = oled_budget.plan_export(frames, oled_budget.linker_script_for(output_path), encoding=encoding,
+                                   tile_shape=oled_budget.tile_shape_for(frames_info, mode),
+                                   frame_sizes=oled_budget.frame_sizes_for(frames_info))
+    oled_export.write_frames(output_path, frames, frames_info, plan, notes=[oled_core.threshold_note("manual")])
+    return len(frames)
+
+
+def run_corpus(loader, width, height, workdir, repeat):
+    """运行一个语料，每个阶段取多次运行中的最小值，返回结果字典
+
+    tracemalloc 会明显拖慢 Python 代码，所以峰值内存在单独的一轮中测量，不计入耗时。
+    """
+    best = None
+    frames = 0
+
+    for _ in range(repeat):
+        with oled_timing.job("benchmark") as timer:
+            frames = export_frames(loader(), width, height, workdir)
+        totals = {s: timer.totals.get(s, 0.0) for s in STAGES}
+        best = totals if best is None else {s: min(best[s], totals[s]) for s in STAGES}
+
+    tracemalloc.start()
+    with oled_timing.job("benchmark"):
+        export_frames(loader(), width, height, workdir)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    total = sum(best.values())
+    return {
+        "frames": frames,
+        "size": f"{width}x{height}",
+        "stages_ms": {s: round(best[s] * 1000, 3) for s in STAGES},
+        "total_ms": round(total * 1000, 3),
+        "fps": round(frames / total, 1) if total > 0 else 0.0,
+        "peak_mem_kb": round(peak / 1024, 1),
+    }
+
+
+def build_corpora(workdir, frame_count):
+    """返回 [(名称, 加载函数, 目标宽, 目标高)]"""
+    corpora = []
+
+    gif_path = os.path.join(BASE_DIR, "chiikawa.gif")
+    if os.path.exists(gif_path):
+        gif_dir = os.path.join(workdir, "gif_frames")
+        os.makedirs(gif_dir, exist_ok=True)
+        corpora.append(("chiikawa.gif", lambda: oled_core.extract_gif_frames(gif_path, gif_dir)[0], 128, 64))
+
+    png_files = sorted(glob.glob(os.path.join(BASE_DIR, "png_output", "*.png")), key=oled_core.natural_sort_key)
+    if png_files:
+        corpora.append(("png_output", lambda: png_files, 128, 64))
+
+    for width, height in SYNTHETIC_SIZES:
+        for kind in SYNTHETIC_KINDS:
+            paths = write_synthetic_corpus(workdir, kind, width * 2, height * 2, frame_count)
+            corpora.append((f"{kind}_{width}x{height}", lambda p=paths: p, width, height))
+
+    return corpora
+
+
+def compare(results, baseline, tolerance):
+    """与基准比较，返回回退项列表 [(语料, 基准fps, 当前fps)]"""
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get("corpora", {}).get(name)
+        if not base or not base.get("fps"):
+            continue
+        if result["fps"] < base["fps"] * (1.0 - tolerance):
+            regressions.append((name, base["fps"], result["fps"]))
+    return regressions
+
+
+def print_table(results, baseline):
+    """打印结果表"""
+    header = f"{'语料':<22}{'帧数':>6}" + "".join(f"{s:>10}" for s in STAGES) + f"{'fps':>10}{'基准':>10}{'峰值KB':>10}"
+    print(header)
+    for name, r in results.items():
+        base = baseline.get("corpora", {}).get(name, {}).get("fps", "-")
+        print(f"{name:<22}{r['frames']:>6}" + "".join(f"{r['stages_ms'][s]:>10.2f}" for s in STAGES)
+              + f"{r['fps']:>10}{base:>10}{r['peak_mem_kb']:>10}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="OLED 取模流程性能基准")
+    parser.add_argument("-o", "--output", help="结果 JSON 文件路径")
+    parser.add_argument("-b", "--baseline", default=DEFAULT_BASELINE, help="基准 JSON 文件路径")
+    parser.add_argument("--save-baseline", action="store_true", help="将本次结果保存为基准")
+    parser.add_argument("-r", "--repeat", type=int, default=3, help="每个语料重复次数 (取最小值)")
+    parser.add_argument("-n", "--frames", type=int, default=32, help="合成语料的帧数")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="允许的帧率下降比例")
+    parser.add_argument("--only", nargs="+", metavar="NAME", help="只运行名称包含这些字符串的语料")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="oled_bench_") as workdir:
+        corpora = build_corpora(workdir, args.frames)
+        if args.only:
+            corpora = [c for c in corpora if any(key in c[0] for key in args.only)]
+
+        results = {}
+        for name, loader, width, height in corpora:
+            results[name] = run_corpus(loader, width, height, workdir, args.repeat)
+
+    report = {
+        "created": time.strftime("%Y-%m-%d %H:%M:%S"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "max_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        "corpora": results,
+    }
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+
+    print_table(results, baseline)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"已保存基准: {args.baseline}")
+        return 0
+
+    regressions = compare(results, baseline, args.tolerance)
+    for name, base_fps, fps in regressions:
+        print(f"性能回退: {name} {base_fps} -> {fps} fps")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
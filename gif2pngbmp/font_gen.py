@@ -0,0 +1,354 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+字体取模: 将 TTF/OTF 字体栅格化为 ssd1306 库使用的 SSD1306_Font_t 字模表
+
+字模格式与 ssd1306_fonts.c 相同: 每个字符 height 个 uint16_t，每个值是一行像素，
+MSB 对应最左边的像素，因此字宽最大为16。所有字形一次性绘制到同一张图集上
+(单元格之间留出字形溢出的间隔)，再整体二值化、打包，避免逐像素的 Python 循环。
+"""
+
+import argparse
+import os
+import re
+from datetime import datetime
+
+import numpy as np
+from PIL import Image, ImageDraw, ImageFont
+
+import oled_core
+
+# ssd1306_WriteChar 支持的字符范围
+ASCII_FIRST = 32
+ASCII_LAST = 126
+ASCII_CHARS = "".join(chr(c) for c in range(ASCII_FIRST, ASCII_LAST + 1))
+
+# uint16_t 行数据决定的最大字宽
+MAX_GLYPH_WIDTH = 16
+
+# 扫描字符串时处理的源文件类型; C 源文件只取字符串字面量，其他文件取全部文本
+SCAN_EXTENSIONS = ('.c', '.h', '.cpp', '.hpp', '.txt', '.json', '.ini', '.csv')
+C_EXTENSIONS = ('.c', '.h', '.cpp', '.hpp')
+C_STRING_RE = re.compile(r'"((?:\\.|[^"\\\n])*)"')
+C_INCLUDE_RE = re.compile(r'^\s*#\s*include\b.*$', re.MULTILINE)
+C_ESCAPE_RE = re.compile(r'\\(?:x([0-9A-Fa-f]+)|([0-7]{1,3})|u([0-9A-Fa-f]{4})|U([0-9A-Fa-f]{8})|([abfnrtv])|(.))',
+                         re.DOTALL)
+
+# SSD1306_UnicodeFont_t 的码点表为 uint16_t，只支持基本多文种平面
+MAX_CODE_POINT = 0xFFFF
+
+
+class FontGlyphs:
+    """一组栅格化后的字形"""
+
+    def __init__(self, chars, bitmaps, widths, cell_width, cell_height):
+        self.chars = chars            # 字符串，与 bitmaps 一一对应
+        self.bitmaps = bitmaps        # (N, cell_height, cell_width) 的 bool 数组
+        self.widths = widths          # (N,) 每个字符的步进宽度
+        self.cell_width = cell_width
+        self.cell_height = cell_height
+
+
+def load_font(font_path, size):
+    """加载字体文件"""
+    return ImageFont.truetype(font_path, size)
+
+
+def measure_font(font, chars):
+    """测量字符的步进宽度和统一的单元格高度"""
+    ascent, descent = font.getmetrics()
+    widths = np.array([int(np.ceil(font.getlength(ch))) for ch in chars], dtype=np.int64)
+    return widths, ascent + descent
+
+
+def rasterize_glyphs(font, chars, cell_width, cell_height, threshold=128, columns=64):
+    """把所有字符绘制到一张图集上，再切分为 (N, cell_height, cell_width) 的二值字形
+
+    斜体或带负边距的字形 (j、f 等) 会超出自己的单元格。图集中的单元格之间留出
+    不小于最大溢出量的间隔，字形只画在自己的格子里，切分时再裁回单元格。
+    绘制完成后一次性二值化，通过 reshape/transpose 得到整组字形，不逐个处理像素。
+    """
+    count = len(chars)
+    if count == 0:
+        return np.zeros((0, cell_height, cell_width), dtype=bool)
+
+    boxes = np.array([font.getbbox(ch) for ch in chars], dtype=np.int64).reshape(-1, 4)
+    pad_x = int(max(0, -boxes[:, 0].min(), boxes[:, 2].max() - cell_width))
+    pad_y = int(max(0, -boxes[:, 1].min(), boxes[:, 3].max() - cell_height))
+    stride_x, stride_y = cell_width + 2 * pad_x, cell_height + 2 * pad_y
+
+    columns = max(1, min(columns, count))
+    rows = (count + columns - 1) // columns
+    atlas = Image.new("L", (columns * stride_x, rows * stride_y), 0)
+    draw = ImageDraw.Draw(atlas)
+
+    for i, ch in enumerate(chars):
+        x = (i % columns) * stride_x + pad_x
+        y = (i // columns) * stride_y + pad_y
+        draw.text((x, y), ch, font=font, fill=255)
+
+    gray = np.asarray(atlas, dtype=np.uint8)
+    # 先切成带间隔的网格，再裁掉间隔: 超出单元格的像素只落在自己的间隔里
+    grid = gray.reshape(rows, stride_y, columns, stride_x).transpose(0, 2, 1, 3)
+    cells = grid.reshape(rows * columns, stride_y, stride_x)[:count]
+    glyphs = cells[:, pad_y:pad_y + cell_height, pad_x:pad_x + cell_width]
+    return oled_core.binarize(glyphs, threshold)
+
+
+def build_glyphs(font_path, size, chars=ASCII_CHARS, proportional=False, threshold=128,
+                 cell_width=None, cell_height=None):
+    """栅格化字符集，返回 FontGlyphs
+
+    未指定单元格尺寸时，宽度取最大步进宽度，高度取 ascent + descent。
+    """
+    font = load_font(font_path, size)
+    widths, natural_height = measure_font(font, chars)
+
+    cell_width = cell_width or int(widths.max(initial=1))
+    cell_height = cell_height or natural_height
+    if cell_width > MAX_GLYPH_WIDTH:
+        raise ValueError(f"字宽 {cell_width} 超过 SSD1306_Font_t 支持的最大宽度 {MAX_GLYPH_WIDTH}，请减小字号")
+
+    bitmaps = rasterize_glyphs(font, chars, cell_width, cell_height, threshold)
+    if proportional:
+        widths = np.clip(widths, 1, cell_width)
+    else:
+        widths = np.full(len(chars), cell_width, dtype=np.int64)
+    return FontGlyphs(chars, bitmaps, widths, cell_width, cell_height)
+
+
+def pack_rows_u16(bitmaps):
+    """将 (N, H, W<=16) 字形打包为 (N, H) 的 uint16 行数据，MSB 为最左像素"""
+    bitmaps = np.asarray(bitmaps, dtype=bool)
+    count, height, width = bitmaps.shape
+    padded = np.zeros((count, height, 16), dtype=bool)
+    padded[:, :, :width] = bitmaps
+    packed = np.packbits(padded, axis=-1)
+    return (packed[..., 0].astype(np.uint16) << 8) | packed[..., 1]
+
+
+def char_comment(ch):
+    """字模注释中显示的字符 (避免生成 */ 或行尾反斜杠)"""
+    if ch == "\\":
+        return "backslash"
+    return ch
+
+
+def format_font_source(name, glyphs, source_desc=""):
+    """生成 SSD1306_Font_t 的C源代码 (格式与 ssd1306_fonts.c 中生成的字体一致)"""
+    rows = pack_rows_u16(glyphs.bitmaps)
+    table = f"{name.replace('_', '')}"
+    width_table = f"{table}_char_width"
+    proportional = bool(np.any(glyphs.widths != glyphs.cell_width))
+
+    lines = [
+        "// 此文件由OLED图像取模工具生成",
+        "// 生成时间: " + datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "// 编码: UTF-8",
+    ]
+    if source_desc:
+        lines.append(f"// 字体: {source_desc}")
+    lines += ["", '#include "ssd1306_fonts.h"', "", f"static const uint16_t {table} [] = {{"]
+    for ch, glyph_rows in zip(glyphs.chars, rows.tolist()):
+        lines.append(f"/** {char_comment(ch)} **/")
+        lines.append("".join(f"0x{v:04X}," for v in glyph_rows))
+    lines.append("};")
+
+    if proportional:
+        lines += ["", f"static const uint8_t {width_table}[] = {{"]
+        for ch, width in zip(glyphs.chars, glyphs.widths.tolist()):
+            lines.append(f"  {width},  /** {char_comment(ch)} **/")
+        lines.append("};")
+
+    lines += ["", f"const SSD1306_Font_t {name} = {{{glyphs.cell_width}, {glyphs.cell_height}, {table}, "
+              f"{width_table if proportional else 'NULL'}}};", ""]
+    return "\n".join(lines)
+
+
+def format_font_header(name, header_name, font_type="SSD1306_Font_t"):
+    """生成声明字体的头文件"""
+    guard = header_name.upper().replace(".", "_").replace("-", "_")
+    return (
+        "// 此文件由OLED图像取模工具生成\n"
+        "// 编码: UTF-8\n\n"
+        f"#ifndef {guard}\n"
+        f"#define {guard}\n\n"
+        '#include "ssd1306.h"\n\n'
+        f"extern const {font_type} {name};\n\n"
+        f"#endif // {guard}\n"
+    )
+
+
+def generate_font(font_path, size, output_path, name=None, proportional=False, threshold=128,
+                  chars=ASCII_CHARS):
+    """生成字体 .c 和同名 .h 文件，返回 FontGlyphs"""
+    glyphs = build_glyphs(font_path, size, chars, proportional, threshold)
+    name = name or f"Font_{glyphs.cell_width}x{glyphs.cell_height}"
+
+    base, _ = os.path.splitext(output_path)
+    header_path = base + ".h"
+    desc = f"{os.path.basename(font_path)} {size}px"
+
+    with open(base + ".c", "w", encoding="utf-8") as f:
+        f.write(format_font_source(name, glyphs, desc))
+    with open(header_path, "w", encoding="utf-8") as f:
+        f.write(format_font_header(name, os.path.basename(header_path)))
+    return glyphs
+
+
+def iter_scan_files(paths):
+    """展开需要扫描的文件列表 (目录递归查找 SCAN_EXTENSIONS)"""
+    for path in paths:
+        if os.path.isdir(path):
+            for dirpath, _, filenames in os.walk(path):
+                for filename in sorted(filenames):
+                    if filename.lower().endswith(SCAN_EXTENSIONS):
+                        yield os.path.join(dirpath, filename)
+        else:
+            yield path
+
+
+def _escape_bytes(match):
+    """一个转义序列对应的 UTF-8 字节: \\x / 八进制为单个字节 (多字节 UTF-8 序列逐字节写出)，
+    \\u / \\U 为码点; 控制字符转义和超出一个字节的 \\x 直接丢弃"""
+    hex_byte, octal, short, long_, control, other = match.groups()
+    if hex_byte is not None or octal is not None:
+        value = int(hex_byte, 16) if hex_byte is not None else int(octal, 8)
+        return bytes([value]) if value <= 0xFF else b""
+    if short or long_:
+        value = int(short or long_, 16)
+        return chr(value).encode("utf-8", "ignore") if value <= 0x10FFFF else b""
+    if control:
+        return b""
+    return other.encode("utf-8")
+
+
+def decode_c_literal(literal):
+    """还原 C 字符串字面量 (不含引号) 中的字符
+
+    先按 UTF-8 得到源文本字节，转义序列替换为它们表示的字节，最后整体按 UTF-8 解码，
+    所以 "\\xE4\\xB8\\xAD" 和 "\\u4E2D" 都还原为 "中"。
+    """
+    data = bytearray()
+    pos = 0
+    for match in C_ESCAPE_RE.finditer(literal):
+        data += literal[pos:match.start()].encode("utf-8")
+        data += _escape_bytes(match)
+        pos = match.end()
+    data += literal[pos:].encode("utf-8")
+    return data.decode("utf-8", "ignore")
+
+
+def collect_code_points(paths, include_ascii=True):
+    """扫描源文件/字符串文件，收集实际使用的字符，返回升序的码点数组
+
+    C 源文件只统计字符串字面量中的字符；超出 BMP 的字符无法放入 uint16_t 码点表，会被跳过。
+    返回 (码点数组, 跳过的字符集合)
+    """
+    used = set()
+    for path in iter_scan_files(paths):
+        with open(path, 'r', encoding='utf-8', errors='ignore') as f:
+            text = f.read()
+        if path.lower().endswith(C_EXTENSIONS):
+            # 只取字符串字面量 (#include 的文件名除外)，并还原转义字符; 控制字符转义直接丢弃
+            literals = C_STRING_RE.findall(C_INCLUDE_RE.sub("", text))
+            text = "".join(decode_c_literal(literal) for literal in literals)
+        used.update(text)
+
+    if include_ascii:
+        used.update(ASCII_CHARS)
+
+    # 去掉控制字符和空白 (空格保留)
+    used = {ch for ch in used if ch == " " or (ch.isprintable() and not ch.isspace())}
+    skipped = {ch for ch in used if ord(ch) > MAX_CODE_POINT}
+    code_points = np.array(sorted(ord(ch) for ch in used - skipped), dtype=np.uint16)
+    return code_points, skipped
+
+
+def format_unicode_font_source(name, glyphs, code_points, source_desc=""):
+    """生成 SSD1306_UnicodeFont_t 的C源代码: 升序码点表 + 字模数据 (+ 比例字宽)"""
+    rows = pack_rows_u16(glyphs.bitmaps)
+    table = f"{name.replace('_', '')}"
+    index_table = f"{table}_code_points"
+    width_table = f"{table}_char_width"
+    proportional = bool(np.any(glyphs.widths != glyphs.cell_width))
+
+    lines = [
+        "// 此文件由OLED图像取模工具生成",
+        "// 生成时间: " + datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "// 编码: UTF-8",
+    ]
+    if source_desc:
+        lines.append(f"// 字体: {source_desc}")
+    lines += [f"// 字符数: {len(code_points)}", "", '#include "ssd1306_fonts.h"', ""]
+
+    # 码点表必须升序，ssd1306_WriteUTF8 在其上做二分查找
+    lines.append(f"static const uint16_t {index_table}[{len(code_points)}] = {{")
+    values = [f"0x{cp:04X}," for cp in code_points.tolist()]
+    for i in range(0, len(values), 12):
+        lines.append("\t" + " ".join(values[i:i + 12]))
+    lines += ["};", "", f"static const uint16_t {table} [] = {{"]
+
+    for ch, glyph_rows in zip(glyphs.chars, rows.tolist()):
+        lines.append(f"/** {char_comment(ch)} U+{ord(ch):04X} **/")
+        lines.append("".join(f"0x{v:04X}," for v in glyph_rows))
+    lines.append("};")
+
+    if proportional:
+        lines += ["", f"static const uint8_t {width_table}[] = {{"]
+        for ch, width in zip(glyphs.chars, glyphs.widths.tolist()):
+            lines.append(f"  {width},  /** {char_comment(ch)} **/")
+        lines.append("};")
+
+    lines += ["", f"const SSD1306_UnicodeFont_t {name} = {{{glyphs.cell_width}, {glyphs.cell_height}, "
+              f"{len(code_points)}, {index_table}, {table}, {width_table if proportional else 'NULL'}}};", ""]
+    return "\n".join(lines)
+
+
+def generate_unicode_font(font_path, size, scan_paths, output_path, name=None, proportional=False,
+                          threshold=128, include_ascii=True):
+    """扫描源文件收集用到的字符，生成稀疏 Unicode 字库 .c/.h
+
+    返回 (FontGlyphs, 跳过的字符集合)
+    """
+    code_points, skipped = collect_code_points(scan_paths, include_ascii)
+    chars = "".join(chr(cp) for cp in code_points.tolist())
+    glyphs = build_glyphs(font_path, size, chars, proportional, threshold)
+    name = name or f"FontU_{glyphs.cell_width}x{glyphs.cell_height}"
+
+    base, _ = os.path.splitext(output_path)
+    header_path = base + ".h"
+    desc = f"{os.path.basename(font_path)} {size}px"
+
+    with open(base + ".c", "w", encoding="utf-8") as f:
+        f.write(format_unicode_font_source(name, glyphs, code_points, desc))
+    with open(header_path, "w", encoding="utf-8") as f:
+        f.write(format_font_header(name, os.path.basename(header_path), "SSD1306_UnicodeFont_t"))
+    return glyphs, skipped
+
+
+def main():
+    parser = argparse.ArgumentParser(description="将 TTF/OTF 字体转换为 SSD1306_Font_t 字模")
+    parser.add_argument("font", help="字体文件路径")
+    parser.add_argument("size", type=int, help="字号 (像素)")
+    parser.add_argument("-o", "--output", required=True, help="输出 .c 文件路径 (同时生成同名 .h)")
+    parser.add_argument("-n", "--name", help="字体变量名，默认 Font_<宽>x<高>")
+    parser.add_argument("-p", "--proportional", action="store_true", help="生成比例字宽表")
+    parser.add_argument("-t", "--threshold", type=int, default=128, help="二值化阈值 (0-255)")
+    parser.add_argument("-s", "--scan", nargs="+", metavar="PATH",
+                        help="扫描源文件/目录中用到的字符，生成稀疏 Unicode 字库 (用于 ssd1306_WriteUTF8)")
+    parser.add_argument("--no-ascii", action="store_true", help="稀疏字库中不自动包含可打印 ASCII 字符")
+    args = parser.parse_args()
+
+    if args.scan:
+        glyphs, skipped = generate_unicode_font(args.font, args.size, args.scan, args.output, args.name,
+                                                args.proportional, args.threshold, not args.no_ascii)
+        if skipped:
+            print(f"跳过 {len(skipped)} 个超出 BMP 的字符: {''.join(sorted(skipped))}")
+    else:
+        glyphs = generate_font(args.font, args.size, args.output, args.name, args.proportional, args.threshold)
+    print(f"已生成 {len(glyphs.chars)} 个字符, 单元格 {glyphs.cell_width}x{glyphs.cell_height}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+按页存放的字模: 由 ssd1306_fonts.c 的行字模重新生成 SSD1306_PageFont_t
+
+ssd1306_fonts.c 中每个字符是 height 个 uint16_t 行 (MSB 为最左像素)，
+ssd1306_WriteChar 只能逐像素调用 ssd1306_DrawPixel (前景和背景都画)。
+这里把同一批字模转换为显存格式: 每个字符 pages 页、每页 width 字节，每字节一列
+8 行，LSB 在上。固件 ssd1306_WritePageChar 按整字节移位合成到显存，
+输出与 ssd1306_WriteChar 完全相同 (由 host_check.py font 检查)。
+
+读取 ssd1306_fonts.c 中的全部字体 (保留各自的 #ifdef SSD1306_INCLUDE_FONT_* 开关
+和比例字宽表)，生成 ssd1306_fonts_pages.c; 内容不变时不重写。字体声明在
+ssd1306_fonts.h 中，修改 ssd1306_fonts.c 后重新运行本工具。
+
+用法:
+  python font_pages.py                    生成 ../ssd1306/ssd1306_fonts_pages.c
+  python font_pages.py --check            只检查生成的文件是否是最新的
+"""
+
+import argparse
+import os
+import re
+import sys
+
+import numpy as np
+
+import font_gen
+import oled_export
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+SSD1306_DIR = os.path.join(os.path.dirname(BASE_DIR), "ssd1306")
+DEFAULT_SOURCE = os.path.join(SSD1306_DIR, "ssd1306_fonts.c")
+DEFAULT_OUTPUT = os.path.join(SSD1306_DIR, "ssd1306_fonts_pages.c")
+
+C_COMMENT_RE = re.compile(r"/\*.*?\*/|//[^\n]*", re.DOTALL)
+ARRAY_RE = re.compile(r"static\s+const\s+(uint16_t|uint8_t)\s+(\w+)\s*\[\s*\]\s*=\s*\{(.*?)\};", re.DOTALL)
+FONT_RE = re.compile(r"const\s+SSD1306_Font_t\s+(\w+)\s*=\s*\{\s*(\d+)\s*,\s*(\d+)\s*,\s*(\w+)\s*,\s*(\w+)\s*\}\s*;")
+IFDEF_RE = re.compile(r"^\s*#\s*ifdef\s+(\w+)", re.MULTILINE)
+NUMBER_RE = re.compile(r"0[xX][0-9a-fA-F]+|\d+")
+
+
+class RowFont:
+    """ssd1306_fonts.c 中的一个 SSD1306_Font_t"""
+
+    def __init__(self, name, width, height, rows, char_width=None, guard=None):
+        self.name = name              # 例如 Font_7x10
+        self.width = width
+        self.height = height
+        self.rows = rows              # (字符数, height) 的 uint16 行数据
+        self.char_width = char_width  # 比例字宽 (字符数,)，等宽字体为 None
+        self.guard = guard            # 包住字体定义的 #ifdef 宏
+
+    @property
+    def pages(self):
+        return -(-self.height // 8)
+
+    @property
+    def page_name(self):
+        return "Page" + self.name
+
+
+def parse_fonts(text):
+    """解析 ssd1306_fonts.c，返回 RowFont 列表 (按定义顺序)"""
+    stripped = C_COMMENT_RE.sub(" ", text)
+    arrays = {name: [int(v, 0) for v in NUMBER_RE.findall(body)] for _, name, body in ARRAY_RE.findall(stripped)}
+
+    fonts = []
+    for match in FONT_RE.finditer(stripped):
+        name, width, height, data, widths = match.groups()
+        width, height = int(width), int(height)
+        if data not in arrays:
+            raise ValueError(f"{name}: 找不到字模数组 {data}")
+        values = arrays[data]
+        if len(values) % height:
+            raise ValueError(f"{name}: 字模数组长度 {len(values)} 不是字高 {height} 的整数倍")
+        char_width = None
+        if widths != "NULL":
+            if widths not in arrays:
+                raise ValueError(f"{name}: 找不到字宽表 {widths}")
+            char_width = np.array(arrays[widths], dtype=np.uint8)
+        guards = IFDEF_RE.findall(stripped, 0, match.start())
+        fonts.append(RowFont(name, width, height, np.array(values, dtype=np.uint16).reshape(-1, height),
+                             char_width, guards[-1] if guards else None))
+    return fonts
+
+
+def rows_to_pages(rows, width):
+    """(字符数, H) 的 uint16 行数据 -> (字符数, 页数, width) 的显存字节，LSB 在上"""
+    rows = np.asarray(rows, dtype=np.uint16)
+    count, height = rows.shape
+    bits = np.unpackbits(rows.astype(">u2").view(np.uint8).reshape(count, height, 2), axis=-1)[:, :, :width]
+    pad = (-height) % 8
+    if pad:
+        bits = np.concatenate([bits, np.zeros((count, pad, width), dtype=np.uint8)], axis=1)
+    return np.packbits(bits.reshape(count, -1, 8, width), axis=2, bitorder="little")[:, :, 0, :]
+
+
+def glyph_comment(index):
+    """字模行尾注释中的字符 (空格写作 sp，与 ssd1306_fonts.c 一致)"""
+    ch = chr(font_gen.ASCII_FIRST + index)
+    return "sp" if ch == " " else font_gen.char_comment(ch)
+
+
+def format_page_fonts(fonts, source_name="ssd1306_fonts.c"):
+    """生成 ssd1306_fonts_pages.c 的文本"""
+    output = oled_export.file_banner()
+    output += f"// 由 {source_name} 的行字模转换为按页存放的显存格式 (font_pages.py)\n"
+    output += "// 每个字符 pages 页 x width 字节，每字节一列 8 行，LSB在上\n\n"
+    output += '#include "ssd1306_fonts.h"\n'
+
+    for font in fonts:
+        table = f"{font.name.replace('_', '')}_pages"
+        width_table = f"{font.name.replace('_', '')}_page_char_width"
+        glyphs = rows_to_pages(font.rows, font.width).reshape(len(font.rows), -1)
+
+        output += "\n"
+        if font.guard:
+            output += f"#ifdef {font.guard}\n"
+        output += f"static const uint8_t {table} [] = {{\n"
+        for i, glyph in enumerate(glyphs.tolist()):
+            output += "".join(f"0x{b:02X}," for b in glyph)
+            output += f"  // {glyph_comment(i)}\n"
+        output += "};\n"
+        if font.char_width is not None:
+            output += f"\nstatic const uint8_t {width_table}[] = {{\n"
+            output += "".join(f"  {w},  // {glyph_comment(i)}\n"
+                              for i, w in enumerate(font.char_width.tolist()))
+            output += "};\n"
+        output += (f"\nconst SSD1306_PageFont_t {font.page_name} = {{{font.width}, {font.height}, {font.pages}, "
+                   f"{table}, {width_table if font.char_width is not None else 'NULL'}}};\n")
+        if font.guard:
+            output += "#endif\n"
+    return output
+
+
+def generate_page_fonts(source_path=DEFAULT_SOURCE, output_path=DEFAULT_OUTPUT):
+    """读取行字模、写出按页字模，返回 (RowFont 列表, 是否写入)"""
+    with open(source_path, "r", encoding="utf-8") as f:
+        fonts = parse_fonts(f.read())
+    if not fonts:
+        raise ValueError(f"{source_path} 中没有 SSD1306_Font_t 定义")
+    text = format_page_fonts(fonts, os.path.basename(source_path))
+    return fonts, oled_export.write_if_changed(output_path, text)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="由 ssd1306_fonts.c 生成按页存放的 SSD1306_PageFont_t 字模")
+    parser.add_argument("--source", default=DEFAULT_SOURCE, help="行字模源文件")
+    parser.add_argument("-o", "--output", default=DEFAULT_OUTPUT, help="输出 .c 文件")
+    parser.add_argument("--check", action="store_true", help="只检查输出文件是否是最新的，不写文件")
+    args = parser.parse_args()
+
+    if args.check:
+        with open(args.source, "r", encoding="utf-8") as f:
+            text = format_page_fonts(parse_fonts(f.read()), os.path.basename(args.source))
+        try:
+            with open(args.output, "r", encoding="utf-8") as f:
+                current = f.read()
+        except OSError:
+            current = ""
+        if oled_export.content_hash(current) != oled_export.content_hash(text):
+            print(f"{args.output} 不是最新的，请重新运行 font_pages.py", file=sys.stderr)
+            return 1
+        print(f"{args.output} 是最新的")
+        return 0
+
+    fonts, written = generate_page_fonts(args.source, args.output)
+    for font in fonts:
+        print(f"  {font.page_name}: {len(font.rows)} 个字符, {font.width}x{font.height}, "
+              f"{font.pages} 页 ({len(font.rows) * font.pages * font.width} B)")
+    print(f"已生成 {args.output}" + ("" if written else " (内容未变化，未重写)"))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,1210 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+固件驱动的主机端检查 (无需开发板，需要 gcc 或 clang)
+
+把固件源文件和一组最小的 HAL 替身头文件一起在主机上编译，运行驱动代码，
+并与 Python 参考实现逐项比较。替身头文件在临时目录中生成，不写入工程。
+
+检查项:
+  ws2812   DMA 环形缓冲: 模拟定时器逐个读取占空比，在读完半区/整个环时调用
+           HalfCplt/Cplt 回调，收集输出波形，检查每一位展开为当前的
+           Code0/Code1、复位低电平长度，以及 T0H/T1H 是否在 WS2812B 的时序范围内
+  tilemap  图块编码: 用 oled_export 生成图块集和索引表，固件 ssd1306_DrawTilemap(16)
+           在不同位置 (含右侧/底部裁剪) 画到显存，与 Python 参考逐字节比较
+  sprite   透明精灵: 用 oled_sprite 从带透明色的 GIF/PNG 生成图像和遮罩平面，
+           ssd1306_DrawSprite 在背景上不同位置 (含非页对齐和裁剪) 合成，与 Python
+           参考及 ssd1306_DrawBitmap + 逐像素 ssd1306_DrawPixel 的组合逐字节比较，并计时对比
+  bitmap   ssd1306_DrawBitmap 的 8x8 转置快速路径: 随机位图 (行尾补齐位为随机值)、
+           随机位置 (含裁剪和 uint8_t 回绕)、两种颜色，与原来逐像素调用
+           ssd1306_DrawPixel 的实现逐字节比较，并计时对比
+  font     按页字模: ssd1306_fonts_pages.c 是否由 font_pages.py 从 ssd1306_fonts.c
+           生成的最新版本; 每种字体、两种颜色、随机光标位置 (含非页对齐) 和背景下
+           ssd1306_WritePageChar 与 ssd1306_WriteChar 逐字节比较，并给出两者的字符/秒
+  fontgen  font_gen 字体取模: 斜体字体 (系统字体目录中查找或 --font 指定) 和默认字体，
+           自然字宽和 4 像素窄单元格下，图集栅格化的每个字形与单独绘制再裁剪到单元格的
+           结果逐像素比较，检查超出单元格的笔画不会画进相邻字形
+  stream   串口推流: oled_stream.c 与模拟 UART 一起编译，oled_stream.py 的 StreamSender
+           经模拟串口推流 (设备时钟随主机等待前进)。无损、包损坏 (CRC 丢弃、NAK)、
+           应答丢失 (超时重发、重复 ACK) 时设备按顺序恰好显示每一帧; BAUD 的 ACK 丢失后 (设备未退回/
+           超时退回/全部丢失) 两端回到同一波特率并能继续推流
+
+用法:
+  python host_check.py              运行全部检查
+  python host_check.py ws2812 -v    只运行 ws2812，打印每个用例
+  python host_check.py fontgen --font LatoItalic.ttf
+"""
+
+import argparse
+import os
+import random
+import re
+import shutil
+import struct
+import subprocess
+import sys
+import tempfile
+import time
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR = os.path.dirname(BASE_DIR)
+
+# TIM3 时钟 (SystemClock_Config: HSE 8MHz x 9, APB1 定时器 x2)
+TIM_CLOCK_HZ = 72_000_000
+# WS2812B 数据手册: T0H 0.4us, T1H 0.8us, 误差 ±150ns; 复位低电平 >= 50us
+WS2812_T0H_NS = (250, 550)
+WS2812_T1H_NS = (650, 950)
+WS2812_RESET_US = 50
+
+
+class CheckError(Exception):
+    pass
+
+
+def find_compiler(preferred=None):
+    for cc in ([preferred] if preferred else []) + ["gcc", "clang", "cc"]:
+        if cc and shutil.which(cc):
+            return cc
+    return None
+
+
+def read_defines(path):
+    """读取 C 文件中的整数 #define"""
+    with open(path, "r", encoding="utf-8") as f:
+        text = f.read()
+    return {name: int(value) for name, value in re.findall(r"^#define\s+(\w+)\s+(\d+)\s*$", text, re.M)}
+
+
+def read_tim3_period(path=os.path.join(REPO_DIR, "Core", "Src", "tim.c")):
+    with open(path, "r", encoding="utf-8") as f:
+        match = re.search(r"htim3\.Init\.Period\s*=\s*(\d+)(?:\s*-\s*(\d+))?", f.read())
+    if not match:
+        raise CheckError("tim.c 中没有找到 htim3.Init.Period")
+    return int(match.group(1)) - int(match.group(2) or 0) + 1
+
+
+def compile_program(cc, workdir, name, sources, include_dirs, defines=(), libs=()):
+    exe = os.path.join(workdir, name)
+    cmd = [cc, "-std=c99", "-O2", "-Wall", "-Wextra", "-o", exe]
+    cmd += [f"-I{d}" for d in include_dirs]
+    cmd += [f"-D{d}" for d in defines]
+    cmd += list(sources) + [f"-l{lib}" for lib in libs]
+    result = subprocess.run(cmd, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise CheckError(f"编译失败:\n{' '.join(cmd)}\n{result.stderr}")
+    if result.stderr.strip():
+        raise CheckError(f"编译警告:\n{result.stderr}")
+    return exe
+
+
+def write_files(directory, files):
+    os.makedirs(directory, exist_ok=True)
+    for name, text in files.items():
+        with open(os.path.join(directory, name), "w", encoding="utf-8") as f:
+            f.write(text)
+
+
+# ---------------------------------------------------------------- ws2812
+
+WS2812_SHIMS = {
+    "main.h": """\
+#ifndef MAIN_H
+#define MAIN_H
+#include <stdint.h>
+#include <stddef.h>
+
+typedef enum { HAL_OK = 0, HAL_ERROR, HAL_BUSY, HAL_TIMEOUT } HAL_StatusTypeDef;
+typedef struct { int id; } TIM_TypeDef;
+typedef enum {
+    HAL_TIM_ACTIVE_CHANNEL_1 = 0x01, HAL_TIM_ACTIVE_CHANNEL_2 = 0x02,
+    HAL_TIM_ACTIVE_CHANNEL_3 = 0x04, HAL_TIM_ACTIVE_CHANNEL_4 = 0x08,
+    HAL_TIM_ACTIVE_CHANNEL_CLEARED = 0x00
+} HAL_TIM_ActiveChannel;
+typedef struct {
+    TIM_TypeDef* Instance;
+    HAL_TIM_ActiveChannel Channel;
+} TIM_HandleTypeDef;
+
+extern TIM_TypeDef tim3_instance;
+#define TIM3 (&tim3_instance)
+#define TIM_CHANNEL_3 0x08U
+#define TIM_CHANNEL_4 0x0CU
+
+HAL_StatusTypeDef HAL_TIM_PWM_Start_DMA(TIM_HandleTypeDef* htim, uint32_t Channel, const uint32_t* pData, uint16_t Length);
+HAL_StatusTypeDef HAL_TIM_PWM_Stop_DMA(TIM_HandleTypeDef* htim, uint32_t Channel);
+void HAL_TIM_PWM_PulseFinishedCallback(TIM_HandleTypeDef* htim);
+void HAL_TIM_PWM_PulseFinishedHalfCpltCallback(TIM_HandleTypeDef* htim);
+#endif
+""",
+    "tim.h": """\
+#ifndef TIM_H
+#define TIM_H
+#include "main.h"
+extern TIM_HandleTypeDef htim3;
+#endif
+""",
+    "stm32f1xx_hal_tim.h": "",
+}
+
+# 模拟 TIM3 CH3/CH4 的循环 DMA: 两个通道同步逐个读取占空比
+WS2812_DRIVER = r"""
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+#include "main.h"
+#include "tim.h"
+#include "ws2812.h"
+
+TIM_TypeDef tim3_instance;
+TIM_HandleTypeDef htim3 = { TIM3, HAL_TIM_ACTIVE_CHANNEL_CLEARED };
+
+#define MAX_SLOTS 200000
+
+typedef struct {
+    uint32_t channel;
+    HAL_TIM_ActiveChannel active;
+    const uint16_t* ring;
+    uint16_t len;
+    uint16_t pos;
+    int running;
+    int starts;
+    uint32_t played;
+    uint16_t out[MAX_SLOTS];
+} sim_channel_t;
+
+static sim_channel_t sim[2] = {
+    { .channel = TIM_CHANNEL_3, .active = HAL_TIM_ACTIVE_CHANNEL_3 },
+    { .channel = TIM_CHANNEL_4, .active = HAL_TIM_ACTIVE_CHANNEL_4 },
+};
+
+static sim_channel_t* find(uint32_t channel) {
+    return channel == TIM_CHANNEL_3 ? &sim[0] : channel == TIM_CHANNEL_4 ? &sim[1] : NULL;
+}
+
+HAL_StatusTypeDef HAL_TIM_PWM_Start_DMA(TIM_HandleTypeDef* htim, uint32_t Channel, const uint32_t* pData, uint16_t Length) {
+    sim_channel_t* ch = find(Channel);
+    if (htim != &htim3 || !ch || Length == 0 || Length % 2) return HAL_ERROR;
+    if (ch->running) return HAL_BUSY;
+    ch->ring = (const uint16_t*)pData;
+    ch->len = Length;
+    ch->pos = 0;
+    ch->running = 1;
+    ch->starts++;
+    return HAL_OK;
+}
+
+HAL_StatusTypeDef HAL_TIM_PWM_Stop_DMA(TIM_HandleTypeDef* htim, uint32_t Channel) {
+    sim_channel_t* ch = find(Channel);
+    if (htim != &htim3 || !ch) return HAL_ERROR;
+    ch->running = 0;
+    return HAL_OK;
+}
+
+/* One timer period: every running channel outputs its next slot */
+static void tick(void) {
+    for (int i = 0; i < 2; i++) {
+        sim_channel_t* ch = &sim[i];
+        if (!ch->running) continue;
+        if (ch->played >= MAX_SLOTS) { fprintf(stderr, "channel %d never stops\n", i); exit(3); }
+        ch->out[ch->played++] = ch->ring[ch->pos++];
+        if (ch->pos == ch->len / 2 || ch->pos == ch->len) {
+            htim3.Channel = ch->active;
+            if (ch->pos == ch->len) {
+                ch->pos = 0;
+                HAL_TIM_PWM_PulseFinishedCallback(&htim3);
+            } else {
+                HAL_TIM_PWM_PulseFinishedHalfCpltCallback(&htim3);
+            }
+            htim3.Channel = HAL_TIM_ACTIVE_CHANNEL_CLEARED;
+        }
+    }
+}
+
+/*
+ * stdin: mode (u8: 0 update, 1 both, 2 CH3 only, 3 CH4 only), count (u16 LE),
+ *        then count*3 bytes for CH3 and count*3 bytes for CH4
+ * stdout: per channel starts (u32), slots (u32), slots x u16 duty values
+ */
+int main(void) {
+    uint8_t head[3];
+    if (fread(head, 1, 3, stdin) != 3) return 2;
+    uint16_t count = head[1] | (head[2] << 8);
+    size_t bytes = (size_t)count * 3;
+    uint8_t* grb3 = malloc(bytes + 1);
+    uint8_t* grb4 = malloc(bytes + 1);
+    if (fread(grb3, 1, bytes, stdin) != bytes || fread(grb4, 1, bytes, stdin) != bytes) return 2;
+
+    if (head[0] == 0) {
+        ws2812_update();
+    } else {
+        ws2812_show(head[0] != 3 ? grb3 : NULL, head[0] != 2 ? grb4 : NULL, count);
+        // A frame started while busy must be skipped, not restart the transfer
+        ws2812_show(head[0] != 3 ? grb4 : NULL, head[0] != 2 ? grb3 : NULL, count);
+    }
+    while (ws2812_busy()) {
+        if (!sim[0].running && !sim[1].running) { fprintf(stderr, "busy without DMA\n"); return 4; }
+        tick();
+    }
+    for (int i = 0; i < 2; i++) {
+        uint32_t meta[2] = { (uint32_t)sim[i].starts, sim[i].played };
+        fwrite(meta, sizeof(meta), 1, stdout);
+        fwrite(sim[i].out, sizeof(uint16_t), sim[i].played, stdout);
+    }
+    return 0;
+}
+"""
+
+
+def ws2812_expected(grb, code0, code1):
+    """Python 参考: 每字节高位先发，1 -> Code1, 0 -> Code0"""
+    return [code1 if byte & (0x80 >> bit) else code0 for byte in grb for bit in range(8)]
+
+
+def ws2812_cases(rng):
+    yield "reset", 0, 0, b"", b""
+    for count in (1, 2, 3, 5, 8, 16, 100, 300):
+        a = bytes(rng.randrange(256) for _ in range(count * 3))
+        b = bytes(rng.randrange(256) for _ in range(count * 3))
+        yield f"random x{count}", 1, count, a, b
+    yield "all 0xFF", 1, 7, b"\xff" * 21, b"\xaa" * 21
+    yield "all 0x00", 1, 4, b"\x00" * 12, b"\x01" * 12
+    yield "CH3 only", 2, 6, bytes(range(18)), bytes(18)
+    yield "CH4 only", 3, 6, bytes(18), bytes(range(100, 118))
+
+
+def run_ws2812_case(exe, mode, count, grb3, grb4):
+    result = subprocess.run([exe], input=struct.pack("<BH", mode, count) + grb3 + grb4, capture_output=True)
+    if result.returncode != 0:
+        raise CheckError(f"驱动程序退出码 {result.returncode}: {result.stderr.decode(errors='replace')}")
+    out, channels = result.stdout, []
+    for _ in range(2):
+        starts, slots = struct.unpack_from("<II", out)
+        values = list(struct.unpack_from(f"<{slots}H", out, 8))
+        channels.append((starts, values))
+        out = out[8 + slots * 2:]
+    return channels
+
+
+def check_ws2812(cc, workdir, verbose=False):
+    defines = read_defines(os.path.join(REPO_DIR, "ws2812", "ws2812.c"))
+    code0, code1, code_reset = defines["Code0"], defines["Code1"], defines["CodeReset"]
+    reset_slots = defines["WS2812_RESET_SLOTS"]
+    period = read_tim3_period()
+    tick_ns = 1e9 / TIM_CLOCK_HZ
+
+    t0h, t1h = code0 * tick_ns, code1 * tick_ns
+    reset_us = reset_slots * period * tick_ns / 1000
+    print(f"  TIM3 周期 {period} ({period * tick_ns:.0f} ns/位): Code0={code0} -> T0H {t0h:.0f} ns, "
+          f"Code1={code1} -> T1H {t1h:.0f} ns, 复位 {reset_slots} 位 = {reset_us:.0f} us")
+    if not WS2812_T0H_NS[0] <= t0h <= WS2812_T0H_NS[1]:
+        raise CheckError(f"T0H {t0h:.0f} ns 超出 {WS2812_T0H_NS} ns")
+    if not WS2812_T1H_NS[0] <= t1h <= WS2812_T1H_NS[1]:
+        raise CheckError(f"T1H {t1h:.0f} ns 超出 {WS2812_T1H_NS} ns")
+    if reset_us < WS2812_RESET_US or code_reset != 0:
+        raise CheckError(f"复位低电平 {reset_us:.0f} us (CodeReset={code_reset}) 不满足 >= {WS2812_RESET_US} us")
+
+    shim_dir = os.path.join(workdir, "ws2812_shim")
+    write_files(shim_dir, dict(WS2812_SHIMS, **{"driver.c": WS2812_DRIVER}))
+    sources = [os.path.join(shim_dir, "driver.c"), os.path.join(REPO_DIR, "ws2812", "ws2812.c")]
+    includes = [shim_dir, os.path.join(REPO_DIR, "ws2812")]
+
+    cases = 0
+    for ring_leds in (2, 4, 10):
+        exe = compile_program(cc, workdir, f"ws2812_ring{ring_leds}", sources, includes,
+                              [f"WS2812_RING_LEDS={ring_leds}"])
+        for label, mode, count, grb3, grb4 in ws2812_cases(random.Random(ring_leds)):
+            channels = run_ws2812_case(exe, mode, count, grb3, grb4)
+            for index, (grb, (starts, values)) in enumerate(zip((grb3, grb4), channels)):
+                used = mode in (0, 1) or mode == index + 2
+                name = f"ring {ring_leds} LED, {label}, CH{index + 3}"
+                if not used:
+                    if starts or values:
+                        raise CheckError(f"{name}: 未使用的通道启动了 DMA")
+                    continue
+                expected = ws2812_expected(grb if mode else b"", code0, code1)
+                if starts != 1:
+                    raise CheckError(f"{name}: DMA 启动 {starts} 次 (忙时应跳过新帧)")
+                if values[:len(expected)] != expected:
+                    first = next(i for i, (a, b) in enumerate(zip(values, expected)) if a != b) \
+                        if len(values) >= len(expected) else len(values)
+                    raise CheckError(f"{name}: 第 {first} 位 (LED {first // 24}) 展开错误")
+                tail = values[len(expected):]
+                if any(v != code_reset for v in tail) or len(tail) < reset_slots:
+                    raise CheckError(f"{name}: 复位 {len(tail)} 位, 需要 >= {reset_slots} 个 CodeReset")
+                if verbose:
+                    print(f"    {name}: {len(expected)} 位 + 复位 {len(tail)} 位")
+                cases += 1
+        ring_bytes = ring_leds * 24 * 2
+        print(f"  环形缓冲 {ring_leds} LED: 每通道 {ring_bytes} 字节 (原 48 字节/LED), 通过")
+    print(f"  {cases} 个通道波形与 Code0/Code1 展开一致")
+
+
+# ---------------------------------------------------------------- ssd1306
+
+# ssd1306_conf.h 选择 STM32F1 + SPI，替身只提供它 (和 oled_stream.c) 用到的 HAL 声明;
+# UART 函数由 stream 检查的驱动程序实现
+SSD1306_SHIMS = {
+    "main.h": """\
+#ifndef MAIN_H
+#define MAIN_H
+#include "stm32f1xx_hal.h"
+#endif
+""",
+    "stm32f1xx_hal.h": """\
+#ifndef STM32F1XX_HAL_H
+#define STM32F1XX_HAL_H
+#include <stdint.h>
+#include <stddef.h>
+typedef struct { int id; } SPI_HandleTypeDef;
+typedef struct { int id; } GPIO_TypeDef;
+typedef enum { GPIO_PIN_RESET = 0, GPIO_PIN_SET } GPIO_PinState;
+extern GPIO_TypeDef host_gpio;
+#define OLED_CS_GPIO_Port (&host_gpio)
+#define OLED_DC_GPIO_Port (&host_gpio)
+#define OLED_Res_GPIO_Port (&host_gpio)
+#define OLED_CS_Pin 1
+#define OLED_DC_Pin 2
+#define OLED_Res_Pin 4
+#define HAL_MAX_DELAY 0xFFFFFFFFU
+void HAL_GPIO_WritePin(GPIO_TypeDef* port, uint16_t pin, GPIO_PinState state);
+int HAL_SPI_Transmit(SPI_HandleTypeDef* spi, uint8_t* data, uint16_t size, uint32_t timeout);
+void HAL_Delay(uint32_t ms);
+typedef struct { uint32_t BaudRate; } UART_InitTypeDef;
+typedef struct { UART_InitTypeDef Init; } UART_HandleTypeDef;
+int HAL_UART_Init(UART_HandleTypeDef* huart);
+int HAL_UART_Transmit(UART_HandleTypeDef* huart, uint8_t* data, uint16_t size, uint32_t timeout);
+int HAL_UART_Receive_IT(UART_HandleTypeDef* huart, uint8_t* data, uint16_t size);
+int HAL_UART_AbortReceive(UART_HandleTypeDef* huart);
+void HAL_UART_RxCpltCallback(UART_HandleTypeDef* huart);
+void HAL_UART_ErrorCallback(UART_HandleTypeDef* huart);
+uint32_t HAL_GetTick(void);
+#endif
+""",
+    "_ansi.h": "#define _BEGIN_STD_C\n#define _END_STD_C\n",
+    "hal_stub.c": """\
+#include "stm32f1xx_hal.h"
+GPIO_TypeDef host_gpio;
+SPI_HandleTypeDef hspi1;
+void HAL_GPIO_WritePin(GPIO_TypeDef* port, uint16_t pin, GPIO_PinState state) { (void)port; (void)pin; (void)state; }
+int HAL_SPI_Transmit(SPI_HandleTypeDef* spi, uint8_t* data, uint16_t size, uint32_t timeout) {
+    (void)spi; (void)data; (void)size; (void)timeout; return 0;
+}
+void HAL_Delay(uint32_t ms) { (void)ms; }
+""",
+}
+
+
+def ssd1306_build(cc, workdir, name, files, extra_sources=(), include_dirs=(), defines=()):
+    """编译 ssd1306.c + 替身 + 检查程序，files 为检查程序的源文件 {文件名: 文本}"""
+    shim_dir = os.path.join(workdir, "ssd1306_shim")
+    write_files(shim_dir, dict(SSD1306_SHIMS, **files))
+    sources = [os.path.join(shim_dir, n) for n in files if n.endswith(".c")]
+    sources += [os.path.join(shim_dir, "hal_stub.c"), os.path.join(REPO_DIR, "ssd1306", "ssd1306.c")]
+    return compile_program(cc, workdir, name, sources + list(extra_sources),
+                           [shim_dir, os.path.join(REPO_DIR, "ssd1306")] + list(include_dirs), defines, ["m"])
+
+
+TILEMAP_DRIVER = r"""
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+#include "ssd1306.h"
+#include "tiles.h"
+
+/* argv: x page; stdout: SSD1306_BUFFER_SIZE bytes per frame */
+int main(int argc, char** argv) {
+    int x = argc > 2 ? atoi(argv[1]) : 0;
+    int page = argc > 2 ? atoi(argv[2]) : 0;
+    for (int i = 0; i < IMAGE_COUNT; i++) {
+        memset(ssd1306_GetBuffer(), 0xA5, SSD1306_BUFFER_SIZE);
+        TILEMAP_DRAW(i, x, page);
+        fwrite(ssd1306_GetBuffer(), 1, SSD1306_BUFFER_SIZE, stdout);
+    }
+    return 0;
+}
+"""
+
+
+def tilemap_corpus(rng, count, width, height, noisy=False):
+    """界面类帧: 边框 + 移动的图标 + 偶尔变化的文字行; noisy 时为随机帧 (图块数 > 256)"""
+    import numpy as np
+
+    if noisy:
+        return [rng.random((height, width)) > 0.5 for _ in range(count)]
+    icon = rng.random((8, 8)) > 0.5
+    text = rng.random((8, width - 16)) > 0.5
+    frames = []
+    for i in range(count):
+        bits = np.zeros((height, width), dtype=bool)
+        bits[0, :] = bits[-1, :] = bits[:, 0] = bits[:, -1] = True
+        x = 8 + 8 * (i % max(1, width // 8 - 2))
+        bits[8:16, x:x + 8] = icon[:, :min(8, width - x)]
+        if i % 4 == 0:
+            text = rng.random(text.shape) > 0.5
+        bits[height - 16:height - 8, 8:width - 8] = text
+        frames.append(bits)
+    return frames
+
+
+def check_tilemap(cc, workdir, verbose=False):
+    import numpy as np
+
+    import oled_core
+    import oled_export
+    import oled_tiles
+
+    screen = read_defines(os.path.join(REPO_DIR, "ssd1306", "ssd1306.h"))
+    screen_w, screen_pages = screen["SSD1306_WIDTH"], screen["SSD1306_HEIGHT"] // 8
+    rng = np.random.default_rng(39)
+
+    cases = [("界面 128x64 垂直", 128, 64, "vertical", False),
+             ("界面 64x48 水平", 64, 48, "horizontal", False),
+             ("界面 30x20 水平", 30, 20, "horizontal", False),
+             ("随机 128x64 (uint16 索引)", 128, 64, "vertical", True)]
+    positions = [(0, 0), (5, 1), (100, 6), (127, 7)]
+
+    for label, width, height, mode, noisy in cases:
+        frames = [oled_core.pack_bits(b, mode) for b in tilemap_corpus(rng, 12, width, height, noisy)]
+        tileset = oled_tiles.build_tileset(frames, width, height, mode)
+        for i, frame in enumerate(frames):
+            if not np.array_equal(oled_tiles.render_tileset(tileset, i, mode), frame):
+                raise CheckError(f"{label}: 第 {i} 帧由图块还原后不一致")
+
+        frames_info = [(f"frame_{i}", width, height, "128") for i in range(len(frames))]
+        header = oled_export.render_tilemap("single", frames_info, tileset, ["// host_check"], 100)
+        exe = ssd1306_build(cc, workdir, "tilemap", {"tiles.h": header, "tilemap.c": TILEMAP_DRIVER})
+
+        for x, page in positions:
+            result = subprocess.run([exe, str(x), str(page)], capture_output=True)
+            if result.returncode != 0:
+                raise CheckError(f"{label}: 程序退出码 {result.returncode}")
+            buffers = np.frombuffer(result.stdout, dtype=np.uint8).reshape(len(frames), screen_pages, screen_w)
+            for i in range(len(frames)):
+                # 参考: 图块按页拼成整幅 (页数, 列数 * 8)，裁剪到屏幕内
+                expected = np.full((screen_pages, screen_w), 0xA5, dtype=np.uint8)
+                image = tileset.tiles[tileset.maps[i]].reshape(tileset.pages, -1)
+                rows, cols = min(tileset.pages, screen_pages - page), min(image.shape[1], screen_w - x)
+                expected[page:page + rows, x:x + cols] = image[:rows, :cols]
+                if not np.array_equal(buffers[i], expected):
+                    raise CheckError(f"{label}: 第 {i} 帧画在 ({x}, 页 {page}) 时显存不一致")
+        print(f"  {label}: {tileset.summary(sum(int(f.size) for f in frames))}, "
+              f"{len(positions)} 个位置一致")
+
+
+SPRITE_DRIVER = r"""
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+#include <time.h>
+#include "ssd1306.h"
+#include "sprites.h"
+#include "sprites_rows.h"
+
+static void fill_background(void) {
+    uint8_t* buf = ssd1306_GetBuffer();
+    for (int k = 0; k < SSD1306_BUFFER_SIZE; k++) {
+        buf[k] = (uint8_t)(k * 37 + 11);
+    }
+}
+
+/* Baseline without a mask plane: set pixels with DrawBitmap, then clear the opaque unset pixels one by one */
+static void draw_per_pixel(int i, uint8_t x, uint8_t y) {
+    int row_bytes = (SPRITE_WIDTH + 7) / 8;
+    ssd1306_DrawBitmap(x, y, sprite_rows_bits[i], SPRITE_WIDTH, SPRITE_HEIGHT, White);
+    for (int j = 0; j < SPRITE_HEIGHT; j++) {
+        for (int c = 0; c < SPRITE_WIDTH; c++) {
+            if (sprite_rows_clear[i][j * row_bytes + c / 8] & (0x80 >> (c % 8))) {
+                ssd1306_DrawPixel((uint8_t)(x + c), (uint8_t)(y + j), Black);
+            }
+        }
+    }
+}
+
+/* argv: draw x y -> two buffers per sprite (masked blit, per-pixel); bench n -> ns per blit for both */
+int main(int argc, char** argv) {
+    if (argc > 3 && strcmp(argv[1], "draw") == 0) {
+        uint8_t x = (uint8_t)atoi(argv[2]), y = (uint8_t)atoi(argv[3]);
+        for (int i = 0; i < SPRITE_COUNT; i++) {
+            fill_background();
+            SPRITE_DRAW(i, x, y);
+            fwrite(ssd1306_GetBuffer(), 1, SSD1306_BUFFER_SIZE, stdout);
+            fill_background();
+            draw_per_pixel(i, x, y);
+            fwrite(ssd1306_GetBuffer(), 1, SSD1306_BUFFER_SIZE, stdout);
+        }
+        return 0;
+    }
+    long n = argc > 2 ? atol(argv[2]) : 100000;
+    double ns[2];
+    for (int method = 0; method < 2; method++) {
+        fill_background();
+        clock_t start = clock();
+        for (long k = 0; k < n; k++) {
+            uint8_t x = (uint8_t)(k * 7 % (SSD1306_WIDTH - SPRITE_WIDTH + 1));
+            uint8_t y = (uint8_t)(k * 5 % (SSD1306_HEIGHT - SPRITE_HEIGHT + 1));
+            if (method == 0) {
+                SPRITE_DRAW(k % SPRITE_COUNT, x, y);
+            } else {
+                draw_per_pixel(k % SPRITE_COUNT, x, y);
+            }
+        }
+        ns[method] = (double)(clock() - start) / CLOCKS_PER_SEC * 1e9 / n;
+    }
+    printf("%.1f %.1f\n", ns[0], ns[1]);
+    return 0;
+}
+"""
+
+
+def sprite_sources(rng, workdir):
+    """生成带透明的源文件: 索引色 GIF (透明色索引，高度不是 8 的倍数) 和 RGBA PNG (透明通道)"""
+    import numpy as np
+    from PIL import Image
+
+    cases = []
+    frames = []
+    for i in range(4):
+        index = rng.integers(1, 4, size=(13, 20), dtype=np.uint8)
+        yy, xx = np.mgrid[:13, :20]
+        index[(yy - 6) ** 2 + (xx - 10 - i) ** 2 > 36] = 0
+        img = Image.fromarray(index, "P")
+        img.putpalette([0, 0, 0, 255, 255, 255, 40, 40, 40, 200, 200, 200] + [0] * 756)
+        frames.append(img)
+    gif_path = os.path.join(workdir, "sprite.gif")
+    frames[0].save(gif_path, save_all=True, append_images=frames[1:], transparency=0, disposal=2, loop=0)
+    cases.append(("GIF 20x13 透明色", [gif_path], None))
+
+    rgba = rng.integers(0, 256, size=(32, 32, 4), dtype=np.uint8)
+    rgba[..., 3] = np.where(rng.random((32, 32)) > 0.3, 255, 0)
+    png_path = os.path.join(workdir, "sprite.png")
+    Image.fromarray(rgba, "RGBA").save(png_path)
+    cases.append(("PNG 32x32 透明通道", [png_path], None))
+    cases.append(("PNG 缩放到 24x16", [png_path], (24, 16)))
+    return cases
+
+
+def check_sprite(cc, workdir, verbose=False, iterations=100000):
+    import numpy as np
+
+    import oled_core
+    import oled_sprite
+
+    screen = read_defines(os.path.join(REPO_DIR, "ssd1306", "ssd1306.h"))
+    screen_w, screen_pages = screen["SSD1306_WIDTH"], screen["SSD1306_HEIGHT"] // 8
+    background = (np.arange(screen_w * screen_pages) * 37 + 11).astype(np.uint8).reshape(screen_pages, screen_w)
+    rng = np.random.default_rng(48)
+    positions = [(0, 0), (3, 5), (50, 8), (61, 27), (120, 13), (100, 60), (127, 63)]
+
+    for label, paths, size in sprite_sources(rng, workdir):
+        width, height = size or (None, None)
+        grays, alphas, names = oled_sprite.load_rgba(paths, width, height)
+        header = os.path.join(workdir, "sprites.h")
+        count, opaque, _ = oled_sprite.export_sprites(grays, alphas, names, header, threshold=128)
+        planes = [oled_sprite.sprite_planes(g, a) for g, a in zip(grays, alphas)]
+        if not 0 < opaque < 1:
+            raise CheckError(f"{label}: 遮罩没有区分透明和不透明像素 (不透明 {opaque:.0%})")
+
+        rows = "".join(
+            f"const uint8_t sprite_rows_{name}[{count}][{(grays[0].shape[1] + 7) // 8 * grays[0].shape[0]}] = {{"
+            + ", ".join("{ " + ", ".join(str(v) for v in oled_core.pack_bits(plane, "horizontal").tolist()) + " }"
+                        for plane in data) + "};\n"
+            for name, data in (("bits", [b for b, _ in planes]), ("clear", [m & ~b for b, m in planes])))
+        with open(header, "r", encoding="utf-8") as f:
+            files = {"sprites.h": f.read(), "sprites_rows.h": "#include <stdint.h>\n" + rows,
+                     "sprite.c": SPRITE_DRIVER}
+        exe = ssd1306_build(cc, workdir, "sprite", files)
+
+        for x, y in positions:
+            result = subprocess.run([exe, "draw", str(x), str(y)], capture_output=True)
+            if result.returncode != 0:
+                raise CheckError(f"{label}: 程序退出码 {result.returncode}")
+            buffers = np.frombuffer(result.stdout, dtype=np.uint8).reshape(count, 2, screen_pages, screen_w)
+            for i, (bits, mask) in enumerate(planes):
+                expected = oled_sprite.draw_sprite(background, bits, mask, x, y)
+                if not np.array_equal(buffers[i, 0], expected):
+                    raise CheckError(f"{label}: 第 {i} 帧 ssd1306_DrawSprite 画在 ({x}, {y}) 时显存不一致")
+                if not np.array_equal(buffers[i, 1], expected):
+                    raise CheckError(f"{label}: 第 {i} 帧逐像素绘制在 ({x}, {y}) 时与参考不一致")
+
+        result = subprocess.run([exe, "bench", str(iterations)], capture_output=True, text=True)
+        fast_ns, pixel_ns = (float(v) for v in result.stdout.split())
+        print(f"  {label}: {count} 帧, 不透明 {opaque:.0%}, {len(positions)} 个位置一致; "
+              f"每次绘制 DrawSprite {fast_ns:.0f} ns, DrawBitmap + DrawPixel {pixel_ns:.0f} ns "
+              f"({pixel_ns / max(fast_ns, 1e-3):.1f}x)")
+
+
+BITMAP_DRIVER = r"""
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+#include <time.h>
+#include "ssd1306.h"
+
+/* The per-pixel ssd1306_DrawBitmap before the block fast path, kept as the reference */
+static void reference_DrawBitmap(uint8_t x, uint8_t y, const unsigned char* bitmap, uint8_t w, uint8_t h, SSD1306_COLOR color) {
+    int16_t byteWidth = (w + 7) / 8;
+    uint8_t byte = 0;
+
+    if (x >= SSD1306_WIDTH || y >= SSD1306_HEIGHT) {
+        return;
+    }
+    for (uint8_t j = 0; j < h; j++, y++) {
+        for (uint8_t i = 0; i < w; i++) {
+            if (i & 7) {
+                byte <<= 1;
+            } else {
+                byte = bitmap[j * byteWidth + i / 8];
+            }
+            if (byte & 0x80) {
+                ssd1306_DrawPixel(x + i, y, color);
+            }
+        }
+    }
+}
+
+static uint32_t seed = 49;
+static uint32_t next(void) {
+    seed = seed * 1664525U + 1013904223U;
+    return seed >> 8;
+}
+
+static uint8_t bitmap[32 * 255];
+static uint8_t background[SSD1306_BUFFER_SIZE];
+static uint8_t expected[SSD1306_BUFFER_SIZE];
+
+/* argv: cases iterations; stdout: "cases mismatches fast_ns reference_ns" or the first mismatch */
+int main(int argc, char** argv) {
+    long cases = argc > 1 ? atol(argv[1]) : 20000;
+    long iterations = argc > 2 ? atol(argv[2]) : 20000;
+    uint8_t* buf = ssd1306_GetBuffer();
+
+    for (long n = 0; n < cases; n++) {
+        /* Mostly sprite-sized bitmaps near the screen, sometimes large ones that wrap in uint8_t */
+        uint8_t w = n % 8 == 7 ? next() % 256 : 1 + next() % 80;
+        uint8_t h = n % 8 == 7 ? next() % 256 : 1 + next() % 48;
+        uint8_t x = n % 5 == 0 ? next() % 256 : next() % (SSD1306_WIDTH + 8);
+        uint8_t y = n % 5 == 0 ? next() % 256 : next() % (SSD1306_HEIGHT + 8);
+        SSD1306_COLOR color = next() % 2 ? White : Black;
+        for (size_t k = 0; k < sizeof(bitmap); k++) {
+            bitmap[k] = (uint8_t)next();
+        }
+        for (size_t k = 0; k < sizeof(background); k++) {
+            background[k] = (uint8_t)next();
+        }
+
+        memcpy(buf, background, SSD1306_BUFFER_SIZE);
+        reference_DrawBitmap(x, y, bitmap, w, h, color);
+        memcpy(expected, buf, SSD1306_BUFFER_SIZE);
+        memcpy(buf, background, SSD1306_BUFFER_SIZE);
+        ssd1306_DrawBitmap(x, y, bitmap, w, h, color);
+        if (memcmp(expected, buf, SSD1306_BUFFER_SIZE) != 0) {
+            printf("mismatch x=%u y=%u w=%u h=%u color=%d\n", x, y, w, h, color);
+            return 1;
+        }
+    }
+
+    /* Timing: a 32x24 sprite at varying positions, and a full-screen image */
+    const uint8_t sizes[2][2] = { { 32, 24 }, { SSD1306_WIDTH, SSD1306_HEIGHT } };
+    for (int s = 0; s < 2; s++) {
+        double ns[2];
+        for (int method = 0; method < 2; method++) {
+            clock_t start = clock();
+            for (long k = 0; k < iterations; k++) {
+                uint8_t w = sizes[s][0], h = sizes[s][1];
+                uint8_t x = (uint8_t)(k * 7 % (SSD1306_WIDTH - w + 1));
+                uint8_t y = (uint8_t)(k * 5 % (SSD1306_HEIGHT - h + 1));
+                SSD1306_COLOR color = k % 2 ? White : Black;
+                if (method == 0) {
+                    ssd1306_DrawBitmap(x, y, bitmap, w, h, color);
+                } else {
+                    reference_DrawBitmap(x, y, bitmap, w, h, color);
+                }
+            }
+            ns[method] = (double)(clock() - start) / CLOCKS_PER_SEC * 1e9 / iterations;
+        }
+        printf("%ux%u %.1f %.1f\n", sizes[s][0], sizes[s][1], ns[0], ns[1]);
+    }
+    return 0;
+}
+"""
+
+
+def check_bitmap(cc, workdir, verbose=False, cases=20000, iterations=20000):
+    exe = ssd1306_build(cc, workdir, "bitmap", {"bitmap.c": BITMAP_DRIVER})
+    result = subprocess.run([exe, str(cases), str(iterations)], capture_output=True, text=True)
+    if result.returncode != 0:
+        raise CheckError(f"与逐像素实现不一致: {result.stdout.strip() or result.returncode}")
+    print(f"  {cases} 个随机用例 (含裁剪、uint8_t 回绕、行尾补齐位、白/黑两色) 与逐像素实现一致")
+    for line in result.stdout.split("\n"):
+        if line.strip():
+            size, fast_ns, pixel_ns = line.split()
+            fast_ns, pixel_ns = float(fast_ns), float(pixel_ns)
+            print(f"  {size}: 每次绘制 {fast_ns:.0f} ns, 逐像素 {pixel_ns:.0f} ns ({pixel_ns / max(fast_ns, 1e-3):.1f}x)")
+
+
+FONT_DRIVER = r"""
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+#include <time.h>
+#include "ssd1306.h"
+#include "ssd1306_fonts.h"
+
+typedef struct {
+    const char* name;
+    const SSD1306_Font_t* rows;
+    const SSD1306_PageFont_t* pages;
+} FontPair;
+
+static const FontPair fonts[] = {
+FONT_TABLE
+};
+
+static uint32_t seed = 50;
+static uint32_t next(void) {
+    seed = seed * 1664525U + 1013904223U;
+    return seed >> 8;
+}
+
+static uint8_t background[SSD1306_BUFFER_SIZE];
+static uint8_t expected[SSD1306_BUFFER_SIZE];
+
+/* argv: cases iterations; stdout: one "name chars row_cps page_cps" line per font, or the first mismatch */
+int main(int argc, char** argv) {
+    long cases = argc > 1 ? atol(argv[1]) : 2000;
+    long iterations = argc > 2 ? atol(argv[2]) : 20000;
+    uint8_t* buf = ssd1306_GetBuffer();
+    static const char text[] = "Hello, OLED 0123456789 ~!@#";
+
+    for (size_t f = 0; f < sizeof(fonts) / sizeof(fonts[0]); f++) {
+        const FontPair* font = &fonts[f];
+        for (long n = 0; n < cases; n++) {
+            /* A run of consecutive characters from a random cursor, so the cursor advance is compared too */
+            uint8_t x = next() % SSD1306_WIDTH;
+            uint8_t y = next() % (SSD1306_HEIGHT - font->rows->height + 2);
+            SSD1306_COLOR color = next() % 2 ? White : Black;
+            char first = (char)(32 + next() % 95);
+            for (size_t k = 0; k < sizeof(background); k++) {
+                background[k] = (uint8_t)next();
+            }
+
+            char results[2][8];
+            for (int method = 0; method < 2; method++) {
+                memcpy(buf, background, SSD1306_BUFFER_SIZE);
+                ssd1306_SetCursor(x, y);
+                for (int k = 0; k < 8; k++) {
+                    char ch = (char)(32 + (first - 32 + k) % 95);
+                    results[method][k] = method == 0 ? ssd1306_WriteChar(ch, *font->rows, color)
+                                                     : ssd1306_WritePageChar(ch, font->pages, color);
+                }
+                if (method == 0) {
+                    memcpy(expected, buf, SSD1306_BUFFER_SIZE);
+                }
+            }
+            if (memcmp(expected, buf, SSD1306_BUFFER_SIZE) != 0 || memcmp(results[0], results[1], 8) != 0) {
+                printf("mismatch %s x=%u y=%u first=%d color=%d\n", font->name, x, y, first, color);
+                return 1;
+            }
+        }
+
+        /* Timing: write the text line by line at page-aligned and unaligned rows */
+        double cps[2];
+        for (int method = 0; method < 2; method++) {
+            long chars = 0;
+            clock_t start = clock();
+            for (long k = 0; k < iterations; k++) {
+                ssd1306_SetCursor(0, (uint8_t)(k % (SSD1306_HEIGHT - font->rows->height + 1)));
+                for (const char* p = text; *p; p++) {
+                    char ch = method == 0 ? ssd1306_WriteChar(*p, *font->rows, White)
+                                          : ssd1306_WritePageChar(*p, font->pages, White);
+                    if (ch != *p) {
+                        break;
+                    }
+                    chars++;
+                }
+            }
+            cps[method] = chars / ((double)(clock() - start) / CLOCKS_PER_SEC + 1e-9);
+        }
+        printf("%s %ld %.0f %.0f\n", font->name, cases * 8, cps[0], cps[1]);
+    }
+    return 0;
+}
+"""
+
+
+def check_font(cc, workdir, verbose=False, cases=2000, iterations=20000):
+    import font_pages
+    import oled_export
+
+    with open(font_pages.DEFAULT_SOURCE, "r", encoding="utf-8") as f:
+        fonts = font_pages.parse_fonts(f.read())
+    with open(font_pages.DEFAULT_OUTPUT, "r", encoding="utf-8") as f:
+        current = f.read()
+    if oled_export.content_hash(current) != oled_export.content_hash(font_pages.format_page_fonts(fonts)):
+        raise CheckError("ssd1306_fonts_pages.c 不是最新的，请运行 python font_pages.py")
+
+    table = "\n".join(f'    {{ "{font.name}", &{font.name}, &{font.page_name} }},' for font in fonts)
+    exe = ssd1306_build(cc, workdir, "font", {"font.c": FONT_DRIVER.replace("FONT_TABLE", table)},
+                        [font_pages.DEFAULT_SOURCE, font_pages.DEFAULT_OUTPUT])
+    result = subprocess.run([exe, str(cases), str(iterations)], capture_output=True, text=True)
+    if result.returncode != 0:
+        raise CheckError(f"与 ssd1306_WriteChar 不一致: {result.stdout.strip().splitlines()[-1:] or result.returncode}")
+    for line in result.stdout.split("\n"):
+        if line.strip():
+            name, chars, row_cps, page_cps = line.split()
+            row_cps, page_cps = float(row_cps), float(page_cps)
+            print(f"  {name}: {chars} 个字符一致; ssd1306_WriteChar {row_cps / 1e6:.2f} M 字符/秒, "
+                  f"ssd1306_WritePageChar {page_cps / 1e6:.2f} M 字符/秒 ({page_cps / max(row_cps, 1e-3):.1f}x)")
+
+
+# ---------------------------------------------------------------- fontgen
+
+# 系统字体目录中的斜体字体 (按顺序取第一个存在的)
+ITALIC_FONT_PATTERNS = [
+    "/usr/share/fonts/**/*Italic*.ttf",
+    "/usr/share/fonts/**/*Oblique*.ttf",
+    "/Library/Fonts/*Italic*.ttf",
+    "/System/Library/Fonts/Supplemental/*Italic*.ttf",
+    "C:/Windows/Fonts/ariali.ttf",
+]
+
+
+def find_italic_font():
+    import glob
+
+    for pattern in ITALIC_FONT_PATTERNS:
+        found = sorted(glob.glob(pattern, recursive=True))
+        if found:
+            return found[0]
+    return None
+
+
+def check_fontgen(cc, workdir, verbose=False, font_path=None, size=14):
+    import numpy as np
+    from PIL import Image, ImageDraw, ImageFont
+
+    import font_gen
+    import oled_core
+
+    fonts = [("默认字体", ImageFont.load_default(size))]
+    font_path = font_path or find_italic_font()
+    if font_path:
+        fonts.insert(0, (os.path.basename(font_path), ImageFont.truetype(font_path, size)))
+    else:
+        print("  没有找到斜体字体 (可用 --font 指定)，只检查默认字体")
+
+    chars = font_gen.ASCII_CHARS
+    for name, font in fonts:
+        widths, height = font_gen.measure_font(font, chars)
+        # 自然字宽下检查斜体/负边距的溢出，窄单元格下几乎每个字形都超出单元格
+        for cell_width in (int(widths.max()), 4):
+            glyphs = font_gen.rasterize_glyphs(font, chars, cell_width, height)
+            wrong = []
+            for ch, glyph in zip(chars, glyphs):
+                image = Image.new("L", (cell_width, height), 0)
+                ImageDraw.Draw(image).text((0, 0), ch, font=font, fill=255)
+                if not np.array_equal(glyph, oled_core.binarize(np.asarray(image, dtype=np.uint8), 128)):
+                    wrong.append(ch)
+            if wrong:
+                raise CheckError(f"{name} {size}px 单元格 {cell_width}x{height}: "
+                                 f"字形 {''.join(wrong)!r} 含有相邻单元格的像素")
+            if verbose:
+                print(f"    {name} 单元格 {cell_width}x{height}")
+        print(f"  {name} {size}px: {len(chars)} 个字形在自然字宽和 4 像素单元格下与单独绘制一致")
+
+
+# ---------------------------------------------------------------- stream
+
+STREAM_DRIVER = r"""
+#include <stdio.h>
+#include <stdlib.h>
+#include "oled_stream.h"
+
+/*
+ * stdin, one command per line:
+ *   B baud hex   bytes sent by the host at that baud rate
+ *   T ms         time passes without input
+ * stdout, then "." once the command is done:
+ *   X baud hex   packet transmitted by the device at its current baud rate
+ *   U baud       HAL_UART_Init
+ *   S hex        screen buffer after oled_stream_poll returned 1
+ */
+UART_HandleTypeDef huart1;
+static uint8_t* rx_target;
+static uint32_t tick;
+
+static void print_hex(const uint8_t* data, uint16_t size) {
+    for (uint16_t i = 0; i < size; i++) {
+        printf("%02X", data[i]);
+    }
+    printf("\n");
+}
+
+int HAL_UART_Init(UART_HandleTypeDef* huart) {
+    printf("U %lu\n", (unsigned long)huart->Init.BaudRate);
+    return 0;
+}
+
+int HAL_UART_Transmit(UART_HandleTypeDef* huart, uint8_t* data, uint16_t size, uint32_t timeout) {
+    (void)timeout;
+    printf("X %lu ", (unsigned long)huart->Init.BaudRate);
+    print_hex(data, size);
+    return 0;
+}
+
+int HAL_UART_Receive_IT(UART_HandleTypeDef* huart, uint8_t* data, uint16_t size) {
+    (void)huart;
+    (void)size;
+    rx_target = data;
+    return 0;
+}
+
+int HAL_UART_AbortReceive(UART_HandleTypeDef* huart) {
+    (void)huart;
+    rx_target = NULL;
+    return 0;
+}
+
+uint32_t HAL_GetTick(void) {
+    return tick;
+}
+
+static void poll(void) {
+    if (oled_stream_poll()) {
+        printf("S ");
+        print_hex(ssd1306_GetBuffer(), SSD1306_BUFFER_SIZE);
+    }
+}
+
+int main(void) {
+    static char line[8192];
+
+    huart1.Init.BaudRate = 115200;
+    oled_stream_init(&huart1);
+    while (fgets(line, sizeof(line), stdin)) {
+        if (line[0] == 'B') {
+            char* p;
+            unsigned long baud = strtoul(line + 2, &p, 10);
+            unsigned int byte;
+            for (int n = 1; sscanf(++p, "%2x", &byte) == 1; p++, n++) {
+                // At the wrong baud rate the UART sees framing errors, not the byte
+                if (rx_target && baud == huart1.Init.BaudRate) {
+                    *rx_target = (uint8_t)byte;
+                    HAL_UART_RxCpltCallback(&huart1);
+                }
+                // The main loop keeps up with the receive ring
+                if (n % 64 == 0) {
+                    poll();
+                }
+            }
+            tick++;
+        } else if (line[0] == 'T') {
+            tick += strtoul(line + 2, NULL, 10);
+        }
+        poll();
+        printf(".\n");
+        fflush(stdout);
+    }
+    return 0;
+}
+"""
+
+# 检查用的 BAUD 超时 (固件默认 5 s)，与主机的超时等比例缩短
+STREAM_BAUD_TIMEOUT_MS = 200
+
+
+class StreamDevicePort:
+    """StreamSender 的串口: 写入的字节交给编译好的 oled_stream.c，它的应答按波特率送回
+
+    设备时钟只在主机等待 (读不到数据) 时前进。corrupt 为主机发出的包被损坏的概率，
+    drop 为设备的应答丢失的概率; BAUD 的前 drop_baud_acks 个 ACK 被丢弃。
+    """
+
+    def __init__(self, exe, rng, corrupt=0.0, drop=0.0, drop_baud_acks=0):
+        import oled_stream
+
+        self.proc = subprocess.Popen([exe], stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True)
+        self.rng = rng
+        self.corrupt = corrupt
+        self.drop = drop
+        self.drop_baud_acks = drop_baud_acks
+        self.baud = oled_stream.LINK_BAUD
+        self.baud_seqs = set()
+        self.pending = bytearray()
+        self.shown = []    # 设备显示的显存
+        self.inits = []    # 设备切换的波特率
+        self.replies = []  # 设备发出的 (类型, 序号)
+
+    def _command(self, line):
+        import oled_stream
+
+        self.proc.stdin.write(line + "\n")
+        self.proc.stdin.flush()
+        while True:
+            out = self.proc.stdout.readline()
+            if not out:
+                raise CheckError(f"设备程序退出，退出码 {self.proc.wait()}")
+            tag, _, rest = out.rstrip("\n").partition(" ")
+            if tag == ".":
+                return
+            if tag == "S":
+                self.shown.append(bytes.fromhex(rest))
+            elif tag == "U":
+                self.inits.append(int(rest))
+            elif tag == "X":
+                baud, data = rest.split()
+                packet = bytes.fromhex(data)
+                self.replies.append((packet[2], packet[3]))
+                if packet[2] == oled_stream.ACK and packet[3] in self.baud_seqs and self.drop_baud_acks:
+                    self.drop_baud_acks -= 1
+                elif int(baud) == self.baud and not (self.drop and self.rng.random() < self.drop):
+                    self.pending += packet
+
+    def write(self, data):
+        import oled_stream
+
+        data = bytearray(data)
+        if data[2] == oled_stream.BAUD:
+            self.baud_seqs.add(data[3])
+        if self.corrupt and self.rng.random() < self.corrupt:
+            data[self.rng.randrange(len(data))] ^= 0xFF
+        self._command(f"B {self.baud} {data.hex()}")
+
+    def read(self, timeout):
+        if not self.pending:
+            time.sleep(timeout)
+            self._command(f"T {max(1, round(timeout * 1000))}")
+        data, self.pending = bytes(self.pending), bytearray()
+        return data
+
+    def set_baudrate(self, baud):
+        self.baud = baud
+
+    def close(self):
+        self.proc.stdin.close()
+        self.proc.wait()
+
+
+def check_stream(cc, workdir, verbose=False, frame_count=64):
+    import numpy as np
+
+    import oled_stream
+
+    defines = read_defines(os.path.join(REPO_DIR, "oled_stream", "oled_stream.h"))
+    baud_timeout = defines["OLED_STREAM_BAUD_TIMEOUT_MS"]
+    host_retry_ms = (oled_stream.MAX_RETRIES + 1) * oled_stream.DEFAULT_TIMEOUT * 1000
+    if baud_timeout != round(oled_stream.BAUD_TIMEOUT * 1000) or baud_timeout <= host_retry_ms:
+        raise CheckError(f"OLED_STREAM_BAUD_TIMEOUT_MS ({baud_timeout}) 应等于 oled_stream.BAUD_TIMEOUT "
+                         f"且长于主机重发 BAUD 的 {host_retry_ms:.0f} ms")
+
+    stream_dir = os.path.join(REPO_DIR, "oled_stream")
+    exe = ssd1306_build(cc, workdir, "stream", {"stream.c": STREAM_DRIVER},
+                        [os.path.join(stream_dir, "oled_stream.c")], [stream_dir],
+                        ["OLED_STREAM_ENABLE=1", f"OLED_STREAM_BAUD_TIMEOUT_MS={STREAM_BAUD_TIMEOUT_MS}"])
+    screen = read_defines(os.path.join(REPO_DIR, "ssd1306", "ssd1306.h"))
+    frame_size = screen["SSD1306_WIDTH"] * screen["SSD1306_HEIGHT"] // 8
+    rng = np.random.default_rng(36)
+    frames = [rng.integers(0, 256, frame_size, dtype=np.uint8) for _ in range(frame_count)]
+    baud = oled_stream.DEFAULT_BAUD
+
+    def run(label, timeout, corrupt=0.0, drop=0.0, drop_baud_acks=0, switch_ok=True):
+        port = StreamDevicePort(exe, random.Random(label), corrupt, drop, drop_baud_acks)
+        try:
+            sender = oled_stream.StreamSender(port, timeout=timeout)
+            # 握手前的帧不应被应用，也没有应答
+            port.write(oled_stream.build_packet(oled_stream.FRAME, 1, oled_stream.encode_delta(frames[0], frames[1])))
+            if port.shown or port.replies:
+                raise CheckError(f"{label}: 设备在 HELLO 之前处理了帧")
+            if sender.hello() != frame_size:
+                raise CheckError(f"{label}: HELLO 应答的帧大小不是 {frame_size}")
+            try:
+                sender.set_baud(baud)
+            except TimeoutError:
+                if switch_ok:
+                    raise CheckError(f"{label}: 切换波特率失败")
+            else:
+                if not switch_ok:
+                    raise CheckError(f"{label}: BAUD 的 ACK 全部丢失时切换应失败")
+            expected_baud = baud if switch_ok else oled_stream.LINK_BAUD
+            if port.baud != expected_baud or (port.inits or [oled_stream.LINK_BAUD])[-1] != expected_baud:
+                raise CheckError(f"{label}: 主机 {port.baud}、设备 {port.inits} 波特率不一致")
+            try:
+                stats = sender.stream(frames)
+            except TimeoutError:
+                raise CheckError(f"{label}: 推流超时")
+        finally:
+            port.close()
+
+        # 每次 HELLO 清屏显示一次空白，之后每帧按顺序恰好显示一次
+        shown = [np.frombuffer(b, dtype=np.uint8) for b in port.shown]
+        blanks, tail = shown[:-len(frames)], shown[-len(frames):]
+        if len(tail) != len(frames) or any(b.any() for b in blanks) \
+                or not all(np.array_equal(a, b) for a, b in zip(tail, frames)):
+            raise CheckError(f"{label}: 设备显示的帧与发送的不一致 ({len(shown)} 次显示)")
+        acks = [seq for kind, seq in port.replies if kind == oled_stream.ACK]
+        naks = sum(kind == oled_stream.NAK for kind, _ in port.replies)
+        duplicates = len(acks) - len(set(acks))
+        print(f"  {label}: {len(frames)} 帧一致, 重发 {stats.retransmits} 包, NAK {naks}, "
+              f"重复 ACK {duplicates}, 设备波特率 {port.inits or '未切换'}")
+        return naks, duplicates, port.inits
+
+    run("无损", 0.02)
+    # 损坏的包被 CRC 丢弃，后面的包序号不连续 -> NAK
+    naks, _, _ = run("包损坏 10%", 0.02, corrupt=0.1)
+    # 连续丢失的 ACK 使主机超时重发已应用的包 -> 重复 ACK
+    _, duplicates, _ = run("应答丢失 50%", 0.02, drop=0.5)
+    if not naks or not duplicates:
+        raise CheckError("损坏/丢失用例没有覆盖 NAK 和重复 ACK")
+    # 主机重发 BAUD 的总时间短于设备超时: 设备仍在新波特率，主机在新波特率上重新握手
+    _, _, inits = run("BAUD 的 ACK 丢失 (设备未退回)", STREAM_BAUD_TIMEOUT_MS / 1000 / 20, drop_baud_acks=1)
+    if inits != [baud]:
+        raise CheckError(f"设备未退回的用例中波特率切换为 {inits}")
+    # 长于设备超时: 设备退回原波特率，主机在原波特率上重新握手后再次切换
+    _, _, inits = run("BAUD 的 ACK 丢失 (设备退回)", STREAM_BAUD_TIMEOUT_MS / 1000 / 4, drop_baud_acks=1)
+    if inits != [baud, oled_stream.LINK_BAUD, baud]:
+        raise CheckError(f"设备退回的用例中波特率切换为 {inits}")
+    run("BAUD 的 ACK 全部丢失", STREAM_BAUD_TIMEOUT_MS / 1000 / 4, drop_baud_acks=2, switch_ok=False)
+
+
+CHECKS = {
+    "ws2812": check_ws2812,
+    "tilemap": check_tilemap,
+    "sprite": check_sprite,
+    "bitmap": check_bitmap,
+    "font": check_font,
+    "fontgen": check_fontgen,
+    "stream": check_stream,
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="在主机上编译并检查固件驱动")
+    parser.add_argument("checks", nargs="*", choices=[[]] + list(CHECKS), help="要运行的检查 (默认全部)")
+    parser.add_argument("--cc", help="C 编译器 (默认 gcc/clang/cc)")
+    parser.add_argument("-v", "--verbose", action="store_true", help="打印每个用例")
+    parser.add_argument("--font", help="fontgen 检查使用的斜体 TTF/OTF (默认在系统字体目录中查找)")
+    args = parser.parse_args()
+
+    cc = find_compiler(args.cc)
+    if not cc:
+        print("没有找到 C 编译器 (gcc/clang)")
+        return 2
+
+    failed = 0
+    with tempfile.TemporaryDirectory(prefix="oled_host_") as workdir:
+        for name in args.checks or list(CHECKS):
+            print(f"[{name}]")
+            try:
+                if name == "fontgen":
+                    check_fontgen(cc, workdir, args.verbose, args.font)
+                else:
+                    CHECKS[name](cc, workdir, args.verbose)
+            except CheckError as e:
+                print(f"  失败: {e}")
+                failed += 1
+    print("全部通过" if not failed else f"{failed} 项失败")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
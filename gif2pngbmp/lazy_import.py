@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+延迟导入: 第一次访问属性时才导入的模块代理，以及窗口显示后的后台预热
+
+2in1.py 启动时不导入 numpy/PIL 和依赖它们的模块，先显示窗口; 之后在后台线程
+中按顺序导入 (预热)，用户在预热完成前就用到某个模块时，在当前线程立即导入。
+importlib 对同一个模块的并发导入有模块锁，两边同时导入也只执行一次。
+"""
+
+import importlib
+import threading
+import time
+
+
+class LazyModule:
+    """模块代理: 属性访问时导入真正的模块"""
+
+    def __init__(self, name):
+        self._lazy_name = name
+        self._lazy_module = None
+
+    def _load(self):
+        if self._lazy_module is None:
+            self._lazy_module = importlib.import_module(self._lazy_name)
+        return self._lazy_module
+
+    @property
+    def loaded(self):
+        return self._lazy_module is not None
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    def __repr__(self):
+        state = "已导入" if self.loaded else "未导入"
+        return f"<LazyModule {self._lazy_name} ({state})>"
+
+
+def warm_up(modules, on_done=None, on_error=None):
+    """在后台线程中依次导入 modules (LazyModule 列表)
+
+    on_done(耗时秒数) 和 on_error(异常) 在后台线程中调用。返回线程对象。
+    """
+    def run():
+        start = time.perf_counter()
+        try:
+            for module in modules:
+                module._load()
+        except Exception as e:
+            if on_error:
+                on_error(e)
+            return
+        if on_done:
+            on_done(time.perf_counter() - start)
+
+    thread = threading.Thread(target=run, name="warm-up", daemon=True)
+    thread.start()
+    return thread
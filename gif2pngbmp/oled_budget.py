@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Flash/RAM 预算规划
+
+读取链接脚本 (STM32F103XX_FLASH.ld) 中的 MEMORY 区域，扣除代码预留后，
+估算帧数据在各种编码下的大小，并给出报告或自动选择编码: 原始编码放得下时
+保持原始 (输出 image_array[]，main.c 不用改)，放不下时才选放得下的最小编码。
+在写任何文件之前调用。
+
+编码:
+  raw        每帧一个数组 (原有格式)
+  dedup      相同的帧只保留一份，指针数组指向同一个数组
+  delta_rle  与上一帧异或后 RLE 编码，固件用 ssd1306_ApplyDeltaRLE 解到 RAM 帧缓冲
+  tiles      按页切成 8x8 图块去重，共用图块集 + 每帧索引表 (见 oled_tiles.py)，
+             固件用 ssd1306_DrawTilemap 拷贝到显存; 只在明确选择时使用，自动不会选择
+"""
+
+import glob
+import os
+import re
+
+import oled_core
+import oled_tiles
+import oled_timing
+from oled_defaults import (AUTO_ENCODINGS, DEFAULT_FLASH_RESERVE_KB, DEFAULT_RAM_RESERVE_KB, ENCODING_NAMES,
+                           ENCODINGS)
+
+# 指针数组每项4字节，宽高数组每项各2字节，连续存放时偏移表每项2字节 (超过64KB时4字节)
+POINTER_SIZE = 4
+SIZE_ENTRY = 2
+OFFSET_SIZE = 2
+
+MEMORY_RE = re.compile(r'\bMEMORY\s*\{(.*?)\}', re.DOTALL)
+REGION_RE = re.compile(
+    r'(\w+)\s*(?:\(\s*([^)]*)\))?\s*:\s*ORIGIN\s*=\s*(\w+)\s*,\s*LENGTH\s*=\s*(\w+)',
+    re.IGNORECASE)
+SYMBOL_RE = re.compile(r'^\s*(_Min_Heap_Size|_Min_Stack_Size)\s*=\s*(\w+)\s*;', re.MULTILINE)
+COMMENT_RE = re.compile(r'/\*.*?\*/', re.DOTALL)
+
+
+def parse_size(text):
+    """解析链接脚本中的数值: 0x 十六进制、十进制，以及 K/M 后缀"""
+    text = text.strip()
+    scale = 1
+    if text[-1:] in ("K", "k"):
+        scale, text = 1024, text[:-1]
+    elif text[-1:] in ("M", "m"):
+        scale, text = 1024 * 1024, text[:-1]
+    return int(text, 0) * scale
+
+
+def parse_linker_script(ld_path):
+    """解析链接脚本，返回 (区域字典 {名称: (起始地址, 长度, 属性)}, 最小堆+栈大小)"""
+    with open(ld_path, 'r', encoding='utf-8', errors='replace') as f:
+        text = COMMENT_RE.sub('', f.read())
+
+    match = MEMORY_RE.search(text)
+    if not match:
+        raise ValueError(f"链接脚本中没有 MEMORY 区域: {ld_path}")
+
+    regions = {}
+    for name, attrs, origin, length in REGION_RE.findall(match.group(1)):
+        regions[name.upper()] = (parse_size(origin), parse_size(length), attrs.strip())
+
+    heap_stack = sum(parse_size(value) for _, value in SYMBOL_RE.findall(text))
+    return regions, heap_stack
+
+
+def find_linker_script(start_dir):
+    """从 start_dir 向上查找 *_FLASH.ld (工程根目录)"""
+    directory = os.path.abspath(start_dir)
+    while True:
+        candidates = sorted(glob.glob(os.path.join(directory, "*_FLASH.ld")))
+        if candidates:
+            return candidates[0]
+        parent = os.path.dirname(directory)
+        if parent == directory:
+            return None
+        directory = parent
+
+
+def linker_script_for(output_path):
+    """输出文件所在工程的链接脚本，找不到时用本工具所在工程的"""
+    return (find_linker_script(os.path.dirname(os.path.abspath(output_path)))
+            or find_linker_script(os.path.dirname(os.path.abspath(__file__))))
+
+
+def table_size(frames, blob=False, data_size=0, frame_sizes=None):
+    """帧元数据的大小
+
+    每帧一个数组: 指针数组 + 宽高数组
+    连续存放:     偏移表，帧尺寸不一致时另加宽高数组
+    frame_sizes: 每帧的 (宽, 高)，与 oled_export.render_blob 一样按宽高判断尺寸是否一致
+                 (不同宽高的帧字节数可能相同); 未给出时按每帧字节数判断
+    """
+    count = len(frames)
+    if not blob:
+        return count * (POINTER_SIZE + 2 * SIZE_ENTRY)
+    uniform = len(set(frame_sizes if frame_sizes is not None else (f.size for f in frames))) <= 1
+    offset = OFFSET_SIZE if data_size <= 0xFFFF else 4
+    return count * offset + (0 if uniform else count * 2 * SIZE_ENTRY)
+
+
+def estimate_sizes(frames, with_tables=True, blob=False, tile_shape=None, frame_sizes=None):
+    """估算各编码的 Flash/RAM 占用，frames 为打包后的 uint8 数组列表
+
+    返回 {编码: {"flash": 字节, "ram": 字节, "arrays": 数组个数}}，
+    帧大小不一致时没有差分编码。连续存放时总要输出偏移表。
+    tile_shape: 所有帧相同的 (宽, 高, 取模方式)，给出时估算图块编码
+    (图块编码的 "tileset" 项为 oled_tiles.Tileset); 图块数超过 uint16_t 索引时没有图块编码
+    frame_sizes: 每帧的 (宽, 高)，用于连续存放时判断是否需要宽高数组
+    """
+    count = len(frames)
+    frame_size = int(frames[0].size) if frames else 0
+    tables = table_size(frames, blob, sum(int(f.size) for f in frames), frame_sizes) if (with_tables or blob) else 0
+
+    raw = sum(int(f.size) for f in frames)
+    unique = {oled_core.frame_key(f): int(f.size) for f in frames}
+    estimates = {
+        "raw": {"flash": raw + tables, "ram": 0, "arrays": count},
+        "dedup": {"flash": sum(unique.values()) + tables, "ram": 0, "arrays": len(unique)},
+    }
+
+    if all(f.size == frame_size for f in frames):
+        # 差分解码需要一个帧大小的RAM缓冲区
+        delta = oled_core.delta_rle_encode(frames)
+        estimates["delta_rle"] = {"flash": sum(int(d.size) for d in delta) + tables,
+                                  "ram": frame_size, "arrays": count}
+
+    if tile_shape and count and all(f.size == frame_size for f in frames):
+        # 图块索引表本身就是二维数组，不需要指针数组
+        try:
+            tileset = oled_tiles.build_tileset(frames, *tile_shape)
+        except ValueError:
+            tileset = None
+        if tileset is not None:
+            estimates["tiles"] = {"flash": tileset.flash_size(), "ram": 0, "arrays": 2, "tileset": tileset}
+    return estimates
+
+
+class BudgetPlan:
+    """预算规划结果"""
+
+    def __init__(self, estimates, flash_budget, ram_budget, requested="auto", ld_path=None, saved_by_blob=None):
+        self.estimates = estimates
+        self.saved_by_blob = saved_by_blob
+        self.flash_budget = flash_budget
+        self.ram_budget = ram_budget
+        self.requested = requested
+        self.ld_path = ld_path
+
+        self.available = [e for e in ENCODINGS if e in estimates]
+        fitting = [e for e in self.available if self.fits_encoding(e)]
+        if requested == "auto" and "raw" in fitting:
+            # 原始编码放得下时不换编码，输出的 image_array[] 与原来的用法一致
+            self.encoding = "raw"
+        elif requested == "auto":
+            # 放得下的编码中选 Flash 最小的; 都放不下时也选最小的并给出警告 (图块编码不参与)
+            candidates = [e for e in self.available if e in AUTO_ENCODINGS]
+            pool = [e for e in candidates if e in fitting] or candidates
+            self.encoding = min(pool, key=lambda e: (estimates[e]["flash"], estimates[e]["ram"]))
+        elif requested in self.available:
+            self.encoding = requested
+        elif requested == "tiles":
+            raise ValueError(f"图块编码要求所有帧尺寸相同，且不同图块不超过 {oled_tiles.MAX_WORD_TILES} 个")
+        else:
+            raise ValueError(f"{ENCODING_NAMES.get(requested, requested)}编码要求所有帧尺寸相同")
+        self.fits = self.fits_encoding(self.encoding)
+
+    def fits_encoding(self, encoding):
+        """该编码是否放得下 (没有预算信息时视为放得下)"""
+        est = self.estimates[encoding]
+        flash_ok = self.flash_budget is None or est["flash"] <= self.flash_budget
+        ram_ok = self.ram_budget is None or est["ram"] <= self.ram_budget
+        return flash_ok and ram_ok
+
+    def report(self):
+        """生成可读的预算报告"""
+        lines = []
+        if self.ld_path:
+            lines.append(f"链接脚本: {os.path.basename(self.ld_path)}")
+        if self.flash_budget is not None:
+            lines.append(f"可用于帧数据: Flash {self.flash_budget / 1024:.1f} KB, RAM {self.ram_budget / 1024:.1f} KB")
+        for encoding in self.available:
+            est = self.estimates[encoding]
+            mark = "*" if encoding == self.encoding else " "
+            state = "" if self.fits_encoding(encoding) else "  (超出)"
+            lines.append(f"{mark} {ENCODING_NAMES[encoding]:<6} Flash {est['flash'] / 1024:7.2f} KB, "
+                         f"RAM {est['ram']:5d} B{state}")
+        if self.saved_by_blob is not None:
+            lines.append(f"连续存放: 元数据比每帧一个数组 + 指针数组少 {self.saved_by_blob} B")
+        if "tiles" in self.estimates:
+            lines.append(self.estimates["tiles"]["tileset"].summary(self.estimates["raw"]["flash"]))
+        if not self.fits:
+            lines.append(f"警告: {ENCODING_NAMES[self.encoding]}编码超出预算，链接时会失败")
+        return "\n".join(lines)
+
+    def summary(self):
+        """单行摘要，用于状态栏和文件注释"""
+        est = self.estimates[self.encoding]
+        text = f"帧编码: {ENCODING_NAMES[self.encoding]}, Flash {est['flash'] / 1024:.2f} KB"
+        if self.flash_budget is not None:
+            text += f" / {self.flash_budget / 1024:.1f} KB"
+        if est["ram"]:
+            text += f", RAM {est['ram']} B"
+        return text
+
+
+def frame_sizes_for(frames_info):
+    """frames_info 中每帧的 (宽, 高)"""
+    return [(info[1], info[2]) for info in frames_info]
+
+
+def tile_shape_for(frames_info, mode):
+    """所有帧尺寸相同时返回图块编码需要的 (宽, 高, 取模方式)，否则为 None"""
+    sizes = {(info[1], info[2]) for info in frames_info}
+    return (*sizes.pop(), mode) if len(sizes) == 1 else None
+
+
+def plan_export(frames, ld_path=None, flash_reserve_kb=DEFAULT_FLASH_RESERVE_KB,
+                ram_reserve_kb=DEFAULT_RAM_RESERVE_KB, encoding="auto", with_tables=True, blob=False,
+                tile_shape=None, frame_sizes=None, compare_tiles=False):
+    """估算帧数据大小并选择编码; 找不到链接脚本时只做估算不做检查
+
+    frame_sizes: 每帧的 (宽, 高) (见 frame_sizes_for)
+    图块编码不参与自动选择，整个序列切图块去重只在 encoding 为 "tiles" 或
+    compare_tiles 为真 (报告中列出图块编码) 时进行。
+    """
+    if encoding != "tiles" and not compare_tiles:
+        tile_shape = None
+    with oled_timing.span("budget"):
+        estimates = estimate_sizes(frames, with_tables, blob, tile_shape, frame_sizes)
+    saved_by_blob = None
+    if blob:
+        saved_by_blob = table_size(frames) - table_size(frames, True, sum(int(f.size) for f in frames), frame_sizes)
+
+    flash_budget = ram_budget = None
+    if ld_path:
+        regions, heap_stack = parse_linker_script(ld_path)
+        if "FLASH" in regions:
+            flash_budget = max(regions["FLASH"][1] - int(flash_reserve_kb * 1024), 0)
+        if "RAM" in regions:
+            ram_budget = max(regions["RAM"][1] - heap_stack - int(ram_reserve_kb * 1024), 0)
+
+    return BudgetPlan(estimates, flash_budget, ram_budget, encoding, ld_path, saved_by_blob)
+
+
+def duplicate_map(frames):
+    """返回每帧第一次出现的序号，用于去重编码"""
+    first = {}
+    return [first.setdefault(oled_core.frame_key(f), i) for i, f in enumerate(frames)]
+
+
+def frames_for_encoding(frames, encoding):
+    """按编码返回要写出的数组列表 (去重时重复帧为 None)"""
+    if encoding == "delta_rle":
+        return oled_core.delta_rle_encode(frames)
+    if encoding == "dedup":
+        return [f if j == i else None for i, (f, j) in enumerate(zip(frames, duplicate_map(frames)))]
+    return list(frames)
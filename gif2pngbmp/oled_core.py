@@ -0,0 +1,560 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+OLED 取模核心: 解码、直方图、阈值选择、二值化与打包
+
+2in1.py 的预览和导出都经过这里，所有运算都按整帧/整组帧向量化完成。
+"""
+
+import hashlib
+import os
+import re
+import threading
+from collections import OrderedDict
+
+import numpy as np
+from PIL import Image
+
+import oled_timing
+from oled_defaults import THRESHOLD_MODE_NAMES, THRESHOLD_MODES
+
+# 自适应阈值的分块大小 (与SSD1306页高度一致)
+ADAPTIVE_TILE = 8
+
+# 抖动方式
+DITHER_MODES = ("none", "bayer")
+DITHER_NAMES = {
+    "none": "不抖动",
+    "bayer": "有序抖动 (Bayer 8x8)",
+}
+
+
+def natural_sort_key(s):
+    """自然排序的键函数，文件按 1, 2, 10 而不是 1, 10, 2 的顺序排列"""
+    return [int(text) if text.isdigit() else text.lower() for text in re.split(r'(\d+)', s)]
+
+
+def bayer_matrix(order=3):
+    """2^order 阶 Bayer 矩阵，取值 0 .. 4^order-1"""
+    m = np.zeros((1, 1), dtype=np.int64)
+    for _ in range(order):
+        m = np.block([[4 * m, 4 * m + 2], [4 * m + 3, 4 * m + 1]])
+    return m
+
+
+BAYER_8 = bayer_matrix(3)
+
+
+def to_gray(img, target_width=None, target_height=None):
+    """按需调整大小并转换为灰度 uint8 数组"""
+    if target_width and target_height:
+        img = img.resize((target_width, target_height), Image.LANCZOS)
+    if img.mode != 'L':
+        img = img.convert('L')
+    return np.asarray(img, dtype=np.uint8).copy()
+
+
+def decode_gray(image_path, target_width=None, target_height=None):
+    """打开图像、按需调整大小并转换为灰度 uint8 数组"""
+    with Image.open(image_path) as img:
+        return to_gray(img, target_width, target_height)
+
+
+def compute_histograms(stack):
+    """计算一组灰度帧的256级直方图，stack 形状为 (N, H, W) 或 (H, W)"""
+    stack = np.asarray(stack, dtype=np.uint8)
+    if stack.ndim == 2:
+        return np.bincount(stack.ravel(), minlength=256).astype(np.int64)
+
+    count = stack.shape[0]
+    # 每帧加上 i*256 的偏移，一次 bincount 得到所有帧的直方图
+    offsets = (np.arange(count, dtype=np.int64) * 256)[:, None]
+    flat = stack.reshape(count, -1).astype(np.int64) + offsets
+    return np.bincount(flat.ravel(), minlength=count * 256).reshape(count, 256)
+
+
+def otsu_thresholds(hists):
+    """根据直方图计算 Otsu 阈值，hists 形状为 (256,) 或 (N, 256)"""
+    hists = np.asarray(hists, dtype=np.float64)
+    single = hists.ndim == 1
+    hists = np.atleast_2d(hists)
+
+    levels = np.arange(256, dtype=np.float64)
+    total = hists.sum(axis=1, keepdims=True)
+    total[total == 0] = 1
+
+    # 以阈值 t 划分 [0, t) 与 [t, 255]，与二值化规则 gray >= t 一致
+    w0 = np.cumsum(hists, axis=1) / total
+    mu = np.cumsum(hists * levels, axis=1) / total
+    mu_t = mu[:, -1:]
+    w0 = np.concatenate([np.zeros((hists.shape[0], 1)), w0[:, :-1]], axis=1)
+    mu = np.concatenate([np.zeros((hists.shape[0], 1)), mu[:, :-1]], axis=1)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        between = (mu_t * w0 - mu) ** 2 / (w0 * (1.0 - w0))
+    between[~np.isfinite(between)] = -1.0
+
+    result = np.argmax(between, axis=1).astype(np.int64)
+    # 单一灰度的帧没有可分的类，退回中值
+    result[between.max(axis=1) <= 0] = 128
+    return int(result[0]) if single else result
+
+
+def percentile_thresholds(hists, percent=50.0):
+    """根据直方图计算百分位阈值: 约 percent% 的像素低于阈值"""
+    hists = np.asarray(hists, dtype=np.float64)
+    single = hists.ndim == 1
+    hists = np.atleast_2d(hists)
+
+    cdf = np.cumsum(hists, axis=1)
+    target = cdf[:, -1:] * (float(percent) / 100.0)
+    # 第一个累计数达到目标的灰度级，阈值取其下一级
+    result = np.minimum(np.argmax(cdf >= target, axis=1) + 1, 255).astype(np.int64)
+    return int(result[0]) if single else result
+
+
+def tile_histograms(gray, tile=ADAPTIVE_TILE):
+    """计算单帧按 tile x tile 分块的直方图，返回 (行块数, 列块数, 256)"""
+    gray = np.asarray(gray, dtype=np.uint8)
+    height, width = gray.shape
+    rows = (height + tile - 1) // tile
+    cols = (width + tile - 1) // tile
+
+    tile_index = (np.arange(height)[:, None] // tile) * cols + (np.arange(width)[None, :] // tile)
+    flat = tile_index.astype(np.int64) * 256 + gray
+    return np.bincount(flat.ravel(), minlength=rows * cols * 256).reshape(rows, cols, 256)
+
+
+def adaptive_threshold_map(tile_hists, shape, offset=0, tile=ADAPTIVE_TILE):
+    """由分块直方图计算每块的局部均值，并展开为逐像素阈值图"""
+    levels = np.arange(256, dtype=np.float64)
+    counts = tile_hists.sum(axis=-1)
+    counts[counts == 0] = 1
+    means = (tile_hists * levels).sum(axis=-1) / counts
+
+    tiles = np.clip(np.rint(means) - offset, 0, 255).astype(np.uint8)
+    height, width = shape
+    return np.repeat(np.repeat(tiles, tile, axis=0), tile, axis=1)[:height, :width]
+
+
+def select_thresholds(hists, mode="manual", manual=128, percent=50.0, per_frame=True):
+    """为一组帧选择全局阈值，返回长度为 N 的数组 (自适应模式另行处理)"""
+    hists = np.atleast_2d(np.asarray(hists))
+    count = hists.shape[0]
+
+    if mode in ("manual", "adaptive"):
+        return np.full(count, int(manual), dtype=np.int64)
+
+    # 全局模式: 合并所有帧的直方图后只算一次
+    source = hists if per_frame else hists.sum(axis=0, keepdims=True)
+    if mode == "otsu":
+        values = otsu_thresholds(source)
+    elif mode == "percentile":
+        values = percentile_thresholds(source, percent)
+    else:
+        raise ValueError(f"未知的阈值模式: {mode}")
+
+    return np.broadcast_to(values, (count,)).astype(np.int64)
+
+
+def binarize(gray, threshold, invert=False):
+    """二值化: 灰度 >= 阈值 为 1，threshold 可以是标量或同形状的阈值图"""
+    with oled_timing.span("binarize"):
+        bits = np.asarray(gray) >= threshold
+        if invert:
+            bits = ~bits
+    return bits
+
+
+def dither_threshold(threshold, shape, mode="bayer"):
+    """在阈值 (标量或阈值图) 上叠加有序抖动的偏移，返回逐像素阈值图
+
+    阈值图在 threshold ± 127 之间按 Bayer 矩阵平铺，平坦的灰度区域按灰度比例点亮。
+    """
+    if mode == "none":
+        return threshold
+    if mode != "bayer":
+        raise ValueError(f"未知的抖动方式: {mode}")
+    height, width = shape
+    reps = (-(-height // BAYER_8.shape[0]), -(-width // BAYER_8.shape[1]))
+    offset = (np.tile(BAYER_8, reps)[:height, :width] + 0.5) * (255.0 / BAYER_8.size) - 127.5
+    return np.asarray(threshold, dtype=np.float64) + offset
+
+
+def pack_bits(bits, mode="horizontal"):
+    """将二值数组 (H, W) 打包为字节数组
+
+    horizontal: 每个字节代表8个水平像素，MSB在左，每行按字节补齐
+    vertical:   按列输出，每个字节代表8个垂直像素，LSB在上
+    """
+    with oled_timing.span("pack"):
+        bits = np.asarray(bits, dtype=bool)
+        if mode == "horizontal":
+            return np.packbits(bits, axis=-1).ravel()
+        return np.ascontiguousarray(pack_pages(bits).T).ravel()
+
+
+def pack_pages(bits):
+    """将二值数组 (H, W) 打包为SSD1306显存布局 (页数, W): 每页8行，LSB在上"""
+    bits = np.asarray(bits, dtype=bool)
+    height, width = bits.shape
+    pad = (-height) % 8
+    if pad:
+        bits = np.concatenate([bits, np.zeros((pad, width), dtype=bool)], axis=0)
+    return np.packbits(bits.reshape(-1, 8, width), axis=1, bitorder='little')[:, 0, :]
+
+
+def frame_key(frame):
+    """帧内容的 16 字节摘要，用于去重
+
+    直接对数组的内存做哈希 (内存映射的帧也不复制)，字典里只保存摘要而不是整帧的 bytes。
+    """
+    return hashlib.blake2b(np.ascontiguousarray(frame, dtype=np.uint8), digest_size=16).digest()
+
+
+def page_changes(prev_pages, pages):
+    """统计两帧显存之间每页变化的字节数 (即该页需要重新发送的字节)"""
+    if prev_pages is None or prev_pages.shape != pages.shape:
+        return np.full(pages.shape[0], pages.shape[1], dtype=np.int64)
+    return np.count_nonzero(prev_pages != pages, axis=1)
+
+
+def xor_delta(prev, data):
+    """与上一帧按字节异或，prev 为 None 时相当于与全0帧异或"""
+    data = np.asarray(data, dtype=np.uint8)
+    if prev is None:
+        return data.copy()
+    return np.bitwise_xor(np.asarray(prev, dtype=np.uint8), data)
+
+
+# RLE 每个记录最多覆盖的字节数，以及值得用重复记录编码的最短游程
+RLE_MAX_COUNT = 128
+RLE_MIN_RUN = 3
+
+
+def rle_encode(data):
+    """RLE 编码 (与固件 ssd1306_ApplyDeltaRLE 对应)
+
+    控制字节 c: 最高位为1时，下一个字节重复 (c & 0x7F) + 1 次;
+    否则后面跟 c + 1 个原样字节。
+    """
+    data = np.asarray(data, dtype=np.uint8).ravel()
+    if data.size == 0:
+        return np.zeros(0, dtype=np.uint8)
+
+    # 用 numpy 找出所有游程的起点和长度，再逐个游程 (而不是逐字节) 生成记录
+    starts = np.flatnonzero(np.concatenate(([True], data[1:] != data[:-1])))
+    lengths = np.diff(np.append(starts, data.size))
+
+    out = bytearray()
+    literal_start = None
+
+    def flush_literal(end):
+        for pos in range(literal_start, end, RLE_MAX_COUNT):
+            chunk = data[pos:min(pos + RLE_MAX_COUNT, end)]
+            out.append(chunk.size - 1)
+            out.extend(chunk.tobytes())
+
+    for start, length in zip(starts.tolist(), lengths.tolist()):
+        if length < RLE_MIN_RUN:
+            if literal_start is None:
+                literal_start = start
+            continue
+        if literal_start is not None:
+            flush_literal(start)
+            literal_start = None
+        value = int(data[start])
+        while length > 0:
+            count = min(length, RLE_MAX_COUNT)
+            out.append(0x80 | (count - 1))
+            out.append(value)
+            length -= count
+
+    if literal_start is not None:
+        flush_literal(data.size)
+
+    return np.frombuffer(bytes(out), dtype=np.uint8)
+
+
+def rle_decode(encoded, size):
+    """解码 rle_encode 的输出，返回 size 个字节"""
+    encoded = bytes(np.asarray(encoded, dtype=np.uint8).tobytes())
+    out = bytearray()
+    pos = 0
+    while len(out) < size:
+        ctrl = encoded[pos]
+        count = (ctrl & 0x7F) + 1
+        if ctrl & 0x80:
+            out.extend(encoded[pos + 1:pos + 2] * count)
+            pos += 2
+        else:
+            out.extend(encoded[pos + 1:pos + 1 + count])
+            pos += 1 + count
+    return np.frombuffer(bytes(out[:size]), dtype=np.uint8)
+
+
+def delta_rle_encode(frames):
+    """对一组等长帧做 异或差分 + RLE，第一帧与全0帧差分 (即关键帧)"""
+    encoded = []
+    prev = None
+    for data in frames:
+        encoded.append(rle_encode(xor_delta(prev, data)))
+        prev = data
+    return encoded
+
+
+def render_histogram(hist, height=64):
+    """把直方图渲染为 (height, 256) 的灰度图，柱高按平方根压缩以显示小峰"""
+    hist = np.sqrt(np.asarray(hist, dtype=np.float64))
+    peak = hist.max() or 1.0
+    bars = np.rint(hist / peak * height).astype(np.int64)
+    rows = np.arange(height)[::-1, None]
+    return np.where(rows < bars[None, :], 64, 235).astype(np.uint8)
+
+
+HEX_TOKENS = [f"0x{b:02x}" for b in range(256)]
+
+
+def format_byte_lines(data, per_line=16):
+    """将字节数据格式化为十六进制文本行 (每行 per_line 个，行尾不带逗号)"""
+    data = np.asarray(data, dtype=np.uint8)
+    tokens = [HEX_TOKENS[b] for b in data.ravel().tolist()]
+    return [", ".join(tokens[i:i + per_line]) for i in range(0, len(tokens), per_line)]
+
+
+def format_c_array(variable_name, data, per_line=16):
+    """将字节数据格式化为C数组定义"""
+    lines = format_byte_lines(data, per_line)
+    return f"const unsigned char {variable_name}[] = {{\n\t" + ", \n\t".join(lines) + "\n};"
+
+
+class CArrayText:
+    """按行取用的 C 数组文本，内容与 format_c_array 相同 (前面可加注释行)
+
+    只保存打包后的字节，取某几行时才格式化那几行: 代码预览只格式化可见的行，
+    保存和复制用 chunks() 分段生成全文。
+    """
+
+    def __init__(self, variable_name, data, per_line=16, comments=()):
+        self.data = np.asarray(data, dtype=np.uint8).ravel()
+        self.per_line = per_line
+        self.head = list(comments) + [f"const unsigned char {variable_name}[] = {{"]
+        self.data_lines = max(1, -(-self.data.size // per_line))
+
+    def __len__(self):
+        return len(self.head) + self.data_lines + 1
+
+    def lines(self, start, stop):
+        """第 start 到 stop-1 行 (不含换行符)"""
+        start, stop = max(0, start), min(len(self), stop)
+        out = []
+        for i in range(start, stop):
+            j = i - len(self.head)
+            if j < 0:
+                out.append(self.head[i])
+            elif j < self.data_lines:
+                row = self.data[j * self.per_line:(j + 1) * self.per_line].tolist()
+                tail = ", " if j < self.data_lines - 1 else ""
+                out.append("\t" + ", ".join(HEX_TOKENS[b] for b in row) + tail)
+            else:
+                out.append("};")
+        return out
+
+    def chunks(self, lines_per_chunk=4096):
+        """分段生成全文，拼起来与 str() 相同"""
+        total = len(self)
+        for start in range(0, total, lines_per_chunk):
+            stop = min(total, start + lines_per_chunk)
+            yield "\n".join(self.lines(start, stop)) + ("\n" if stop < total else "")
+
+    def __str__(self):
+        return "".join(self.chunks())
+
+
+def describe_threshold(mode, value):
+    """返回阈值的可读描述，用于预览和导出注释"""
+    if mode == "adaptive":
+        return f"{THRESHOLD_MODE_NAMES[mode]}, 平均 {float(np.mean(value)):.1f}"
+    return f"{int(value)} ({THRESHOLD_MODE_NAMES.get(mode, mode)})"
+
+
+class CachedFrame:
+    """缓存的解码帧: 灰度数组、直方图以及源图像信息"""
+    __slots__ = ("gray", "hist", "source_size", "source_format", "file_size", "_tile_hists")
+
+    def __init__(self, gray, source_size=None, source_format=None, file_size=0):
+        self.gray = gray
+        self.hist = compute_histograms(gray)
+        self.source_size = source_size or (gray.shape[1], gray.shape[0])
+        self.source_format = source_format
+        self.file_size = file_size
+        self._tile_hists = None
+
+    @property
+    def tile_hists(self):
+        """分块直方图按需计算后缓存"""
+        if self._tile_hists is None:
+            self._tile_hists = tile_histograms(self.gray)
+        return self._tile_hists
+
+
+class FrameCache:
+    """按 (路径, 修改时间, 目标尺寸) 缓存解码后的灰度帧和直方图 (LRU)
+
+    也可以登记不对应磁盘文件的内存帧 (例如从C数组导入的帧) 和帧存储/视频中的帧
+    (oled_store.FrameStore、oled_video 的读取器，按需从内存映射读取)，按名称访问。
+    """
+
+    def __init__(self, max_items=512):
+        self.max_items = max_items
+        self._items = OrderedDict()
+        self._memory = {}
+        self._stored = {}
+        self._lock = threading.Lock()
+
+    def add_memory_frame(self, name, gray, source_format="C数组", file_size=0):
+        """登记一个内存帧 (灰度 uint8 数组)"""
+        with self._lock:
+            self._memory[name] = (np.asarray(gray, dtype=np.uint8), source_format, file_size)
+
+    def add_store(self, store, names):
+        """登记帧存储中的帧，names[i] 为第 i 帧的名称"""
+        with self._lock:
+            for index, name in enumerate(names):
+                self._stored[name] = (store, index)
+
+    def stored_frame(self, name):
+        """帧存储中的帧返回 (存储, 序号)，否则为 None"""
+        return self._stored.get(name)
+
+    def is_memory_frame(self, name):
+        """是否为内存帧 (包括帧存储中的帧)"""
+        return name in self._memory or name in self._stored
+
+    def open_image(self, image_path):
+        """打开图像 (内存帧返回由灰度数组生成的图像)"""
+        if image_path in self._memory:
+            return Image.fromarray(self._memory[image_path][0])
+        if image_path in self._stored:
+            store, index = self._stored[image_path]
+            return Image.fromarray(np.asarray(store.gray(index)))
+        return Image.open(image_path)
+
+    def get(self, image_path, target_width=None, target_height=None):
+        """获取缓存帧，未命中时解码并计算直方图"""
+        size = (target_width, target_height) if target_width and target_height else None
+        memory = self._memory.get(image_path)
+        stored = self._stored.get(image_path)
+        key = (image_path, None if (memory or stored) else os.path.getmtime(image_path), size)
+
+        with self._lock:
+            frame = self._items.get(key)
+            if frame is not None:
+                self._items.move_to_end(key)
+                return frame
+
+        if memory:
+            gray, source_format, file_size = memory
+            img = Image.fromarray(gray)
+            frame = CachedFrame(to_gray(img, target_width, target_height), img.size, source_format, file_size)
+        elif stored:
+            # 尺寸相同时直接使用内存映射中的视图 (二值存储按需解包)
+            store, index = stored
+            with oled_timing.span("decode"):
+                gray = store.gray(index)
+            if size and size != (store.width, store.height):
+                with oled_timing.span("resize"):
+                    gray = to_gray(Image.fromarray(np.asarray(gray)), target_width, target_height)
+            frame = CachedFrame(gray, (store.width, store.height), store.source_format, store.frame_size)
+        else:
+            with Image.open(image_path) as img:
+                with oled_timing.span("decode"):
+                    img.load()
+                with oled_timing.span("resize"):
+                    gray = to_gray(img, target_width, target_height)
+                frame = CachedFrame(gray, img.size, img.format, os.path.getsize(image_path))
+
+        with self._lock:
+            self._items[key] = frame
+            while len(self._items) > self.max_items:
+                self._items.popitem(last=False)
+        return frame
+
+    def clear(self):
+        """清空缓存 (包括内存帧)"""
+        with self._lock:
+            self._items.clear()
+            self._memory.clear()
+            self._stored.clear()
+
+
+def frame_thresholds(frames, mode="manual", manual=128, percent=50.0, per_frame=True, adaptive_offset=0):
+    """为一组缓存帧计算阈值; 自适应模式下每帧返回一张阈值图"""
+    if mode == "adaptive":
+        return [adaptive_threshold_map(f.tile_hists, f.gray.shape, adaptive_offset) for f in frames]
+
+    hists = np.stack([f.hist for f in frames]) if frames else np.zeros((0, 256), dtype=np.int64)
+    return list(select_thresholds(hists, mode, manual, percent, per_frame))
+
+
+def threshold_note(mode, per_frame=True):
+    """输出文件中说明阈值模式的注释行"""
+    note = f"// 阈值模式: {THRESHOLD_MODE_NAMES[mode]}"
+    if mode in ("otsu", "percentile"):
+        note += " (逐帧)" if per_frame else " (全局)"
+    return note
+
+
+def convert_frames(cache, paths, target_width=None, target_height=None, threshold_mode="manual", manual=128,
+                   percent=50.0, per_frame=True, invert=False, mode="horizontal", on_frame=None):
+    """导出流程: 从帧缓存取帧、计算阈值、二值化并打包，返回 (打包帧列表, frames_info)
+
+    2in1.py 的导出和 benchmark.py 都经过这里; on_frame(序号, 路径) 在处理每帧之前调用。
+    """
+    frames = [cache.get(p, target_width, target_height) for p in paths]
+    thresholds = frame_thresholds(frames, threshold_mode, manual, percent, per_frame,
+                                  adaptive_offset=manual - 128)
+    packed, frames_info = [], []
+    for i, (path, frame, threshold) in enumerate(zip(paths, frames, thresholds)):
+        if on_frame:
+            on_frame(i, path)
+        height, width = frame.gray.shape
+        packed.append(pack_bits(binarize(frame.gray, threshold, invert), mode))
+        frames_info.append((os.path.basename(path), width, height, describe_threshold(threshold_mode, threshold)))
+    return packed, frames_info
+
+
+def extract_gif_frames(gif_path, output_dir, resize=True, convert_bw=False, threshold=128, on_frame=None):
+    """把 GIF 逐帧保存为 PNG (可选调整到 128x64、二值化)，返回 (帧路径列表, 每帧持续时间ms)
+
+    同时写出 frame_info.txt; on_frame(已保存帧数, 总帧数) 在每帧保存后调用。
+    """
+    frames = []
+    with Image.open(gif_path) as gif:
+        duration = gif.info.get('duration', 100)
+        total = getattr(gif, "n_frames", 1)
+        for index in range(total):
+            with oled_timing.span("decode"):
+                gif.seek(index)
+                frame = gif.copy()
+
+            if resize:
+                with oled_timing.span("resize"):
+                    frame = frame.resize((128, 64), Image.LANCZOS)
+
+            if convert_bw:
+                with oled_timing.span("binarize"):
+                    frame = frame.convert("L")
+                    frame = frame.point(lambda x: 255 if x > threshold else 0, '1')
+
+            frame_path = os.path.join(output_dir, f"frame_{index:03d}.png")
+            with oled_timing.span("write"):
+                frame.save(frame_path, "PNG")
+            frames.append(frame_path)
+            if on_frame:
+                on_frame(index + 1, total)
+
+    with open(os.path.join(output_dir, "frame_info.txt"), 'w') as f:
+        f.write(f"总帧数: {len(frames)}\n")
+        f.write(f"每帧持续时间: {duration}ms\n")
+    return frames, duration
@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+界面启动时就要用到的常量 (阈值模式、帧编码、预算预留、总线时钟、推流波特率)
+
+不导入 numpy/PIL: 2in1.py 启动时只导入这个模块就能建出主界面，
+oled_core、oled_budget 等模块从这里导入同名常量，取值只在这里维护。
+"""
+
+# 阈值模式
+THRESHOLD_MODES = ("manual", "otsu", "percentile", "adaptive")
+THRESHOLD_MODE_NAMES = {
+    "manual": "手动",
+    "otsu": "Otsu",
+    "percentile": "百分位",
+    "adaptive": "自适应(分块均值)",
+}
+
+# 帧编码
+ENCODINGS = ("raw", "dedup", "delta_rle", "tiles")
+# "自动" 只在这些编码中选择; 图块编码输出的是图块集和索引表 (没有 image_array[])，
+# 固件要改用 TILEMAP_DRAW，所以只在明确选择时使用
+AUTO_ENCODINGS = ("raw", "dedup", "delta_rle")
+ENCODING_NAMES = {
+    "auto": "自动",
+    "raw": "原始",
+    "dedup": "去重",
+    "delta_rle": "差分RLE",
+    "tiles": "图块",
+}
+
+# 代码、常量 (字体等) 和运行时变量的默认预留
+DEFAULT_FLASH_RESERVE_KB = 24
+DEFAULT_RAM_RESERVE_KB = 4
+
+# SPI1 在 APB2 (72MHz) 上 4 分频
+DEFAULT_SPI_HZ = 18e6
+
+# 串口推流的默认波特率 (握手使用 MX_USART1_UART_Init 的 115200)
+DEFAULT_BAUD = 921600
@@ -0,0 +1,464 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SSD1306 / CH1116 屏幕仿真
+
+按驱动 (ssd1306/ssd1306.c) 实际发送的命令/数据字节流更新 GRAM 模型，逐像素还原
+屏幕显示，并按总线时钟估算每帧的传输时间，从而在没有硬件时预估动画能达到的帧率。
+
+模型说明:
+  - SSD1306 的 GRAM 为 128 列，CH1116 (与 SH1106 兼容) 为 132 列，面板显示中间
+    128 列，所以 ssd1306_conf.h 中的 SSD1306_X_OFFSET = 2
+  - 0xB0~0xB7 和 0x00~0x1F 在任何寻址模式下都设置页/列指针 (驱动依赖这一点)
+  - 方向以驱动默认的 0xA1 + 0xC8 为正向，0xA0/0xC0 分别为水平/垂直镜像
+  - 总线时间 = 字节数 x 每字节位数 / 时钟 + 每次传输的固定开销 (HAL 调用、CS/DC 翻转)
+  - 面板扫描帧率 = 振荡频率 / (分频 x 每行时钟数 x 复用行数)，由 0xD5/0xD9/0xA8 决定
+
+用法:
+  python oled_emulator.py test4.h                       估算帧率
+  python oled_emulator.py test4.h --spi-mhz 9 --delay 50
+"""
+
+import argparse
+import os
+import re
+import sys
+
+import numpy as np
+
+from oled_defaults import DEFAULT_SPI_HZ
+
+CONTROLLERS = ("ssd1306", "ch1116")
+
+# GRAM 列数
+GRAM_COLUMNS = {"ssd1306": 128, "ch1116": 132}
+GRAM_PAGES = 8
+
+# 带参数的命令: 命令字节 -> 参数个数 (CH1116 没有 0x20/0x21/0x22/0x8D，这些字节按单字节命令处理)
+SSD1306_PARAMS = {
+    0x20: 1, 0x21: 2, 0x22: 2, 0x81: 1, 0x8D: 1, 0xA3: 2, 0xA8: 1,
+    0xD3: 1, 0xD5: 1, 0xD9: 1, 0xDA: 1, 0xDB: 1,
+    0x26: 6, 0x27: 6, 0x29: 5, 0x2A: 5,
+}
+CH1116_PARAMS = {0x81: 1, 0xA8: 1, 0xAD: 1, 0xD3: 1, 0xD5: 1, 0xD9: 1, 0xDA: 1, 0xDB: 1}
+
+# 72MHz 下 HAL_SPI_Transmit 调用和两次 HAL_GPIO_WritePin 的大致开销
+DEFAULT_OVERHEAD_US = 2.0
+
+# 内部振荡器频率: 数据手册只给出复位设置 (0xD5 高4位 = 8) 的典型值，设置更高时实际更快，
+# 用这个值估算的面板帧率偏低 (闪烁检查偏保守)
+DEFAULT_OSC_HZ = 370e3
+# 每行扫描中 BANK0 段驱动脉宽占用的时钟数 (另加预充电两个阶段)
+BANK0_DCLKS = 50
+
+DEFINE_RE = re.compile(r'^[ \t]*#[ \t]*define[ \t]+(\w+)[ \t]*([^\n]*?)[ \t]*(?://.*)?$', re.MULTILINE)
+
+
+class DriverConfig:
+    """ssd1306_conf.h 中影响显示和总线的配置"""
+
+    def __init__(self, width=128, height=64, x_offset=0, mirror_vert=False, mirror_horiz=False,
+                 inverse=False, bus="spi"):
+        self.width = width
+        self.height = height
+        self.x_offset = x_offset
+        self.mirror_vert = mirror_vert
+        self.mirror_horiz = mirror_horiz
+        self.inverse = inverse
+        self.bus = bus
+
+    @property
+    def pages(self):
+        return self.height // 8
+
+
+def parse_conf(path):
+    """读取 ssd1306_conf.h (只看未注释的 #define)"""
+    with open(path, 'r', encoding='utf-8', errors='replace') as f:
+        defines = dict(DEFINE_RE.findall(f.read()))
+
+    def number(name, default):
+        value = defines.get(name, "").strip("() ")
+        return int(value, 0) if value else default
+
+    return DriverConfig(
+        width=number("SSD1306_WIDTH", 128),
+        height=number("SSD1306_HEIGHT", 64),
+        x_offset=number("SSD1306_X_OFFSET", 0),
+        mirror_vert="SSD1306_MIRROR_VERT" in defines,
+        mirror_horiz="SSD1306_MIRROR_HORIZ" in defines,
+        inverse="SSD1306_INVERSE_COLOR" in defines,
+        bus="i2c" if "SSD1306_USE_I2C" in defines else "spi",
+    )
+
+
+def find_conf(start_dir):
+    """查找工程中的 ssd1306/ssd1306_conf.h"""
+    directory = os.path.abspath(start_dir)
+    while True:
+        path = os.path.join(directory, "ssd1306", "ssd1306_conf.h")
+        if os.path.exists(path):
+            return path
+        parent = os.path.dirname(directory)
+        if parent == directory:
+            return None
+        directory = parent
+
+
+class BusModel:
+    """总线时间模型"""
+
+    def __init__(self, bus="spi", clock_hz=DEFAULT_SPI_HZ, overhead_us=DEFAULT_OVERHEAD_US):
+        self.bus = bus
+        self.clock_hz = float(clock_hz)
+        self.overhead = overhead_us * 1e-6
+
+    def transaction_time(self, nbytes):
+        """一次传输 (一次 ssd1306_WriteCommand/WriteData) 的时间，秒"""
+        if self.bus == "i2c":
+            # 地址字节 + 控制字节，每字节 9 位 (含 ACK)
+            return (nbytes + 2) * 9 / self.clock_hz + self.overhead
+        return nbytes * 8 / self.clock_hz + self.overhead
+
+
+class OledEmulator:
+    """SSD1306/CH1116 的 GRAM 与命令解码模型"""
+
+    def __init__(self, controller="ch1116", width=128, height=64, bus=None):
+        if controller not in CONTROLLERS:
+            raise ValueError(f"未知的控制器: {controller}")
+        self.controller = controller
+        self.width = width
+        self.height = height
+        self.columns = GRAM_COLUMNS[controller]
+        self.params = SSD1306_PARAMS if controller == "ssd1306" else CH1116_PARAMS
+        self.bus = bus or BusModel()
+        self.conf = None  # make_emulator 创建时为对应的 DriverConfig
+        self.reset()
+
+    def reset(self):
+        """硬件复位后的状态"""
+        self.gram = np.zeros((GRAM_PAGES, self.columns), dtype=np.uint8)
+        self.page = 0
+        self.column = 0
+        self.addressing = 2  # 页寻址
+        self.column_range = (0, self.columns - 1)
+        self.page_range = (0, GRAM_PAGES - 1)
+        self.display_on = False
+        self.entire_on = False
+        self.inverse = False
+        self.seg_remap = False
+        self.com_reverse = False
+        self.start_line = 0
+        self.display_offset = 0
+        self.multiplex = 64
+        self.contrast = 0x7F
+        self.clock_div = 0x80
+        self.precharge = 0x22
+        self.bus_time = 0.0
+        self.bytes_sent = 0
+        self._pending = None
+        self._args = []
+
+    # ---- 字节流 ----
+
+    def write(self, dc, data):
+        """一次传输: dc=0 为命令，dc=1 为数据，返回这次传输的总线时间"""
+        data = bytes(data)
+        if dc:
+            self._write_data(data)
+        else:
+            for byte in data:
+                self._command(byte)
+        elapsed = self.bus.transaction_time(len(data))
+        self.bus_time += elapsed
+        self.bytes_sent += len(data)
+        return elapsed
+
+    def replay(self, transactions):
+        """依次执行 [(dc, bytes)]，返回总线时间"""
+        return sum(self.write(dc, data) for dc, data in transactions)
+
+    def _command(self, byte):
+        if self._pending is not None:
+            self._args.append(byte)
+            if len(self._args) == self.params[self._pending]:
+                self._execute(self._pending, self._args)
+                self._pending = None
+            return
+
+        if byte in self.params:
+            self._pending, self._args = byte, []
+        else:
+            self._execute(byte, [])
+
+    def _execute(self, cmd, args):
+        if 0x20 <= cmd <= 0x22 and cmd not in self.params:
+            return  # CH1116 没有水平/垂直寻址，参数字节会被当作下一条命令
+        if cmd <= 0x0F:
+            self.column = (self.column & 0xF0) | cmd
+        elif cmd <= 0x1F:
+            self.column = (self.column & 0x0F) | ((cmd & 0x0F) << 4)
+        elif cmd == 0x20:
+            self.addressing = args[0] & 0x03
+        elif cmd == 0x21:
+            self.column_range = (args[0] & 0x7F, args[1] & 0x7F)
+            self.column = self.column_range[0]
+        elif cmd == 0x22:
+            self.page_range = (args[0] & 0x07, args[1] & 0x07)
+            self.page = self.page_range[0]
+        elif 0x40 <= cmd <= 0x7F:
+            self.start_line = cmd & 0x3F
+        elif cmd == 0x81:
+            self.contrast = args[0]
+        elif cmd in (0xA0, 0xA1):
+            self.seg_remap = cmd == 0xA1
+        elif cmd in (0xA4, 0xA5):
+            self.entire_on = cmd == 0xA5
+        elif cmd in (0xA6, 0xA7):
+            self.inverse = cmd == 0xA7
+        elif cmd == 0xA8:
+            self.multiplex = (args[0] & 0x3F) + 1
+        elif cmd in (0xAE, 0xAF):
+            self.display_on = cmd == 0xAF
+        elif 0xB0 <= cmd <= 0xB7:
+            self.page = cmd & 0x07
+        elif cmd in (0xC0, 0xC8):
+            self.com_reverse = cmd == 0xC8
+        elif cmd == 0xD3:
+            self.display_offset = args[0] & 0x3F
+        elif cmd == 0xD5:
+            self.clock_div = args[0]
+        elif cmd == 0xD9:
+            self.precharge = args[0]
+        # 其他命令 (时钟、预充电、电荷泵、滚动等) 不影响显示内容
+
+    def _write_data(self, data):
+        if self.addressing == 0 and self.controller == "ssd1306":
+            col_start, col_end = self.column_range
+            page_start, page_end = self.page_range
+            for byte in data:
+                self.gram[self.page, self.column % self.columns] = byte
+                self.column += 1
+                if self.column > col_end:
+                    self.column = col_start
+                    self.page = page_start if self.page >= page_end else self.page + 1
+        elif self.addressing == 1 and self.controller == "ssd1306":
+            col_start, col_end = self.column_range
+            page_start, page_end = self.page_range
+            for byte in data:
+                self.gram[self.page, self.column % self.columns] = byte
+                self.page += 1
+                if self.page > page_end:
+                    self.page = page_start
+                    self.column = col_start if self.column >= col_end else self.column + 1
+        else:
+            # 页寻址 (CH1116 只有这种): 列指针递增，到末尾回绕，页不变
+            start = self.column % self.columns
+            count = min(len(data), self.columns - start)
+            self.gram[self.page, start:start + count] = np.frombuffer(data[:count], dtype=np.uint8)
+            rest = data[count:]
+            while rest:
+                chunk = rest[:self.columns]
+                self.gram[self.page, :len(chunk)] = np.frombuffer(chunk, dtype=np.uint8)
+                rest = rest[self.columns:]
+            self.column = (start + len(data)) % self.columns
+
+    # ---- 显示 ----
+
+    def frame_hz(self, osc_hz=DEFAULT_OSC_HZ):
+        """面板扫描帧率: Fosc / (D x K x 复用行数)
+
+        D 为 0xD5 低4位 + 1，K 为预充电阶段1、阶段2 (0xD9 低/高4位，0 按 1 计) 加 BANK0 脉宽。
+        """
+        divide = (self.clock_div & 0x0F) + 1
+        dclks = max(self.precharge & 0x0F, 1) + max(self.precharge >> 4, 1) + BANK0_DCLKS
+        return osc_hz / (divide * dclks * self.multiplex)
+
+    def gram_bits(self):
+        """GRAM 展开为 (64, 列数) 的 bool 数组"""
+        return np.unpackbits(self.gram[:, None, :], axis=1, bitorder='little').reshape(GRAM_PAGES * 8, self.columns).astype(bool)
+
+    def render(self):
+        """屏幕上实际显示的图像 (height, width) bool，方向以 0xA1 + 0xC8 为正向"""
+        if not self.display_on:
+            return np.zeros((self.height, self.width), dtype=bool)
+        if self.entire_on:
+            return np.ones((self.height, self.width), dtype=bool)
+
+        bits = self.gram_bits()
+        # 起始行和显示偏移让行循环移位，复用率决定点亮多少行
+        bits = np.roll(bits, -(self.start_line + self.display_offset) % bits.shape[0], axis=0)
+        rows = min(self.multiplex, self.height)
+
+        # 面板只接在中间的列上 (CH1116 为 2..129)
+        view = (self.columns - self.width) // 2
+        image = bits[:rows, view:view + self.width]
+        if not self.seg_remap:
+            image = image[:, ::-1]
+        if not self.com_reverse:
+            image = image[::-1, :]
+
+        if rows < self.height:
+            image = np.vstack([image, np.zeros((self.height - rows, self.width), dtype=bool)])
+        return ~image if self.inverse else image
+
+
+# ---- 驱动发送的字节流 (与 ssd1306.c 一致) ----
+
+def init_transactions(conf):
+    """ssd1306_Init() 发送的命令 (不含最后的清屏刷新)"""
+    height_mux = {32: 0x1F, 64: 0x3F, 128: 0x3F}[conf.height]
+    com_pins = {32: 0x02, 64: 0x12, 128: 0x12}[conf.height]
+    commands = [
+        0xAE,
+        0x20, 0x00,
+        0xB0,
+        0xC0 if conf.mirror_vert else 0xC8,
+        0x00, 0x10,
+        0x40,
+        0x81, 0xFF,
+        0xA0 if conf.mirror_horiz else 0xA1,
+        0xA7 if conf.inverse else 0xA6,
+        0xFF if conf.height == 128 else 0xA8, height_mux,
+        0xA4,
+        0xD3, 0x00,
+        0xD5, 0xF0,
+        0xD9, 0x22,
+        0xDA, com_pins,
+        0xDB, 0x20,
+        0x8D, 0x14,
+        0xAF,
+    ]
+    # 每个 ssd1306_WriteCommand 是一次单字节传输
+    return [(0, bytes([c])) for c in commands]
+
+
+def panel_hz(conf, controller="ssd1306", osc_hz=DEFAULT_OSC_HZ):
+    """按 ssd1306_Init() 发送的时钟分频、预充电和复用率估算面板扫描帧率 (Hz)"""
+    emulator = OledEmulator(controller, conf.width, conf.height)
+    emulator.replay(init_transactions(conf))
+    return emulator.frame_hz(osc_hz)
+
+
+def update_screen_transactions(buffer, conf):
+    """ssd1306_UpdateScreen() 发送的字节流: 每页 3 个命令 + 一行数据"""
+    buffer = np.asarray(buffer, dtype=np.uint8).reshape(conf.pages, conf.width)
+    lower = conf.x_offset & 0x0F
+    upper = (conf.x_offset >> 4) & 0x07
+    transactions = []
+    for page in range(conf.pages):
+        transactions.append((0, bytes([0xB0 + page])))
+        transactions.append((0, bytes([0x00 + lower])))
+        transactions.append((0, bytes([0x10 + upper])))
+        transactions.append((1, buffer[page].tobytes()))
+    return transactions
+
+
+def bitmap_to_buffer(bits, conf):
+    """ssd1306_Fill(Black) + ssd1306_DrawBitmap(0, 0, ..., White) 后的 SSD1306_Buffer"""
+    bits = np.asarray(bits, dtype=bool)
+    canvas = np.zeros((conf.height, conf.width), dtype=bool)
+    height = min(bits.shape[0], conf.height)
+    width = min(bits.shape[1], conf.width)
+    canvas[:height, :width] = bits[:height, :width]
+    packed = np.packbits(canvas.reshape(conf.pages, 8, conf.width), axis=1, bitorder='little')
+    return packed[:, 0, :]
+
+
+def expected_image(bits, conf):
+    """按配置 (镜像、反色) 屏幕上应当看到的图像"""
+    canvas = np.zeros((conf.height, conf.width), dtype=bool)
+    height = min(bits.shape[0], conf.height)
+    width = min(bits.shape[1], conf.width)
+    canvas[:height, :width] = bits[:height, :width]
+    if conf.mirror_horiz:
+        canvas = canvas[:, ::-1]
+    if conf.mirror_vert:
+        canvas = canvas[::-1, :]
+    return ~canvas if conf.inverse else canvas
+
+
+def make_emulator(conf, controller="ch1116", clock_hz=None, overhead_us=DEFAULT_OVERHEAD_US):
+    """按配置创建仿真器并执行初始化序列"""
+    if clock_hz is None:
+        clock_hz = DEFAULT_SPI_HZ if conf.bus == "spi" else 400e3
+    emulator = OledEmulator(controller, conf.width, conf.height, BusModel(conf.bus, clock_hz, overhead_us))
+    emulator.conf = conf
+    emulator.replay(init_transactions(conf))
+    emulator.replay(update_screen_transactions(np.zeros((conf.pages, conf.width), dtype=np.uint8), conf))
+    return emulator
+
+
+def simulate_frames(frames, conf, controller="ch1116", clock_hz=None, overhead_us=DEFAULT_OVERHEAD_US):
+    """逐帧回放 ssd1306_UpdateScreen 的字节流
+
+    frames 为 (H, W) bool 位图序列。返回 {"bus_ms": 每帧总线时间, "mismatch": 每帧与预期不同的像素数,
+    "images": 屏幕图像列表}
+    """
+    emulator = make_emulator(conf, controller, clock_hz, overhead_us)
+    bus_ms, mismatch, images = [], [], []
+    for bits in frames:
+        elapsed = emulator.replay(update_screen_transactions(bitmap_to_buffer(bits, conf), conf))
+        image = emulator.render()
+        bus_ms.append(elapsed * 1000)
+        mismatch.append(int(np.count_nonzero(image != expected_image(bits, conf))))
+        images.append(image)
+    return {"bus_ms": bus_ms, "mismatch": mismatch, "images": images}
+
+
+def format_report(result, conf, controller, clock_hz, frame_delay=None):
+    """帧率估算报告"""
+    bus_ms = result["bus_ms"]
+    if not bus_ms:
+        return "没有帧"
+    average = sum(bus_ms) / len(bus_ms)
+    lines = [
+        f"控制器: {controller.upper()}, {conf.width}x{conf.height}, X偏移 {conf.x_offset}, "
+        f"{conf.bus.upper()} {clock_hz / 1e6:g} MHz",
+        f"每帧总线时间: {average:.3f} ms (最大 {max(bus_ms):.3f} ms)",
+        f"总线限制的最高帧率: {1000 / average:.1f} fps",
+    ]
+    if frame_delay:
+        lines.append(f"加上 FRAME_DELAY {frame_delay} ms: {1000 / (average + frame_delay):.1f} fps")
+    bad = [i for i, m in enumerate(result["mismatch"]) if m]
+    if bad:
+        lines.append(f"警告: {len(bad)} 帧显示与位图不一致 (第 {bad[0]} 帧 {result['mismatch'][bad[0]]} 个像素)，"
+                     f"检查 X 偏移和控制器类型")
+    else:
+        lines.append("所有帧显示与位图一致")
+    return "\n".join(lines)
+
+
+def main():
+    import oled_import
+
+    parser = argparse.ArgumentParser(description="SSD1306/CH1116 屏幕仿真与帧率估算")
+    parser.add_argument("input", help="生成的 .h/.c 文件")
+    parser.add_argument("--conf", help="ssd1306_conf.h 路径 (默认在工程中查找)")
+    parser.add_argument("--controller", choices=CONTROLLERS, default="ch1116")
+    parser.add_argument("--spi-mhz", type=float, default=DEFAULT_SPI_HZ / 1e6, help="总线时钟 (MHz)")
+    parser.add_argument("--overhead-us", type=float, default=DEFAULT_OVERHEAD_US, help="每次传输的固定开销 (us)")
+    parser.add_argument("--delay", type=int, help="每帧延时 (ms)，用于估算实际帧率")
+    parser.add_argument("--mode", choices=("horizontal", "vertical"), default="horizontal", help="取模方式")
+    parser.add_argument("--png-dir", help="把仿真的屏幕图像保存为 PNG")
+    args = parser.parse_args()
+
+    conf_path = args.conf or find_conf(os.path.dirname(os.path.abspath(args.input)))
+    conf = parse_conf(conf_path) if conf_path else DriverConfig()
+    frames = [f.bits for f in oled_import.parse_c_file(args.input, args.mode)]
+    clock_hz = args.spi_mhz * 1e6
+
+    result = simulate_frames(frames, conf, args.controller, clock_hz, args.overhead_us)
+    print(format_report(result, conf, args.controller, clock_hz, args.delay))
+
+    if args.png_dir:
+        from PIL import Image
+        os.makedirs(args.png_dir, exist_ok=True)
+        for i, image in enumerate(result["images"]):
+            Image.fromarray(image.astype(np.uint8) * 255).save(os.path.join(args.png_dir, f"oled_{i:03d}.png"))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,515 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+帧数据导出: 生成C代码文本、按内容哈希写文件、登记到 CMakeLists.txt
+
+三种布局:
+  single  单个文件，包含全部定义 (原有的 .c 输出，可直接 #include)
+  header  成对输出中的 .h，只有声明和元数据 (宏)
+  source  成对输出中的 .c，包含全部定义，作为源文件单独编译一次
+
+帧数据可以每帧一个数组 + 指针数组 (原有格式)，也可以连续存放在一个对齐的
+image_data[] 中，用 uint16_t 偏移表和访问宏 IMAGE_PTR(i) 取帧。
+图块编码另有 tile_set[] + tile_maps[] 布局 (见 render_tilemap)，位平面灰度见 render_greyscale，
+带透明遮罩的精灵见 render_sprites。
+"""
+
+import hashlib
+import os
+import re
+from datetime import datetime
+
+import oled_budget
+import oled_core
+import oled_timing
+
+LAYOUTS = ("single", "header", "source")
+
+# 不参与内容哈希的行 (每次生成都会变化)
+VOLATILE_LINE_RE = re.compile(r'^// 生成时间:.*$', re.MULTILINE)
+
+TARGET_SOURCES_RE = re.compile(r'target_sources\(\$\{CMAKE_PROJECT_NAME\}\s+PRIVATE\b(.*?)\)', re.DOTALL)
+TARGET_INCLUDES_RE = re.compile(r'target_include_directories\(\$\{CMAKE_PROJECT_NAME\}\s+PRIVATE\b(.*?)\)', re.DOTALL)
+
+
+def file_banner():
+    """生成文件开头的说明注释"""
+    return ("// 此文件由OLED图像取模工具生成\n"
+            "// 生成时间: " + datetime.now().strftime("%Y-%m-%d %H:%M:%S") + "\n"
+            "// 编码: UTF-8\n\n")
+
+
+def header_guard(header_path):
+    """由头文件名生成头文件保护宏"""
+    return os.path.splitext(os.path.basename(header_path))[0].upper() + "_H"
+
+
+def format_value_list(values, per_line):
+    """格式化数组初始化列表 (与原有指针数组/尺寸数组的格式一致)"""
+    text = "\n\t"
+    for i, value in enumerate(values):
+        text += f"{value}, "
+        if (i + 1) % per_line == 0 and i < len(values) - 1:
+            text += "\n\t"
+    return text + "\n};\n"
+
+
+def _file_head(layout, notes, header_name):
+    """文件开头: 说明注释、头文件保护或 #include"""
+    output = file_banner()
+    output += "".join(f"{line}\n" for line in notes)
+    output += "\n"
+
+    if layout == "header":
+        guard = header_guard(header_name)
+        output += f"#ifndef {guard}\n"
+        output += f"#define {guard}\n\n"
+        output += "#include <stdint.h>\n\n"
+    elif layout == "source":
+        output += "#include <stdint.h>\n"
+        output += f'#include "{os.path.basename(header_name)}"\n\n'
+    return output
+
+
+def render_frames(layout, frames_info, var_names, arrays, notes=(), defines=(),
+                  generate_array=True, frame_delay=100, header_name=None, blob=False):
+    """生成帧数据的C代码文本
+
+    frames_info: [(文件名, 宽, 高, 阈值描述)]
+    var_names:   每帧在指针数组中引用的变量名
+    arrays:      每帧要定义的字节数组，None 表示与前面的帧共用数组
+    notes:       文件开头的注释行
+    defines:     元数据行 (注释或宏)，放在声明部分
+    header_name: 成对输出时的头文件名 (guard 和 #include 使用)
+    blob:        连续存放所有帧 (见 render_blob)
+    """
+    if layout not in LAYOUTS:
+        raise ValueError(f"未知的输出布局: {layout}")
+    if blob:
+        return render_blob(layout, frames_info, var_names, arrays, notes, defines, frame_delay, header_name)
+
+    declare = layout in ("single", "header")
+    count = len(var_names)
+
+    output = _file_head(layout, notes, header_name)
+
+    for (file_name, width, height, threshold_text), var_name, data in zip(frames_info, var_names, arrays):
+        # 添加图像尺寸和阈值注释
+        output += f"// 图像: {file_name}, 尺寸: {width}x{height} 像素, 阈值: {threshold_text}"
+
+        if data is None:
+            output += f", 与 {var_name} 相同\n"
+        # 头文件只有extern声明
+        elif layout == "header":
+            output += f"\nextern const unsigned char {var_name}[];\n"
+        else:
+            output += "\n" + oled_core.format_c_array(var_name, data) + "\n\n"
+
+    if declare and defines:
+        output += "\n" + "".join(f"{line}\n" for line in defines)
+
+    # 如果需要生成指针数组
+    if generate_array and count:
+        if layout == "header":
+            output += f"\n// 所有图像的指针数组\n"
+            output += f"extern const unsigned char* const image_array[{count}];\n"
+            output += f"\n// 图像尺寸数组\n"
+            output += f"extern const uint16_t image_widths[{count}];\n"
+            output += f"extern const uint16_t image_heights[{count}];\n"
+        else:
+            output += f"\n// 所有图像的指针数组\n"
+            output += f"const unsigned char* const image_array[{count}] = {{" + format_value_list(var_names, 5)
+            output += f"\n// 图像尺寸数组\n"
+            output += f"const uint16_t image_widths[{count}] = {{" + format_value_list([w for _, w, _, _ in frames_info], 8)
+            output += f"const uint16_t image_heights[{count}] = {{" + format_value_list([h for _, _, h, _ in frames_info], 8)
+
+        if declare:
+            output += f"\n// 图像总数\n"
+            output += f"#define IMAGE_COUNT {count}\n"
+
+            # 添加帧速率信息
+            output += f"\n// 动画帧速率 (毫秒/帧)\n"
+            output += f"#define FRAME_DELAY {frame_delay}\n"
+
+    if layout == "header":
+        output += f"\n#endif // {header_guard(header_name)}\n"
+
+    return output
+
+
+def blob_offsets(var_names, arrays):
+    """计算每帧在连续数据中的偏移，共用数组的帧 (None) 指向第一次出现的位置
+
+    返回 (偏移列表, 总字节数)
+    """
+    positions = {}
+    offsets = []
+    total = 0
+    for var_name, data in zip(var_names, arrays):
+        if data is not None:
+            positions[var_name] = total
+            total += int(data.size)
+        offsets.append(positions[var_name])
+    return offsets, total
+
+
+def render_blob(layout, frames_info, var_names, arrays, notes=(), defines=(),
+                frame_delay=100, header_name=None):
+    """连续存放布局: 所有帧字节放在一个4字节对齐的 image_data[] 中
+
+    偏移表为 uint16_t (超过64KB时为 uint32_t)，所有帧尺寸相同时只输出一组宽高宏。
+    访问宏: IMAGE_PTR(i)、IMAGE_WIDTH(i)、IMAGE_HEIGHT(i)
+    """
+    declare = layout in ("single", "header")
+    define = layout in ("single", "source")
+    count = len(var_names)
+
+    offsets, total = blob_offsets(var_names, arrays)
+    offset_type = "uint16_t" if total <= 0xFFFF else "uint32_t"
+    widths = [w for _, w, _, _ in frames_info]
+    heights = [h for _, _, h, _ in frames_info]
+    uniform = len(set(zip(widths, heights))) <= 1
+
+    output = _file_head(layout, notes, header_name)
+
+    if define:
+        # 每帧前加一行注释，便于在数组中定位
+        output += "// 所有帧数据 (连续存放，4字节对齐)\n"
+        output += f"const unsigned char image_data[{total}] __attribute__((aligned(4))) = {{"
+        for i, ((file_name, width, height, threshold_text), data) in enumerate(zip(frames_info, arrays)):
+            output += f"\n\t// [{i}] +{offsets[i]}: {file_name}, {width}x{height}, 阈值: {threshold_text}"
+            if data is None:
+                output += f", 与 [{offsets.index(offsets[i])}] 相同"
+            elif data.size:
+                output += "\n\t" + ", \n\t".join(oled_core.format_byte_lines(data)) + ","
+        output += "\n};\n"
+
+        output += f"\n// 每帧在 image_data 中的偏移\n"
+        output += f"const {offset_type} image_offsets[{count}] = {{" + format_value_list(offsets, 8)
+
+        if not uniform:
+            output += f"\n// 图像尺寸数组\n"
+            output += f"const uint16_t image_widths[{count}] = {{" + format_value_list(widths, 8)
+            output += f"const uint16_t image_heights[{count}] = {{" + format_value_list(heights, 8)
+
+    if declare:
+        if layout == "header":
+            output += "// 所有帧数据 (连续存放，4字节对齐) 和每帧的偏移\n"
+            output += f"extern const unsigned char image_data[{total}];\n"
+            output += f"extern const {offset_type} image_offsets[{count}];\n"
+            if not uniform:
+                output += f"extern const uint16_t image_widths[{count}];\n"
+                output += f"extern const uint16_t image_heights[{count}];\n"
+
+        if defines:
+            output += "\n" + "".join(f"{line}\n" for line in defines)
+
+        output += f"\n// 图像总数\n"
+        output += f"#define IMAGE_COUNT {count}\n"
+
+        output += f"\n// 访问宏\n"
+        output += "#define IMAGE_PTR(i) (&image_data[image_offsets[(i)]])\n"
+        if uniform and count:
+            output += f"#define IMAGE_FRAME_WIDTH {widths[0]}\n"
+            output += f"#define IMAGE_FRAME_HEIGHT {heights[0]}\n"
+            output += "#define IMAGE_WIDTH(i) IMAGE_FRAME_WIDTH\n"
+            output += "#define IMAGE_HEIGHT(i) IMAGE_FRAME_HEIGHT\n"
+        else:
+            output += "#define IMAGE_WIDTH(i) (image_widths[(i)])\n"
+            output += "#define IMAGE_HEIGHT(i) (image_heights[(i)])\n"
+
+        # 添加帧速率信息
+        output += f"\n// 动画帧速率 (毫秒/帧)\n"
+        output += f"#define FRAME_DELAY {frame_delay}\n"
+
+    if layout == "header":
+        output += f"\n#endif // {header_guard(header_name)}\n"
+
+    return output
+
+
+def render_tilemap(layout, frames_info, tileset, notes=(), frame_delay=100, header_name=None):
+    """图块布局: 共用图块集 tile_set[][8] + 每帧索引表 tile_maps[][]
+
+    tileset 为 oled_tiles.Tileset; 图块是显存格式 (每字节一列，LSB在上)，
+    与取模方式无关。访问宏 TILEMAP_DRAW(i, x, page) 把第 i 帧画到显存。
+    """
+    declare = layout in ("single", "header")
+    define = layout in ("single", "source")
+    count = len(frames_info)
+    index_type = "uint8_t" if tileset.index_size == 1 else "uint16_t"
+    map_size = tileset.pages * tileset.cols
+    draw = "ssd1306_DrawTilemap" if tileset.index_size == 1 else "ssd1306_DrawTilemap16"
+
+    output = _file_head(layout, notes, header_name)
+
+    if define:
+        output += f"// 共用图块集: 每个图块 8 字节 (8列 x 1页)\n"
+        output += f"const uint8_t tile_set[{tileset.tile_count}][8] = {{"
+        for i, tile in enumerate(tileset.tiles):
+            output += f"\n\t{{ {', '.join(f'0x{b:02X}' for b in tile)} }}, // {i}"
+        output += "\n};\n"
+
+        output += f"\n// 每帧的图块索引 ({tileset.pages} 页 x {tileset.cols} 列，按页存放)\n"
+        output += f"const {index_type} tile_maps[{count}][{map_size}] = {{"
+        for i, ((file_name, width, height, threshold_text), index_map) in enumerate(zip(frames_info, tileset.maps)):
+            output += f"\n\t// [{i}] {file_name}, {width}x{height}, 阈值: {threshold_text}"
+            rows = (", ".join(str(v) for v in row) for row in index_map.tolist())
+            output += "\n\t{\n\t\t" + ",\n\t\t".join(rows) + "\n\t},"
+        output += "\n};\n"
+
+    if declare:
+        if layout == "header":
+            output += "// 共用图块集和每帧的图块索引\n"
+            output += f"extern const uint8_t tile_set[{tileset.tile_count}][8];\n"
+            output += f"extern const {index_type} tile_maps[{count}][{map_size}];\n"
+
+        output += f"\n// {tileset.summary()}\n"
+        output += f"#define FRAME_ENCODING_TILES 1\n"
+        output += f"#define TILE_COUNT {tileset.tile_count}\n"
+        output += f"#define TILEMAP_COLS {tileset.cols}\n"
+        output += f"#define TILEMAP_PAGES {tileset.pages}\n"
+        output += f"#define IMAGE_FRAME_WIDTH {tileset.width}\n"
+        output += f"#define IMAGE_FRAME_HEIGHT {tileset.height}\n"
+
+        output += f"\n// 图像总数\n"
+        output += f"#define IMAGE_COUNT {count}\n"
+
+        output += f"\n// 访问宏: 把第 i 帧画到显存 (x 为像素列，page 为页号)，再调用 ssd1306_UpdateScreen()\n"
+        output += (f"#define TILEMAP_DRAW(i, x, page) {draw}((x), (page), &tile_set[0][0], "
+                   f"tile_maps[(i)], TILEMAP_COLS, TILEMAP_PAGES)\n")
+
+        # 添加帧速率信息
+        output += f"\n// 动画帧速率 (毫秒/帧)\n"
+        output += f"#define FRAME_DELAY {frame_delay}\n"
+
+    if layout == "header":
+        output += f"\n#endif // {header_guard(header_name)}\n"
+
+    return output
+
+
+def render_greyscale(frames_info, buffers, schedule, notes=(), prefix="grey"):
+    """位平面灰度: 每帧 bits 个整屏显存格式的平面 + 刷新计划元数据 (单个头文件)
+
+    buffers 为 (帧数, bits, 页数 x 宽) 的 uint8，schedule 为 oled_grey.GreySchedule。
+    固件每次刷新用 GREY_SHOW(i, s) 把周期第 s 次刷新的平面拷贝到显存，再 ssd1306_UpdateScreen()。
+    """
+    count, bits, plane_size = buffers.shape
+    output = _file_head("single", notes, None)
+
+    output += f"// {schedule.summary()}\n"
+    output += f"#define GREY_BITS {bits}\n"
+    output += f"#define GREY_PLANE_SIZE {plane_size}\n"
+    output += f"#define GREY_CYCLE_REFRESHES {schedule.cycle_refreshes}\n"
+    output += f"// 一次刷新 (拷贝 + ssd1306_UpdateScreen) 的估算时间和灰度周期频率\n"
+    output += f"#define GREY_REFRESH_US {round(schedule.refresh_s * 1e6)}\n"
+    output += f"#define GREY_CYCLE_HZ {int(schedule.cycle_hz)}\n"
+
+    output += f"\n// 每个平面 (从最低位开始) 一个周期内的刷新次数\n"
+    output += f"const uint8_t {prefix}_plane_refreshes[GREY_BITS] = {{ {', '.join(map(str, schedule.refreshes))} }};\n"
+    output += f"// 周期内每次刷新显示的平面 (高位平面分散，减少闪烁)\n"
+    output += (f"const uint8_t {prefix}_sequence[GREY_CYCLE_REFRESHES] = "
+               f"{{ {', '.join(map(str, schedule.sequence))} }};\n")
+
+    output += f"\n// 位平面: [帧][平面][显存字节]，每字节一列，LSB在上\n"
+    output += f"const uint8_t {prefix}_planes[{count}][GREY_BITS][GREY_PLANE_SIZE] = {{"
+    for (file_name, width, height), planes in zip(frames_info, buffers):
+        output += f"\n\t// {file_name}, {width}x{height}\n\t{{"
+        for k, plane in enumerate(planes):
+            output += f"\n\t\t// 平面 {k} (权重 {1 << k})"
+            output += "\n\t\t{\n\t\t\t" + ",\n\t\t\t".join(oled_core.format_byte_lines(plane, 16)) + "\n\t\t},"
+        output += "\n\t},"
+    output += "\n};\n"
+
+    output += f"\n// 图像总数\n"
+    output += f"#define IMAGE_COUNT {count}\n"
+    output += f"\n// 访问宏: 第 i 帧、周期第 s 次刷新的平面拷贝到显存\n"
+    output += (f"#define GREY_SHOW(i, s) ssd1306_FillBuffer((uint8_t*){prefix}_planes[(i)][{prefix}_sequence[(s)]], "
+               f"GREY_PLANE_SIZE)\n")
+    return output
+
+
+def render_sprites(frames_info, bits, masks, notes=(), prefix="sprite"):
+    """透明精灵: 每帧一个图像平面和一个遮罩平面，都是按页存放的显存格式 (单个头文件)
+
+    bits/masks 为 (帧数, 页数 x 宽) 的 uint8，图像位已与遮罩相与。固件用
+    SPRITE_DRAW(i, x, y) 按字节合成: 遮罩为 1 的像素取精灵的值，为 0 的保留背景。
+    """
+    (_, width, height), count = frames_info[0], len(frames_info)
+    pages = -(-height // 8)
+    output = _file_head("single", notes, None)
+
+    output += f"// 精灵尺寸和每个平面的字节数 (页数 x 宽，每字节一列，LSB在上)\n"
+    output += f"#define SPRITE_WIDTH {width}\n"
+    output += f"#define SPRITE_HEIGHT {height}\n"
+    output += f"#define SPRITE_PAGES {pages}\n"
+    output += f"#define SPRITE_SIZE {pages * width}\n"
+
+    for title, name, planes in (("图像 (1 = 点亮，只在遮罩内)", "bits", bits), ("遮罩 (1 = 不透明)", "mask", masks)):
+        output += f"\n// {title}: [帧][显存字节]\n"
+        output += f"const uint8_t {prefix}_{name}[{count}][SPRITE_SIZE] = {{"
+        for (file_name, w, h), plane in zip(frames_info, planes):
+            output += f"\n\t// {file_name}, {w}x{h}"
+            output += "\n\t{\n\t\t" + ",\n\t\t".join(oled_core.format_byte_lines(plane, 16)) + "\n\t},"
+        output += "\n};\n"
+
+    output += f"\n// 精灵总数\n"
+    output += f"#define SPRITE_COUNT {count}\n"
+    output += f"\n// 访问宏: 把第 i 帧画到显存 (x, y 为左上角像素，可不按页对齐)，背景保留在透明处\n"
+    output += (f"#define SPRITE_DRAW(i, x, y) ssd1306_DrawSprite((x), (y), {prefix}_bits[(i)], {prefix}_mask[(i)], "
+               f"SPRITE_WIDTH, SPRITE_HEIGHT)\n")
+    return output
+
+
+def write_frames(output_path, frames, frames_info, plan, prefix="frame", notes=(), generate_header=False,
+                 generate_array=True, frame_delay=100, blob=False):
+    """按预算规划选定的编码生成并写出帧数据，返回保存结果的描述
+
+    generate_header 时成对输出 .h (声明) 和 .c (定义) 并把 .c 登记到 CMakeLists.txt，
+    内容不变的文件不重写。
+    """
+    # 按编码准备数组 (去重时重复帧引用第一次出现的数组)
+    encoding = plan.encoding
+    with oled_timing.span("budget"):
+        arrays = oled_budget.frames_for_encoding(frames, encoding)
+    first_index = oled_budget.duplicate_map(frames)
+    var_names = [f"{prefix}_{(first_index[i] if encoding == 'dedup' else i):03d}" for i in range(len(frames))]
+    notes = list(notes) + [f"// {plan.summary()}"]
+
+    # 差分编码需要在固件中用帧缓冲解码
+    defines = []
+    if encoding == "delta_rle" and frames:
+        defines = [
+            "// 差分RLE编码: 每帧与上一帧异或后RLE压缩，第0帧前先清零帧缓冲",
+            "// static uint8_t frame_buf[FRAME_BUFFER_SIZE];",
+            "// if (i == 0) memset(frame_buf, 0, FRAME_BUFFER_SIZE);",
+            "// ssd1306_ApplyDeltaRLE(frame_buf, FRAME_BUFFER_SIZE, "
+            + ("IMAGE_PTR(i));" if blob else "image_array[i]);"),
+            "#define FRAME_ENCODING_DELTA_RLE 1",
+            f"#define FRAME_BUFFER_SIZE {frames[0].size}",
+        ]
+
+    def render(layout, header_name=None):
+        with oled_timing.span("format"):
+            if encoding == "tiles":
+                return render_tilemap(layout, frames_info, plan.estimates["tiles"]["tileset"], notes,
+                                      frame_delay, header_name)
+            return render_frames(layout, frames_info, var_names, arrays, notes, defines,
+                                 generate_array, frame_delay, header_name, blob)
+
+    if not generate_header:
+        saved = os.path.basename(output_path)
+        if not write_if_changed(output_path, render("single")):
+            saved += " (内容未变化，未重写)"
+        return saved
+
+    stem = os.path.splitext(output_path)[0]
+    header_path, source_path = stem + ".h", stem + ".c"
+    written = [path for path, text in ((header_path, render("header", header_path)),
+                                       (source_path, render("source", header_path)))
+               if write_if_changed(path, text)]
+    cmake_path = register_cmake_source(source_path)
+
+    saved = f"{os.path.basename(header_path)} + {os.path.basename(source_path)}"
+    if not written:
+        saved += " (内容未变化，未重写)"
+    if cmake_path:
+        saved += f", 已登记到 {os.path.basename(cmake_path)}"
+    return saved
+
+
+def content_hash(text):
+    """计算内容哈希 (忽略生成时间行)"""
+    return hashlib.sha256(VOLATILE_LINE_RE.sub('', text).encode('utf-8')).hexdigest()
+
+
+def write_if_changed(path, text):
+    """内容哈希变化时才写文件 (原子替换)，返回是否写入
+
+    文件不变时修改时间也不变，增量编译可以跳过它。
+    """
+    with oled_timing.span("write"):
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8', errors='replace') as f:
+                if content_hash(f.read()) == content_hash(text):
+                    return False
+
+        atomic_write(path, text)
+    return True
+
+
+def atomic_write(path, text):
+    """先写同目录下的临时文件再替换，构建过程不会读到写了一半的文件"""
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            f.write(text)
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+def find_cmake_lists(start_dir):
+    """从 start_dir 向上查找工程的 CMakeLists.txt (含 target_sources 的那个)"""
+    directory = os.path.abspath(start_dir)
+    while True:
+        path = os.path.join(directory, "CMakeLists.txt")
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                if TARGET_SOURCES_RE.search(f.read()):
+                    return path
+        parent = os.path.dirname(directory)
+        if parent == directory:
+            return None
+        directory = parent
+
+
+def _add_to_block(text, block_re, entry):
+    """在 CMake 命令块的最后一个条目后面插入一行，已存在时不修改"""
+    match = block_re.search(text)
+    if not match:
+        return text, False
+
+    body = match.group(1)
+    if re.search(r'^\s*' + re.escape(entry) + r'\s*$', body, re.MULTILINE):
+        return text, False
+
+    # 插在最后一个非空条目之后，保持缩进
+    lines = body.split("\n")
+    last = max((i for i, line in enumerate(lines) if line.strip()), default=0)
+    lines.insert(last + 1, "    " + entry)
+    start, end = match.span(1)
+    return text[:start] + "\n".join(lines) + text[end:], True
+
+
+def register_cmake_source(source_path, cmake_path=None):
+    """把生成的 .c 登记到 CMakeLists.txt 的 target_sources，并确保其目录在包含路径中
+
+    返回 CMakeLists.txt 路径 (已修改) 或 None (未找到或无需修改)
+    """
+    cmake_path = cmake_path or find_cmake_lists(os.path.dirname(os.path.abspath(source_path)))
+    if not cmake_path:
+        return None
+
+    root = os.path.dirname(cmake_path)
+    rel = os.path.relpath(os.path.abspath(source_path), root).replace(os.sep, "/")
+    if rel.startswith(".."):
+        # 不在工程目录内
+        return None
+
+    with open(cmake_path, 'r', encoding='utf-8') as f:
+        text = f.read()
+
+    text, added_source = _add_to_block(text, TARGET_SOURCES_RE, "${CMAKE_SOURCE_DIR}/" + rel)
+    rel_dir = os.path.dirname(rel)
+    include_entry = "${CMAKE_SOURCE_DIR}/" + rel_dir if rel_dir else "${CMAKE_SOURCE_DIR}"
+    text, added_include = _add_to_block(text, TARGET_INCLUDES_RE, include_entry)
+
+    if not (added_source or added_include):
+        return None
+
+    atomic_write(cmake_path, text)
+    return cmake_path
@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+位平面灰度导出
+
+SSD1306 只有开/关两种像素，灰度靠时间平均: 每帧量化为 2^bits 级灰度，拆成
+bits 个位平面，第 k 个平面 (权重 2^k) 连续显示 2^k 次刷新，一个灰度周期共
+2^bits - 1 次 ssd1306_UpdateScreen。显示顺序按 "尺子序列" 交错 (3 位时为
+2 1 2 0 2 1 2)，高位平面分散在整个周期里，闪烁比按平面顺序连续显示小。
+
+每次刷新的时间按 oled_emulator 的总线模型计算 ssd1306_UpdateScreen 的字节流
+(每页 3 个命令 + 一行数据)，加上拷贝平面到显存的时间。刷新也不能快于面板扫描
+(否则平面会被跳过，权重不对): 面板帧率默认由 oled_emulator 按 ssd1306_Init 的
+时钟分频 (0xD5)、预充电 (0xD9) 和复用行数估算，128x64 时约 107 Hz。一次刷新取
+总线时间和面板扫描周期中较慢的一个，灰度周期频率低于闪烁阈值的组合直接拒绝，
+不生成文件。
+
+默认闪烁阈值 60 Hz 在 ssd1306_Init 的设置下达不到: 107 Hz 的面板扫描让 2 位灰度
+最高约 36 Hz、3 位约 15 Hz，与总线多快无关。导出时需要用 --min-hz 接受这个周期
+(会看到闪烁); 如果在固件中提高了 0xD5 振荡频率或缩短了 0xD9 预充电，用 --panel-hz
+给出实测的面板帧率。I2C 400kHz 时总线本身就比面板慢，降低阈值也未必够。
+
+量化、抖动和拆平面都对整个帧序列一次向量化完成，不逐帧、逐像素循环。
+
+用法:
+  python oled_grey.py chiikawa.gif -o grey.h --bits 2 --check      查看刷新计划 (默认阈值下会被拒绝)
+  python oled_grey.py chiikawa.gif -o grey.h --bits 2 --min-hz 30
+  python oled_grey.py frames/*.png -o grey.h --bits 3 --min-hz 15 --dither bayer
+  python oled_grey.py frames/*.png -o grey.h --bits 2 --panel-hz 160 --min-hz 50  (固件提高了面板帧率时)
+  python oled_grey.py frames/*.png -o grey.h --bits 2 --bus i2c --spi-mhz 0.4 --min-hz 30   (会被拒绝)
+"""
+
+import argparse
+import glob
+import os
+import sys
+
+import numpy as np
+
+import oled_core
+import oled_emulator
+import oled_export
+
+GREY_BITS = (2, 3)
+# 灰度周期低于此频率时肉眼可见闪烁; 默认面板帧率下达不到，见模块说明
+DEFAULT_MIN_CYCLE_HZ = 60.0
+# 72MHz 下 ssd1306_FillBuffer 拷贝一个平面 (1KB) 的大致时间
+DEFAULT_COPY_US = 20.0
+
+
+def plane_refreshes(bits):
+    """每个平面 (从最低位开始) 一个周期内显示的刷新次数: 1, 2, 4 ..."""
+    return [1 << k for k in range(bits)]
+
+
+def plane_sequence(bits):
+    """一个周期内每次刷新显示的平面号，第 i 次 (从1开始) 显示 bits-1-ctz(i)"""
+    return [bits - 1 - ((i & -i).bit_length() - 1) for i in range(1, 1 << bits)]
+
+
+def quantize(grays, bits, dither="none", invert=False):
+    """把 (帧数, H, W) 的灰度一次量化为 0 .. 2^bits-1 级
+
+    不抖动时四舍五入; bayer 时按 Bayer 8x8 矩阵在相邻两级之间取舍。
+    """
+    if bits not in GREY_BITS:
+        raise ValueError(f"灰度位数只支持 {GREY_BITS}: {bits}")
+    if dither not in oled_core.DITHER_MODES:
+        raise ValueError(f"未知的抖动方式: {dither}")
+    grays = np.asarray(grays, dtype=np.float64)
+    top = (1 << bits) - 1
+    scaled = grays * (top / 255.0)
+    if dither == "bayer":
+        height, width = grays.shape[-2:]
+        bayer = oled_core.BAYER_8
+        reps = (-(-height // bayer.shape[0]), -(-width // bayer.shape[1]))
+        offset = (np.tile(bayer, reps)[:height, :width] + 0.5) / bayer.size
+    else:
+        offset = 0.5
+    levels = np.clip(np.floor(scaled + offset), 0, top).astype(np.uint8)
+    return top - levels if invert else levels
+
+
+def split_planes(levels, bits):
+    """(帧数, H, W) 灰度级 -> (帧数, bits, H, W) 的位平面 (bool)，平面 k 为第 k 位"""
+    shifts = np.arange(bits, dtype=np.uint8).reshape(1, bits, 1, 1)
+    return ((levels[:, None, :, :] >> shifts) & 1).astype(bool)
+
+
+def plane_buffers(planes, conf):
+    """位平面 -> 整屏显存布局 (帧数, bits, 页数 x 宽)，帧小于屏幕时放在左上角
+
+    固件用 ssd1306_FillBuffer 整块拷贝，不经过 DrawBitmap。
+    """
+    count, bits, height, width = planes.shape
+    canvas = np.zeros((count, bits, conf.height, conf.width), dtype=bool)
+    height, width = min(height, conf.height), min(width, conf.width)
+    canvas[:, :, :height, :width] = planes[:, :, :height, :width]
+    packed = np.packbits(canvas.reshape(count, bits, conf.pages, 8, conf.width), axis=3, bitorder='little')
+    return packed.reshape(count, bits, conf.pages * conf.width)
+
+
+def temporal_average(buffers, bits, conf):
+    """按显示顺序回放一个周期，返回每帧平均亮度 (0-1, (帧数, H, W))，检查用"""
+    pages = buffers.reshape(buffers.shape[0], bits, conf.pages, 1, conf.width)
+    rows = np.unpackbits(pages, axis=3, bitorder='little').reshape(buffers.shape[0], bits, conf.height, conf.width)
+    sequence = plane_sequence(bits)
+    return rows[:, sequence].sum(axis=1) / len(sequence)
+
+
+class GreySchedule:
+    """灰度周期的刷新计划和闪烁检查结果"""
+
+    def __init__(self, bits, conf, bus_s, copy_s, panel_hz, min_cycle_hz=DEFAULT_MIN_CYCLE_HZ,
+                 clock_hz=None):
+        self.bits = bits
+        self.conf = conf
+        self.bus_s = bus_s
+        self.copy_s = copy_s
+        self.panel_hz = panel_hz
+        self.min_cycle_hz = min_cycle_hz
+        self.clock_hz = clock_hz
+        self.refreshes = plane_refreshes(bits)
+        self.sequence = plane_sequence(bits)
+
+    @property
+    def panel_limited(self):
+        """面板扫描比总线 + 拷贝慢，刷新间隔由面板决定"""
+        return 1.0 / self.panel_hz > self.bus_s + self.copy_s
+
+    @property
+    def refresh_s(self):
+        """一次刷新的间隔: 总线 + 拷贝与面板扫描周期中较慢的一个"""
+        return max(self.bus_s + self.copy_s, 1.0 / self.panel_hz)
+
+    @property
+    def cycle_refreshes(self):
+        return len(self.sequence)
+
+    @property
+    def cycle_s(self):
+        return self.refresh_s * self.cycle_refreshes
+
+    @property
+    def cycle_hz(self):
+        return 1.0 / self.cycle_s
+
+    @property
+    def fits(self):
+        return self.cycle_hz >= self.min_cycle_hz
+
+    def max_bits(self):
+        """当前总线下不闪烁的最高灰度位数，一个都不行时为 None"""
+        ok = [b for b in GREY_BITS if 1.0 / (self.refresh_s * ((1 << b) - 1)) >= self.min_cycle_hz]
+        return max(ok) if ok else None
+
+    def summary(self):
+        return (f"{self.bits} 位灰度 ({1 << self.bits} 级), 每周期 {self.cycle_refreshes} 次刷新 x "
+                f"{self.refresh_s * 1e3:.3f} ms = {self.cycle_s * 1e3:.2f} ms ({self.cycle_hz:.0f} Hz)")
+
+    def report(self):
+        conf = self.conf
+        clock = f" {self.clock_hz / 1e6:g} MHz" if self.clock_hz else ""
+        lines = [
+            f"屏幕: {conf.width}x{conf.height}, {conf.bus.upper()}{clock}",
+            f"ssd1306_UpdateScreen 总线时间: {self.bus_s * 1e3:.3f} ms, 拷贝平面: {self.copy_s * 1e3:.3f} ms",
+        ]
+        lines.append(f"面板帧率: {self.panel_hz:.1f} Hz (刷新不快于 {1e3 / self.panel_hz:.3f} ms"
+                     + (", 刷新间隔由面板扫描决定)" if self.panel_limited else ")"))
+        lines.append("每平面刷新次数 (低位起): " + ", ".join(str(n) for n in self.refreshes))
+        lines.append("显示顺序: " + " ".join(str(p) for p in self.sequence))
+        lines.append(self.summary())
+        if self.fits:
+            lines.append(f"不低于闪烁阈值 {self.min_cycle_hz:g} Hz")
+        else:
+            best = self.max_bits()
+            if best:
+                hint = f"，当前总线和面板最多用 {best} 位"
+            elif self.panel_limited:
+                hint = "，受面板扫描帧率限制，提高总线时钟没有用"
+            else:
+                hint = "，需要提高总线时钟" + ("或改用 SPI" if conf.bus == "i2c" else "")
+            lines.append(f"低于闪烁阈值 {self.min_cycle_hz:g} Hz，会闪烁{hint}")
+        return "\n".join(lines)
+
+
+def plan_schedule(bits, conf, clock_hz=None, overhead_us=oled_emulator.DEFAULT_OVERHEAD_US,
+                  copy_us=DEFAULT_COPY_US, panel_hz=None, min_cycle_hz=DEFAULT_MIN_CYCLE_HZ):
+    """按总线模型和面板扫描帧率计算灰度周期，不检查是否闪烁
+
+    panel_hz 未给出时按 ssd1306_Init 的初始化命令估算 (oled_emulator.panel_hz)。
+    """
+    if bits not in GREY_BITS:
+        raise ValueError(f"灰度位数只支持 {GREY_BITS}: {bits}")
+    if clock_hz is None:
+        clock_hz = oled_emulator.DEFAULT_SPI_HZ if conf.bus == "spi" else 400e3
+    bus = oled_emulator.BusModel(conf.bus, clock_hz, overhead_us)
+    # 传输次数和长度与显存内容无关
+    transactions = oled_emulator.update_screen_transactions(np.zeros((conf.pages, conf.width), dtype=np.uint8), conf)
+    bus_s = sum(bus.transaction_time(len(data)) for _, data in transactions)
+    if panel_hz is None:
+        panel_hz = oled_emulator.panel_hz(conf)
+    return GreySchedule(bits, conf, bus_s, copy_us * 1e-6, panel_hz, min_cycle_hz, clock_hz)
+
+
+def check_schedule(schedule):
+    """会闪烁时抛出 ValueError (带报告)"""
+    if not schedule.fits:
+        raise ValueError("灰度刷新计划会闪烁:\n" + schedule.report())
+    return schedule
+
+
+def export_greyscale(grays, names, output_path, bits, conf, clock_hz=None, dither="none", invert=False,
+                     panel_hz=None, min_cycle_hz=DEFAULT_MIN_CYCLE_HZ, prefix="grey", source_desc=""):
+    """量化、拆平面、检查刷新计划并写出头文件，返回 (GreySchedule, 是否写入)
+
+    grays 为同尺寸的灰度帧; 会闪烁时抛出 ValueError，不写文件。
+    """
+    if not len(grays):
+        raise ValueError("没有帧")
+    shapes = {g.shape for g in grays}
+    if len(shapes) != 1:
+        raise ValueError(f"灰度帧尺寸不一致: {sorted(shapes)}")
+    schedule = check_schedule(plan_schedule(bits, conf, clock_hz, panel_hz=panel_hz, min_cycle_hz=min_cycle_hz))
+
+    levels = quantize(np.stack(grays), bits, dither, invert)
+    buffers = plane_buffers(split_planes(levels, bits), conf)
+    height, width = grays[0].shape
+    frames_info = [(name, width, height) for name in names]
+    notes = [f"// 位平面灰度: {source_desc or f'{len(grays)} 帧'}"]
+    if dither != "none":
+        notes.append(f"// 抖动: {oled_core.DITHER_NAMES[dither]}")
+    text = oled_export.render_greyscale(frames_info, buffers, schedule, notes, prefix)
+    return schedule, oled_export.write_if_changed(output_path, text)
+
+
+def main():
+    import oled_profiles
+
+    parser = argparse.ArgumentParser(description="把图像/动画导出为位平面灰度帧 (带刷新计划检查)")
+    parser.add_argument("inputs", nargs="+", help="GIF 或图像文件 (支持通配符)")
+    parser.add_argument("-o", "--output", required=True, help="输出 .h 文件路径")
+    parser.add_argument("--bits", type=int, choices=GREY_BITS, default=2, help="灰度位数")
+    parser.add_argument("--conf", help="ssd1306_conf.h 路径 (默认在工程中查找)")
+    parser.add_argument("--bus", choices=("spi", "i2c"), help="覆盖 ssd1306_conf.h 中的总线")
+    parser.add_argument("--spi-mhz", type=float, help="总线时钟 (MHz)，默认 SPI 18 / I2C 0.4")
+    parser.add_argument("--panel-hz", type=float,
+                        help="面板扫描帧率 (Hz)，默认按 ssd1306_Init 的命令估算 (128x64 约 107 Hz)")
+    parser.add_argument("--min-hz", type=float, default=DEFAULT_MIN_CYCLE_HZ,
+                        help=f"闪烁阈值 (Hz)，默认 {DEFAULT_MIN_CYCLE_HZ:g}; "
+                             "默认面板帧率下 2 位灰度需要 <= 35、3 位需要 <= 15")
+    parser.add_argument("--size", type=int, nargs=2, metavar=("W", "H"), help="调整到此尺寸 (默认屏幕尺寸)")
+    parser.add_argument("--dither", choices=oled_core.DITHER_MODES, default="none")
+    parser.add_argument("--invert", action="store_true", help="反转灰度")
+    parser.add_argument("-n", "--name", default="grey", help="变量名前缀")
+    parser.add_argument("--check", action="store_true", help="只检查刷新计划，不导出")
+    args = parser.parse_args()
+
+    conf_path = args.conf or oled_emulator.find_conf(os.path.dirname(os.path.abspath(__file__)))
+    conf = oled_emulator.parse_conf(conf_path) if conf_path else oled_emulator.DriverConfig()
+    if args.bus:
+        conf.bus = args.bus
+    clock_hz = args.spi_mhz * 1e6 if args.spi_mhz else None
+
+    schedule = plan_schedule(args.bits, conf, clock_hz, panel_hz=args.panel_hz, min_cycle_hz=args.min_hz)
+    print(schedule.report())
+    if not schedule.fits:
+        print("已拒绝: 刷新计划会闪烁，未写文件", file=sys.stderr)
+        hint = f"接受 {schedule.cycle_hz:.1f} Hz 的周期: --min-hz {int(schedule.cycle_hz)}"
+        if schedule.panel_limited:
+            hint += "; 固件提高了面板帧率时用 --panel-hz 给出实测值"
+        print(hint, file=sys.stderr)
+        return 1
+    if args.check:
+        return 0
+
+    paths = [p for pattern in args.inputs for p in sorted(glob.glob(pattern), key=oled_core.natural_sort_key)]
+    grays, names = oled_profiles.decode_sources(paths)
+    width, height = args.size or (conf.width, conf.height)
+    grays = [oled_profiles.resize_gray(g, width, height) for g in grays]
+    _, written = export_greyscale(grays, names, args.output, args.bits, conf, clock_hz, args.dither, args.invert,
+                                  args.panel_hz, args.min_hz, args.name, f"{len(grays)} 帧")
+    print(f"已导出 {len(grays)} 帧到 {args.output}" + ("" if written else " (内容未变化，未重写)"))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+导入已生成的C数组 (头文件/源文件)，还原为帧位图
+
+支持本工具各版本的输出 (chiikawa.h、test*.h、cxk.h)、image2cpp 风格的
+ssd1306_bmp.h 以及连续存放布局 (image_data[] + 每帧注释)，差分RLE编码的
+数据会按顺序解码。十六进制文本一次性用 bytes.fromhex 解码，不逐个 token 调用 int()。
+"""
+
+import os
+import re
+
+import numpy as np
+
+import oled_core
+
+# const unsigned char name[] = { ... };  (也接受 uint8_t、static、对齐属性)
+ARRAY_RE = re.compile(
+    r'(?:static\s+)?const\s+(?:unsigned\s+char|uint8_t)\s+(?P<name>\w+)\s*\[\s*\d*\s*\]\s*'
+    r'(?:__attribute__\s*\(\(.*?\)\)\s*)?=\s*\{(?P<body>[^}]*)\}',
+    re.DOTALL)
+# const unsigned char* const image_array[] = { frame_000, ... };
+POINTER_TABLE_RE = re.compile(
+    r'const\s+(?:unsigned\s+char|uint8_t)\s*\*\s*(?:const\s+)?(?P<name>\w+)\s*\[\s*\w*\s*\]\s*=\s*\{(?P<body>[^}]*)\}')
+IDENTIFIER_RE = re.compile(r'[A-Za-z_]\w*')
+LINE_COMMENT_RE = re.compile(r'//[^\n]*')
+BLOCK_COMMENT_RE = re.compile(r'/\*.*?\*/', re.DOTALL)
+HEX_BYTE_RE = re.compile(r'0[xX]([0-9a-fA-F]{2})\b')
+NUMBER_RE = re.compile(r'0[xX][0-9a-fA-F]+|\d+')
+
+# 数组前一行的尺寸注释: "尺寸: 128x64 像素" 或 "'frame_000', 128x64px"
+SIZE_COMMENT_RE = re.compile(r'(\d+)\s*[xX×]\s*(\d+)\s*(?:像素|px)')
+SOURCE_COMMENT_RE = re.compile(r"图像:\s*([^,，]+)|'([^']+)'")
+# 连续存放布局中每帧的注释: "// [i] +偏移: 文件名, WxH"
+BLOB_FRAME_RE = re.compile(r'//\s*\[(\d+)\]\s*\+(\d+):\s*([^,\n]+),\s*(\d+)x(\d+)')
+# 差分RLE编码的标记 (头文件中的宏，或 .c 开头的帧编码注释)
+DELTA_RLE_RE = re.compile(r'#define\s+FRAME_ENCODING_DELTA_RLE\b|//\s*帧编码:\s*差分RLE')
+
+DEFAULT_WIDTH = 128
+
+
+class ImportedFrame:
+    """导入的一帧: 数组名、来源注释、尺寸、原始字节和位图 (H, W) bool"""
+    __slots__ = ("name", "source", "width", "height", "data", "bits")
+
+    def __init__(self, name, source, width, height, data, bits):
+        self.name = name
+        self.source = source
+        self.width = width
+        self.height = height
+        self.data = data
+        self.bits = bits
+
+
+def decode_hex_bytes(body):
+    """把数组初始化列表解码为 uint8 数组
+
+    生成的文件都是两位十六进制，直接拼接后 bytes.fromhex 一次解码;
+    遇到十进制或其他写法时才退回逐个解析。
+    """
+    body = LINE_COMMENT_RE.sub('', BLOCK_COMMENT_RE.sub('', body))
+    digits = HEX_BYTE_RE.findall(body)
+    tokens = NUMBER_RE.findall(body)
+    if len(digits) == len(tokens):
+        return np.frombuffer(bytes.fromhex(''.join(digits)), dtype=np.uint8)
+    return np.array([int(t, 0) & 0xFF for t in tokens], dtype=np.uint8)
+
+
+def infer_size(size, width=DEFAULT_WIDTH):
+    """没有尺寸注释时按屏幕宽度推测高度"""
+    height = size * 8 // width if width else 0
+    return (width, height) if height else (size * 8, 1)
+
+
+def unpack_bits(data, width, height, mode="horizontal"):
+    """把打包的字节还原为 (height, width) 的 bool 数组 (pack_bits 的逆运算)"""
+    data = np.asarray(data, dtype=np.uint8)
+    if mode == "horizontal":
+        row_bytes = (width + 7) // 8
+        rows = data[:row_bytes * height].reshape(height, row_bytes)
+        return np.unpackbits(rows, axis=1)[:, :width].astype(bool)
+
+    # 垂直: 按列输出，每列 pages 个字节，LSB在上
+    pages = (height + 7) // 8
+    columns = data[:pages * width].reshape(width, pages)
+    bits = np.unpackbits(columns.T[:, None, :], axis=1, bitorder='little')
+    return bits.reshape(pages * 8, width)[:height].astype(bool)
+
+
+def _comment_before(text, start):
+    """返回数组定义前一行的注释 (没有时为空字符串)"""
+    line_end = text.rfind('\n', 0, start)
+    if line_end < 0:
+        return ""
+    line_start = text.rfind('\n', 0, line_end) + 1
+    line = text[line_start:line_end].strip()
+    return line if line.startswith('//') else ""
+
+
+def packed_size(width, height, mode="horizontal"):
+    """一帧打包后的字节数"""
+    if mode == "horizontal":
+        return ((width + 7) // 8) * height
+    return ((height + 7) // 8) * width
+
+
+class _DeltaDecoder:
+    """按顺序解码差分RLE帧 (第一帧与全0帧差分)"""
+
+    def __init__(self):
+        self.prev = None
+
+    def decode(self, data, size):
+        frame = oled_core.rle_decode(data, size)
+        if self.prev is not None and self.prev.size == size:
+            frame = np.bitwise_xor(frame, self.prev)
+        self.prev = frame
+        return frame
+
+
+def _split_blob(name, body, data, mode, delta=None):
+    """按每帧注释拆分连续存放的 image_data[]，数据不完整时返回 None"""
+    frames = []
+    marks = BLOB_FRAME_RE.findall(body)
+    for index, (_, offset, source, width, height) in enumerate(marks):
+        width, height, offset = int(width), int(height), int(offset)
+        size = packed_size(width, height, mode)
+        try:
+            chunk = delta.decode(data[offset:], size) if delta else data[offset:offset + size]
+        except IndexError:
+            return None
+        if chunk.size < size:
+            return None
+        frames.append(ImportedFrame(f"{name}_{index:03d}", source.strip(), width, height, chunk,
+                                    unpack_bits(chunk, width, height, mode)))
+    return frames
+
+
+def parse_c_text(text, mode="horizontal"):
+    """解析C源码中的所有字节数组，返回 ImportedFrame 列表
+
+    有指针数组时按指针数组的顺序 (去重输出中重复的帧会重复出现)，否则按定义顺序。
+    """
+    frames = []
+    delta = _DeltaDecoder() if DELTA_RLE_RE.search(text) else None
+    for match in ARRAY_RE.finditer(text):
+        name, body = match.group("name"), match.group("body")
+        data = decode_hex_bytes(body)
+        if data.size == 0:
+            continue
+
+        if BLOB_FRAME_RE.search(body):
+            blob_frames = _split_blob(name, body, data, mode, delta)
+            if blob_frames:
+                frames.extend(blob_frames)
+            continue
+
+        comment = _comment_before(text, match.start())
+        size_match = SIZE_COMMENT_RE.search(comment)
+        if size_match:
+            width, height = int(size_match.group(1)), int(size_match.group(2))
+        else:
+            width, height = infer_size(int(data.size))
+
+        source_match = SOURCE_COMMENT_RE.search(comment)
+        source = next((g for g in source_match.groups() if g), "").strip() if source_match else ""
+
+        expected = packed_size(width, height, mode)
+        if delta:
+            try:
+                data = delta.decode(data, expected)
+            except IndexError:
+                continue
+        if data.size < expected:
+            # 数据比注释的尺寸短，不是位图
+            continue
+        frames.append(ImportedFrame(name, source, width, height, data,
+                                    unpack_bits(data, width, height, mode)))
+
+    # 按指针数组还原帧序列 (只在它引用的数组都已解析时)
+    by_name = {f.name: f for f in frames}
+    for table in POINTER_TABLE_RE.finditer(text):
+        names = IDENTIFIER_RE.findall(LINE_COMMENT_RE.sub('', table.group("body")))
+        if names and all(n in by_name for n in names):
+            return [by_name[n] for n in names]
+    return frames
+
+
+def parse_c_file(path, mode="horizontal"):
+    """解析C头文件/源文件"""
+    with open(path, 'r', encoding='utf-8', errors='replace') as f:
+        return parse_c_text(f.read(), mode)
+
+
+def bit_stack(frames):
+    """把尺寸相同的帧堆叠为 (N, H, W) bool 数组，尺寸不一致时抛出 ValueError"""
+    if not frames:
+        return np.zeros((0, 0, 0), dtype=bool)
+    shapes = {f.bits.shape for f in frames}
+    if len(shapes) > 1:
+        raise ValueError(f"帧尺寸不一致: {sorted(shapes)}")
+    return np.stack([f.bits for f in frames])
+
+
+def frame_path(c_path, frame):
+    """导入帧在文件列表中使用的名称 (不对应磁盘上的文件)"""
+    return os.path.join(os.path.abspath(c_path), f"{frame.name}.bmp")
@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+多目标导出配置
+
+同一套素材要导出到不同的屏幕 (例如 128x64 SPI 的 CH1116、128x32 I2C、64x48)，
+每个目标是一个命名的导出配置: 尺寸、取模方式、反色、抖动、帧编码和输出路径。
+
+源图像只解码一次 (原始尺寸的灰度帧，来自 FrameCache)，然后在内存中分发给每个
+配置各自调整大小、计算阈值、二值化、打包、做 Flash/RAM 预算并写文件。
+选中多个配置时用进程池并行导出，每个进程处理一个配置。
+
+配置保存在 export_profiles.json (与本工具同目录)。
+
+用法:
+  python oled_profiles.py png_output/*.png                    导出全部配置
+  python oled_profiles.py chiikawa.gif --only ch1116_128x64     只导出指定配置
+  python oled_profiles.py frames/*.png --profiles my.json --list
+"""
+
+import argparse
+import glob
+import json
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from PIL import Image
+
+import oled_budget
+import oled_core
+import oled_export
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_PROFILES_PATH = os.path.join(BASE_DIR, "export_profiles.json")
+
+PACK_MODES = ("horizontal", "vertical")
+PACK_MODE_NAMES = {"horizontal": "水平", "vertical": "垂直"}
+
+
+class ExportProfile:
+    """一个导出目标的设置"""
+
+    FIELDS = ("name", "width", "height", "mode", "invert", "dither", "encoding", "output_path", "header", "blob")
+
+    def __init__(self, name, width=128, height=64, mode="vertical", invert=False, dither="none",
+                 encoding="auto", output_path="", header=False, blob=False):
+        self.name = name
+        self.width = int(width)
+        self.height = int(height)
+        self.mode = mode
+        self.invert = bool(invert)
+        self.dither = dither
+        self.encoding = encoding
+        self.output_path = output_path
+        self.header = bool(header)
+        self.blob = bool(blob)
+        self.validate()
+
+    def validate(self):
+        if not self.name:
+            raise ValueError("配置名称不能为空")
+        if self.width <= 0 or self.height <= 0:
+            raise ValueError(f"{self.name}: 尺寸无效 {self.width}x{self.height}")
+        if self.mode not in PACK_MODES:
+            raise ValueError(f"{self.name}: 未知的取模方式 {self.mode}")
+        if self.dither not in oled_core.DITHER_MODES:
+            raise ValueError(f"{self.name}: 未知的抖动方式 {self.dither}")
+        if self.encoding != "auto" and self.encoding not in oled_budget.ENCODINGS:
+            raise ValueError(f"{self.name}: 未知的帧编码 {self.encoding}")
+
+    def to_dict(self):
+        return {field: getattr(self, field) for field in self.FIELDS}
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(**{field: data[field] for field in cls.FIELDS if field in data})
+
+    def describe(self, with_output=True):
+        """列表中显示的单行描述"""
+        text = (f"{self.name}: {self.width}x{self.height} {PACK_MODE_NAMES[self.mode]}, "
+                f"{oled_budget.ENCODING_NAMES[self.encoding]}")
+        if self.invert:
+            text += ", 反色"
+        if self.dither != "none":
+            text += ", 抖动"
+        if with_output:
+            text += f" -> {self.output_path or '(未设置输出)'}"
+        return text
+
+
+# 本工程用到的三种屏幕
+DEFAULT_PROFILES = (
+    {"name": "ch1116_128x64", "width": 128, "height": 64, "output_path": "oled_128x64.h"},
+    {"name": "ssd1306_128x32", "width": 128, "height": 32, "output_path": "oled_128x32.h"},
+    {"name": "oled_64x48", "width": 64, "height": 48, "output_path": "oled_64x48.h"},
+)
+
+
+def load_profiles(path=DEFAULT_PROFILES_PATH):
+    """读取配置列表，文件不存在时返回默认配置"""
+    if not os.path.exists(path):
+        return [ExportProfile.from_dict(p) for p in DEFAULT_PROFILES]
+    with open(path, "r", encoding="utf-8") as f:
+        return [ExportProfile.from_dict(p) for p in json.load(f)]
+
+
+def save_profiles(profiles, path=DEFAULT_PROFILES_PATH):
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump([p.to_dict() for p in profiles], f, ensure_ascii=False, indent=2)
+
+
+def resize_gray(gray, width, height):
+    """在内存中把原始尺寸的灰度帧调整到目标尺寸 (与单目标导出相同的 LANCZOS)"""
+    if gray.shape == (height, width):
+        return gray
+    return oled_core.to_gray(Image.fromarray(gray), width, height)
+
+
+def pack_profile_frames(grays, names, profile, threshold_mode="manual", manual=128, percent=50.0, per_frame=True):
+    """按配置把原始灰度帧打包，返回 (帧数组列表, frames_info)"""
+    frames = [oled_core.CachedFrame(resize_gray(g, profile.width, profile.height)) for g in grays]
+    thresholds = oled_core.frame_thresholds(frames, threshold_mode, manual, percent, per_frame,
+                                            adaptive_offset=manual - 128)
+    packed, frames_info = [], []
+    for name, frame, threshold in zip(names, frames, thresholds):
+        bits = oled_core.binarize(frame.gray, oled_core.dither_threshold(threshold, frame.gray.shape, profile.dither),
+                                  profile.invert)
+        packed.append(oled_core.pack_bits(bits, profile.mode))
+        frames_info.append((name, profile.width, profile.height, oled_core.describe_threshold(threshold_mode, threshold)))
+    return packed, frames_info
+
+
+def export_profile(profile, grays, names, threshold=None, prefix="frame", generate_array=True, frame_delay=100,
+                   flash_reserve_kb=oled_budget.DEFAULT_FLASH_RESERVE_KB,
+                   ram_reserve_kb=oled_budget.DEFAULT_RAM_RESERVE_KB, write_over_budget=False):
+    """导出一个配置 (在工作进程中运行)，返回结果字典
+
+    threshold: {"mode", "manual", "percent", "per_frame"}; 超出预算时默认不写文件。
+    """
+    threshold = dict(threshold or {})
+    threshold_mode = threshold.get("mode", "manual")
+    frames, frames_info = pack_profile_frames(
+        grays, names, profile, threshold_mode, threshold.get("manual", 128),
+        threshold.get("percent", 50.0), threshold.get("per_frame", True))
+
+    plan = oled_budget.plan_export(
+        frames, oled_budget.linker_script_for(profile.output_path), flash_reserve_kb, ram_reserve_kb,
+        profile.encoding, generate_array, profile.blob, (profile.width, profile.height, profile.mode),
+        oled_budget.frame_sizes_for(frames_info))
+    result = {"name": profile.name, "summary": plan.summary(), "report": plan.report(), "fits": plan.fits,
+              "saved": None}
+    if not plan.fits and not write_over_budget:
+        return result
+
+    notes = [f"// 导出配置: {profile.describe(with_output=False)}",
+             f"// 阈值模式: {oled_core.THRESHOLD_MODE_NAMES[threshold_mode]}"]
+    if profile.dither != "none":
+        notes.append(f"// 抖动: {oled_core.DITHER_NAMES[profile.dither]}")
+    result["saved"] = oled_export.write_frames(
+        profile.output_path, frames, frames_info, plan, prefix, notes, profile.header,
+        generate_array, frame_delay, profile.blob)
+    return result
+
+
+def export_profiles(profiles, grays, names, on_result=None, max_workers=None, mp_context=None, **options):
+    """把同一组原始灰度帧导出到多个配置，多个配置时用进程池并行
+
+    on_result(结果字典) 在每个配置完成时调用; 返回按配置顺序排列的结果列表。
+    mp_context: 进程启动方式 (界面中从工作线程启动进程池时用 "spawn")
+    """
+    names_seen = [p.name for p in profiles]
+    if len(set(names_seen)) != len(names_seen):
+        raise ValueError("配置名称重复")
+    if len(profiles) <= 1:
+        results = [export_profile(p, grays, names, **options) for p in profiles]
+        for result in results:
+            if on_result:
+                on_result(result)
+        return results
+
+    workers = min(len(profiles), max_workers or os.cpu_count() or 1)
+    by_name = {}
+    if isinstance(mp_context, str):
+        mp_context = multiprocessing.get_context(mp_context)
+    with ProcessPoolExecutor(max_workers=workers, mp_context=mp_context) as pool:
+        futures = [pool.submit(export_profile, p, grays, names, **options) for p in profiles]
+        for future in as_completed(futures):
+            result = future.result()
+            by_name[result["name"]] = result
+            if on_result:
+                on_result(result)
+    return [by_name[p.name] for p in profiles]
+
+
+def decode_sources(paths, cache=None):
+    """每个源只解码一次，返回 (原始尺寸灰度帧列表, 文件名列表); GIF 按帧展开"""
+    cache = cache or oled_core.FrameCache()
+    grays, names = [], []
+    for path in paths:
+        if path.lower().endswith(".gif"):
+            with Image.open(path) as gif:
+                for index in range(getattr(gif, "n_frames", 1)):
+                    gif.seek(index)
+                    grays.append(oled_core.to_gray(gif.convert("RGB")))
+                    names.append(f"{os.path.basename(path)}#{index}")
+        else:
+            grays.append(cache.get(path).gray)
+            names.append(os.path.basename(path))
+    return grays, names
+
+
+def main():
+    parser = argparse.ArgumentParser(description="把同一组图像一次解码后导出到多个目标")
+    parser.add_argument("inputs", nargs="*", help="GIF 或图像文件 (支持通配符)")
+    parser.add_argument("--profiles", default=DEFAULT_PROFILES_PATH, help="配置文件 (JSON)")
+    parser.add_argument("--only", nargs="+", metavar="NAME", help="只导出这些配置")
+    parser.add_argument("--list", action="store_true", help="只列出配置")
+    parser.add_argument("--threshold-mode", choices=oled_core.THRESHOLD_MODES, default="manual")
+    parser.add_argument("-t", "--threshold", type=int, default=128, help="手动阈值 (自适应模式下为偏移 + 128)")
+    parser.add_argument("--delay", type=int, default=100, help="帧延时 (ms)")
+    parser.add_argument("-p", "--prefix", default="frame", help="变量名前缀")
+    parser.add_argument("-j", "--jobs", type=int, help="最多并行进程数")
+    parser.add_argument("--force", action="store_true", help="超出 Flash/RAM 预算时仍写文件")
+    args = parser.parse_args()
+
+    profiles = load_profiles(args.profiles)
+    if args.only:
+        unknown = set(args.only) - {p.name for p in profiles}
+        if unknown:
+            parser.error(f"没有这些配置: {', '.join(sorted(unknown))}")
+        profiles = [p for p in profiles if p.name in args.only]
+    if args.list:
+        for profile in profiles:
+            print(profile.describe())
+        return
+
+    if not args.inputs:
+        parser.error("需要输入文件")
+    paths = [p for pattern in args.inputs for p in sorted(glob.glob(pattern), key=oled_core.natural_sort_key)]
+    grays, names = decode_sources(paths)
+    print(f"已解码 {len(grays)} 帧，导出 {len(profiles)} 个配置")
+
+    def report(result):
+        state = f"已保存到 {result['saved']}" if result["saved"] else "超出预算，未写入"
+        print(f"[{result['name']}] {result['summary']}, {state}")
+
+    export_profiles(profiles, grays, names, report, args.jobs,
+                    threshold={"mode": args.threshold_mode, "manual": args.threshold},
+                    prefix=args.prefix, frame_delay=args.delay, write_over_budget=args.force)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+透明精灵导出: 图像平面 + 遮罩平面
+
+普通取模先把帧 convert("L")，GIF 的透明色和 PNG 的透明通道都被压平成某个
+灰度，画到屏幕上会连同背景一起覆盖。精灵导出保留透明信息: 帧转为 RGBA
+(GIF 的透明色索引由 PIL 转成透明度为 0)，透明度 >= alpha 阈值的像素属于
+遮罩，图像位只在遮罩内取二值化结果。
+
+两个平面都按页存放 (显存格式，每字节一列 8 行，LSB在上)，固件
+ssd1306_DrawSprite 逐页、逐列按整字节合成:
+  显存 = (显存 & ~遮罩) | 图像
+y 不按页对齐时每个字节移位后分到上下两页，不用逐像素调用 ssd1306_DrawPixel。
+
+用法:
+  python oled_sprite.py walk.gif -o sprite.h
+  python oled_sprite.py icon_*.png -o icons.h --size 16 16 -t 100 --invert -n icon
+"""
+
+import argparse
+import glob
+import os
+import sys
+
+import numpy as np
+from PIL import Image
+
+import oled_core
+import oled_export
+import oled_timing
+
+DEFAULT_ALPHA_THRESHOLD = 128
+
+
+def load_rgba(paths, width=None, height=None):
+    """解码为 (灰度帧列表, 透明度列表, 名称列表); GIF 按帧展开，给出尺寸时调整大小
+
+    调整大小在 RGBA 上进行 (PIL 按预乘透明度插值)，透明像素的颜色不会渗到边缘。
+    """
+    grays, alphas, names = [], [], []
+
+    def add(img, name):
+        with oled_timing.span("decode"):
+            rgba = img.convert("RGBA")
+        if width and height and rgba.size != (width, height):
+            with oled_timing.span("resize"):
+                rgba = rgba.resize((width, height), Image.LANCZOS)
+        with oled_timing.span("decode"):
+            grays.append(np.asarray(rgba.convert("L"), dtype=np.uint8).copy())
+            alphas.append(np.asarray(rgba.getchannel("A"), dtype=np.uint8).copy())
+        names.append(name)
+
+    for path in paths:
+        with Image.open(path) as img:
+            for index in range(getattr(img, "n_frames", 1)):
+                img.seek(index)
+                add(img, f"{os.path.basename(path)}#{index}" if path.lower().endswith(".gif")
+                    else os.path.basename(path))
+    return grays, alphas, names
+
+
+def sprite_planes(gray, alpha, threshold=128, invert=False, alpha_threshold=DEFAULT_ALPHA_THRESHOLD, dither="none"):
+    """返回 (图像, 遮罩) 两个 (H, W) 的布尔数组，图像只在遮罩内为 1"""
+    mask = np.asarray(alpha) >= alpha_threshold
+    bits = oled_core.binarize(gray, oled_core.dither_threshold(threshold, mask.shape, dither), invert)
+    return bits & mask, mask
+
+
+def pack_sprite(bits, mask):
+    """把图像和遮罩打包为按页存放的显存字节 (页数 x 宽)"""
+    with oled_timing.span("pack"):
+        return (oled_core.pack_pages(np.asarray(bits) & np.asarray(mask)).ravel(),
+                oled_core.pack_pages(mask).ravel())
+
+
+def draw_sprite(buffer, bits, mask, x, y):
+    """参考实现: 把精灵 (H, W 布尔数组) 画到显存 buffer (页数, 屏宽) 上，裁剪到屏幕内，返回新显存"""
+    buffer = np.asarray(buffer, dtype=np.uint8)
+    pixels = np.unpackbits(buffer[:, None, :], axis=1, bitorder="little").reshape(-1, buffer.shape[1]).astype(bool)
+    height, width = min(mask.shape[0], pixels.shape[0] - y), min(mask.shape[1], pixels.shape[1] - x)
+    if height > 0 and width > 0:
+        region = pixels[y:y + height, x:x + width]
+        m = mask[:height, :width]
+        region[m] = bits[:height, :width][m]
+    return oled_core.pack_pages(pixels)
+
+
+def export_sprites(grays, alphas, names, output_path, threshold=128, invert=False,
+                   alpha_threshold=DEFAULT_ALPHA_THRESHOLD, dither="none", prefix="sprite", source_desc=""):
+    """二值化、生成遮罩并写出头文件，返回 (帧数, 不透明像素占比, 是否写入)
+
+    所有帧必须同尺寸; 没有任何透明像素时照常导出 (遮罩全为 1)。
+    """
+    if not grays:
+        raise ValueError("没有帧")
+    shapes = {g.shape for g in grays}
+    if len(shapes) != 1:
+        raise ValueError(f"精灵帧尺寸不一致: {sorted(shapes)}")
+
+    planes, masks, coverage = [], [], 0
+    for gray, alpha in zip(grays, alphas):
+        bits, mask = sprite_planes(gray, alpha, threshold, invert, alpha_threshold, dither)
+        packed_bits, packed_mask = pack_sprite(bits, mask)
+        planes.append(packed_bits)
+        masks.append(packed_mask)
+        coverage += int(mask.sum())
+
+    height, width = grays[0].shape
+    frames_info = [(name, width, height) for name in names]
+    notes = [f"// 透明精灵: {source_desc or f'{len(grays)} 帧'}",
+             f"// 阈值: {threshold}{' (反转)' if invert else ''}, 透明度阈值: {alpha_threshold}"]
+    if dither != "none":
+        notes.append(f"// 抖动: {oled_core.DITHER_NAMES[dither]}")
+    with oled_timing.span("format"):
+        text = oled_export.render_sprites(frames_info, np.stack(planes), np.stack(masks), notes, prefix)
+    opaque = coverage / (len(grays) * width * height)
+    return len(grays), opaque, oled_export.write_if_changed(output_path, text)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="把带透明的 GIF/PNG 导出为精灵 (图像 + 遮罩，按页存放)")
+    parser.add_argument("inputs", nargs="+", help="GIF 或 PNG 文件 (支持通配符)")
+    parser.add_argument("-o", "--output", required=True, help="输出 .h 文件路径")
+    parser.add_argument("--size", type=int, nargs=2, metavar=("W", "H"), help="调整到此尺寸 (默认原始尺寸)")
+    parser.add_argument("-t", "--threshold", type=int, default=128, help="二值化阈值")
+    parser.add_argument("--alpha", type=int, default=DEFAULT_ALPHA_THRESHOLD, help="透明度阈值 (>= 此值为不透明)")
+    parser.add_argument("--dither", choices=oled_core.DITHER_MODES, default="none")
+    parser.add_argument("--invert", action="store_true", help="反转灰度")
+    parser.add_argument("-n", "--name", default="sprite", help="变量名前缀")
+    args = parser.parse_args()
+
+    paths = [p for pattern in args.inputs for p in sorted(glob.glob(pattern), key=oled_core.natural_sort_key)]
+    if not paths:
+        print("没有匹配的输入文件", file=sys.stderr)
+        return 1
+    width, height = args.size or (None, None)
+    grays, alphas, names = load_rgba(paths, width, height)
+    try:
+        count, opaque, written = export_sprites(grays, alphas, names, args.output, args.threshold, args.invert,
+                                                args.alpha, args.dither, args.name, f"{len(paths)} 个文件")
+    except ValueError as e:
+        print(f"导出失败: {e}", file=sys.stderr)
+        return 1
+    print(f"已导出 {count} 个精灵到 {args.output} (不透明像素 {opaque:.0%})"
+          + ("" if written else " (内容未变化，未重写)"))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
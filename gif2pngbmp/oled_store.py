@@ -0,0 +1,388 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+磁盘帧存储: 长序列 (几万帧的视频导出) 的二值帧按 1 位/像素打包存放在文件中，
+通过内存映射 (np.memmap) 读取
+
+文件格式 (小端):
+  0   8  魔数 b"OLEDFRM\\0"
+  8   2  版本 (1)
+  10  1  类型: 0 = 二值帧 (按取模方式打包), 1 = 灰度帧 (uint8, 每像素 1 字节)
+  11  1  取模方式: 0 = 水平, 1 = 垂直 (灰度帧为 0)
+  12  4  宽
+  16  4  高
+  20  4  每帧字节数
+  24  8  帧数
+  32 .. 63 保留 (0)
+  64 起   各帧依次存放，没有帧间填充
+
+二值帧的字节与 oled_core.pack_bits 的输出相同，预览、导出、去重和图块编码直接
+使用映射出来的每帧视图，不复制。灰度帧可选地存成同样格式的 uint8 文件，
+全局阈值 (Otsu/百分位) 需要先看完所有帧时作为中间结果。
+
+生成时一帧一帧地解码、二值化、打包、追加写入，内存占用只有一帧，与帧数无关。
+输入也可以是 Y4M / 原始灰度帧视频 (oled_video)，亮度平面直接从映射中读取。
+
+用法:
+  python oled_store.py build frames/*.png -o seq.oledfrm --size 128x64 --threshold-mode otsu
+  python oled_store.py build frames/*.png -o seq.oledfrm --gray seq.oledgray    同时保留灰度帧
+  python oled_store.py build clip.y4m -o clip.oledfrm --size 128x64
+  python oled_store.py build clip.gray --raw-size 128x64 -o clip.oledfrm
+  python oled_store.py info seq.oledfrm
+  python oled_store.py export seq.oledfrm -o ../Core/Inc/anim.h --encoding delta_rle
+"""
+
+import argparse
+import glob
+import os
+import struct
+import sys
+
+import numpy as np
+
+import oled_budget
+import oled_core
+import oled_export
+import oled_video
+from oled_profiles import resize_gray
+
+MAGIC = b"OLEDFRM\0"
+VERSION = 1
+HEADER = struct.Struct("<8sHBBIIIQ")
+HEADER_SIZE = 64
+
+KINDS = ("bits", "gray")
+MODES = ("horizontal", "vertical")
+STORE_EXTENSION = ".oledfrm"
+
+# 追加写入时每隔多少帧更新一次文件头中的帧数 (其他进程可以边生成边预览)
+FLUSH_EVERY = 256
+
+
+def frame_size(width, height, kind="bits", mode="horizontal"):
+    """每帧字节数"""
+    if kind == "gray":
+        return width * height
+    if mode == "vertical":
+        return width * ((height + 7) // 8)
+    return height * ((width + 7) // 8)
+
+
+class FrameStore:
+    """内存映射的帧存储
+
+    用 create() 新建后 append() 追加帧，close() 时写入最终帧数; 用 open() 只读打开。
+    frames 为 (帧数, 每帧字节数) 的只读 np.memmap，frames[i] 是映射中的视图。
+    """
+
+    source_format = "帧存储"
+
+    def __init__(self, path, kind, width, height, mode, count=0, writable=False):
+        if kind not in KINDS:
+            raise ValueError(f"未知的帧存储类型: {kind}")
+        if mode not in MODES:
+            raise ValueError(f"未知的取模方式: {mode}")
+        self.path = path
+        self.kind = kind
+        self.width = width
+        self.height = height
+        self.mode = mode
+        self.frame_size = frame_size(width, height, kind, mode)
+        self.count = count
+        self._file = open(path, "r+b") if writable else None
+        self._map = None
+
+    @classmethod
+    def create(cls, path, width, height, kind="bits", mode="horizontal"):
+        """新建 (覆盖) 帧存储文件"""
+        store_mode = "horizontal" if kind == "gray" else mode
+        with open(path, "wb") as f:
+            f.write(b"\0" * HEADER_SIZE)
+        store = cls(path, kind, width, height, store_mode, 0, writable=True)
+        store.flush()
+        return store
+
+    @classmethod
+    def open(cls, path):
+        """只读打开已有的帧存储"""
+        with open(path, "rb") as f:
+            head = f.read(HEADER_SIZE)
+        if len(head) < HEADER_SIZE or head[:len(MAGIC)] != MAGIC:
+            raise ValueError(f"{path} 不是帧存储文件")
+        _, version, kind, mode, width, height, size, count = HEADER.unpack_from(head)
+        if version != VERSION:
+            raise ValueError(f"{path}: 不支持的帧存储版本 {version}")
+        store = cls(path, KINDS[kind], width, height, MODES[mode], count)
+        if size != store.frame_size:
+            raise ValueError(f"{path}: 每帧字节数 {size} 与 {width}x{height} 不符")
+        available = (os.path.getsize(path) - HEADER_SIZE) // size if size else 0
+        store.count = min(count, available)
+        return store
+
+    def __len__(self):
+        return self.count
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def describe(self):
+        kind = "二值" if self.kind == "bits" else "灰度"
+        mode = f", {'水平' if self.mode == 'horizontal' else '垂直'}取模" if self.kind == "bits" else ""
+        return (f"{os.path.basename(self.path)}: {self.count} 帧 {kind} {self.width}x{self.height}{mode}, "
+                f"每帧 {self.frame_size} B, 共 {self.count * self.frame_size / 1024:.1f} KB")
+
+    def append(self, data):
+        """追加一帧 (二值帧为打包后的字节，灰度帧为 (高, 宽) uint8)"""
+        if self._file is None:
+            raise ValueError("帧存储是只读打开的")
+        data = np.ascontiguousarray(data, dtype=np.uint8)
+        if data.size != self.frame_size:
+            raise ValueError(f"帧大小 {data.size} B 与存储的 {self.frame_size} B 不符")
+        self._file.seek(HEADER_SIZE + self.count * self.frame_size)
+        self._file.write(data.data)
+        self.count += 1
+        if self.count % FLUSH_EVERY == 0:
+            self.flush()
+
+    def flush(self):
+        """把帧数写回文件头"""
+        if self._file is None:
+            return
+        self._file.seek(0)
+        self._file.write(HEADER.pack(MAGIC, VERSION, KINDS.index(self.kind), MODES.index(self.mode),
+                                     self.width, self.height, self.frame_size, self.count))
+        self._file.flush()
+
+    def close(self):
+        if self._file is not None:
+            self.flush()
+            self._file.close()
+            self._file = None
+        self._map = None
+
+    @property
+    def frames(self):
+        """(帧数, 每帧字节数) 的只读内存映射"""
+        if self._map is None or len(self._map) != self.count:
+            if self._file is not None:
+                self._file.flush()
+            if self.count == 0:
+                return np.zeros((0, self.frame_size), dtype=np.uint8)
+            self._map = np.memmap(self.path, dtype=np.uint8, mode="r", offset=HEADER_SIZE,
+                                  shape=(self.count, self.frame_size))
+        return self._map
+
+    def packed(self, index):
+        """第 index 帧的打包字节 (映射中的视图)"""
+        if self.kind != "bits":
+            raise ValueError("灰度帧存储没有打包的帧")
+        return self.frames[index]
+
+    def bits(self, index):
+        """第 index 帧的二值数组 (高, 宽)"""
+        if self.kind == "gray":
+            raise ValueError("灰度帧存储没有二值帧")
+        data = self.frames[index]
+        if self.mode == "vertical":
+            pages = data.reshape(self.width, -1).T
+            bits = np.unpackbits(pages[:, None, :], axis=1, bitorder="little").reshape(-1, self.width)
+            return bits[:self.height].astype(bool)
+        return np.unpackbits(data.reshape(self.height, -1), axis=1)[:, :self.width].astype(bool)
+
+    def gray(self, index):
+        """第 index 帧的灰度数组 (高, 宽); 灰度存储返回映射中的视图，二值存储为 0/255"""
+        if self.kind == "gray":
+            return self.frames[index].reshape(self.height, self.width)
+        return self.bits(index).astype(np.uint8) * 255
+
+    def duplicate_map(self):
+        """每帧第一次出现的序号 (按内容摘要，不把帧复制成 bytes)"""
+        first = {}
+        return [first.setdefault(oled_core.frame_key(f), i) for i, f in enumerate(self.frames)]
+
+
+def store_frame_name(store_path, index):
+    """存储中的帧在文件列表中使用的名称 (不对应磁盘上的文件)"""
+    return f"{os.path.abspath(store_path)}#{index:06d}"
+
+
+def open_sources(paths, raw_size=None):
+    """图像文件和视频文件 (Y4M / 原始灰度帧) 的灰度帧，返回 (生成器, 总帧数)
+
+    图像逐个解码 (一次只保留一帧)，视频的每帧是映射中的视图。
+    raw_size: 原始灰度帧的 (宽, 高)
+    """
+    width, height = raw_size or (None, None)
+    videos = {p: oled_video.open_video(p, width, height) for p in paths if oled_video.is_video(p)}
+    total = sum(len(videos[p]) if p in videos else 1 for p in paths)
+
+    def frames():
+        for path in paths:
+            if path in videos:
+                yield from videos[path]
+            else:
+                yield oled_core.decode_gray(path)
+
+    return frames(), total
+
+
+def build_store(grays, path, width, height, mode="horizontal", threshold_mode="manual", manual=128,
+                percent=50.0, per_frame=True, invert=False, dither="none", gray_path=None, on_progress=None):
+    """把灰度帧序列逐帧二值化打包，写入帧存储，返回存储 (只读打开)
+
+    grays 可以是任意可迭代的灰度帧 (生成器即可)，尺寸不同时调整到 width x height。
+    全局 Otsu/百分位阈值要先统计所有帧: 第一遍把灰度帧写入灰度存储 (gray_path，
+    没给出时用临时文件，结束后删除) 并累加直方图，第二遍从映射中读取。
+    on_progress(已处理帧数) 每帧调用一次。
+    """
+    two_pass = threshold_mode in ("otsu", "percentile") and not per_frame
+    temp_gray = gray_path is None and two_pass
+    if temp_gray:
+        gray_path = path + ".gray.tmp"
+
+    gray_store = FrameStore.create(gray_path, width, height, "gray") if gray_path else None
+    store = FrameStore.create(path, width, height, "bits", mode)
+    try:
+        total_hist = np.zeros(256, dtype=np.int64)
+
+        def pack_one(frame, threshold):
+            threshold = oled_core.dither_threshold(threshold, frame.gray.shape, dither)
+            store.append(oled_core.pack_bits(oled_core.binarize(frame.gray, threshold, invert), mode))
+
+        done = 0
+        for gray in grays:
+            frame = oled_core.CachedFrame(resize_gray(np.asarray(gray, dtype=np.uint8), width, height))
+            if gray_store is not None:
+                gray_store.append(frame.gray)
+            if two_pass:
+                total_hist += frame.hist
+            else:
+                threshold = oled_core.frame_thresholds([frame], threshold_mode, manual, percent, per_frame,
+                                                       adaptive_offset=manual - 128)[0]
+                pack_one(frame, threshold)
+            done += 1
+            if on_progress:
+                on_progress(done)
+
+        if two_pass:
+            gray_store.flush()
+            threshold = oled_core.select_thresholds(total_hist, threshold_mode, manual, percent, False)[0]
+            for i in range(len(gray_store)):
+                pack_one(oled_core.CachedFrame(gray_store.gray(i)), threshold)
+    finally:
+        store.close()
+        if gray_store is not None:
+            gray_store.close()
+            if temp_gray:
+                os.remove(gray_path)
+    return FrameStore.open(path)
+
+
+def export_store(store, output_path, prefix="frame", encoding="auto", generate_header=False, generate_array=True,
+                 frame_delay=100, blob=False, flash_reserve_kb=oled_budget.DEFAULT_FLASH_RESERVE_KB,
+                 ram_reserve_kb=oled_budget.DEFAULT_RAM_RESERVE_KB, write_over_budget=False):
+    """把二值帧存储导出为 C 数组，返回 (预算规划, 保存的路径或 None)
+
+    每帧直接使用映射中的视图，预算、去重和图块编码都不复制帧数据。
+    """
+    if store.kind != "bits":
+        raise ValueError("只能导出二值帧存储")
+    frames = list(store.frames)
+    frames_info = [(f"{os.path.basename(store.path)}#{i}", store.width, store.height, "生成帧存储时已二值化")
+                   for i in range(len(frames))]
+    plan = oled_budget.plan_export(
+        frames, oled_budget.linker_script_for(output_path), flash_reserve_kb, ram_reserve_kb, encoding,
+        generate_array, blob, (store.width, store.height, store.mode), oled_budget.frame_sizes_for(frames_info))
+    if not plan.fits and not write_over_budget:
+        return plan, None
+    saved = oled_export.write_frames(
+        output_path, frames, frames_info, plan, prefix, [f"// 帧存储: {store.describe()}"],
+        generate_header, generate_array, frame_delay, blob)
+    return plan, saved
+
+
+def parse_size(text):
+    """"128x64" -> (128, 64)"""
+    try:
+        width, height = (int(v) for v in text.lower().split("x"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"尺寸格式应为 宽x高: {text}")
+    if width <= 0 or height <= 0:
+        raise argparse.ArgumentTypeError(f"尺寸必须为正: {text}")
+    return width, height
+
+
+def main():
+    parser = argparse.ArgumentParser(description="长序列的 1 位/像素磁盘帧存储 (内存映射)")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    build = sub.add_parser("build", help="把图像逐帧二值化打包写入帧存储")
+    build.add_argument("inputs", nargs="+", help="图像或视频文件 (.y4m/.gray/.raw，支持通配符)")
+    build.add_argument("-o", "--output", required=True, help=f"帧存储文件 ({STORE_EXTENSION})")
+    build.add_argument("--size", type=parse_size, default=(128, 64), help="目标尺寸，默认 128x64")
+    build.add_argument("--mode", choices=MODES, default="horizontal", help="取模方式")
+    build.add_argument("--threshold-mode", choices=oled_core.THRESHOLD_MODES, default="manual")
+    build.add_argument("-t", "--threshold", type=int, default=128, help="手动阈值 (自适应模式下为偏移 + 128)")
+    build.add_argument("--percent", type=float, default=50.0, help="百分位阈值的百分比")
+    build.add_argument("--global", dest="per_frame", action="store_false", help="Otsu/百分位用所有帧合并的直方图")
+    build.add_argument("--invert", action="store_true", help="反色")
+    build.add_argument("--dither", choices=oled_core.DITHER_MODES, default="none")
+    build.add_argument("--gray", help="同时把灰度帧写入这个文件 (uint8 内存映射)")
+    build.add_argument("--raw-size", type=parse_size, help="原始灰度帧视频的尺寸，例如 128x64")
+
+    info = sub.add_parser("info", help="显示帧存储信息")
+    info.add_argument("store")
+
+    export = sub.add_parser("export", help="把二值帧存储导出为 C 数组")
+    export.add_argument("store")
+    export.add_argument("-o", "--output", required=True, help="输出 .c/.h")
+    export.add_argument("-p", "--prefix", default="frame", help="变量名前缀")
+    export.add_argument("--encoding", choices=("auto",) + oled_budget.ENCODINGS, default="auto")
+    export.add_argument("--header", action="store_true", help="成对输出 .h 和 .c")
+    export.add_argument("--blob", action="store_true", help="连续存放")
+    export.add_argument("--delay", type=int, default=100, help="帧延时 (ms)")
+    export.add_argument("--force", action="store_true", help="超出 Flash/RAM 预算时仍写文件")
+    args = parser.parse_args()
+
+    if args.command == "build":
+        paths = [p for pattern in args.inputs for p in sorted(glob.glob(pattern), key=oled_core.natural_sort_key)]
+        if not paths:
+            parser.error("没有找到输入文件")
+        width, height = args.size
+        try:
+            sources, total = open_sources(paths, args.raw_size)
+        except (OSError, ValueError) as e:
+            parser.error(str(e))
+
+        def progress(done):
+            if done % 500 == 0 or done == total:
+                print(f"\r{done}/{total}", end="", file=sys.stderr, flush=True)
+
+        store = build_store(sources, args.output, width, height, args.mode, args.threshold_mode,
+                            args.threshold, args.percent, args.per_frame, args.invert, args.dither, args.gray,
+                            progress)
+        print(file=sys.stderr)
+        print(store.describe())
+    elif args.command == "info":
+        store = FrameStore.open(args.store)
+        print(store.describe())
+        if store.kind == "bits" and len(store):
+            unique = len(set(store.duplicate_map()))
+            print(f"不重复的帧: {unique}/{len(store)}")
+    else:
+        store = FrameStore.open(args.store)
+        plan, saved = export_store(store, args.output, args.prefix, args.encoding, args.header, True,
+                                   args.delay, args.blob, write_over_budget=args.force)
+        print(plan.report())
+        if saved is None:
+            print("超出 Flash/RAM 预算，未写入 (--force 仍然写入)", file=sys.stderr)
+            return 1
+        print(f"已保存到 {saved}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
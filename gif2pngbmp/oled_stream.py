@@ -0,0 +1,509 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+串口推流: 通过 USART1 把帧序列推送到开发板 (固件接收端: oled_stream/oled_stream.c)
+
+每帧与上一帧异或后 RLE 编码 (与 ssd1306_ApplyDeltaRLE 相同的格式)，按滑动窗口发送:
+最多 window 个包未确认，设备按顺序应用并累积确认 (ACK)，发现缺包时回 NAK，
+超时或 NAK 时从最后确认的下一帧重发 (回退N帧)。设备只按顺序应用帧，所以设备上的
+帧缓冲总是最后确认的帧，差分总是相对它计算。
+
+切换波特率时设备发出 ACK 后立即切换。ACK 丢失时主机先在新波特率上重新握手，
+不通再回到原波特率握手后重试; 设备在新波特率上 BAUD_TIMEOUT 内收不到有效包时
+也会退回原波特率并等待 HELLO，两端不会停在不同的波特率上。
+
+包格式: A5 5A | 类型 | 序号 | 长度 (u16 LE) | 数据 | CRC-16/CCITT (u16 LE)
+
+串口优先用 pyserial (Windows 需要); 没有 pyserial 时在 Linux/macOS 上用 termios。
+固件默认不接收推流，需要用 OLED_STREAM_ENABLE=1 编译 (见 oled_stream/oled_stream.h)。
+
+用法:
+  python oled_stream.py send COM3 test4.h --baud 921600     推流
+  python oled_stream.py selftest test4.h --loss 0.05        在 pty 上与模拟设备端到端测试
+"""
+
+import argparse
+import binascii
+import os
+import random
+import select
+import struct
+import sys
+import threading
+import time
+
+import numpy as np
+
+import oled_core
+import oled_emulator
+import oled_import
+from oled_defaults import DEFAULT_BAUD
+
+SYNC = b"\xA5\x5A"
+HELLO = 0x01
+FRAME = 0x02
+BAUD = 0x03
+ACK = 0x80
+NAK = 0x81
+
+HEADER = struct.Struct("<BBH")
+HELLO_INFO = struct.Struct("<HHH")
+
+# MX_USART1_UART_Init 的波特率
+LINK_BAUD = 115200
+DEFAULT_WINDOW = 4
+DEFAULT_TIMEOUT = 0.3
+MAX_RETRIES = 10
+# 固件 OLED_STREAM_BAUD_TIMEOUT_MS，长于主机重发 BAUD 的总时间
+BAUD_TIMEOUT = 5.0
+
+
+def crc16(data):
+    """CRC-16/CCITT (多项式 0x1021，初值 0xFFFF)，与固件 crc16_update 相同"""
+    return binascii.crc_hqx(bytes(data), 0xFFFF)
+
+
+def build_packet(kind, seq, payload=b""):
+    """组包"""
+    body = HEADER.pack(kind, seq & 0xFF, len(payload)) + bytes(payload)
+    return SYNC + body + struct.pack("<H", crc16(body))
+
+
+class PacketParser:
+    """增量解析字节流，CRC 错误的包直接丢弃"""
+
+    def __init__(self, max_payload=0xFFFF):
+        self.max_payload = max_payload
+        self.buffer = bytearray()
+
+    def feed(self, data):
+        """送入收到的字节，返回完整包列表 [(类型, 序号, 数据)]"""
+        self.buffer.extend(data)
+        packets = []
+        while True:
+            start = self.buffer.find(SYNC)
+            if start < 0:
+                # 保留可能是同步头前半部分的最后一个字节
+                del self.buffer[:max(len(self.buffer) - 1, 0)]
+                return packets
+            del self.buffer[:start]
+            if len(self.buffer) < 2 + HEADER.size:
+                return packets
+
+            kind, seq, length = HEADER.unpack_from(self.buffer, 2)
+            if length > self.max_payload:
+                del self.buffer[:2]
+                continue
+            total = 2 + HEADER.size + length + 2
+            if len(self.buffer) < total:
+                return packets
+
+            body = bytes(self.buffer[2:total - 2])
+            (crc,) = struct.unpack_from("<H", self.buffer, total - 2)
+            if crc == crc16(body):
+                packets.append((kind, seq, body[HEADER.size:]))
+                del self.buffer[:total]
+            else:
+                del self.buffer[:2]
+
+
+def encode_delta(prev, frame):
+    """与上一帧 (设备上的帧) 异或后 RLE 编码"""
+    return oled_core.rle_encode(oled_core.xor_delta(prev, frame)).tobytes()
+
+
+# ---- 串口 ----
+
+class _PySerialPort:
+    def __init__(self, path, baud):
+        import serial
+        self.port = serial.Serial(path, baud, timeout=0)
+
+    def read(self, timeout):
+        self.port.timeout = timeout
+        return self.port.read(max(1, self.port.in_waiting))
+
+    def write(self, data):
+        self.port.write(data)
+
+    def set_baudrate(self, baud):
+        self.port.baudrate = baud
+
+    def close(self):
+        self.port.close()
+
+
+class _TermiosPort:
+    def __init__(self, path, baud):
+        import termios
+        import tty
+        self.termios = termios
+        self.fd = os.open(path, os.O_RDWR | os.O_NOCTTY)
+        tty.setraw(self.fd)
+        self.set_baudrate(baud)
+
+    def read(self, timeout):
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        return os.read(self.fd, 4096) if ready else b""
+
+    def write(self, data):
+        view = memoryview(data)
+        while view:
+            written = os.write(self.fd, view)
+            view = view[written:]
+
+    def set_baudrate(self, baud):
+        speed = getattr(self.termios, f"B{baud}", None)
+        if speed is None:
+            return  # pty 等不支持的速率: 波特率只影响真实串口
+        attrs = self.termios.tcgetattr(self.fd)
+        attrs[4] = attrs[5] = speed
+        self.termios.tcsetattr(self.fd, self.termios.TCSADRAIN, attrs)
+
+    def close(self):
+        os.close(self.fd)
+
+
+def open_port(path, baud=LINK_BAUD):
+    """打开串口"""
+    try:
+        return _PySerialPort(path, baud)
+    except ImportError:
+        if os.name != "posix":
+            raise RuntimeError("串口推流需要 pyserial: pip install pyserial")
+        return _TermiosPort(path, baud)
+
+
+# ---- 发送端 ----
+
+class StreamStats:
+    """推流统计"""
+
+    def __init__(self):
+        self.frames = 0
+        self.raw_bytes = 0
+        self.sent_bytes = 0
+        self.retransmits = 0
+        self.start = time.perf_counter()
+
+    def summary(self):
+        elapsed = max(time.perf_counter() - self.start, 1e-9)
+        ratio = self.sent_bytes / self.raw_bytes * 100 if self.raw_bytes else 0.0
+        return (f"{self.frames} 帧, {elapsed:.2f} s, {self.frames / elapsed:.1f} fps, "
+                f"发送 {self.sent_bytes} B (原始的 {ratio:.1f}%), 重发 {self.retransmits} 包")
+
+
+class StreamSender:
+    """滑动窗口推流 (回退N帧)"""
+
+    def __init__(self, port, window=DEFAULT_WINDOW, timeout=DEFAULT_TIMEOUT):
+        if not 1 <= window < 128:
+            raise ValueError("窗口大小必须在 1~127 之间")
+        self.port = port
+        self.window = window
+        self.timeout = timeout
+        self.parser = PacketParser()
+        self.seq = 0
+        self.acked = 0
+        self.pending = []          # [(序号, 帧, 包)]，按序号排列
+        self.acked_frame = None    # 设备上最后确认的帧
+        self.frame_size = 0
+        self.stats = StreamStats()
+
+    # 设备累积确认: ACK n 表示 n 及之前的包都已应用
+    def _ack(self, seq):
+        while self.pending and ((seq - self.pending[0][0]) & 0xFF) < 128:
+            _, frame, _ = self.pending.pop(0)
+            if frame is not None:
+                self.acked_frame = frame
+            self.acked = seq
+
+    def _resend(self):
+        self.stats.retransmits += len(self.pending)
+        for _, _, packet in self.pending:
+            self.port.write(packet)
+            self.stats.sent_bytes += len(packet)
+
+    def _receive(self, timeout):
+        """处理收到的 ACK/NAK，返回是否有进展"""
+        progress = False
+        for kind, seq, payload in self.parser.feed(self.port.read(timeout)):
+            if kind == ACK:
+                before = len(self.pending)
+                self._ack(seq)
+                progress |= len(self.pending) < before
+            elif kind == NAK:
+                # 设备需要 seq: 之前的都已应用，从 seq 开始重发
+                self._ack((seq - 1) & 0xFF)
+                if self.pending and self.pending[0][0] == seq:
+                    self._resend()
+                progress = True
+        return progress
+
+    def _send(self, kind, payload=b"", frame=None):
+        self.seq = (self.seq + 1) & 0xFF
+        packet = build_packet(kind, self.seq, payload)
+        self.pending.append((self.seq, frame, packet))
+        self.port.write(packet)
+        self.stats.sent_bytes += len(packet)
+
+    def _wait_window(self, limit):
+        """等待未确认包数降到 limit 以下，超时重发"""
+        retries = 0
+        deadline = time.perf_counter() + self.timeout
+        while len(self.pending) > limit:
+            if self._receive(min(self.timeout, max(deadline - time.perf_counter(), 0.001))):
+                retries = 0
+                deadline = time.perf_counter() + self.timeout
+            elif time.perf_counter() >= deadline:
+                retries += 1
+                if retries > MAX_RETRIES:
+                    raise TimeoutError("设备没有响应")
+                self._resend()
+                deadline = time.perf_counter() + self.timeout
+
+    def hello(self):
+        """同步序号并清屏，返回设备的帧大小 (字节)"""
+        self.pending = []
+        self.seq = random.randrange(256)
+        for _ in range(MAX_RETRIES):
+            packet = build_packet(HELLO, self.seq)
+            self.port.write(packet)
+            deadline = time.perf_counter() + self.timeout
+            while time.perf_counter() < deadline:
+                for kind, seq, payload in self.parser.feed(self.port.read(0.02)):
+                    if kind == ACK and seq == self.seq and len(payload) >= HELLO_INFO.size:
+                        width, height, _ = HELLO_INFO.unpack_from(payload)
+                        self.frame_size = width * height // 8
+                        self.acked = self.seq
+                        self.acked_frame = np.zeros(self.frame_size, dtype=np.uint8)
+                        return self.frame_size
+        raise TimeoutError("设备没有响应 HELLO，检查串口和波特率")
+
+    def set_baud(self, baud, link_baud=LINK_BAUD):
+        """切换波特率: 设备确认后双方同时切换
+
+        没收到 ACK 时设备可能已经切换: 先在新波特率上重新握手; 仍不通说明设备没收到
+        BAUD 或已超时退回，在原波特率上重新握手后再试一次。重新握手会清屏。
+        """
+        for _ in range(2):
+            self._send(BAUD, struct.pack("<I", baud))
+            try:
+                self._wait_window(0)
+            except TimeoutError:
+                self.port.set_baudrate(baud)
+                try:
+                    self.hello()
+                    return
+                except TimeoutError:
+                    self.port.set_baudrate(link_baud)
+                    self.hello()
+                    continue
+            time.sleep(0.01)
+            self.port.set_baudrate(baud)
+            return
+        raise TimeoutError(f"设备没有切换到 {baud} 波特率")
+
+    def send_frame(self, frame):
+        """发送一帧 (SSD1306_Buffer 布局的 uint8 数组)"""
+        frame = np.asarray(frame, dtype=np.uint8).ravel()
+        if self.frame_size and frame.size != self.frame_size:
+            raise ValueError(f"帧大小 {frame.size} 与设备的 {self.frame_size} 字节不符")
+        self._wait_window(self.window - 1)
+        prev = self.pending[-1][1] if self.pending and self.pending[-1][1] is not None else self.acked_frame
+        self._send(FRAME, encode_delta(prev, frame), frame)
+        self.stats.frames += 1
+        self.stats.raw_bytes += frame.size
+
+    def flush(self):
+        """等待所有帧被确认"""
+        self._wait_window(0)
+
+    def stream(self, frames, frame_delay=0, stop=None):
+        """按帧延时 (ms) 依次发送，stop 为 threading.Event 时可中途停止"""
+        next_time = time.perf_counter()
+        for frame in frames:
+            if stop is not None and stop.is_set():
+                break
+            self.send_frame(frame)
+            next_time += frame_delay / 1000
+            delay = next_time - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+        self.flush()
+        return self.stats
+
+
+def connect(path, baud=DEFAULT_BAUD, window=DEFAULT_WINDOW, link_baud=LINK_BAUD):
+    """打开串口，握手，并切换到推流波特率"""
+    port = open_port(path, link_baud)
+    try:
+        sender = StreamSender(port, window)
+        sender.hello()
+        if baud != link_baud:
+            sender.set_baud(baud, link_baud)
+        return sender
+    except Exception:
+        port.close()
+        raise
+
+
+# ---- 模拟设备 (pty) ----
+
+class DeviceStandIn(threading.Thread):
+    """按固件 oled_stream.c 的逻辑应答的模拟设备，运行在 pty 主端
+
+    loss 为按概率损坏收到的帧包 (模拟线路误码)，用于测试重发。
+    """
+
+    def __init__(self, fd, width=128, height=64, loss=0.0, seed=0):
+        super().__init__(daemon=True)
+        self.fd = fd
+        self.width = width
+        self.height = height
+        self.frame_size = width * height // 8
+        self.max_payload = self.frame_size + (self.frame_size + 127) // 128
+        self.loss = loss
+        self.random = random.Random(seed)
+        self.buffer = np.zeros(self.frame_size, dtype=np.uint8)
+        self.shown = []
+        self.baud = LINK_BAUD
+        self.baud_deadline = None  # 切换后还没收到有效包时退回的时刻
+        self.synced = False
+        self.expected = 0
+        self.nak_for = None
+        self.stop_event = threading.Event()
+
+    def _reply(self, kind, seq, payload=b""):
+        os.write(self.fd, build_packet(kind, seq, payload))
+
+    def _handle(self, kind, seq, payload):
+        if kind == HELLO:
+            self.buffer[:] = 0
+            self.synced = True
+            self.expected = (seq + 1) & 0xFF
+            self.nak_for = None
+            self._reply(ACK, seq, HELLO_INFO.pack(self.width, self.height, self.max_payload))
+            return
+        if not self.synced:
+            return
+        if seq != self.expected:
+            if (self.expected - seq) & 0xFF < 128:
+                self._reply(ACK, (self.expected - 1) & 0xFF)
+            elif self.nak_for != self.expected:
+                self._reply(NAK, self.expected)
+                self.nak_for = self.expected
+            return
+        if kind == FRAME:
+            try:
+                delta = oled_core.rle_decode(np.frombuffer(payload, dtype=np.uint8), self.frame_size)
+            except IndexError:
+                return
+            self.buffer ^= delta
+            self.shown.append(self.buffer.copy())
+        elif kind == BAUD:
+            (baud,) = struct.unpack("<I", payload)
+        self.expected = (self.expected + 1) & 0xFF
+        self.nak_for = None
+        self._reply(ACK, seq)
+        if kind == BAUD:
+            self.baud = baud
+            self.baud_deadline = time.monotonic() + BAUD_TIMEOUT if baud != LINK_BAUD else None
+
+    def run(self):
+        parser = PacketParser(self.max_payload)
+        while not self.stop_event.is_set():
+            if self.baud_deadline is not None and time.monotonic() >= self.baud_deadline:
+                self.baud, self.baud_deadline, self.synced = LINK_BAUD, None, False
+            ready, _, _ = select.select([self.fd], [], [], 0.05)
+            if not ready:
+                continue
+            try:
+                data = bytearray(os.read(self.fd, 4096))
+            except OSError:
+                return
+            if self.loss and self.random.random() < self.loss:
+                data[self.random.randrange(len(data))] ^= 0xFF
+            for packet in parser.feed(data):
+                self.baud_deadline = None
+                self._handle(*packet)
+
+    def stop(self):
+        self.stop_event.set()
+        self.join()
+
+
+def frames_from_file(path, width=128, height=64):
+    """读取生成的 .h/.c，转换为 SSD1306_Buffer 布局的帧"""
+    conf = oled_emulator.DriverConfig(width, height)
+    return [oled_emulator.bitmap_to_buffer(f.bits, conf).ravel() for f in oled_import.parse_c_file(path)]
+
+
+def selftest(frames, loss=0.0, window=DEFAULT_WINDOW, baud=DEFAULT_BAUD):
+    """在 pty 上运行发送端和模拟设备，检查设备按顺序显示了每一帧"""
+    import pty
+    master, slave = pty.openpty()
+    device = DeviceStandIn(master, loss=loss)
+    device.start()
+    try:
+        sender = StreamSender(_TermiosPort(os.ttyname(slave), LINK_BAUD), window)
+        sender.hello()
+        sender.set_baud(baud)
+        stats = sender.stream(frames)
+    finally:
+        device.stop()
+        os.close(slave)
+        os.close(master)
+
+    ok = len(device.shown) == len(frames) and all(np.array_equal(a, b) for a, b in zip(device.shown, frames))
+    return ok, stats, device
+
+
+def main():
+    parser = argparse.ArgumentParser(description="串口推流到开发板 (USART1)")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    send = sub.add_parser("send", help="推流到开发板")
+    send.add_argument("port", help="串口 (COM3、/dev/ttyUSB0)")
+    send.add_argument("input", help="生成的 .h/.c 文件")
+    send.add_argument("--baud", type=int, default=DEFAULT_BAUD, help="推流波特率")
+    send.add_argument("--window", type=int, default=DEFAULT_WINDOW, help="未确认包的最大个数")
+    send.add_argument("--delay", type=int, default=0, help="帧延时 (ms)")
+    send.add_argument("--loop", action="store_true", help="循环播放")
+
+    test = sub.add_parser("selftest", help="在 pty 上与模拟设备端到端测试")
+    test.add_argument("input", nargs="?", help="生成的 .h/.c 文件 (默认随机帧)")
+    test.add_argument("--frames", type=int, default=64, help="随机帧数")
+    test.add_argument("--loss", type=float, default=0.0, help="包损坏概率")
+    test.add_argument("--window", type=int, default=DEFAULT_WINDOW)
+    test.add_argument("--baud", type=int, default=DEFAULT_BAUD)
+    args = parser.parse_args()
+
+    if args.command == "selftest":
+        if args.input:
+            frames = frames_from_file(args.input)
+        else:
+            rng = np.random.default_rng(0)
+            frames = [rng.integers(0, 256, 1024, dtype=np.uint8) for _ in range(args.frames)]
+        ok, stats, device = selftest(frames, args.loss, args.window, args.baud)
+        print(stats.summary())
+        print(f"设备波特率: {device.baud}, 显示 {len(device.shown)}/{len(frames)} 帧: {'一致' if ok else '不一致'}")
+        return 0 if ok else 1
+
+    frames = frames_from_file(args.input)
+    sender = connect(args.port, args.baud, args.window)
+    try:
+        while True:
+            sender.stream(frames, args.delay)
+            if not args.loop:
+                break
+    except KeyboardInterrupt:
+        pass
+    finally:
+        sender.port.close()
+    print(sender.stats.summary())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+8x8 图块 (tilemap) 编码
+
+每帧按 SSD1306 的页边界切成 8x8 的图块 (一页高，8列宽)，每个图块是显存中
+连续的 8 个字节 (每字节一列，LSB在上)。整个帧序列的图块一起去重，输出一份
+共用的图块集和每帧的索引表，固件用 ssd1306_DrawTilemap 直接拷贝到显存。
+
+去重时把每个图块的 8 个字节看作一个 uint64 (即图块内容本身的完美哈希)，
+对全部图块一次 np.unique，按第一次出现的顺序编号，保证输出稳定。
+"""
+
+import numpy as np
+
+import oled_core
+
+TILE_SIZE = 8
+# 图块数不超过 256 时索引为 uint8_t，否则为 uint16_t
+MAX_BYTE_TILES = 256
+MAX_WORD_TILES = 0x10000
+
+
+def frame_pages(frame, width, height, mode="horizontal"):
+    """把打包后的一帧还原为显存布局 (页数, 宽)"""
+    pages = (height + 7) // 8
+    frame = np.asarray(frame, dtype=np.uint8)
+    if mode == "vertical":
+        return frame.reshape(width, pages).T
+    bits = np.unpackbits(frame.reshape(height, -1), axis=1)[:, :width]
+    return oled_core.pack_pages(bits)
+
+
+def split_tiles(pages):
+    """(页数, 宽) 显存 -> (页数, 图块列数) 的 uint64 图块键，宽度不足8的倍数时右侧补0"""
+    page_count, width = pages.shape
+    pad = (-width) % TILE_SIZE
+    if pad:
+        pages = np.concatenate([pages, np.zeros((page_count, pad), dtype=np.uint8)], axis=1)
+    return np.ascontiguousarray(pages).view(np.uint64)
+
+
+class Tileset:
+    """去重后的图块集和每帧的索引表"""
+
+    def __init__(self, tiles, maps, width, height):
+        self.tiles = tiles          # (图块数, 8) uint8
+        self.maps = maps            # (帧数, 页数, 图块列数) uint8/uint16
+        self.width = width
+        self.height = height
+
+    @property
+    def pages(self):
+        return self.maps.shape[1]
+
+    @property
+    def cols(self):
+        return self.maps.shape[2]
+
+    @property
+    def tile_count(self):
+        return len(self.tiles)
+
+    @property
+    def total_tiles(self):
+        return int(self.maps.size)
+
+    @property
+    def index_size(self):
+        return self.maps.dtype.itemsize
+
+    @property
+    def reuse_ratio(self):
+        """引用重复图块的比例"""
+        return 1.0 - self.tile_count / self.total_tiles if self.total_tiles else 0.0
+
+    def flash_size(self):
+        """图块集 + 索引表的字节数"""
+        return self.tiles.size + self.maps.size * self.index_size
+
+    def summary(self, raw_size=None):
+        """单行报告: 图块数、复用率和比原始帧少的 Flash"""
+        text = (f"图块: {self.tile_count} 个 / {self.total_tiles} 个位置, 复用率 {self.reuse_ratio:.1%}, "
+                f"图块集 {self.tiles.size} B + 索引 {self.maps.size * self.index_size} B")
+        if raw_size is not None:
+            text += f", 比原始少 {raw_size - self.flash_size()} B"
+        return text
+
+
+def build_tileset(frames, width, height, mode="horizontal"):
+    """对整个帧序列切图块并去重，frames 为同尺寸的打包数组
+
+    不同图块超过 uint16_t 索引能表示的 MAX_WORD_TILES 个时抛出 ValueError。
+    """
+    if not len(frames):
+        return Tileset(np.zeros((0, TILE_SIZE), dtype=np.uint8),
+                       np.zeros((0, (height + 7) // 8, (width + 7) // 8), dtype=np.uint8), width, height)
+
+    keys = np.stack([split_tiles(frame_pages(f, width, height, mode)) for f in frames])
+    unique, first, inverse = np.unique(keys.ravel(), return_index=True, return_inverse=True)
+    if len(unique) > MAX_WORD_TILES:
+        raise ValueError(f"不同图块有 {len(unique)} 个，超过 uint16_t 索引能表示的 {MAX_WORD_TILES} 个")
+
+    # 按第一次出现的顺序重新编号
+    order = np.argsort(first, kind="stable")
+    rank = np.empty(len(unique), dtype=np.int64)
+    rank[order] = np.arange(len(unique))
+
+    index_type = np.uint8 if len(unique) <= MAX_BYTE_TILES else np.uint16
+    maps = rank[inverse.ravel()].astype(index_type).reshape(keys.shape)
+    tiles = unique[order].view(np.uint8).reshape(-1, TILE_SIZE)
+    return Tileset(tiles, maps, width, height)
+
+
+def render_tileset(tileset, frame_index, mode="horizontal"):
+    """用图块集还原一帧的打包数组 (检查用，与固件的拷贝顺序相同)"""
+    pages = tileset.tiles[tileset.maps[frame_index]].reshape(tileset.pages, -1)[:, :tileset.width]
+    if mode == "vertical":
+        return np.ascontiguousarray(pages.T).ravel()
+    bits = np.unpackbits(pages[:, None, :], axis=1, bitorder="little").reshape(-1, tileset.width)
+    return oled_core.pack_bits(bits[:tileset.height], mode)
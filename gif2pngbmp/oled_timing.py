@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+阶段计时: 每个任务 (导出、提取GIF帧、批量工具、预览) 按阶段累计耗时
+
+任务在自己的线程中用 job() 开始计时，之后这个线程里 span("decode") 等调用都
+累加到该任务上; 没有任务在计时时 span() 什么也不做，所以可以直接写在
+oled_core、oled_export 等底层函数里，不用层层传参。嵌套的阶段只记在最外层
+(例如预算规划中切图块时调用的打包算作 "预算/编码")，总和不会超过任务耗时。
+
+结果可以显示为单行摘要 (状态栏)，也可以写成 JSON; 需要时同时用 cProfile
+记录这个线程的调用，每个任务写一个 .prof 文件 (python -m pstats 文件 查看)。
+"""
+
+import cProfile
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+STAGES = ("decode", "resize", "binarize", "pack", "budget", "format", "write")
+STAGE_NAMES = {
+    "decode": "解码",
+    "resize": "缩放",
+    "binarize": "二值化",
+    "pack": "打包",
+    "budget": "预算/编码",
+    "format": "格式化",
+    "write": "写文件",
+}
+
+_local = threading.local()
+
+
+class JobTimer:
+    """一个任务的阶段耗时，同名阶段累加"""
+
+    def __init__(self, job, title=None, profile=False):
+        self.job = job
+        self.title = title or job
+        self.started = time.time()
+        self.totals = {}
+        self.counts = {}
+        self.wall = None
+        self.active = None
+        self._start = time.perf_counter()
+        self.profiler = cProfile.Profile() if profile else None
+
+    def add(self, stage, seconds):
+        self.totals[stage] = self.totals.get(stage, 0.0) + seconds
+        self.counts[stage] = self.counts.get(stage, 0) + 1
+
+    def finish(self):
+        if self.wall is None:
+            self.wall = time.perf_counter() - self._start
+
+    @property
+    def other(self):
+        """不属于任何阶段的时间 (阈值计算、界面更新等)"""
+        return max(0.0, (self.wall or 0.0) - sum(self.totals.values()))
+
+    def ordered_stages(self):
+        """按 STAGES 的顺序，其他阶段名排在后面"""
+        return [s for s in STAGES if s in self.totals] + sorted(s for s in self.totals if s not in STAGES)
+
+    def summary(self):
+        """单行摘要: 总计和各阶段毫秒数"""
+        parts = [f"{STAGE_NAMES.get(s, s)} {self.totals[s] * 1000:.0f}" for s in self.ordered_stages()]
+        if self.wall is not None and self.other * 1000 >= 1:
+            parts.append(f"其他 {self.other * 1000:.0f}")
+        return f"{self.title} {(self.wall or 0.0) * 1000:.0f} ms: " + ", ".join(parts)
+
+    def to_dict(self):
+        return {
+            "job": self.job,
+            "title": self.title,
+            "started": time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(self.started)),
+            "wall_ms": round((self.wall or 0.0) * 1000, 3),
+            "other_ms": round(self.other * 1000, 3),
+            "stages": {s: {"ms": round(self.totals[s] * 1000, 3), "count": self.counts[s]}
+                       for s in self.ordered_stages()},
+        }
+
+    def dump(self, directory):
+        """写 JSON (和 cProfile 的 .prof)，返回 JSON 路径"""
+        os.makedirs(directory, exist_ok=True)
+        stem = os.path.join(directory, time.strftime("%Y%m%d_%H%M%S", time.localtime(self.started))
+                            + f"_{int(self.started * 1000) % 1000:03d}_{self.job}")
+        with open(stem + ".json", "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False, indent=2)
+        if self.profiler is not None:
+            self.profiler.dump_stats(stem + ".prof")
+        return stem + ".json"
+
+
+@contextmanager
+def job(name, title=None, profile=False):
+    """在当前线程开始一个计时任务 (可选 cProfile)，退出时结束计时"""
+    timer = JobTimer(name, title, profile)
+    previous = getattr(_local, "timer", None)
+    _local.timer = timer
+    if timer.profiler is not None:
+        try:
+            timer.profiler.enable()
+        except ValueError:
+            # Python 3.12 起同一时间只能有一个 cProfile 在工作，另一个任务正在记录时跳过
+            timer.profiler = None
+    try:
+        yield timer
+    finally:
+        if timer.profiler is not None:
+            timer.profiler.disable()
+        timer.finish()
+        _local.timer = previous
+
+
+def current():
+    """当前线程正在计时的任务，没有时为 None"""
+    return getattr(_local, "timer", None)
+
+
+@contextmanager
+def span(stage):
+    """把 with 块的耗时累加到当前线程任务的 stage 阶段"""
+    timer = getattr(_local, "timer", None)
+    if timer is None or timer.active is not None:
+        yield
+        return
+    timer.active = stage
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timer.active = None
+        timer.add(stage, time.perf_counter() - start)
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+视频源: 未压缩的 Y4M (YUV4MPEG2) 和原始灰度帧文件
+
+视频工具 (ffmpeg 等) 可以直接输出这两种格式，不用先转成 GIF (丢失灰度) 或
+逐帧 PNG (多一次编码/解码):
+  ffmpeg -i clip.mp4 -vf scale=128:64 -pix_fmt gray clip.y4m
+  ffmpeg -i clip.mp4 -vf scale=128:64 -pix_fmt gray -f rawvideo clip.gray
+
+整个文件用 mmap 映射，每帧的亮度 (Y) 平面是映射中的 (高, 宽) uint8 视图，
+不复制; 色度平面直接跳过。读取器提供与 oled_store.FrameStore 相同的
+width/height/frame_size/kind 和 gray(i)，可以登记到 FrameCache 中预览和导出，
+也可以作为 oled_store.build_store 的输入逐帧转换。
+
+只支持 8 位采样 (C420jpeg/C420paldv/C420mpeg2/C420/C422/C444/C444alpha/Cmono)。
+
+用法:
+  python oled_video.py clip.y4m                       显示帧数、尺寸和帧率
+  python oled_video.py clip.gray --size 128x64        原始灰度帧需要给出尺寸
+  python oled_store.py build clip.y4m -o clip.oledfrm --size 128x64
+"""
+
+import argparse
+import mmap
+import os
+import sys
+
+import numpy as np
+
+Y4M_MAGIC = b"YUV4MPEG2"
+Y4M_FRAME = b"FRAME"
+Y4M_EXTENSIONS = (".y4m",)
+RAW_EXTENSIONS = (".gray", ".raw", ".y")
+VIDEO_EXTENSIONS = Y4M_EXTENSIONS + RAW_EXTENSIONS
+
+# 每种色度格式一帧中色度 (和透明度) 平面的总字节数 (宽, 高) -> 字节
+CHROMA_SIZES = {
+    "420jpeg": lambda w, h: 2 * ((w + 1) // 2) * ((h + 1) // 2),
+    "420paldv": lambda w, h: 2 * ((w + 1) // 2) * ((h + 1) // 2),
+    "420mpeg2": lambda w, h: 2 * ((w + 1) // 2) * ((h + 1) // 2),
+    "420": lambda w, h: 2 * ((w + 1) // 2) * ((h + 1) // 2),
+    "422": lambda w, h: 2 * ((w + 1) // 2) * h,
+    "444": lambda w, h: 2 * w * h,
+    "444alpha": lambda w, h: 3 * w * h,
+    "mono": lambda w, h: 0,
+}
+
+
+def is_video(path):
+    """按扩展名判断是否为视频源"""
+    return path.lower().endswith(VIDEO_EXTENSIONS)
+
+
+def _map_file(path):
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            raise ValueError(f"{path} 是空文件")
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+class VideoReader:
+    """内存映射的视频帧读取器，子类给出每帧亮度平面在文件中的偏移"""
+
+    kind = "gray"
+    source_format = "视频"
+
+    def __init__(self, path, width, height, offsets, frame_delay=None):
+        self.path = path
+        self.width = width
+        self.height = height
+        self.frame_size = width * height
+        self.frame_delay = frame_delay
+        self._offsets = offsets
+        self._map = None
+
+    def __len__(self):
+        return len(self._offsets)
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self.gray(index)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def gray(self, index):
+        """第 index 帧的亮度平面 (高, 宽)，是映射中的视图"""
+        if self._map is None:
+            self._map = _map_file(self.path)
+        return np.frombuffer(self._map, dtype=np.uint8, count=self.frame_size,
+                             offset=self._offsets[index]).reshape(self.height, self.width)
+
+    def close(self):
+        """关闭映射; 还有帧视图在使用时留给垃圾回收"""
+        if self._map is not None:
+            try:
+                self._map.close()
+            except BufferError:
+                pass
+            self._map = None
+
+    def describe(self):
+        rate = f", {1000 / self.frame_delay:.2f} fps" if self.frame_delay else ""
+        return (f"{os.path.basename(self.path)}: {len(self)} 帧 {self.source_format} "
+                f"{self.width}x{self.height}{rate}")
+
+
+class Y4MReader(VideoReader):
+    """YUV4MPEG2 文件: 只读取每帧的 Y 平面"""
+
+    source_format = "Y4M"
+
+    def __init__(self, path):
+        mm = _map_file(path)
+        try:
+            end = mm.find(b"\n")
+            if not mm[:len(Y4M_MAGIC)] == Y4M_MAGIC or end < 0:
+                raise ValueError(f"{path} 不是 Y4M 文件")
+            params = {}
+            for token in mm[len(Y4M_MAGIC):end].split():
+                params[chr(token[0])] = token[1:].decode("ascii")
+            if "W" not in params or "H" not in params:
+                raise ValueError(f"{path}: Y4M 文件头缺少宽高")
+            width, height = int(params["W"]), int(params["H"])
+            colorspace = params.get("C", "420jpeg")
+            if colorspace not in CHROMA_SIZES:
+                raise ValueError(f"{path}: 不支持的色度格式 C{colorspace} (只支持 8 位采样)")
+            frame_delay = None
+            if "F" in params:
+                num, den = (int(v) for v in params["F"].split(":"))
+                if num > 0:
+                    frame_delay = 1000.0 * den / num
+
+            # 帧头 "FRAME" 后面可以带参数，逐帧找换行符; 不完整的最后一帧丢弃
+            plane = width * height
+            payload = plane + CHROMA_SIZES[colorspace](width, height)
+            offsets = []
+            pos = end + 1
+            size = len(mm)
+            while pos < size:
+                if mm[pos:pos + len(Y4M_FRAME)] != Y4M_FRAME:
+                    raise ValueError(f"{path}: 偏移 {pos} 处缺少 FRAME 帧头")
+                line_end = mm.find(b"\n", pos)
+                if line_end < 0 or line_end + 1 + payload > size:
+                    break
+                offsets.append(line_end + 1)
+                pos = line_end + 1 + payload
+        finally:
+            mm.close()
+
+        super().__init__(path, width, height, offsets, frame_delay)
+        self.colorspace = colorspace
+
+
+class RawReader(VideoReader):
+    """原始 8 位灰度帧依次存放的文件 (ffmpeg -pix_fmt gray -f rawvideo)，需要给出尺寸"""
+
+    source_format = "RAW"
+
+    def __init__(self, path, width, height, frame_delay=None):
+        if width <= 0 or height <= 0:
+            raise ValueError("原始灰度帧需要给出宽和高")
+        count = os.path.getsize(path) // (width * height)
+        offsets = range(0, count * width * height, width * height)
+        super().__init__(path, width, height, offsets, frame_delay)
+
+
+def open_video(path, width=None, height=None):
+    """按扩展名打开视频源; 原始灰度帧需要 width/height"""
+    if path.lower().endswith(Y4M_EXTENSIONS):
+        return Y4MReader(path)
+    if not width or not height:
+        raise ValueError(f"{os.path.basename(path)}: 原始灰度帧需要给出宽和高")
+    return RawReader(path, width, height)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="显示 Y4M / 原始灰度帧文件的信息")
+    parser.add_argument("path", help="视频文件 (.y4m，或 .gray/.raw/.y 原始灰度帧)")
+    parser.add_argument("--size", help="原始灰度帧的尺寸，例如 128x64")
+    args = parser.parse_args()
+
+    width = height = None
+    if args.size:
+        width, height = (int(v) for v in args.size.lower().split("x"))
+    try:
+        reader = open_video(args.path, width, height)
+    except (OSError, ValueError) as e:
+        print(f"无法打开: {e}", file=sys.stderr)
+        return 1
+    print(reader.describe())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+监视模式: 源文件夹或设置文件 (.ini) 变化时自动增量导出
+
+美术把帧拖进文件夹后不用再手动 "转换并保存":
+  - 轮询文件夹中的图像和设置文件的 (修改时间, 大小)，一批变化在 debounce 秒内
+    没有新的变化后才导出一次 (复制一批文件时只导出一次，也不会读到写了一半的文件)
+  - 只重新解码、二值化和打包变化的帧; 其余帧沿用上次的打包结果
+    (阈值取决于所有帧时仍重新计算阈值，但直方图来自帧缓存)
+  - 输出的 .c/.h 只在内容变化时原子替换，固件增量编译时不会重新编译没变的资源
+
+只用标准库轮询，不依赖 watchdog 之类的文件系统通知库。
+设置文件与界面 "保存设置" 的格式相同。
+
+用法:
+  python oled_watch.py png_output -o ../Core/Inc/anim.h --settings oled.ini
+  python oled_watch.py png_output -o anim.c --once          只导出一次
+"""
+
+import argparse
+import glob
+import os
+import sys
+import threading
+import time
+
+import numpy as np
+
+import oled_budget
+import oled_core
+import oled_export
+
+IMAGE_EXTENSIONS = ('.png', '.bmp', '.jpg', '.jpeg')
+DEFAULT_DEBOUNCE_S = 0.5
+DEFAULT_INTERVAL_S = 0.25
+
+# 设置文件中的键: (类型, 默认值)，与界面的默认值一致
+SETTINGS_SCHEMA = {
+    "prefix": (str, "frame"),
+    "threshold": (int, 128),
+    "threshold_mode": (str, "manual"),
+    "threshold_per_frame": (bool, True),
+    "threshold_percent": (int, 50),
+    "invert": (bool, False),
+    "resize": (bool, True),
+    "width": (int, 128),
+    "height": (int, 64),
+    "mode": (str, "horizontal"),
+    "header": (bool, False),
+    "array": (bool, True),
+    "blob": (bool, False),
+    "speed": (int, 100),
+    "encoding": (str, "auto"),
+    "flash_reserve": (int, oled_budget.DEFAULT_FLASH_RESERVE_KB),
+    "ram_reserve": (int, oled_budget.DEFAULT_RAM_RESERVE_KB),
+}
+
+
+def read_settings(path):
+    """读取设置文件，返回 {键: 字符串值}"""
+    settings = {}
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if line and not line.startswith('[') and '=' in line:
+                key, value = line.split('=', 1)
+                settings[key.strip()] = value.strip()
+    return settings
+
+
+def write_settings(path, settings):
+    """写设置文件，布尔值写为 1/0"""
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write("[Settings]\n")
+        for key, value in settings.items():
+            if isinstance(value, bool):
+                value = 1 if value else 0
+            f.write(f"{key}={value}\n")
+
+
+def parse_settings(settings):
+    """把设置文件的字符串值按 SETTINGS_SCHEMA 转换类型，缺少的键用默认值"""
+    values = {}
+    for key, (kind, default) in SETTINGS_SCHEMA.items():
+        if key not in settings:
+            values[key] = default
+        elif kind is bool:
+            values[key] = bool(int(settings[key]))
+        else:
+            values[key] = kind(settings[key])
+    if values["threshold_mode"] not in oled_core.THRESHOLD_MODES:
+        raise ValueError(f"未知的阈值模式: {values['threshold_mode']}")
+    if values["encoding"] != "auto" and values["encoding"] not in oled_budget.ENCODINGS:
+        raise ValueError(f"未知的帧编码: {values['encoding']}")
+    return values
+
+
+def list_sources(folder):
+    """文件夹中的图像文件 (不递归)，按自然顺序"""
+    paths = [p for p in glob.glob(os.path.join(folder, "*")) if p.lower().endswith(IMAGE_EXTENSIONS)]
+    return sorted(paths, key=oled_core.natural_sort_key)
+
+
+def file_stamp(path):
+    """(修改时间 ns, 大小)，文件不存在时为 None"""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def threshold_key(threshold):
+    """阈值 (标量或阈值图) 的比较键"""
+    if np.ndim(threshold) == 0:
+        return float(threshold)
+    threshold = np.ascontiguousarray(threshold)
+    return threshold.shape, threshold.tobytes()
+
+
+class IncrementalExporter:
+    """记住每帧上次的打包结果，只重新转换变化的帧"""
+
+    def __init__(self, output_path, cache=None):
+        self.output_path = output_path
+        self.cache = cache or oled_core.FrameCache()
+        self._packed = {}   # 路径 -> (比较键, 打包数组, (宽, 高))
+
+    def export(self, paths, settings):
+        """按设置导出 paths，返回结果字典 {converted, reused, summary, report, fits, saved}
+
+        超出 Flash/RAM 预算时不写文件 (监视模式下没有人回答询问)。
+        """
+        s = settings
+        target_width, target_height = (s["width"], s["height"]) if s["resize"] else (None, None)
+        frames = [self.cache.get(p, target_width, target_height) for p in paths]
+        thresholds = oled_core.frame_thresholds(
+            frames, s["threshold_mode"], s["threshold"], s["threshold_percent"], s["threshold_per_frame"],
+            adaptive_offset=s["threshold"] - 128)
+
+        packed, frames_info, converted = [], [], 0
+        pack_settings = (target_width, target_height, s["mode"], s["invert"])
+        for path, frame, threshold in zip(paths, frames, thresholds):
+            key = (file_stamp(path), pack_settings, threshold_key(threshold))
+            entry = self._packed.get(path)
+            if entry is None or entry[0] != key:
+                bits = oled_core.binarize(frame.gray, threshold, s["invert"])
+                entry = (key, oled_core.pack_bits(bits, s["mode"]), (frame.gray.shape[1], frame.gray.shape[0]))
+                self._packed[path] = entry
+                converted += 1
+            packed.append(entry[1])
+            frames_info.append((os.path.basename(path), *entry[2],
+                                oled_core.describe_threshold(s["threshold_mode"], threshold)))
+        for path in set(self._packed) - set(paths):
+            del self._packed[path]
+
+        plan = oled_budget.plan_export(
+            packed, oled_budget.linker_script_for(self.output_path), s["flash_reserve"], s["ram_reserve"],
+            s["encoding"], s["array"], s["blob"], oled_budget.tile_shape_for(frames_info, s["mode"]),
+            oled_budget.frame_sizes_for(frames_info))
+        result = {"converted": converted, "reused": len(paths) - converted, "summary": plan.summary(),
+                  "report": plan.report(), "fits": plan.fits, "saved": None}
+        if not plan.fits:
+            return result
+
+        threshold_note = oled_core.threshold_note(s["threshold_mode"], s["threshold_per_frame"])
+        result["saved"] = oled_export.write_frames(
+            self.output_path, packed, frames_info, plan, s["prefix"] or "frame", [threshold_note],
+            s["header"], s["array"], s["speed"], s["blob"])
+        return result
+
+
+class FolderWatcher:
+    """轮询源文件夹和设置文件，一批变化稳定 debounce 秒后回调一次"""
+
+    def __init__(self, folder, settings_path=None, debounce=DEFAULT_DEBOUNCE_S, interval=DEFAULT_INTERVAL_S):
+        self.folder = folder
+        self.settings_path = settings_path
+        self.debounce = debounce
+        self.interval = interval
+
+    def poll(self):
+        """当前状态: {路径: (修改时间, 大小)}"""
+        state = {path: file_stamp(path) for path in list_sources(self.folder)}
+        if self.settings_path:
+            state[self.settings_path] = file_stamp(self.settings_path)
+        return {path: stamp for path, stamp in state.items() if stamp is not None}
+
+    def run(self, on_change, stop):
+        """循环直到 stop (threading.Event) 被设置; 启动时先回调一次
+
+        on_change(变化的路径集合) 在轮询线程中调用。
+        """
+        seen = {}
+        changed = set()
+        last_change = None
+        while not stop.is_set():
+            state = self.poll()
+            if state != seen:
+                changed |= {p for p in set(state) | set(seen) if state.get(p) != seen.get(p)}
+                seen = state
+                last_change = time.monotonic()
+            if changed and time.monotonic() - last_change >= self.debounce:
+                batch, changed = changed, set()
+                on_change(batch)
+            stop.wait(self.interval)
+
+
+def watch(folder, output_path, settings_path=None, on_result=None, on_error=None, stop=None,
+          settings=None, debounce=DEFAULT_DEBOUNCE_S, interval=DEFAULT_INTERVAL_S, once=False):
+    """监视文件夹并增量导出
+
+    settings_path 给出时每次变化都重新读取; 否则使用 settings (已转换类型的字典，
+    缺省为默认设置)。on_result(结果字典, 源文件列表) 在每次导出后调用，
+    on_error(异常) 在导出出错时调用 (例如文件还没写完)，下一次变化时重试。
+    """
+    exporter = IncrementalExporter(output_path)
+    watcher = FolderWatcher(folder, settings_path, debounce, interval)
+    stop = stop or threading.Event()
+    current = {"settings": settings}
+
+    def rebuild(changed):
+        try:
+            if settings_path and (current["settings"] is None or settings_path in changed):
+                current["settings"] = parse_settings(read_settings(settings_path))
+            elif current["settings"] is None:
+                current["settings"] = parse_settings({})
+            paths = list_sources(folder)
+            if not paths:
+                raise ValueError(f"{folder} 中没有图像文件")
+            result = exporter.export(paths, current["settings"])
+            result["changed"] = len(changed)
+            if on_result:
+                on_result(result, paths)
+        except Exception as e:
+            if on_error is None:
+                raise
+            on_error(e)
+        if once:
+            stop.set()
+
+    watcher.run(rebuild, stop)
+
+
+def describe_result(result):
+    """单行结果描述"""
+    state = f"已保存到 {result['saved']}" if result["saved"] else "超出预算，未写入"
+    return (f"重新转换 {result['converted']} 帧, 沿用 {result['reused']} 帧; "
+            f"{result['summary']}; {state}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="监视图像文件夹和设置文件，变化时增量导出")
+    parser.add_argument("folder", help="源图像文件夹")
+    parser.add_argument("-o", "--output", required=True, help="输出 .c/.h 文件 (设置中勾选头文件时成对输出)")
+    parser.add_argument("--settings", help="设置文件 (.ini，界面 \"保存设置\" 生成)，变化时重新读取")
+    parser.add_argument("--debounce", type=float, default=DEFAULT_DEBOUNCE_S, help="变化稳定多久后导出 (秒)")
+    parser.add_argument("--interval", type=float, default=DEFAULT_INTERVAL_S, help="轮询间隔 (秒)")
+    parser.add_argument("--once", action="store_true", help="只导出一次")
+    args = parser.parse_args()
+
+    if not os.path.isdir(args.folder):
+        parser.error(f"不是文件夹: {args.folder}")
+
+    def report(result, paths):
+        print(f"[{time.strftime('%H:%M:%S')}] {len(paths)} 帧, {describe_result(result)}", flush=True)
+
+    def error(e):
+        print(f"[{time.strftime('%H:%M:%S')}] 导出出错: {e}", file=sys.stderr, flush=True)
+
+    if not args.once:
+        print(f"正在监视 {args.folder} (Ctrl+C 停止)", flush=True)
+    try:
+        watch(args.folder, args.output, args.settings, report, None if args.once else error,
+              debounce=0 if args.once else args.debounce, interval=args.interval, once=args.once)
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
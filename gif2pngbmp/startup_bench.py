@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+2in1.py 启动时间测试
+
+每次新开一个进程运行 2in1.py --startup-trace，记录:
+  首次绘制   从启动进程到主窗口第一次画出来 (root.update() 之后)
+  可交互     后台预热完成 (numpy/PIL 和取模模块都已导入)，回到主循环
+另外单独测一次 "导入全部重模块" 的时间，即改为延迟导入前首次绘制之前要等的部分。
+需要图形界面 (DISPLAY)。
+
+用法:
+  python startup_bench.py            默认运行 5 次
+  python startup_bench.py -n 10 --json startup.json
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+APP_PATH = os.path.join(BASE_DIR, "2in1.py")
+
+
+def run_once(python=sys.executable, timeout=60):
+    """启动一次界面，返回 {"first_paint_ms", "interactive_ms", "warm_up_ms"}"""
+    fd, trace_path = tempfile.mkstemp(suffix=".json")
+    os.close(fd)
+    try:
+        start = time.time()
+        proc = subprocess.run([python, APP_PATH, "--startup-trace", trace_path], cwd=BASE_DIR,
+                              capture_output=True, text=True, timeout=timeout)
+        if proc.returncode != 0:
+            raise RuntimeError(f"2in1.py 退出码 {proc.returncode}: {proc.stderr.strip()}")
+        with open(trace_path, "r", encoding="utf-8") as f:
+            trace = json.load(f)
+    finally:
+        os.remove(trace_path)
+    return {
+        "first_paint_ms": (trace["first_paint"] - start) * 1000,
+        "interactive_ms": (trace["interactive"] - start) * 1000,
+        "warm_up_ms": trace["warm_up_s"] * 1000,
+    }
+
+
+def eager_import_ms(python=sys.executable):
+    """在新进程中一次导入全部重模块的时间 (不含解释器启动)"""
+    code = ("import time; t = time.perf_counter(); import sys; sys.path.insert(0, '.');"
+            "import numpy, PIL.Image, PIL.ImageTk, PIL.ImageSequence;"
+            "import oled_core, oled_budget, oled_export, oled_import, oled_profiles, oled_grey, oled_watch,"
+            " oled_emulator, oled_stream, oled_store, oled_video, oled_sprite, font_gen, ws2812_gen;"
+            "print((time.perf_counter() - t) * 1000)")
+    proc = subprocess.run([python, "-c", code], cwd=BASE_DIR, capture_output=True, text=True, check=True)
+    return float(proc.stdout.strip())
+
+
+def summarize(values):
+    return {"median": statistics.median(values), "min": min(values), "max": max(values)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="测量 2in1.py 的首次绘制和可交互时间")
+    parser.add_argument("-n", "--runs", type=int, default=5, help="运行次数")
+    parser.add_argument("--json", help="把每次结果和汇总写到 JSON 文件")
+    args = parser.parse_args()
+
+    runs = []
+    for i in range(args.runs):
+        try:
+            result = run_once()
+        except (RuntimeError, subprocess.TimeoutExpired) as e:
+            print(f"第 {i + 1} 次启动失败: {e}", file=sys.stderr)
+            return 1
+        runs.append(result)
+        print(f"[{i + 1}/{args.runs}] 首次绘制 {result['first_paint_ms']:.0f} ms, "
+              f"可交互 {result['interactive_ms']:.0f} ms (预热 {result['warm_up_ms']:.0f} ms)")
+
+    eager = eager_import_ms()
+    summary = {key: summarize([r[key] for r in runs]) for key in ("first_paint_ms", "interactive_ms", "warm_up_ms")}
+    summary["eager_import_ms"] = eager
+    print(f"\n首次绘制: 中位数 {summary['first_paint_ms']['median']:.0f} ms "
+          f"(最小 {summary['first_paint_ms']['min']:.0f}, 最大 {summary['first_paint_ms']['max']:.0f})")
+    print(f"可交互:   中位数 {summary['interactive_ms']['median']:.0f} ms "
+          f"(最小 {summary['interactive_ms']['min']:.0f}, 最大 {summary['interactive_ms']['max']:.0f})")
+    print(f"一次导入全部重模块: {eager:.0f} ms (延迟导入后不再挡在首次绘制之前)")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"runs": runs, "summary": summary}, f, ensure_ascii=False, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+WS2812 灯带取模: 将图像/动画转换为每个LED 3字节 (G, R, B) 的帧表
+
+图像缩放到 灯带数 x 每条LED数 的网格 (面积平均)，按行或按列映射到灯带:
+  rows     第 k 行 -> 第 k 条灯带，从左到右
+  columns  第 k 列 -> 第 k 条灯带，从上到下
+灯带 0 接 TIM3 CH3，灯带 1 接 TIM3 CH4 (见 ws2812/ws2812.c)。
+伽马校正按通道查表，整个帧序列一次性查表和重排，不逐帧、逐LED循环。
+
+用法:
+  python ws2812_gen.py chiikawa.gif -o leds.h --leds 8 --axis rows
+  python ws2812_gen.py frames/*.png -o leds.h --gamma 2.8 2.6 2.2 --brightness 0.5
+"""
+
+import argparse
+import glob
+import os
+from datetime import datetime
+
+import numpy as np
+from PIL import Image
+
+import oled_core
+
+AXES = ("rows", "columns")
+# R, G, B 三个通道的伽马
+DEFAULT_GAMMA = (2.8, 2.8, 2.8)
+DEFAULT_LEDS = 8
+DEFAULT_STRIPS = 2
+STRIP_CHANNELS = ("TIM3 CH3", "TIM3 CH4")
+
+# TIM3: 72MHz, Period 90 -> 每位 1.25us; 复位低电平至少 50us
+BIT_TIME_US = 1.25
+RESET_TIME_US = 80
+
+
+def gamma_lut(gamma, brightness=1.0):
+    """单通道的伽马查找表 (256 项 uint8)"""
+    x = np.arange(256, dtype=np.float64) / 255.0
+    return np.round(np.power(x, gamma) * 255.0 * brightness).clip(0, 255).astype(np.uint8)
+
+
+def channel_luts(gammas=DEFAULT_GAMMA, brightness=1.0):
+    """R, G, B 三个通道的查找表，形状 (3, 256)"""
+    if np.isscalar(gammas):
+        gammas = (gammas,) * 3
+    return np.stack([gamma_lut(g, brightness) for g in gammas])
+
+
+def grid_size(strips, leds, axis="rows"):
+    """图像需要缩放到的 (宽, 高)"""
+    if axis not in AXES:
+        raise ValueError(f"未知的映射方式: {axis}")
+    return (leds, strips) if axis == "rows" else (strips, leds)
+
+
+def load_rgb_stack(images, strips, leds, axis="rows"):
+    """把 PIL 图像序列缩放到LED网格，返回 (N, 高, 宽, 3) uint8"""
+    size = grid_size(strips, leds, axis)
+    frames = [np.asarray(img.convert("RGB").resize(size, Image.BOX), dtype=np.uint8) for img in images]
+    return np.stack(frames) if frames else np.zeros((0, size[1], size[0], 3), dtype=np.uint8)
+
+
+def load_gif(gif_path):
+    """逐帧读取 GIF，返回 (图像列表, 每帧延时 ms 列表)"""
+    images, delays = [], []
+    with Image.open(gif_path) as gif:
+        for index in range(getattr(gif, "n_frames", 1)):
+            gif.seek(index)
+            images.append(gif.convert("RGB"))
+            delays.append(int(gif.info.get("duration", 100)) or 100)
+    return images, delays
+
+
+def map_to_strips(stack, axis="rows", serpentine=False):
+    """(N, 高, 宽, 3) 网格 -> (N, 灯带数, 每条LED数, 3)
+
+    serpentine: 奇数条灯带反向 (蛇形走线的LED矩阵)
+    """
+    strips = stack if axis == "rows" else stack.transpose(0, 2, 1, 3)
+    if serpentine:
+        strips = strips.copy()
+        strips[:, 1::2] = strips[:, 1::2, ::-1]
+    return np.ascontiguousarray(strips)
+
+
+def encode_grb(strips, luts):
+    """伽马校正并重排为 G, R, B，返回 (N, 灯带数, 每条LED数 * 3) uint8"""
+    grb = np.empty_like(strips)
+    grb[..., 0] = luts[1][strips[..., 1]]
+    grb[..., 1] = luts[0][strips[..., 0]]
+    grb[..., 2] = luts[2][strips[..., 2]]
+    return grb.reshape(strips.shape[0], strips.shape[1], -1)
+
+
+def frame_time_us(leds):
+    """刷新一条灯带所需的时间 (两条灯带由 CH3/CH4 同时输出)"""
+    return leds * 24 * BIT_TIME_US + RESET_TIME_US
+
+
+def format_led_header(frames, delays, name="ws2812", source_desc="", axis="rows", gammas=DEFAULT_GAMMA):
+    """生成帧表头文件
+
+    frames: (N, 灯带数, 每条LED数 * 3) uint8; delays: 每帧延时 (ms)
+    """
+    count, strips, frame_bytes = frames.shape
+    leds = frame_bytes // 3
+    prefix = name.upper()
+    guard = f"{prefix}_FRAMES_H"
+
+    lines = [
+        "// 此文件由OLED图像取模工具生成",
+        "// 生成时间: " + datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        "// 编码: UTF-8",
+    ]
+    if source_desc:
+        lines.append(f"// 来源: {source_desc}")
+    lines += [
+        f"// WS2812 灯带: {strips} 条 x {leds} 个LED, 按{'行' if axis == 'rows' else '列'}映射, "
+        f"伽马 R/G/B {'/'.join(f'{g:g}' for g in gammas)}",
+        "// " + ", ".join(f"灯带 {i} -> {STRIP_CHANNELS[i] if i < len(STRIP_CHANNELS) else '?'}" for i in range(strips)),
+        f"// 每个LED 3 字节 (G, R, B)，刷新一帧约 {frame_time_us(leds):.0f} us",
+        "",
+        f"#ifndef {guard}",
+        f"#define {guard}",
+        "",
+        "#include <stdint.h>",
+        "",
+        f"#define {prefix}_FRAME_COUNT {count}",
+        f"#define {prefix}_STRIP_COUNT {strips}",
+        f"#define {prefix}_LED_COUNT {leds}",
+        f"#define {prefix}_FRAME_BYTES ({prefix}_LED_COUNT * 3)",
+    ]
+
+    uniform = len(set(delays)) <= 1
+    if uniform:
+        lines.append(f"#define {prefix}_FRAME_DELAY {delays[0] if delays else 100}")
+    lines += [
+        "",
+        "// 使用示例:",
+        f"// ws2812_show({name}_frames[i][0], {name}_frames[i][1], {prefix}_LED_COUNT);",
+        f"// HAL_Delay({prefix + '_FRAME_DELAY' if uniform else f'{name}_frame_delays[i]'});",
+        "",
+        f"const uint8_t {name}_frames[{prefix}_FRAME_COUNT][{prefix}_STRIP_COUNT][{prefix}_FRAME_BYTES] = {{",
+    ]
+    per_line = min(frame_bytes, 24)
+    for i in range(count):
+        lines.append(f"\t{{ // 帧 {i}")
+        for strip in range(strips):
+            body = ",\n\t\t\t".join(oled_core.format_byte_lines(frames[i, strip], per_line))
+            lines.append(f"\t\t{{ {body} }},")
+        lines.append("\t},")
+    lines.append("};")
+
+    if not uniform:
+        values = ", ".join(str(d) for d in delays)
+        lines += ["", f"const uint16_t {name}_frame_delays[{prefix}_FRAME_COUNT] = {{ {values} }};"]
+
+    lines += ["", f"#endif // {guard}", ""]
+    return "\n".join(lines)
+
+
+def convert(images, strips=DEFAULT_STRIPS, leds=DEFAULT_LEDS, axis="rows", gammas=DEFAULT_GAMMA,
+            brightness=1.0, serpentine=False):
+    """图像序列 -> (N, 灯带数, 每条LED数 * 3) 的 GRB 帧表"""
+    stack = load_rgb_stack(images, strips, leds, axis)
+    return encode_grb(map_to_strips(stack, axis, serpentine), channel_luts(gammas, brightness))
+
+
+def generate_led_frames(images, delays, output_path, strips=DEFAULT_STRIPS, leds=DEFAULT_LEDS, axis="rows",
+                        gammas=DEFAULT_GAMMA, brightness=1.0, serpentine=False, name="ws2812", source_desc=""):
+    """转换并写出头文件，返回帧表"""
+    if np.isscalar(gammas):
+        gammas = (gammas,) * 3
+    frames = convert(images, strips, leds, axis, gammas, brightness, serpentine)
+    with open(output_path, "w", encoding="utf-8") as f:
+        f.write(format_led_header(frames, delays, name, source_desc, axis, gammas))
+    return frames
+
+
+def main():
+    parser = argparse.ArgumentParser(description="将图像/动画转换为 WS2812 灯带帧表")
+    parser.add_argument("inputs", nargs="+", help="GIF 文件，或按顺序的图像文件 (支持通配符)")
+    parser.add_argument("-o", "--output", required=True, help="输出 .h 文件路径")
+    parser.add_argument("--leds", type=int, default=DEFAULT_LEDS, help="每条灯带的LED数")
+    parser.add_argument("--strips", type=int, default=DEFAULT_STRIPS, help="灯带数")
+    parser.add_argument("--axis", choices=AXES, default="rows", help="按行或按列映射到灯带")
+    parser.add_argument("--gamma", type=float, nargs="+", default=list(DEFAULT_GAMMA),
+                        help="伽马: 一个值或 R G B 三个值")
+    parser.add_argument("--brightness", type=float, default=1.0, help="亮度系数 (0-1)")
+    parser.add_argument("--serpentine", action="store_true", help="奇数条灯带反向 (蛇形)")
+    parser.add_argument("--delay", type=int, default=100, help="图像序列的帧延时 (ms)")
+    parser.add_argument("-n", "--name", default="ws2812", help="变量名前缀")
+    args = parser.parse_args()
+
+    if len(args.gamma) not in (1, 3):
+        parser.error("--gamma 需要 1 个或 3 个值")
+    gammas = tuple(args.gamma) * 3 if len(args.gamma) == 1 else tuple(args.gamma)
+
+    paths = [p for pattern in args.inputs for p in sorted(glob.glob(pattern), key=oled_core.natural_sort_key)]
+    if len(paths) == 1 and paths[0].lower().endswith(".gif"):
+        images, delays = load_gif(paths[0])
+    else:
+        images = [Image.open(p) for p in paths]
+        delays = [args.delay] * len(images)
+
+    frames = generate_led_frames(images, delays, args.output, args.strips, args.leds, args.axis, gammas,
+                                 args.brightness, args.serpentine, args.name,
+                                 ", ".join(os.path.basename(p) for p in paths[:3]) + (" ..." if len(paths) > 3 else ""))
+    print(f"已生成 {frames.shape[0]} 帧, {frames.shape[1]} 条灯带 x {args.leds} 个LED, "
+          f"{frames.nbytes} 字节, 刷新一帧约 {frame_time_us(args.leds):.0f} us")
+
+
+if __name__ == "__main__":
+    main()
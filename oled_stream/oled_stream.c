@@ -0,0 +1,265 @@
+#include "main.h"
+#include "oled_stream.h"
+#include "ssd1306.h"
+#include <stdint.h>
+#include <string.h>
+
+#if OLED_STREAM_ENABLE
+
+#define HEADER_SIZE     4   // type, seq, len
+#define ACK_TIMEOUT_MS  10
+
+enum {
+    WAIT_SYNC0,
+    WAIT_SYNC1,
+    READ_HEADER,
+    READ_PAYLOAD,
+    READ_CRC,
+};
+
+static UART_HandleTypeDef* stream_uart;
+static uint8_t rx_byte;
+
+// Filled by the receive interrupt, drained by oled_stream_poll
+static volatile uint8_t rx_ring[OLED_STREAM_RX_RING];
+static volatile uint16_t rx_head;
+static uint16_t rx_tail;
+
+// Packet being parsed
+static uint8_t state = WAIT_SYNC0;
+static uint8_t header[HEADER_SIZE];
+static uint8_t payload[OLED_STREAM_MAX_PAYLOAD];
+static uint16_t payload_len;
+static uint16_t received;
+static uint8_t crc_bytes[2];
+
+static uint8_t synced;
+static uint8_t expected_seq;
+static uint8_t last_nak;
+static uint8_t nak_pending;
+
+// Baud rate fallback when the ACK of BAUD is lost
+static uint32_t link_baud;
+static uint32_t baud_tick;
+static uint8_t baud_pending;
+
+static uint16_t crc16_update(uint16_t crc, const uint8_t* data, uint16_t len) {
+    while (len--) {
+        crc ^= (uint16_t)(*data++) << 8;
+        for (uint8_t i = 0; i < 8; i++) {
+            crc = (crc & 0x8000) ? (crc << 1) ^ 0x1021 : crc << 1;
+        }
+    }
+    return crc;
+}
+
+static void send_packet(uint8_t type, uint8_t seq, const uint8_t* data, uint16_t len) {
+    uint8_t packet[2 + HEADER_SIZE + 6 + 2];
+    uint16_t crc;
+
+    packet[0] = OLED_STREAM_SYNC0;
+    packet[1] = OLED_STREAM_SYNC1;
+    packet[2] = type;
+    packet[3] = seq;
+    packet[4] = len & 0xFF;
+    packet[5] = len >> 8;
+    if (len) {
+        memcpy(&packet[6], data, len);
+    }
+
+    crc = crc16_update(0xFFFF, &packet[2], HEADER_SIZE + len);
+    packet[6 + len] = crc & 0xFF;
+    packet[7 + len] = crc >> 8;
+    HAL_UART_Transmit(stream_uart, packet, 8 + len, ACK_TIMEOUT_MS);
+}
+
+/* A delta must decode to exactly one screen buffer and use every payload byte */
+static uint8_t delta_valid(const uint8_t* delta, uint16_t len) {
+    uint16_t pos = 0;
+    uint16_t i = 0;
+
+    while (pos < SSD1306_BUFFER_SIZE) {
+        if (i >= len) {
+            return 0;
+        }
+        uint8_t ctrl = delta[i++];
+        uint16_t count = (ctrl & 0x7F) + 1;
+        i += (ctrl & 0x80) ? 1 : count;
+        pos += count;
+    }
+    return pos == SSD1306_BUFFER_SIZE && i == len;
+}
+
+static void start_receive(void) {
+    HAL_UART_Receive_IT(stream_uart, &rx_byte, 1);
+}
+
+static void set_baud(uint32_t baud) {
+    HAL_UART_AbortReceive(stream_uart);
+    stream_uart->Init.BaudRate = baud;
+    HAL_UART_Init(stream_uart);
+    rx_tail = rx_head;
+    state = WAIT_SYNC0;
+    start_receive();
+}
+
+/* Handles one packet with a valid CRC, returns 1 if the screen changed */
+static uint8_t handle_packet(void) {
+    uint8_t type = header[0];
+    uint8_t seq = header[1];
+
+    if (type == OLED_STREAM_HELLO) {
+        uint8_t info[6] = {
+            SSD1306_WIDTH & 0xFF, SSD1306_WIDTH >> 8,
+            SSD1306_HEIGHT & 0xFF, SSD1306_HEIGHT >> 8,
+            OLED_STREAM_MAX_PAYLOAD & 0xFF, OLED_STREAM_MAX_PAYLOAD >> 8,
+        };
+        ssd1306_Fill(Black);
+        synced = 1;
+        expected_seq = seq + 1;
+        nak_pending = 0;
+        send_packet(OLED_STREAM_ACK, seq, info, sizeof(info));
+        ssd1306_UpdateScreen();
+        return 1;
+    }
+
+    if (!synced) {
+        return 0;
+    }
+
+    if (seq != expected_seq) {
+        if ((uint8_t)(expected_seq - seq) < 128) {
+            // Retransmission of applied packets, their ACK was lost
+            send_packet(OLED_STREAM_ACK, expected_seq - 1, NULL, 0);
+        } else if (!nak_pending || last_nak != expected_seq) {
+            // One NAK per gap, the host goes back to expected_seq
+            send_packet(OLED_STREAM_NAK, expected_seq, NULL, 0);
+            last_nak = expected_seq;
+            nak_pending = 1;
+        }
+        return 0;
+    }
+
+    if (type == OLED_STREAM_FRAME) {
+        if (!delta_valid(payload, payload_len)) {
+            return 0;
+        }
+        ssd1306_ApplyDeltaRLE(ssd1306_GetBuffer(), SSD1306_BUFFER_SIZE, payload);
+        expected_seq++;
+        nak_pending = 0;
+        send_packet(OLED_STREAM_ACK, seq, NULL, 0);
+        ssd1306_UpdateScreen();
+        return 1;
+    }
+
+    if (type == OLED_STREAM_BAUD && payload_len == 4) {
+        uint32_t baud = payload[0] | (payload[1] << 8) | ((uint32_t)payload[2] << 16) | ((uint32_t)payload[3] << 24);
+        expected_seq++;
+        nak_pending = 0;
+        send_packet(OLED_STREAM_ACK, seq, NULL, 0);
+        set_baud(baud);
+        // Confirmed by the next valid packet, see oled_stream_poll
+        baud_pending = baud != link_baud;
+        baud_tick = HAL_GetTick();
+    }
+    return 0;
+}
+
+void oled_stream_init(UART_HandleTypeDef* huart) {
+    stream_uart = huart;
+    link_baud = huart->Init.BaudRate;
+    baud_pending = 0;
+    synced = 0;
+    rx_head = rx_tail = 0;
+    state = WAIT_SYNC0;
+    start_receive();
+}
+
+void oled_stream_rx_byte(uint8_t byte) {
+    uint16_t next = (rx_head + 1) & (OLED_STREAM_RX_RING - 1);
+    if (next != rx_tail) {
+        rx_ring[rx_head] = byte;
+        rx_head = next;
+    }
+    // On overflow the byte is dropped; the CRC fails and the host retransmits
+}
+
+uint8_t oled_stream_poll(void) {
+    uint8_t shown = 0;
+
+    while (rx_tail != rx_head) {
+        uint8_t byte = rx_ring[rx_tail];
+        rx_tail = (rx_tail + 1) & (OLED_STREAM_RX_RING - 1);
+
+        switch (state) {
+        case WAIT_SYNC0:
+            if (byte == OLED_STREAM_SYNC0) {
+                state = WAIT_SYNC1;
+            }
+            break;
+        case WAIT_SYNC1:
+            if (byte == OLED_STREAM_SYNC1) {
+                state = READ_HEADER;
+                received = 0;
+            } else if (byte != OLED_STREAM_SYNC0) {
+                state = WAIT_SYNC0;
+            }
+            break;
+        case READ_HEADER:
+            header[received++] = byte;
+            if (received == HEADER_SIZE) {
+                payload_len = header[2] | (header[3] << 8);
+                received = 0;
+                if (payload_len > OLED_STREAM_MAX_PAYLOAD) {
+                    state = WAIT_SYNC0;
+                } else {
+                    state = payload_len ? READ_PAYLOAD : READ_CRC;
+                }
+            }
+            break;
+        case READ_PAYLOAD:
+            payload[received++] = byte;
+            if (received == payload_len) {
+                received = 0;
+                state = READ_CRC;
+            }
+            break;
+        case READ_CRC:
+            crc_bytes[received++] = byte;
+            if (received == 2) {
+                uint16_t crc = crc16_update(crc16_update(0xFFFF, header, HEADER_SIZE), payload, payload_len);
+                state = WAIT_SYNC0;
+                // Corrupted packets are ignored, the host times out and retransmits
+                if (crc == (crc_bytes[0] | (crc_bytes[1] << 8))) {
+                    baud_pending = 0;
+                    shown |= handle_packet();
+                }
+            }
+            break;
+        }
+    }
+
+    if (baud_pending && HAL_GetTick() - baud_tick >= OLED_STREAM_BAUD_TIMEOUT_MS) {
+        // Nothing readable at the new rate: the host missed the ACK of BAUD
+        baud_pending = 0;
+        synced = 0;
+        set_baud(link_baud);
+    }
+    return shown;
+}
+
+void HAL_UART_RxCpltCallback(UART_HandleTypeDef* huart) {
+    if (huart == stream_uart) {
+        oled_stream_rx_byte(rx_byte);
+        start_receive();
+    }
+}
+
+void HAL_UART_ErrorCallback(UART_HandleTypeDef* huart) {
+    // Overrun/framing errors stop interrupt reception, restart it
+    if (huart == stream_uart) {
+        start_receive();
+    }
+}
+
+#endif // OLED_STREAM_ENABLE
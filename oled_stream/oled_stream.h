@@ -0,0 +1,79 @@
+#ifndef OLED_STREAM_H
+#define OLED_STREAM_H
+
+#include "main.h"
+#include "ssd1306.h"
+
+/*
+ * Frame streaming receiver (host side: gif2pngbmp/oled_stream.py)
+ *
+ * Packet: A5 5A | type | seq | len (u16 LE) | payload | CRC-16/CCITT (u16 LE)
+ * The CRC covers type, seq, len and payload (poly 0x1021, init 0xFFFF).
+ *
+ * Host -> device
+ *   HELLO  clear the screen buffer, the next frame is seq + 1
+ *   FRAME  delta/RLE of the frame XOR the previous frame (ssd1306_ApplyDeltaRLE format)
+ *   BAUD   u32 LE baud rate, switched after the ACK has been sent
+ * Device -> host
+ *   ACK    seq of the last applied packet (cumulative); HELLO ACK carries
+ *          width, height and max payload as u16 LE
+ *   NAK    seq of the packet the device expects next
+ *
+ * Frames are applied in order only, so the buffer always holds the last
+ * acknowledged frame and every delta is taken against it. Packets other than
+ * HELLO are ignored until a HELLO has been received.
+ *
+ * If the ACK of BAUD is lost the host stays at the old rate. When no valid
+ * packet arrives at the new rate within OLED_STREAM_BAUD_TIMEOUT_MS, the
+ * device goes back to the baud rate it was started with and waits for a new
+ * HELLO. The host first retries HELLO at the new rate, then at the link rate.
+ *
+ * The receiver is opt-in: build with OLED_STREAM_ENABLE=1 (CMakeLists.txt
+ * compile definitions) to start USART1 interrupt reception in main.c.
+ */
+
+#ifndef OLED_STREAM_ENABLE
+#define OLED_STREAM_ENABLE      0
+#endif
+
+#define OLED_STREAM_SYNC0       0xA5
+#define OLED_STREAM_SYNC1       0x5A
+
+#define OLED_STREAM_HELLO       0x01
+#define OLED_STREAM_FRAME       0x02
+#define OLED_STREAM_BAUD        0x03
+#define OLED_STREAM_ACK         0x80
+#define OLED_STREAM_NAK         0x81
+
+// Worst case delta/RLE: all literals, one control byte per 128 bytes
+#define OLED_STREAM_MAX_PAYLOAD (SSD1306_BUFFER_SIZE + (SSD1306_BUFFER_SIZE + 127) / 128)
+
+// Longer than the host's BAUD retries (MAX_RETRIES + 1 timeouts, 3.3 s)
+#ifndef OLED_STREAM_BAUD_TIMEOUT_MS
+#define OLED_STREAM_BAUD_TIMEOUT_MS 5000
+#endif
+
+// Receive ring size, must be a power of two
+#ifndef OLED_STREAM_RX_RING
+#define OLED_STREAM_RX_RING     512
+#endif
+
+/**
+ * @brief Starts interrupt reception on the UART (MX_USARTx_UART_Init must have run).
+ *        Its current baud rate is the one fallen back to after a failed BAUD.
+ */
+void oled_stream_init(UART_HandleTypeDef* huart);
+
+/**
+ * @brief Parses received bytes, applies complete frames to the screen buffer and
+ *        answers with ACK/NAK. Call it from the main loop.
+ * @return 1 if a new frame was shown, 0 otherwise.
+ */
+uint8_t oled_stream_poll(void);
+
+/**
+ * @brief Queues one received byte (called from the UART receive interrupt).
+ */
+void oled_stream_rx_byte(uint8_t byte);
+
+#endif // OLED_STREAM_H
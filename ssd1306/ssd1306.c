@@ -69,6 +69,11 @@ SSD1306_Error_t ssd1306_FillBuffer(uint8_t* buf, uint32_t len) {
     return ret;
 }
 
+/* Screen buffer for in-place decoding */
+uint8_t* ssd1306_GetBuffer(void) {
+    return SSD1306_Buffer;
+}
+
 /* Initialize the oled screen */
 void ssd1306_Init(void) {
     // Reset OLED
@@ -213,31 +218,24 @@ void ssd1306_DrawPixel(uint8_t x, uint8_t y, SSD1306_COLOR color) {
 }
 
 /*
- * Draw 1 char to the screen buffer
- * ch       => char om weg te schrijven
- * Font     => Font waarmee we gaan schrijven
- * color    => Black or White
+ * Draw one glyph at the cursor and advance it
+ * rows     => glyph rows, MSB is the leftmost pixel
+ * Returns 0 if there is not enough space on the current line
  */
-char ssd1306_WriteChar(char ch, SSD1306_Font_t Font, SSD1306_COLOR color) {
+static uint8_t ssd1306_DrawGlyph(const uint16_t* rows, uint8_t char_width, uint8_t height, SSD1306_COLOR color) {
     uint32_t i, b, j;
-    
-    // Check if character is valid
-    if (ch < 32 || ch > 126)
-        return 0;
-    
-    // Char width is not equal to font width for proportional font
-    const uint8_t char_width = Font.char_width ? Font.char_width[ch-32] : Font.width;
+
     // Check remaining space on current line
     if (SSD1306_WIDTH < (SSD1306.CurrentX + char_width) ||
-        SSD1306_HEIGHT < (SSD1306.CurrentY + Font.height))
+        SSD1306_HEIGHT < (SSD1306.CurrentY + height))
     {
         // Not enough space on current line
         return 0;
     }
     
     // Use the font to write
-    for(i = 0; i < Font.height; i++) {
-        b = Font.data[(ch - 32) * Font.height + i];
+    for(i = 0; i < height; i++) {
+        b = rows[i];
         for(j = 0; j < char_width; j++) {
             if((b << j) & 0x8000)  {
                 ssd1306_DrawPixel(SSD1306.CurrentX + j, (SSD1306.CurrentY + i), (SSD1306_COLOR) color);
@@ -249,6 +247,25 @@ char ssd1306_WriteChar(char ch, SSD1306_Font_t Font, SSD1306_COLOR color) {
     
     // The current space is now taken
     SSD1306.CurrentX += char_width;
+    return 1;
+}
+
+/*
+ * Draw 1 char to the screen buffer
+ * ch       => char om weg te schrijven
+ * Font     => Font waarmee we gaan schrijven
+ * color    => Black or White
+ */
+char ssd1306_WriteChar(char ch, SSD1306_Font_t Font, SSD1306_COLOR color) {
+    // Check if character is valid
+    if (ch < 32 || ch > 126)
+        return 0;
+    
+    // Char width is not equal to font width for proportional font
+    const uint8_t char_width = Font.char_width ? Font.char_width[ch-32] : Font.width;
+    if (!ssd1306_DrawGlyph(&Font.data[(ch - 32) * Font.height], char_width, Font.height, color)) {
+        return 0;
+    }
     
     // Return written char for validation
     return ch;
@@ -268,6 +285,139 @@ char ssd1306_WriteString(char* str, SSD1306_Font_t Font, SSD1306_COLOR color) {
     return *str;
 }
 
+/*
+ * Draw one page-font glyph at the cursor and advance it; foreground and background
+ * pixels are both written, like ssd1306_DrawGlyph
+ * Returns 0 if there is not enough space on the current line
+ */
+static uint8_t ssd1306_DrawPageGlyph(const uint8_t* glyph, const SSD1306_PageFont_t* Font, uint8_t char_width, SSD1306_COLOR color) {
+    if (SSD1306_WIDTH < (SSD1306.CurrentX + char_width) ||
+        SSD1306_HEIGHT < (SSD1306.CurrentY + Font->height))
+    {
+        return 0;
+    }
+
+    uint8_t shift = SSD1306.CurrentY % 8;
+    uint8_t page = SSD1306.CurrentY / 8;
+
+    for (uint8_t p = 0; p < Font->pages; p++, page++) {
+        // Rows of the glyph in this page; the last page may be partial
+        uint8_t rows = Font->height - p * 8 < 8 ? Font->height - p * 8 : 8;
+        uint8_t rowMask = (uint8_t)(0xFF >> (8 - rows));
+        uint8_t upperMask = (uint8_t)(rowMask << shift);
+        uint8_t lowerMask = shift ? (uint8_t)(rowMask >> (8 - shift)) : 0;
+        const uint8_t* src = &glyph[p * Font->width];
+        uint8_t* upper = &SSD1306_Buffer[page * SSD1306_WIDTH + SSD1306.CurrentX];
+
+        for (uint8_t i = 0; i < char_width; i++) {
+            uint8_t bits = color == White ? src[i] : (uint8_t)(~src[i] & rowMask);
+            upper[i] = (upper[i] & (uint8_t)~upperMask) | (uint8_t)(bits << shift);
+        }
+        if (lowerMask) {
+            uint8_t* lower = upper + SSD1306_WIDTH;
+            for (uint8_t i = 0; i < char_width; i++) {
+                uint8_t bits = color == White ? src[i] : (uint8_t)(~src[i] & rowMask);
+                lower[i] = (lower[i] & (uint8_t)~lowerMask) | (uint8_t)(bits >> (8 - shift));
+            }
+        }
+    }
+
+    SSD1306.CurrentX += char_width;
+    return 1;
+}
+
+/* Draw 1 char with a page font */
+char ssd1306_WritePageChar(char ch, const SSD1306_PageFont_t* Font, SSD1306_COLOR color) {
+    if (ch < 32 || ch > 126)
+        return 0;
+
+    const uint8_t char_width = Font->char_width ? Font->char_width[ch-32] : Font->width;
+    if (!ssd1306_DrawPageGlyph(&Font->data[(ch - 32) * Font->pages * Font->width], Font, char_width, color)) {
+        return 0;
+    }
+    return ch;
+}
+
+/* Write full string to screenbuffer with a page font */
+char ssd1306_WritePageString(const char* str, const SSD1306_PageFont_t* Font, SSD1306_COLOR color) {
+    while (*str) {
+        if (ssd1306_WritePageChar(*str, Font, color) != *str) {
+            // Char could not be written
+            return *str;
+        }
+        str++;
+    }
+
+    // Everything ok
+    return *str;
+}
+
+/*
+ * Decode one UTF-8 sequence (up to 3 bytes, i.e. the BMP)
+ * Returns the number of bytes consumed, 0 for an invalid sequence
+ */
+static uint8_t ssd1306_DecodeUTF8(const char* str, uint16_t* code_point) {
+    const uint8_t* s = (const uint8_t*)str;
+
+    if (s[0] < 0x80) {
+        *code_point = s[0];
+        return 1;
+    }
+    if ((s[0] & 0xE0) == 0xC0 && (s[1] & 0xC0) == 0x80) {
+        *code_point = ((uint16_t)(s[0] & 0x1F) << 6) | (s[1] & 0x3F);
+        return 2;
+    }
+    if ((s[0] & 0xF0) == 0xE0 && (s[1] & 0xC0) == 0x80 && (s[2] & 0xC0) == 0x80) {
+        *code_point = ((uint16_t)(s[0] & 0x0F) << 12) | ((uint16_t)(s[1] & 0x3F) << 6) | (s[2] & 0x3F);
+        return 3;
+    }
+    return 0;
+}
+
+/* Binary search for a code point, returns the glyph index or -1 */
+static int32_t ssd1306_FindGlyph(const SSD1306_UnicodeFont_t* Font, uint16_t code_point) {
+    int32_t lo = 0;
+    int32_t hi = (int32_t)Font->count - 1;
+
+    while (lo <= hi) {
+        int32_t mid = (lo + hi) / 2;
+        uint16_t value = Font->code_points[mid];
+        if (value == code_point) {
+            return mid;
+        }
+        if (value < code_point) {
+            lo = mid + 1;
+        } else {
+            hi = mid - 1;
+        }
+    }
+    return -1;
+}
+
+/* Write UTF-8 string to screenbuffer with a sparse Unicode font */
+char ssd1306_WriteUTF8(const char* str, const SSD1306_UnicodeFont_t* Font, SSD1306_COLOR color) {
+    uint16_t code_point;
+
+    while (*str) {
+        uint8_t len = ssd1306_DecodeUTF8(str, &code_point);
+        int32_t index = len ? ssd1306_FindGlyph(Font, code_point) : -1;
+        if (index < 0) {
+            // Invalid sequence or glyph not in the subset
+            return *str;
+        }
+
+        const uint8_t char_width = Font->char_width ? Font->char_width[index] : Font->width;
+        if (!ssd1306_DrawGlyph(&Font->data[index * Font->height], char_width, Font->height, color)) {
+            // Char could not be written
+            return *str;
+        }
+        str += len;
+    }
+
+    // Everything ok
+    return *str;
+}
+
 /* Position the cursor */
 void ssd1306_SetCursor(uint8_t x, uint8_t y) {
     SSD1306.CurrentX = x;
@@ -545,15 +695,11 @@ SSD1306_Error_t ssd1306_InvertRectangle(uint8_t x1, uint8_t y1, uint8_t x2, uint
   return SSD1306_OK;
 }
 
-/* Draw a bitmap */
-void ssd1306_DrawBitmap(uint8_t x, uint8_t y, const unsigned char* bitmap, uint8_t w, uint8_t h, SSD1306_COLOR color) {
+/* Draw a bitmap one pixel at a time (x + w or y + h past 255 wraps around in uint8_t) */
+static void ssd1306_DrawBitmapPixels(uint8_t x, uint8_t y, const unsigned char* bitmap, uint8_t w, uint8_t h, SSD1306_COLOR color) {
     int16_t byteWidth = (w + 7) / 8; // Bitmap scanline pad = whole byte
     uint8_t byte = 0;
 
-    if (x >= SSD1306_WIDTH || y >= SSD1306_HEIGHT) {
-        return;
-    }
-
     for (uint8_t j = 0; j < h; j++, y++) {
         for (uint8_t i = 0; i < w; i++) {
             if (i & 7) {
@@ -567,7 +713,200 @@ void ssd1306_DrawBitmap(uint8_t x, uint8_t y, const unsigned char* bitmap, uint8
             }
         }
     }
-    return;
+}
+
+/*
+ * Transpose an 8x8 bit block: rows[k] is source row k (MSB is the leftmost pixel),
+ * cols[c] becomes buffer column c (LSB is the top pixel)
+ */
+static void ssd1306_Transpose8(const uint8_t* rows, uint8_t* cols) {
+    uint32_t hi = ((uint32_t)rows[7] << 24) | ((uint32_t)rows[6] << 16) | ((uint32_t)rows[5] << 8) | rows[4];
+    uint32_t lo = ((uint32_t)rows[3] << 24) | ((uint32_t)rows[2] << 16) | ((uint32_t)rows[1] << 8) | rows[0];
+    uint32_t t;
+
+    t = (hi ^ (hi >> 7)) & 0x00AA00AAU;  hi = hi ^ t ^ (t << 7);
+    t = (lo ^ (lo >> 7)) & 0x00AA00AAU;  lo = lo ^ t ^ (t << 7);
+    t = (hi ^ (hi >> 14)) & 0x0000CCCCU; hi = hi ^ t ^ (t << 14);
+    t = (lo ^ (lo >> 14)) & 0x0000CCCCU; lo = lo ^ t ^ (t << 14);
+    t = (hi & 0xF0F0F0F0U) | ((lo >> 4) & 0x0F0F0F0FU);
+    lo = ((hi << 4) & 0xF0F0F0F0U) | (lo & 0x0F0F0F0FU);
+    hi = t;
+
+    cols[0] = hi >> 24; cols[1] = hi >> 16; cols[2] = hi >> 8; cols[3] = hi;
+    cols[4] = lo >> 24; cols[5] = lo >> 16; cols[6] = lo >> 8; cols[7] = lo;
+}
+
+/*
+ * Draw a bitmap (horizontal, MSB first, rows padded to whole bytes); only set pixels are drawn.
+ * Each 8x8 block is transposed into 8 buffer columns and merged a byte at a time,
+ * shifted across two pages when y is not a multiple of 8.
+ */
+void ssd1306_DrawBitmap(uint8_t x, uint8_t y, const unsigned char* bitmap, uint8_t w, uint8_t h, SSD1306_COLOR color) {
+    uint16_t byteWidth = (w + 7) / 8;
+
+    if (x >= SSD1306_WIDTH || y >= SSD1306_HEIGHT) {
+        return;
+    }
+    if (x + w > 256 || y + h > 256) {
+        ssd1306_DrawBitmapPixels(x, y, bitmap, w, h, color);
+        return;
+    }
+
+    // Clip to the screen; pixels past w (row padding) are never drawn
+    uint8_t cols = w < SSD1306_WIDTH - x ? w : SSD1306_WIDTH - x;
+    uint8_t rows = h < SSD1306_HEIGHT - y ? h : SSD1306_HEIGHT - y;
+    uint8_t shift = y % 8;
+    uint8_t rowBytes[8];
+    uint8_t colBytes[8];
+
+    for (uint8_t band = 0; band * 8 < rows; band++) {
+        uint8_t page = y / 8 + band;
+        uint8_t bandRows = rows - band * 8 < 8 ? rows - band * 8 : 8;
+        const unsigned char* src = &bitmap[(uint16_t)band * 8 * byteWidth];
+        uint8_t* upper = &SSD1306_Buffer[page * SSD1306_WIDTH + x];
+        uint8_t* lower = (shift && page + 1 < SSD1306_HEIGHT / 8) ? upper + SSD1306_WIDTH : NULL;
+
+        for (uint8_t bx = 0; bx * 8 < cols; bx++) {
+            uint8_t any = 0;
+            for (uint8_t k = 0; k < 8; k++) {
+                rowBytes[k] = k < bandRows ? src[k * byteWidth + bx] : 0;
+                any |= rowBytes[k];
+            }
+            if (!any) {
+                continue;
+            }
+            ssd1306_Transpose8(rowBytes, colBytes);
+
+            uint8_t n = cols - bx * 8 < 8 ? cols - bx * 8 : 8;
+            uint8_t* dst = upper + bx * 8;
+            for (uint8_t c = 0; c < n; c++) {
+                uint8_t bits = colBytes[c];
+                if (!bits) {
+                    continue;
+                }
+                if (color == White) {
+                    dst[c] |= (uint8_t)(bits << shift);
+                    if (lower) {
+                        lower[bx * 8 + c] |= (uint8_t)(bits >> (8 - shift));
+                    }
+                } else {
+                    dst[c] &= (uint8_t)~(bits << shift);
+                    if (lower) {
+                        lower[bx * 8 + c] &= (uint8_t)~(bits >> (8 - shift));
+                    }
+                }
+            }
+        }
+    }
+}
+
+/* Apply a delta/RLE frame to a frame buffer */
+void ssd1306_ApplyDeltaRLE(uint8_t* frame, uint16_t size, const uint8_t* delta) {
+    uint16_t pos = 0;
+
+    while (pos < size) {
+        uint8_t ctrl = *delta++;
+        uint16_t count = (ctrl & 0x7F) + 1;
+
+        if (count > size - pos) {
+            count = size - pos;
+        }
+
+        if (ctrl & 0x80) {
+            uint8_t value = *delta++;
+            if (value == 0) {
+                // Unchanged bytes
+                pos += count;
+                continue;
+            }
+            while (count--) {
+                frame[pos++] ^= value;
+            }
+        } else {
+            while (count--) {
+                frame[pos++] ^= *delta++;
+            }
+        }
+    }
+}
+
+/* Copy page-aligned 8x8 tiles; each tile row is 8 contiguous buffer bytes */
+static void ssd1306_BlitTiles(uint8_t x, uint8_t page, const uint8_t* tiles,
+                              const uint8_t* map8, const uint16_t* map16, uint8_t cols, uint8_t pages) {
+    if (x >= SSD1306_WIDTH || page >= SSD1306_HEIGHT / 8) {
+        return;
+    }
+    if (pages > SSD1306_HEIGHT / 8 - page) {
+        pages = SSD1306_HEIGHT / 8 - page;
+    }
+    uint16_t visible = (uint16_t)cols * 8;
+    if (visible > SSD1306_WIDTH - x) {
+        visible = SSD1306_WIDTH - x;
+    }
+
+    for (uint8_t row = 0; row < pages; row++) {
+        uint8_t* dst = &SSD1306_Buffer[(page + row) * SSD1306_WIDTH + x];
+        uint16_t index = (uint16_t)row * cols;
+        uint16_t left = visible;
+
+        while (left >= 8) {
+            memcpy(dst, &tiles[(map8 ? map8[index] : map16[index]) * 8], 8);
+            dst += 8;
+            left -= 8;
+            index++;
+        }
+        if (left) {
+            memcpy(dst, &tiles[(map8 ? map8[index] : map16[index]) * 8], left);
+        }
+    }
+}
+
+void ssd1306_DrawTilemap(uint8_t x, uint8_t page, const uint8_t* tiles, const uint8_t* map, uint8_t cols, uint8_t pages) {
+    ssd1306_BlitTiles(x, page, tiles, map, NULL, cols, pages);
+}
+
+void ssd1306_DrawTilemap16(uint8_t x, uint8_t page, const uint8_t* tiles, const uint16_t* map, uint8_t cols, uint8_t pages) {
+    ssd1306_BlitTiles(x, page, tiles, NULL, map, cols, pages);
+}
+
+/* Compose a masked sprite one buffer byte at a time; each sprite page covers one or two screen pages */
+void ssd1306_DrawSprite(uint8_t x, uint8_t y, const uint8_t* bits, const uint8_t* mask, uint8_t w, uint8_t h) {
+    if (x >= SSD1306_WIDTH || y >= SSD1306_HEIGHT) {
+        return;
+    }
+    uint8_t cols = w;
+    if (cols > SSD1306_WIDTH - x) {
+        cols = SSD1306_WIDTH - x;
+    }
+    uint8_t shift = y % 8;
+    uint8_t top = y / 8;
+    uint8_t pages = (h + 7) / 8;
+
+    for (uint8_t row = 0; row < pages && top + row < SSD1306_HEIGHT / 8; row++) {
+        const uint8_t* src = &bits[(uint16_t)row * w];
+        const uint8_t* msk = &mask[(uint16_t)row * w];
+        uint8_t* upper = &SSD1306_Buffer[(top + row) * SSD1306_WIDTH + x];
+
+        if (shift == 0) {
+            for (uint8_t i = 0; i < cols; i++) {
+                upper[i] = (upper[i] & ~msk[i]) | src[i];
+            }
+            continue;
+        }
+
+        // The low part of each byte lands in this page, the high part in the next one
+        uint8_t* lower = top + row + 1 < SSD1306_HEIGHT / 8 ? upper + SSD1306_WIDTH : NULL;
+        for (uint8_t i = 0; i < cols; i++) {
+            uint8_t m = msk[i];
+            if (m == 0) {
+                continue;
+            }
+            upper[i] = (upper[i] & (uint8_t)~(m << shift)) | (uint8_t)(src[i] << shift);
+            if (lower) {
+                lower[i] = (lower[i] & (uint8_t)~(m >> (8 - shift))) | (uint8_t)(src[i] >> (8 - shift));
+            }
+        }
+    }
 }
 
 void ssd1306_SetContrast(const uint8_t value) {
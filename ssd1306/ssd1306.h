@@ -154,6 +154,25 @@ typedef struct {
     const uint8_t *const char_width;    /**< Proportional character width in pixels (NULL for monospaced) */
 } SSD1306_Font_t;
 
+/** Sparse Unicode font: glyphs for a sorted subset of code points */
+typedef struct {
+	const uint8_t width;                /**< Font width in pixels */
+	const uint8_t height;               /**< Font height in pixels */
+	const uint16_t count;               /**< Number of glyphs in the font */
+	const uint16_t *const code_points;  /**< Code points of the glyphs, sorted ascending */
+	const uint16_t *const data;         /**< Pointer to font data array, height rows per glyph */
+    const uint8_t *const char_width;    /**< Proportional character width in pixels (NULL for monospaced) */
+} SSD1306_UnicodeFont_t;
+
+/** Font in buffer format (generated from the row fonts by font_pages.py) */
+typedef struct {
+	const uint8_t width;                /**< Font width in pixels */
+	const uint8_t height;               /**< Font height in pixels */
+	const uint8_t pages;                /**< (height + 7) / 8 */
+	const uint8_t *const data;          /**< pages * width bytes per glyph, page by page, one byte per column, LSB on top */
+    const uint8_t *const char_width;    /**< Proportional character width in pixels (NULL for monospaced) */
+} SSD1306_PageFont_t;
+
 // Procedure definitions
 void ssd1306_Init(void);
 void ssd1306_Fill(SSD1306_COLOR color);
@@ -161,6 +180,26 @@ void ssd1306_UpdateScreen(void);
 void ssd1306_DrawPixel(uint8_t x, uint8_t y, SSD1306_COLOR color);
 char ssd1306_WriteChar(char ch, SSD1306_Font_t Font, SSD1306_COLOR color);
 char ssd1306_WriteString(char* str, SSD1306_Font_t Font, SSD1306_COLOR color);
+
+/**
+ * @brief Write a UTF-8 string using a sparse Unicode font
+ *
+ * Glyphs are looked up with a binary search over Font->code_points.
+ *
+ * @return 0 if the whole string was written, otherwise the first byte
+ *         of the character that could not be decoded, found or placed
+ */
+char ssd1306_WriteUTF8(const char* str, const SSD1306_UnicodeFont_t* Font, SSD1306_COLOR color);
+
+/**
+ * @brief Same as ssd1306_WriteChar/ssd1306_WriteString for page fonts (PageFont_*)
+ *
+ * Each glyph column is merged into the screen buffer a byte at a time, shifted
+ * across two pages when the cursor y is not a multiple of 8. The result is the
+ * same as the row font drawn pixel by pixel.
+ */
+char ssd1306_WritePageChar(char ch, const SSD1306_PageFont_t* Font, SSD1306_COLOR color);
+char ssd1306_WritePageString(const char* str, const SSD1306_PageFont_t* Font, SSD1306_COLOR color);
 void ssd1306_SetCursor(uint8_t x, uint8_t y);
 void ssd1306_Line(uint8_t x1, uint8_t y1, uint8_t x2, uint8_t y2, SSD1306_COLOR color);
 void ssd1306_DrawArc(uint8_t x, uint8_t y, uint8_t radius, uint16_t start_angle, uint16_t sweep, SSD1306_COLOR color);
@@ -182,8 +221,53 @@ void ssd1306_FillRectangle(uint8_t x1, uint8_t y1, uint8_t x2, uint8_t y2, SSD13
  */
 SSD1306_Error_t ssd1306_InvertRectangle(uint8_t x1, uint8_t y1, uint8_t x2, uint8_t y2);
 
+/**
+ * @brief Draws the set pixels of a bitmap in color, clipped at the right and bottom edges.
+ * @param bitmap horizontal bitmap, 8 pixels per byte with the MSB leftmost, each row padded
+ *               to whole bytes (the image tool's horizontal output).
+ * @note Works on 8x8 blocks transposed into buffer bytes; the output is the same as drawing
+ *       every set pixel with ssd1306_DrawPixel.
+ */
 void ssd1306_DrawBitmap(uint8_t x, uint8_t y, const unsigned char* bitmap, uint8_t w, uint8_t h, SSD1306_COLOR color);
 
+/**
+ * @brief Applies one delta/RLE frame (generated by the image tool) to a frame buffer.
+ * @param frame frame buffer of size bytes; clear it before applying the first frame.
+ * @param size frame size in bytes.
+ * @param delta encoded stream: control byte c, if c & 0x80 the next byte is repeated
+ *              (c & 0x7F) + 1 times, otherwise c + 1 literal bytes follow.
+ *              Every decoded byte is XORed into the frame buffer.
+ */
+void ssd1306_ApplyDeltaRLE(uint8_t* frame, uint16_t size, const uint8_t* delta);
+
+/**
+ * @brief Copies a map of page-aligned 8x8 tiles (generated by the image tool) into
+ *        the screen buffer, clipped at the right and bottom edges.
+ * @param x left column in pixels.
+ * @param page top page (8 pixel rows).
+ * @param tiles tile set, 8 bytes per tile in buffer format (one byte per column, LSB on top).
+ * @param map tile indexes, cols per page, page by page.
+ */
+void ssd1306_DrawTilemap(uint8_t x, uint8_t page, const uint8_t* tiles, const uint8_t* map, uint8_t cols, uint8_t pages);
+
+/**
+ * @brief Same as ssd1306_DrawTilemap for tile sets with more than 256 tiles.
+ */
+void ssd1306_DrawTilemap16(uint8_t x, uint8_t page, const uint8_t* tiles, const uint16_t* map, uint8_t cols, uint8_t pages);
+
+/**
+ * @brief Draws a sprite with a transparency mask (generated by the image tool) at any
+ *        pixel position, clipped at the right and bottom edges.
+ * @param x left column in pixels.
+ * @param y top row in pixels; need not be page aligned.
+ * @param bits image plane in buffer format (one byte per column, LSB on top), page by page,
+ *             w bytes per page; set bits must lie inside the mask.
+ * @param mask mask plane in the same layout; 1 = opaque, 0 = keep the background.
+ * @note Composes whole buffer bytes: buf = (buf & ~mask) | bits, shifted into two pages
+ *       when y is not a multiple of 8.
+ */
+void ssd1306_DrawSprite(uint8_t x, uint8_t y, const uint8_t* bits, const uint8_t* mask, uint8_t w, uint8_t h);
+
 /**
  * @brief Sets the contrast of the display.
  * @param[in] value contrast to set.
@@ -211,6 +295,12 @@ void ssd1306_WriteCommand(uint8_t byte);
 void ssd1306_WriteData(uint8_t* buffer, size_t buff_size);
 SSD1306_Error_t ssd1306_FillBuffer(uint8_t* buf, uint32_t len);
 
+/**
+ * @brief Returns the screen buffer (SSD1306_BUFFER_SIZE bytes, one byte per column per page)
+ *        so frames can be decoded into it in place.
+ */
+uint8_t* ssd1306_GetBuffer(void);
+
 _END_STD_C
 
 #endif // __SSD1306_H__
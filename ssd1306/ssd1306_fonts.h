@@ -26,4 +26,25 @@ extern const SSD1306_Font_t Font_16x24;
 extern const SSD1306_Font_t Font_16x15;
 #endif
 
+/* The same fonts in buffer format for ssd1306_WritePageChar/ssd1306_WritePageString,
+ * generated into ssd1306_fonts_pages.c by gif2pngbmp/font_pages.py */
+#ifdef SSD1306_INCLUDE_FONT_6x8
+extern const SSD1306_PageFont_t PageFont_6x8;
+#endif
+#ifdef SSD1306_INCLUDE_FONT_7x10
+extern const SSD1306_PageFont_t PageFont_7x10;
+#endif
+#ifdef SSD1306_INCLUDE_FONT_11x18
+extern const SSD1306_PageFont_t PageFont_11x18;
+#endif
+#ifdef SSD1306_INCLUDE_FONT_16x26
+extern const SSD1306_PageFont_t PageFont_16x26;
+#endif
+#ifdef SSD1306_INCLUDE_FONT_16x24
+extern const SSD1306_PageFont_t PageFont_16x24;
+#endif
+#ifdef SSD1306_INCLUDE_FONT_16x15
+extern const SSD1306_PageFont_t PageFont_16x15;
+#endif
+
 #endif // __SSD1306_FONTS_H__
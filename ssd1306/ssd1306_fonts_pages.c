@@ -0,0 +1,718 @@
+// 此文件由OLED图像取模工具生成
+// 生成时间: 2026-10-19 06:42:24
+// 编码: UTF-8
+
+// 由 ssd1306_fonts.c 的行字模转换为按页存放的显存格式 (font_pages.py)
+// 每个字符 pages 页 x width 字节，每字节一列 8 行，LSB在上
+
+#include "ssd1306_fonts.h"
+
+#ifdef SSD1306_INCLUDE_FONT_6x8
+static const uint8_t Font6x8_pages [] = {
+0x00,0x00,0x00,0x00,0x00,0x00,  // sp
+0x00,0x00,0x5F,0x00,0x00,0x00,  // !
+0x00,0x07,0x00,0x07,0x00,0x00,  // "
+0x14,0x7F,0x14,0x7F,0x14,0x00,  // #
+0x24,0x2A,0x7F,0x2A,0x12,0x00,  // $
+0x23,0x13,0x08,0x64,0x62,0x00,  // %
+0x36,0x49,0x56,0x20,0x50,0x00,  // &
+0x00,0x08,0x07,0x03,0x00,0x00,  // '
+0x00,0x1C,0x22,0x41,0x00,0x00,  // (
+0x00,0x41,0x22,0x1C,0x00,0x00,  // )
+0x2A,0x1C,0x7F,0x1C,0x2A,0x00,  // *
+0x08,0x08,0x3E,0x08,0x08,0x00,  // +
+0x00,0x00,0x70,0x30,0x00,0x00,  // ,
+0x08,0x08,0x08,0x08,0x08,0x00,  // -
+0x00,0x00,0x60,0x60,0x00,0x00,  // .
+0x20,0x10,0x08,0x04,0x02,0x00,  // /
+0x3E,0x51,0x49,0x45,0x3E,0x00,  // 0
+0x00,0x42,0x7F,0x40,0x00,0x00,  // 1
+0x72,0x49,0x49,0x49,0x46,0x00,  // 2
+0x21,0x41,0x49,0x4D,0x33,0x00,  // 3
+0x18,0x14,0x12,0x7F,0x10,0x00,  // 4
+0x27,0x45,0x45,0x45,0x39,0x00,  // 5
+0x3C,0x4A,0x49,0x49,0x31,0x00,  // 6
+0x41,0x21,0x11,0x09,0x07,0x00,  // 7
+0x36,0x49,0x49,0x49,0x36,0x00,  // 8
+0x46,0x49,0x49,0x29,0x1E,0x00,  // 9
+0x00,0x00,0x14,0x00,0x00,0x00,  // :
+0x00,0x40,0x34,0x00,0x00,0x00,  // ;
+0x00,0x08,0x14,0x22,0x41,0x00,  // <
+0x14,0x14,0x14,0x14,0x14,0x00,  // =
+0x00,0x41,0x22,0x14,0x08,0x00,  // >
+0x02,0x01,0x59,0x09,0x06,0x00,  // ?
+0x3E,0x41,0x5D,0x59,0x4E,0x00,  // @
+0x7C,0x12,0x11,0x12,0x7C,0x00,  // A
+0x7F,0x49,0x49,0x49,0x36,0x00,  // B
+0x3E,0x41,0x41,0x41,0x22,0x00,  // C
+0x7F,0x41,0x41,0x41,0x3E,0x00,  // D
+0x7F,0x49,0x49,0x49,0x41,0x00,  // E
+0x7F,0x09,0x09,0x09,0x01,0x00,  // F
+0x3E,0x41,0x41,0x51,0x73,0x00,  // G
+0x7F,0x08,0x08,0x08,0x7F,0x00,  // H
+0x00,0x41,0x7F,0x41,0x00,0x00,  // I
+0x20,0x40,0x41,0x3F,0x01,0x00,  // J
+0x7F,0x08,0x14,0x22,0x41,0x00,  // K
+0x7F,0x40,0x40,0x40,0x40,0x00,  // L
+0x7F,0x02,0x1C,0x02,0x7F,0x00,  // M
+0x7F,0x04,0x08,0x10,0x7F,0x00,  // N
+0x3E,0x41,0x41,0x41,0x3E,0x00,  // O
+0x7F,0x09,0x09,0x09,0x06,0x00,  // P
+0x3E,0x41,0x51,0x21,0x5E,0x00,  // Q
+0x7F,0x09,0x19,0x29,0x46,0x00,  // R
+0x26,0x49,0x49,0x49,0x32,0x00,  // S
+0x03,0x01,0x7F,0x01,0x03,0x00,  // T
+0x3F,0x40,0x40,0x40,0x3F,0x00,  // U
+0x1F,0x20,0x40,0x20,0x1F,0x00,  // V
+0x3F,0x40,0x38,0x40,0x3F,0x00,  // W
+0x63,0x14,0x08,0x14,0x63,0x00,  // X
+0x03,0x04,0x78,0x04,0x03,0x00,  // Y
+0x61,0x59,0x49,0x4D,0x43,0x00,  // Z
+0x00,0x7F,0x41,0x41,0x41,0x00,  // [
+0x02,0x04,0x08,0x10,0x20,0x00,  // backslash
+0x00,0x41,0x41,0x41,0x7F,0x00,  // ]
+0x04,0x02,0x01,0x02,0x04,0x00,  // ^
+0x40,0x40,0x40,0x40,0x40,0x00,  // _
+0x00,0x03,0x07,0x08,0x00,0x00,  // `
+0x20,0x54,0x54,0x78,0x40,0x00,  // a
+0x7F,0x28,0x44,0x44,0x38,0x00,  // b
+0x38,0x44,0x44,0x44,0x28,0x00,  // c
+0x38,0x44,0x44,0x28,0x7F,0x00,  // d
+0x38,0x54,0x54,0x54,0x18,0x00,  // e
+0x00,0x08,0x7E,0x09,0x02,0x00,  // f
+0x18,0x24,0x24,0x1C,0x78,0x00,  // g
+0x7F,0x08,0x04,0x04,0x78,0x00,  // h
+0x00,0x44,0x7D,0x40,0x00,0x00,  // i
+0x20,0x40,0x40,0x3D,0x00,0x00,  // j
+0x7F,0x10,0x28,0x44,0x00,0x00,  // k
+0x00,0x41,0x7F,0x40,0x00,0x00,  // l
+0x7C,0x04,0x78,0x04,0x78,0x00,  // m
+0x7C,0x08,0x04,0x04,0x78,0x00,  // n
+0x38,0x44,0x44,0x44,0x38,0x00,  // o
+0x7C,0x18,0x24,0x24,0x18,0x00,  // p
+0x18,0x24,0x24,0x18,0x7C,0x00,  // q
+0x7C,0x08,0x04,0x04,0x08,0x00,  // r
+0x48,0x54,0x54,0x54,0x24,0x00,  // s
+0x04,0x04,0x3F,0x44,0x24,0x00,  // t
+0x3C,0x40,0x40,0x20,0x7C,0x00,  // u
+0x1C,0x20,0x40,0x20,0x1C,0x00,  // v
+0x3C,0x40,0x30,0x40,0x3C,0x00,  // w
+0x44,0x28,0x10,0x28,0x44,0x00,  // x
+0x4C,0x10,0x10,0x10,0x7C,0x00,  // y
+0x44,0x64,0x54,0x4C,0x44,0x00,  // z
+0x00,0x08,0x36,0x41,0x00,0x00,  // {
+0x00,0x00,0x77,0x00,0x00,0x00,  // |
+0x00,0x41,0x36,0x08,0x00,0x00,  // }
+0x02,0x01,0x02,0x04,0x02,0x00,  // ~
+};
+
+const SSD1306_PageFont_t PageFont_6x8 = {6, 8, 1, Font6x8_pages, NULL};
+#endif
+
+#ifdef SSD1306_INCLUDE_FONT_7x10
+static const uint8_t Font7x10_pages [] = {
+0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // sp
+0x00,0x00,0x00,0xBF,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // !
+0x00,0x00,0x07,0x00,0x07,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // "
+0x00,0xF4,0x2F,0x24,0xF4,0x2F,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // #
+0x00,0x66,0x89,0xFF,0x89,0x72,0x00,0x00,0x00,0x00,0x01,0x00,0x00,0x00,  // $
+0x00,0x26,0x19,0x6E,0x94,0x62,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // %
+0x00,0x60,0x96,0x99,0x66,0x90,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // &
+0x00,0x00,0x00,0x07,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // '
+0x00,0x00,0xFC,0x02,0x01,0x00,0x00,0x00,0x00,0x00,0x01,0x02,0x00,0x00,  // (
+0x00,0x00,0x01,0x02,0xFC,0x00,0x00,0x00,0x00,0x02,0x01,0x00,0x00,0x00,  // )
+0x00,0x00,0x0A,0x07,0x0A,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // *
+0x00,0x10,0x10,0x7C,0x10,0x10,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // +
+0x00,0x00,0x00,0x80,0x00,0x00,0x00,0x00,0x00,0x00,0x03,0x00,0x00,0x00,  // ,
+0x00,0x00,0x20,0x20,0x20,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // -
+0x00,0x00,0x00,0x80,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // .
+0x00,0x00,0xC0,0x3C,0x03,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // /
+0x00,0x7E,0x81,0x89,0x81,0x7E,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // 0
+0x00,0x04,0x02,0xFF,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // 1
+0x00,0x86,0xC1,0xA1,0x91,0x8E,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // 2
+0x00,0x42,0x81,0x89,0x89,0x76,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // 3
+0x00,0x30,0x2C,0x22,0xFF,0x20,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // 4
+0x00,0x4F,0x89,0x89,0x89,0x71,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // 5
+0x00,0x7E,0x89,0x89,0x89,0x72,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // 6
+0x00,0x01,0xE1,0x19,0x05,0x03,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // 7
+0x00,0x76,0x89,0x89,0x89,0x76,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // 8
+0x00,0x4E,0x91,0x91,0x91,0x7E,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // 9
+0x00,0x00,0x00,0x84,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // :
+0x00,0x00,0x00,0x88,0x00,0x00,0x00,0x00,0x00,0x00,0x03,0x00,0x00,0x00,  // ;
+0x00,0x10,0x28,0x28,0x44,0x44,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // <
+0x00,0x28,0x28,0x28,0x28,0x28,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // =
+0x00,0x44,0x44,0x28,0x28,0x10,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // >
+0x00,0x02,0x01,0xB1,0x09,0x06,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // ?
+0x00,0x7E,0x81,0x99,0x95,0x1E,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // @
+0x00,0xE0,0x3E,0x21,0x3E,0xE0,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // A
+0x00,0xFF,0x89,0x89,0x89,0x76,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // B
+0x00,0x7E,0x81,0x81,0x81,0x42,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // C
+0x00,0xFF,0x81,0x81,0x42,0x3C,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // D
+0x00,0xFF,0x89,0x89,0x89,0x89,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // E
+0x00,0xFF,0x09,0x09,0x09,0x01,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // F
+0x00,0x7E,0x81,0x91,0x91,0x72,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // G
+0x00,0xFF,0x08,0x08,0x08,0xFF,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // H
+0x00,0x00,0x81,0xFF,0x81,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // I
+0x00,0x40,0x80,0x80,0x80,0x7F,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // J
+0x00,0xFF,0x08,0x14,0x62,0x81,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // K
+0x00,0xFF,0x80,0x80,0x80,0x80,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // L
+0x00,0xFF,0x06,0x08,0x06,0xFF,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // M
+0x00,0xFF,0x06,0x18,0x60,0xFF,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // N
+0x00,0x7E,0x81,0x81,0x81,0x7E,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // O
+0x00,0xFF,0x11,0x11,0x11,0x0E,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // P
+0x00,0x7E,0x81,0xC1,0x81,0x7E,0x00,0x00,0x00,0x00,0x00,0x00,0x01,0x00,  // Q
+0x00,0xFF,0x11,0x11,0x71,0x8E,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // R
+0x00,0x46,0x89,0x89,0x91,0x62,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // S
+0x00,0x01,0x01,0xFF,0x01,0x01,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // T
+0x00,0x7F,0x80,0x80,0x80,0x7F,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // U
+0x00,0x07,0x38,0xC0,0x38,0x07,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // V
+0x00,0x3F,0xE0,0x1C,0xE0,0x3F,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // W
+0x00,0x81,0x66,0x18,0x66,0x81,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // X
+0x00,0x03,0x0C,0xF0,0x0C,0x03,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // Y
+0x00,0xC1,0xA1,0x99,0x85,0x83,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // Z
+0x00,0x00,0x00,0xFF,0x01,0x00,0x00,0x00,0x00,0x00,0x03,0x02,0x00,0x00,  // [
+0x00,0x00,0x03,0x3C,0xC0,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // backslash
+0x00,0x00,0x01,0xFF,0x00,0x00,0x00,0x00,0x00,0x02,0x03,0x00,0x00,0x00,  // ]
+0x00,0x08,0x06,0x01,0x06,0x08,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // ^
+0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x02,0x02,0x02,0x02,0x02,0x02,0x02,  // _
+0x00,0x00,0x01,0x02,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // `
+0x00,0x68,0x94,0x94,0x54,0xF8,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // a
+0x00,0xFF,0x48,0x84,0x84,0x78,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // b
+0x00,0x78,0x84,0x84,0x84,0x48,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // c
+0x00,0x78,0x84,0x84,0x48,0xFF,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // d
+0x00,0x78,0x94,0x94,0x94,0x58,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // e
+0x00,0x04,0x04,0xFE,0x05,0x05,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // f
+0x00,0x78,0x84,0x84,0x48,0xFC,0x00,0x00,0x02,0x02,0x02,0x02,0x01,0x00,  // g
+0x00,0xFF,0x08,0x04,0x04,0xF8,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // h
+0x00,0x04,0x04,0xFD,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // i
+0x00,0x04,0x04,0xFD,0x00,0x00,0x00,0x02,0x02,0x02,0x01,0x00,0x00,0x00,  // j
+0x00,0xFF,0x10,0x28,0x44,0x80,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // k
+0x00,0x01,0x01,0xFF,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // l
+0x00,0xFC,0x04,0xFC,0x04,0xF8,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // m
+0x00,0xFC,0x08,0x04,0x04,0xF8,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // n
+0x00,0x78,0x84,0x84,0x84,0x78,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // o
+0x00,0xFC,0x48,0x84,0x84,0x78,0x00,0x00,0x03,0x00,0x00,0x00,0x00,0x00,  // p
+0x00,0x78,0x84,0x84,0x48,0xFC,0x00,0x00,0x00,0x00,0x00,0x00,0x03,0x00,  // q
+0x00,0xFC,0x08,0x04,0x04,0x08,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // r
+0x00,0x48,0x94,0x94,0xA4,0x48,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // s
+0x00,0x04,0x7F,0x84,0x84,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // t
+0x00,0x7C,0x80,0x80,0x40,0xFC,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // u
+0x00,0x0C,0x70,0x80,0x70,0x0C,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // v
+0x00,0x3C,0xE0,0x1C,0xE0,0x3C,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // w
+0x00,0x84,0x48,0x30,0x48,0x84,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // x
+0x00,0x0C,0x30,0xC0,0x30,0x0C,0x00,0x00,0x02,0x02,0x01,0x00,0x00,0x00,  // y
+0x00,0xC4,0xA4,0x94,0x8C,0x84,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // z
+0x00,0x00,0x30,0xCF,0x01,0x00,0x00,0x00,0x00,0x00,0x03,0x02,0x00,0x00,  // {
+0x00,0x00,0x00,0xFF,0x00,0x00,0x00,0x00,0x00,0x00,0x03,0x00,0x00,0x00,  // |
+0x00,0x00,0x01,0xCF,0x30,0x00,0x00,0x00,0x00,0x02,0x03,0x00,0x00,0x00,  // }
+0x00,0x18,0x08,0x08,0x10,0x18,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // ~
+};
+
+const SSD1306_PageFont_t PageFont_7x10 = {7, 10, 2, Font7x10_pages, NULL};
+#endif
+
+#ifdef SSD1306_INCLUDE_FONT_11x18
+static const uint8_t Font11x18_pages [] = {
+0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // sp
+0x00,0x00,0x00,0x00,0xFE,0xFE,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x6F,0x6F,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // !
+0x00,0x00,0x00,0x3E,0x3E,0x00,0x3E,0x3E,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // "
+0x00,0x60,0x60,0xFE,0xFE,0x60,0x60,0xFE,0xFE,0x60,0x00,0x00,0x06,0x7F,0x7F,0x06,0x06,0x7F,0x7F,0x06,0x06,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // #
+0x00,0x38,0x7C,0xEE,0xC6,0xFE,0x86,0x1C,0x18,0x00,0x00,0x00,0x1C,0x3C,0x70,0x60,0xFF,0x61,0x3F,0x1E,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x01,0x00,0x00,0x00,0x00,0x00,  // $
+0x3C,0x7E,0x42,0x7E,0x3C,0x80,0xC0,0x60,0x30,0x18,0x00,0x00,0x18,0x0C,0x06,0x03,0x3D,0x7E,0x42,0x7E,0x3C,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // %
+0x00,0x00,0x3C,0x7E,0xC6,0xC6,0x7E,0x3C,0x00,0x00,0x00,0x00,0x1E,0x3F,0x61,0x61,0x63,0x36,0x1C,0x7F,0x23,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // &
+0x00,0x00,0x00,0x00,0x3E,0x3E,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // '
+0x00,0x00,0x00,0x00,0xC0,0xF8,0x1C,0x06,0x01,0x00,0x00,0x00,0x00,0x00,0x00,0x0F,0x7F,0xE0,0x80,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x01,0x02,0x00,0x00,  // (
+0x00,0x00,0x01,0x06,0x1C,0xF8,0xC0,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x80,0xE0,0x7F,0x0F,0x00,0x00,0x00,0x00,0x00,0x00,0x02,0x01,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // )
+0x00,0x00,0x2C,0x38,0x1E,0x1E,0x38,0x2C,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // *
+0x80,0x80,0x80,0x80,0xF8,0xF8,0x80,0x80,0x80,0x80,0x00,0x01,0x01,0x01,0x01,0x1F,0x1F,0x01,0x01,0x01,0x01,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // +
+0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x60,0xE0,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x02,0x01,0x00,0x00,0x00,0x00,0x00,  // ,
+0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x06,0x06,0x06,0x06,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // -
+0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x60,0x60,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // .
+0x00,0x00,0x00,0x00,0x00,0xF0,0xFE,0x0E,0x00,0x00,0x00,0x00,0x00,0x00,0x70,0x7F,0x0F,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // /
+0x00,0xF0,0xFC,0x0E,0x86,0x86,0x0E,0xFC,0xF0,0x00,0x00,0x00,0x0F,0x3F,0x70,0x61,0x61,0x70,0x3F,0x0F,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // 0
+0x00,0x00,0x30,0x18,0x0C,0xFE,0xFE,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x7F,0x7F,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // 1
+0x00,0x38,0x3C,0x0E,0x06,0x06,0x8E,0xFC,0x78,0x00,0x00,0x00,0x70,0x78,0x6C,0x66,0x63,0x61,0x60,0x60,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // 2
+0x00,0x18,0x1C,0x06,0xC6,0xC6,0xFC,0x38,0x00,0x00,0x00,0x00,0x18,0x38,0x70,0x60,0x60,0x71,0x3F,0x1E,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // 3
+0x00,0x00,0x80,0xF0,0x3C,0xFE,0xFE,0x00,0x00,0x00,0x00,0x00,0x0E,0x0F,0x0D,0x0C,0x7F,0x7F,0x0C,0x0C,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // 4
+0x00,0xFE,0xFE,0x86,0xC6,0xC6,0xC6,0x86,0x00,0x00,0x00,0x00,0x19,0x39,0x70,0x60,0x60,0x71,0x3F,0x1F,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // 5
+0x00,0xF0,0xFC,0x8E,0xC6,0xC6,0xCE,0x9C,0x18,0x00,0x00,0x00,0x0F,0x3F,0x71,0x60,0x60,0x71,0x3F,0x1F,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // 6
+0x00,0x06,0x06,0x06,0x06,0xC6,0xF6,0x3E,0x0E,0x00,0x00,0x00,0x00,0x00,0x70,0x7F,0x07,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // 7
+0x00,0x38,0x7C,0x86,0x86,0x86,0x8E,0x7C,0x38,0x00,0x00,0x00,0x1E,0x3F,0x61,0x61,0x61,0x61,0x3F,0x1E,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // 8
+0x00,0xF8,0xFC,0x8E,0x06,0x06,0x8E,0xFC,0xF0,0x00,0x00,0x00,0x18,0x39,0x73,0x63,0x63,0x71,0x3F,0x0F,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // 9
+0x00,0x00,0x00,0x00,0x60,0x60,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x60,0x60,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // :
+0x00,0x00,0x00,0x00,0xC0,0xC0,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x60,0xE0,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x02,0x01,0x00,0x00,0x00,0x00,0x00,  // ;
+0x00,0x00,0x80,0x80,0xC0,0x40,0x60,0x20,0x30,0x00,0x00,0x00,0x01,0x03,0x02,0x06,0x04,0x0C,0x08,0x18,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // <
+0x00,0x60,0x60,0x60,0x60,0x60,0x60,0x60,0x60,0x00,0x00,0x00,0x06,0x06,0x06,0x06,0x06,0x06,0x06,0x06,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // =
+0x00,0x30,0x20,0x60,0x40,0xC0,0x80,0x80,0x00,0x00,0x00,0x00,0x18,0x08,0x0C,0x04,0x06,0x02,0x03,0x01,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // >
+0x00,0x18,0x1C,0x0E,0x06,0x06,0x86,0xCE,0xFC,0x78,0x00,0x00,0x00,0x00,0x00,0x6E,0x6F,0x03,0x01,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // ?
+0x00,0xF0,0xFC,0x1E,0xC6,0xC6,0x66,0xFC,0xF8,0x00,0x00,0x00,0x0F,0x3F,0x70,0x63,0x67,0x36,0x07,0x07,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // @
+0x00,0x00,0x80,0xF8,0x7E,0x06,0x7E,0xF8,0x80,0x00,0x00,0x00,0x70,0x7F,0x0F,0x06,0x06,0x06,0x0F,0x7F,0x70,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // A
+0x00,0xFE,0xFE,0x86,0x86,0x86,0xFC,0x78,0x00,0x00,0x00,0x00,0x7F,0x7F,0x61,0x61,0x61,0x73,0x3E,0x1C,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // B
+0x00,0xF0,0xFC,0x0E,0x06,0x06,0x06,0x1C,0x18,0x00,0x00,0x00,0x0F,0x3F,0x70,0x60,0x60,0x60,0x38,0x18,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // C
+0x00,0xFE,0xFE,0x06,0x06,0x06,0x1C,0xFC,0xF0,0x00,0x00,0x00,0x7F,0x7F,0x60,0x60,0x60,0x38,0x1F,0x07,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // D
+0x00,0xFE,0xFE,0x86,0x86,0x86,0x86,0x86,0x06,0x00,0x00,0x00,0x7F,0x7F,0x61,0x61,0x61,0x61,0x61,0x60,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // E
+0x00,0xFE,0xFE,0x86,0x86,0x86,0x86,0x86,0x06,0x00,0x00,0x00,0x7F,0x7F,0x01,0x01,0x01,0x01,0x01,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // F
+0x00,0xF0,0xFC,0x0E,0x06,0x06,0x06,0x1C,0x18,0x00,0x00,0x00,0x0F,0x3F,0x70,0x60,0x60,0x63,0x3F,0x3F,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // G
+0x00,0xFE,0xFE,0x80,0x80,0x80,0x80,0xFE,0xFE,0x00,0x00,0x00,0x7F,0x7F,0x01,0x01,0x01,0x01,0x7F,0x7F,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // H
+0x00,0x00,0x06,0x06,0xFE,0xFE,0x06,0x06,0x00,0x00,0x00,0x00,0x00,0x60,0x60,0x7F,0x7F,0x60,0x60,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // I
+0x00,0x00,0x00,0x00,0x00,0x00,0x00,0xFE,0xFE,0x00,0x00,0x00,0x1C,0x3C,0x70,0x60,0x60,0x70,0x3F,0x1F,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // J
+0x00,0xFE,0xFE,0x80,0xC0,0x70,0x38,0x0C,0x06,0x02,0x00,0x00,0x7F,0x7F,0x01,0x01,0x07,0x0E,0x38,0x70,0x40,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // K
+0x00,0xFE,0xFE,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x7F,0x7F,0x60,0x60,0x60,0x60,0x60,0x60,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // L
+0x00,0xFE,0xFE,0x1E,0xF8,0x80,0xF8,0x0E,0xFE,0xFE,0x00,0x00,0x7F,0x7F,0x00,0x00,0x01,0x00,0x00,0x7F,0x7F,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // M
+0x00,0xFE,0xFE,0x3E,0xF8,0xC0,0x00,0xFE,0xFE,0x00,0x00,0x00,0x7F,0x7F,0x00,0x01,0x1F,0x7C,0x7F,0x7F,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // N
+0x00,0xF0,0xFC,0x0E,0x06,0x06,0x0E,0xFC,0xF0,0x00,0x00,0x00,0x0F,0x3F,0x70,0x60,0x60,0x70,0x3F,0x0F,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // O
+0x00,0xFE,0xFE,0x06,0x06,0x06,0x8E,0xFC,0xF8,0x00,0x00,0x00,0x7F,0x7F,0x03,0x03,0x03,0x03,0x01,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // P
+0x00,0xF0,0xFC,0x0E,0x06,0x06,0x0E,0xFC,0xF0,0x00,0x00,0x00,0x0F,0x3F,0x70,0x60,0x6C,0x78,0x3F,0x2F,0x40,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // Q
+0x00,0xFE,0xFE,0x86,0x86,0x86,0xCE,0xFC,0x78,0x00,0x00,0x00,0x7F,0x7F,0x01,0x01,0x03,0x0F,0x3C,0x70,0x40,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // R
+0x00,0x00,0x78,0xFC,0xC6,0x86,0x86,0x1C,0x18,0x00,0x00,0x00,0x0C,0x3C,0x70,0x60,0x61,0x63,0x3F,0x1E,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // S
+0x06,0x06,0x06,0x06,0xFE,0xFE,0x06,0x06,0x06,0x06,0x00,0x00,0x00,0x00,0x00,0x7F,0x7F,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // T
+0x00,0xFE,0xFE,0x00,0x00,0x00,0x00,0xFE,0xFE,0x00,0x00,0x00,0x1F,0x3F,0x70,0x60,0x60,0x70,0x3F,0x1F,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // U
+0x00,0x0E,0x7E,0xF0,0x80,0x00,0x80,0xF0,0x7E,0x0E,0x00,0x00,0x00,0x00,0x07,0x3F,0x78,0x3F,0x07,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // V
+0x7E,0xFE,0x00,0x00,0xC0,0xC0,0x00,0x00,0xFE,0x7E,0x00,0x00,0x7F,0x70,0x1E,0x03,0x03,0x1E,0x70,0x7F,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // W
+0x02,0x0E,0x3C,0x70,0xE0,0xC0,0x70,0x38,0x0E,0x02,0x00,0x40,0x70,0x38,0x1E,0x0F,0x07,0x0E,0x3C,0x70,0x40,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // X
+0x02,0x0E,0x3C,0xF0,0xC0,0xC0,0xF0,0x3C,0x0E,0x02,0x00,0x00,0x00,0x00,0x00,0x7F,0x7F,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // Y
+0x00,0x00,0x06,0x06,0x86,0xC6,0x76,0x3E,0x0E,0x00,0x00,0x00,0x70,0x78,0x6E,0x67,0x61,0x60,0x60,0x60,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // Z
+0x00,0x00,0x00,0x00,0xFF,0xFF,0x03,0x03,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0xFF,0xFF,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x03,0x03,0x03,0x03,0x00,0x00,0x00,  // [
+0x00,0x00,0x00,0x0E,0xFE,0xF0,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x0F,0x7F,0x70,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // backslash
+0x00,0x00,0x00,0x03,0x03,0xFF,0xFF,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0xFF,0xFF,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x03,0x03,0x03,0x03,0x00,0x00,0x00,0x00,  // ]
+0x00,0x80,0xE0,0x78,0x0E,0x0E,0x78,0xE0,0x80,0x00,0x00,0x00,0x01,0x01,0x00,0x00,0x00,0x00,0x01,0x01,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // ^
+0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x01,0x01,0x01,0x01,0x01,0x01,0x01,0x01,0x01,0x01,0x01,  // _
+0x00,0x00,0x02,0x06,0x0E,0x08,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // `
+0x00,0x80,0xC0,0x60,0x60,0x60,0x60,0xE0,0xC0,0x00,0x00,0x00,0x38,0x7C,0x66,0x66,0x26,0x36,0x3F,0x7F,0x40,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // a
+0x00,0xFE,0xFE,0xC0,0x60,0x60,0xE0,0xC0,0x80,0x00,0x00,0x00,0x7F,0x7F,0x30,0x60,0x60,0x70,0x3F,0x1F,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // b
+0x00,0x80,0xC0,0xE0,0x60,0x60,0xE0,0xC0,0x80,0x00,0x00,0x00,0x1F,0x3F,0x70,0x60,0x60,0x70,0x39,0x19,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // c
+0x00,0x80,0xC0,0xE0,0x60,0x60,0xC0,0xFE,0xFE,0x00,0x00,0x00,0x1F,0x3F,0x70,0x60,0x60,0x30,0x7F,0x7F,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // d
+0x00,0x80,0xC0,0xE0,0x60,0x60,0xE0,0xC0,0x00,0x00,0x00,0x00,0x1F,0x3F,0x76,0x66,0x66,0x66,0x37,0x17,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // e
+0x00,0x60,0x60,0x60,0xFC,0xFE,0x66,0x66,0x66,0x06,0x00,0x00,0x00,0x00,0x00,0x7F,0x7F,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // f
+0x00,0xC0,0xE0,0x70,0x30,0x30,0x60,0xF0,0xF0,0x00,0x00,0x00,0x8F,0x9F,0x38,0x30,0x30,0x98,0xFF,0xFF,0x00,0x00,0x00,0x01,0x03,0x03,0x03,0x03,0x03,0x01,0x00,0x00,0x00,  // g
+0x00,0xFE,0xFE,0xC0,0x60,0x60,0x60,0xE0,0xC0,0x00,0x00,0x00,0x7F,0x7F,0x00,0x00,0x00,0x00,0x7F,0x7F,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // h
+0x00,0x00,0x60,0x60,0x60,0xE6,0xE6,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x7F,0x7F,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // i
+0x00,0x00,0x30,0x30,0x30,0xF3,0xF3,0x00,0x00,0x00,0x00,0x00,0x80,0x00,0x00,0x00,0xFF,0xFF,0x00,0x00,0x00,0x00,0x00,0x01,0x03,0x03,0x03,0x03,0x01,0x00,0x00,0x00,0x00,  // j
+0x00,0xFE,0xFE,0x00,0x00,0x80,0xC0,0x60,0x20,0x00,0x00,0x00,0x7F,0x7F,0x06,0x03,0x07,0x1C,0x38,0x60,0x40,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // k
+0x00,0x00,0x06,0x06,0x06,0xFE,0xFE,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x7F,0x7F,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // l
+0xE0,0xE0,0x40,0x60,0xE0,0xE0,0xC0,0x60,0xE0,0xC0,0x00,0x7F,0x7F,0x00,0x00,0x7F,0x7F,0x00,0x00,0x7F,0x7F,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // m
+0x00,0xE0,0xE0,0xC0,0x60,0x60,0x60,0xE0,0xC0,0x00,0x00,0x00,0x7F,0x7F,0x00,0x00,0x00,0x00,0x7F,0x7F,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // n
+0x00,0x80,0xC0,0xE0,0x60,0x60,0xE0,0xC0,0x80,0x00,0x00,0x00,0x1F,0x3F,0x70,0x60,0x60,0x70,0x3F,0x1F,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // o
+0x00,0xF0,0xF0,0x60,0x30,0x30,0x70,0xE0,0xC0,0x00,0x00,0x00,0xFF,0xFF,0x18,0x30,0x30,0x38,0x1F,0x0F,0x00,0x00,0x00,0x03,0x03,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // p
+0x00,0xC0,0xE0,0x70,0x30,0x30,0x60,0xF0,0xF0,0x00,0x00,0x00,0x0F,0x1F,0x38,0x30,0x30,0x18,0xFF,0xFF,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x03,0x03,0x00,0x00,  // q
+0x00,0x20,0xE0,0xC0,0xC0,0x60,0x60,0xE0,0x40,0x00,0x00,0x00,0x00,0x7F,0x7F,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // r
+0x00,0x80,0xC0,0x60,0x60,0x60,0x60,0xC0,0xC0,0x00,0x00,0x00,0x33,0x37,0x66,0x66,0x66,0x66,0x3E,0x1C,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // s
+0x00,0x60,0x60,0xF8,0xFC,0x60,0x60,0x60,0x00,0x00,0x00,0x00,0x00,0x00,0x3F,0x7F,0x60,0x60,0x60,0x60,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // t
+0x00,0xE0,0xE0,0x00,0x00,0x00,0x00,0xE0,0xE0,0x00,0x00,0x00,0x3F,0x7F,0x60,0x60,0x60,0x30,0x7F,0x7F,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // u
+0x00,0x20,0xE0,0xC0,0x00,0x00,0x00,0xC0,0xE0,0x20,0x00,0x00,0x00,0x01,0x0F,0x3E,0x70,0x7E,0x0F,0x01,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // v
+0xE0,0xE0,0x00,0xE0,0xE0,0xE0,0x00,0xE0,0xE0,0x00,0x00,0x00,0x1F,0x78,0x1F,0x00,0x1F,0x78,0x1F,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // w
+0x00,0x20,0xE0,0xC0,0x00,0x00,0xC0,0xE0,0x20,0x00,0x00,0x00,0x40,0x70,0x39,0x0F,0x0F,0x39,0x70,0x40,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // x
+0x00,0x30,0xF0,0xC0,0x00,0x00,0x80,0xF0,0x70,0x00,0x00,0x00,0x00,0x01,0x8F,0xFE,0xF0,0x7F,0x0F,0x00,0x00,0x00,0x00,0x03,0x03,0x03,0x01,0x01,0x00,0x00,0x00,0x00,0x00,  // y
+0x00,0x60,0x60,0x60,0x60,0x60,0x60,0xE0,0xE0,0x60,0x00,0x00,0x60,0x70,0x78,0x6C,0x66,0x63,0x61,0x60,0x60,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // z
+0x00,0x00,0x00,0x00,0x80,0xFE,0xFF,0x03,0x03,0x00,0x00,0x00,0x00,0x00,0x03,0x07,0xFF,0xFC,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x01,0x03,0x03,0x03,0x00,0x00,  // {
+0x00,0x00,0x00,0x00,0x00,0xFF,0xFF,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0xFF,0xFF,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x03,0x03,0x00,0x00,0x00,0x00,  // |
+0x00,0x00,0x03,0x03,0xFF,0xFE,0x80,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0xFC,0xFF,0x07,0x03,0x00,0x00,0x00,0x00,0x00,0x03,0x03,0x03,0x01,0x00,0x00,0x00,0x00,0x00,  // }
+0x00,0x00,0x80,0x80,0x80,0x00,0x00,0x00,0x80,0x00,0x00,0x00,0x03,0x01,0x01,0x01,0x03,0x03,0x03,0x01,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // ~
+};
+
+const SSD1306_PageFont_t PageFont_11x18 = {11, 18, 3, Font11x18_pages, NULL};
+#endif
+
+#ifdef SSD1306_INCLUDE_FONT_16x26
+static const uint8_t Font16x26_pages [] = {
+0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // sp
+0x00,0x00,0x00,0x00,0x00,0x00,0xFF,0xFF,0xFF,0xFF,0xFF,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x03,0x7F,0x7F,0x7F,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x1C,0x1C,0x1C,0x1C,0x1C,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // !
+0x00,0x00,0x00,0x7F,0x7F,0x7F,0x7F,0x00,0x00,0x00,0x7F,0x7F,0x7F,0x7F,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // "
+0x00,0x80,0xC0,0xC0,0xC0,0xE0,0xFE,0xFF,0xFF,0xC7,0xC0,0xFC,0xFF,0xFF,0xCF,0xC0,0x60,0x60,0x60,0xE0,0xFE,0xFF,0xFF,0x6F,0xE0,0xFC,0xFF,0xFF,0x7F,0x60,0x60,0x60,0x00,0x00,0x1C,0x1F,0x1F,0x0F,0x00,0x18,0x1F,0x1F,0x1F,0x01,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // #
+0x00,0x00,0x00,0xFC,0xFE,0xFE,0xFF,0x87,0xFF,0xFF,0xFF,0x03,0x07,0x07,0x06,0x00,0x00,0x00,0x00,0x00,0x01,0x03,0x07,0xFF,0xFF,0xFF,0xFF,0xFC,0xF8,0xF8,0xF0,0x00,0x00,0x00,0x0C,0x0C,0x1C,0x1C,0x18,0x7F,0x7F,0x7F,0x7F,0x1F,0x0F,0x0F,0x07,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // $
+0xFE,0xFE,0xFF,0x03,0x01,0xCF,0xFF,0xFE,0xFC,0x80,0xE0,0xF0,0xFC,0x3E,0x1F,0x07,0x01,0x01,0x03,0x83,0xC2,0xF3,0xFB,0x7F,0xFF,0xFF,0xFB,0xF9,0x18,0x18,0xF8,0xF8,0x18,0x1C,0x1F,0x0F,0x07,0x01,0x00,0x00,0x07,0x0F,0x1F,0x1F,0x18,0x18,0x1F,0x1F,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // %
+0x00,0x00,0x00,0x38,0xFE,0xFF,0xFF,0xFF,0x83,0xFF,0xFF,0xFE,0x7E,0x00,0x00,0x00,0xF8,0xFC,0xFC,0xFE,0x0F,0x07,0x1F,0x3F,0xFF,0xFD,0xF1,0xE0,0x80,0xF0,0xFC,0xFC,0x03,0x07,0x0F,0x1F,0x1E,0x1C,0x18,0x18,0x18,0x1D,0x1F,0x0F,0x1F,0x1F,0x1F,0x1D,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // &
+0x00,0x00,0x00,0x00,0x00,0x00,0x3F,0x7F,0x7F,0x7F,0x1F,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // '
+0x00,0x00,0x00,0x00,0x00,0xE0,0xF0,0xFC,0xFC,0x3E,0x0F,0x07,0x03,0x03,0x01,0x01,0x00,0x00,0x00,0x00,0xFF,0xFF,0xFF,0xFF,0x81,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x07,0x0F,0x3F,0x3F,0x7C,0xF0,0xE0,0xC0,0xC0,0x80,0x80,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x01,0x01,0x01,0x01,  // (
+0x00,0x01,0x01,0x03,0x03,0x07,0x0F,0x3E,0xFC,0xFC,0xF0,0xE0,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x81,0xFF,0xFF,0xFF,0xFF,0x00,0x00,0x00,0x00,0x80,0x80,0xC0,0xC0,0xE0,0xF0,0x7C,0x3F,0x3F,0x0F,0x07,0x00,0x00,0x00,0x00,0x00,0x01,0x01,0x01,0x01,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // )
+0x00,0x00,0x38,0x38,0x38,0x30,0xF3,0xFF,0x1F,0xBF,0xF1,0xB0,0x38,0x38,0x38,0x30,0x00,0x00,0x00,0x04,0x06,0x0F,0x0F,0x07,0x01,0x03,0x0F,0x0F,0x0F,0x04,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // *
+0x00,0x00,0x00,0x00,0x00,0x00,0x00,0xC0,0xC0,0xC0,0x00,0x00,0x00,0x00,0x00,0x00,0x60,0x60,0x60,0x60,0x60,0x60,0x60,0xFF,0xFF,0xFF,0x60,0x60,0x60,0x60,0x60,0x60,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x1F,0x1F,0x1F,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // +
+0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x1E,0xFE,0xFE,0xFE,0xFE,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x02,0x03,0x03,0x01,0x00,0x00,0x00,0x00,0x00,0x00,  // ,
+0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x18,0x18,0x18,0x18,0x18,0x18,0x18,0x18,0x18,0x18,0x18,0x18,0x18,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // -
+0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x1E,0x1E,0x1E,0x1E,0x1E,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // .
+0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0xC0,0xF0,0xFC,0xFF,0x3F,0x0F,0x03,0x00,0x00,0x00,0x00,0x00,0xC0,0xF0,0xFC,0xFF,0x3F,0x0F,0x03,0x00,0x00,0x00,0x00,0x00,0xC0,0xF0,0xFC,0xFF,0x3F,0x0F,0x03,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x01,0x01,0x01,0x01,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // /
+0x00,0xE0,0xF8,0xFC,0xFE,0x7F,0x0F,0x07,0x03,0x07,0x0F,0x7F,0xFE,0xFC,0xF8,0xE0,0x00,0xFF,0xFF,0xFF,0xFF,0xC0,0x00,0x00,0x00,0x00,0x00,0xC0,0xFF,0xFF,0xFF,0xFF,0x00,0x00,0x03,0x07,0x0F,0x1F,0x1E,0x1C,0x18,0x1C,0x1E,0x1F,0x0F,0x07,0x03,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // 0
+0x00,0x00,0x0C,0x0C,0x0C,0x0E,0x0E,0xFE,0xFF,0xFF,0xFF,0xFF,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0xFF,0xFF,0xFF,0xFF,0xFF,0x00,0x00,0x00,0x00,0x00,0x00,0x18,0x18,0x18,0x18,0x18,0x1F,0x1F,0x1F,0x1F,0x1F,0x18,0x18,0x18,0x18,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // 1
+0x00,0x00,0x06,0x06,0x07,0x07,0x03,0x03,0x03,0x07,0xFF,0xFE,0xFE,0xFC,0x70,0x00,0x00,0x00,0x00,0x00,0x80,0xE0,0xF0,0xF8,0x7C,0x3E,0x1F,0x0F,0x07,0x03,0x00,0x00,0x00,0x00,0x1E,0x1F,0x1F,0x1F,0x1B,0x18,0x18,0x18,0x18,0x18,0x18,0x18,0x18,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // 2
+0x00,0x00,0x00,0x06,0x07,0x07,0x03,0x03,0x03,0x07,0xFF,0xFF,0xFE,0xFC,0x38,0x00,0x00,0x00,0x00,0x00,0x06,0x06,0x06,0x06,0x07,0x0F,0x1F,0xFF,0xFD,0xF8,0xF0,0x00,0x00,0x00,0x00,0x1C,0x1C,0x1C,0x18,0x18,0x18,0x1C,0x1E,0x0F,0x0F,0x07,0x03,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // 3
+0x00,0x00,0x00,0x00,0x80,0xE0,0xF0,0xF8,0x7E,0xFF,0xFF,0xFF,0xFF,0x00,0x00,0x00,0x60,0x78,0x7C,0x7F,0x7F,0x67,0x63,0x60,0x60,0xFF,0xFF,0xFF,0xFF,0x60,0x60,0x60,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x1F,0x1F,0x1F,0x1F,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // 4
+0x00,0x00,0x00,0xFF,0xFF,0xFF,0xFF,0x07,0x07,0x07,0x07,0x07,0x07,0x07,0x00,0x00,0x00,0x00,0x00,0x03,0x03,0x03,0x03,0x03,0x07,0x0F,0xBF,0xFE,0xFE,0xFC,0xF0,0x00,0x00,0x00,0x00,0x1C,0x1C,0x1C,0x18,0x18,0x18,0x1C,0x1F,0x0F,0x0F,0x07,0x01,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // 5
+0x00,0x00,0xE0,0xF8,0xFC,0xFE,0x3E,0x0F,0x07,0x03,0x03,0x03,0x07,0x07,0x06,0x00,0x00,0x0C,0xFF,0xFF,0xFF,0xFF,0x0E,0x07,0x03,0x03,0x07,0x0F,0xFF,0xFE,0xFC,0xF8,0x00,0x00,0x01,0x07,0x0F,0x0F,0x1F,0x1C,0x18,0x18,0x1C,0x1E,0x0F,0x0F,0x07,0x03,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // 6
+0x00,0x00,0x07,0x07,0x07,0x07,0x07,0x07,0x07,0x07,0xC7,0xF7,0xFF,0x7F,0x3F,0x0F,0x00,0x00,0x00,0x00,0x00,0x80,0xE0,0xF8,0xFE,0x7F,0x1F,0x07,0x01,0x00,0x00,0x00,0x00,0x00,0x00,0x18,0x1F,0x1F,0x1F,0x1F,0x03,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // 7
+0x00,0x00,0x30,0xFC,0xFE,0xFF,0xFF,0x87,0x03,0x03,0x87,0xFF,0xFF,0xFE,0x7C,0x00,0x00,0xC0,0xF0,0xF8,0xFD,0xFF,0x1F,0x07,0x0F,0x0F,0x1F,0x7F,0xFD,0xF8,0xF0,0xE0,0x00,0x01,0x07,0x0F,0x0F,0x1F,0x1C,0x1C,0x18,0x18,0x1C,0x1E,0x0F,0x0F,0x07,0x03,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // 8
+0x00,0xE0,0xF8,0xFC,0xFE,0xFF,0x07,0x03,0x03,0x07,0x0F,0xFF,0xFE,0xFC,0xF8,0xE0,0x00,0x01,0x07,0x0F,0x0F,0x1F,0x1C,0x18,0x18,0x18,0x1C,0xEF,0xFF,0xFF,0xFF,0x3F,0x00,0x00,0x0C,0x1C,0x1C,0x18,0x18,0x18,0x1C,0x1C,0x1F,0x0F,0x07,0x03,0x01,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // 9
+0x00,0x00,0x00,0x00,0x00,0x00,0xC0,0xC0,0xC0,0xC0,0xC0,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x03,0x03,0x03,0x03,0x03,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x1E,0x1E,0x1E,0x1E,0x1E,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // :
+0x00,0x00,0x00,0x00,0x00,0x00,0xC0,0xC0,0xC0,0xC0,0xC0,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x03,0x03,0x03,0x03,0x03,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x1E,0xFE,0xFE,0xFE,0xFE,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x03,0x03,0x03,0x01,0x00,0x00,0x00,0x00,0x00,0x00,  // ;
+0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x80,0x80,0xC0,0xC0,0x20,0x20,0x70,0x70,0xF8,0xF8,0xFC,0xDC,0x8E,0x8E,0x07,0x07,0x03,0x03,0x01,0x01,0x00,0x00,0x00,0x00,0x00,0x00,0x01,0x01,0x03,0x03,0x07,0x07,0x0E,0x0E,0x1C,0x1C,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // <
+0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x8C,0x8C,0x8C,0x8C,0x8C,0x8C,0x8C,0x8C,0x8C,0x8C,0x8C,0x8C,0x8C,0x8C,0x8C,0x8C,0x01,0x01,0x01,0x01,0x01,0x01,0x01,0x01,0x01,0x01,0x01,0x01,0x01,0x01,0x01,0x01,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // =
+0xC0,0xC0,0xC0,0x80,0x80,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x01,0x01,0x03,0x03,0x07,0x07,0x8E,0x8E,0xDC,0xDC,0xF8,0xF8,0x70,0x70,0x20,0x18,0x1C,0x1C,0x0E,0x0E,0x07,0x07,0x03,0x03,0x01,0x01,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // >
+0x00,0x00,0x1E,0x1F,0x1F,0x03,0x03,0x03,0x03,0x03,0x87,0xFF,0xFE,0xFE,0x7C,0x18,0x00,0x00,0x00,0x00,0x00,0x60,0x78,0x7C,0x7E,0x7F,0x07,0x03,0x01,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x1C,0x1C,0x1C,0x1C,0x1C,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // ?
+0x00,0xE0,0xF8,0xFC,0x7E,0x1E,0x8F,0xC7,0xE3,0xF3,0x73,0x37,0x7F,0xFE,0xFE,0xF8,0x3F,0xFF,0xFF,0xFF,0x80,0x00,0xFF,0xFF,0xFF,0xC1,0xC0,0xF0,0xFE,0xFF,0xFF,0xFF,0x00,0x01,0x03,0x07,0x0F,0x0E,0x1C,0x1D,0x19,0x19,0x19,0x1D,0x1C,0x0D,0x01,0x01,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // @
+0x00,0x00,0x00,0x00,0x00,0xE0,0xF8,0xF8,0xF8,0xF8,0xF8,0xE0,0x00,0x00,0x00,0x00,0x00,0x00,0xE0,0xF8,0xFF,0xFF,0xDF,0xC3,0xC0,0xC7,0xFF,0xFF,0xFF,0xFC,0xE0,0x80,0x1C,0x1F,0x1F,0x1F,0x03,0x00,0x00,0x00,0x00,0x00,0x00,0x01,0x07,0x1F,0x1F,0x1F,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // A
+0x00,0x00,0xF8,0xF8,0xF8,0xF8,0x18,0x18,0x18,0x18,0x38,0xF8,0xF8,0xF0,0xE0,0x00,0x00,0x00,0xFF,0xFF,0xFF,0xFF,0x18,0x18,0x18,0x3C,0x3E,0xFF,0xF7,0xE7,0xE3,0xC0,0x00,0x00,0x1F,0x1F,0x1F,0x1F,0x18,0x18,0x18,0x18,0x18,0x1C,0x1F,0x0F,0x0F,0x07,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // B
+0x00,0x00,0xC0,0xE0,0xE0,0xF0,0x70,0x38,0x38,0x18,0x18,0x18,0x18,0x38,0x38,0x38,0x00,0xFF,0xFF,0xFF,0xFF,0xC1,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x03,0x07,0x07,0x0F,0x0F,0x1E,0x1C,0x18,0x18,0x18,0x18,0x18,0x1C,0x1C,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // C
+0x00,0xF8,0xF8,0xF8,0xF8,0x18,0x18,0x18,0x18,0x38,0x38,0xF8,0xF0,0xF0,0xE0,0xC0,0x00,0xFF,0xFF,0xFF,0xFF,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0xFF,0xFF,0xFF,0xFF,0x00,0x1F,0x1F,0x1F,0x1F,0x18,0x18,0x18,0x18,0x1C,0x1C,0x0F,0x0F,0x07,0x07,0x01,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // D
+0x00,0x00,0xF8,0xF8,0xF8,0xF8,0xF8,0x18,0x18,0x18,0x18,0x18,0x18,0x18,0x18,0x18,0x00,0x00,0xFF,0xFF,0xFF,0xFF,0xFF,0x18,0x18,0x18,0x18,0x18,0x18,0x18,0x18,0x00,0x00,0x00,0x1F,0x1F,0x1F,0x1F,0x1F,0x18,0x18,0x18,0x18,0x18,0x18,0x18,0x18,0x18,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // E
+0x00,0x00,0x00,0xF8,0xF8,0xF8,0xF8,0x18,0x18,0x18,0x18,0x18,0x18,0x18,0x18,0x18,0x00,0x00,0x00,0xFF,0xFF,0xFF,0xFF,0x18,0x18,0x18,0x18,0x18,0x18,0x18,0x18,0x18,0x00,0x00,0x00,0x1F,0x1F,0x1F,0x1F,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // F
+0x00,0x80,0xC0,0xE0,0xF0,0xF0,0x78,0x38,0x38,0x18,0x18,0x18,0x18,0x38,0x38,0x30,0x3C,0xFF,0xFF,0xFF,0xFF,0x81,0x00,0x00,0x00,0x30,0x30,0x30,0xF0,0xF0,0xF0,0xF0,0x00,0x01,0x03,0x07,0x0F,0x0F,0x1E,0x1C,0x1C,0x18,0x18,0x18,0x1F,0x1F,0x1F,0x0F,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // G
+0x00,0xF8,0xF8,0xF8,0xF8,0xF8,0x00,0x00,0x00,0x00,0x00,0xF8,0xF8,0xF8,0xF8,0xF8,0x00,0xFF,0xFF,0xFF,0xFF,0xFF,0x18,0x18,0x18,0x18,0x18,0xFF,0xFF,0xFF,0xFF,0xFF,0x00,0x1F,0x1F,0x1F,0x1F,0x1F,0x00,0x00,0x00,0x00,0x00,0x1F,0x1F,0x1F,0x1F,0x1F,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // H
+0x00,0x00,0x18,0x18,0x18,0x18,0xF8,0xF8,0xF8,0xF8,0xF8,0x18,0x18,0x18,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0xFF,0xFF,0xFF,0xFF,0xFF,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x18,0x18,0x18,0x18,0x1F,0x1F,0x1F,0x1F,0x1F,0x18,0x18,0x18,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // I
+0x00,0x00,0x00,0x18,0x18,0x18,0x18,0x18,0x18,0xF8,0xF8,0xF8,0xF8,0xF8,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0xFF,0xFF,0xFF,0xFF,0xFF,0x00,0x00,0x00,0x00,0x1C,0x1C,0x1C,0x18,0x18,0x18,0x1C,0x1F,0x0F,0x0F,0x07,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // J
+0x00,0x00,0xF8,0xF8,0xF8,0xF8,0x00,0x00,0x80,0xC0,0xE0,0xF8,0x78,0x38,0x18,0x08,0x00,0x00,0xFF,0xFF,0xFF,0xFF,0x3E,0x7F,0xFF,0xF7,0xE3,0xC0,0x00,0x00,0x00,0x00,0x00,0x00,0x1F,0x1F,0x1F,0x1F,0x00,0x00,0x00,0x03,0x07,0x0F,0x1F,0x1E,0x1C,0x18,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // K
+0x00,0x00,0xF8,0xF8,0xF8,0xF8,0xF8,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0xFF,0xFF,0xFF,0xFF,0xFF,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x1F,0x1F,0x1F,0x1F,0x1F,0x18,0x18,0x18,0x18,0x18,0x18,0x18,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // L
+0xF8,0xF8,0xF8,0xF8,0xF8,0xF0,0xC0,0x00,0x00,0x00,0xC0,0xF8,0xF8,0xF8,0xF8,0xF8,0xFF,0xFF,0xFF,0xFF,0x0F,0x3F,0xFF,0xFE,0xF0,0xFE,0xFF,0x1F,0x03,0xFF,0xFF,0xFF,0x1F,0x1F,0x1F,0x1F,0x00,0x00,0x01,0x01,0x01,0x01,0x00,0x00,0x00,0x1F,0x1F,0x1F,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // M
+0x00,0xF8,0xF8,0xF8,0xF8,0xF8,0xE0,0xC0,0x00,0x00,0x00,0x00,0xF8,0xF8,0xF8,0xF8,0x00,0xFF,0xFF,0xFF,0xFF,0x07,0x0F,0x3F,0xFF,0xFC,0xF8,0xE0,0xFF,0xFF,0xFF,0xFF,0x00,0x1F,0x1F,0x1F,0x1F,0x00,0x00,0x00,0x00,0x01,0x07,0x1F,0x1F,0x1F,0x1F,0x1F,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // N
+0x00,0xC0,0xE0,0xF0,0xF0,0x78,0x38,0x18,0x18,0x18,0x38,0x78,0xF0,0xF0,0xE0,0xC0,0x7E,0xFF,0xFF,0xFF,0xFF,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0xFF,0xFF,0xFF,0xFF,0x00,0x03,0x07,0x0F,0x0F,0x1E,0x1C,0x18,0x18,0x18,0x1C,0x1E,0x0F,0x0F,0x07,0x03,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // O
+0x00,0x00,0xF8,0xF8,0xF8,0xF8,0xF8,0x18,0x18,0x18,0x18,0x38,0xF8,0xF8,0xF0,0xF0,0x00,0x00,0xFF,0xFF,0xFF,0xFF,0xFF,0x30,0x30,0x30,0x38,0x3C,0x1F,0x1F,0x0F,0x0F,0x00,0x00,0x1F,0x1F,0x1F,0x1F,0x1F,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // P
+0x00,0xC0,0xE0,0xF0,0xF0,0x78,0x38,0x18,0x18,0x18,0x38,0x78,0xF0,0xF0,0xE0,0xC0,0x7E,0xFF,0xFF,0xFF,0xFF,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0xFF,0xFF,0xFF,0xFF,0x00,0x03,0x07,0x0F,0x0F,0x1E,0x1C,0x18,0x18,0x38,0x7C,0x7E,0xFF,0xEF,0xC7,0xC3,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x01,0x01,  // Q
+0x00,0x00,0xF8,0xF8,0xF8,0xF8,0x18,0x18,0x18,0x38,0x78,0xF8,0xF0,0xF0,0xE0,0x00,0x00,0x00,0xFF,0xFF,0xFF,0xFF,0x30,0x70,0xF8,0xF8,0xFE,0xDF,0x8F,0x0F,0x03,0x00,0x00,0x00,0x1F,0x1F,0x1F,0x1F,0x00,0x00,0x00,0x01,0x03,0x0F,0x1F,0x1F,0x1E,0x18,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // R
+0x00,0x00,0xE0,0xF0,0xF0,0xF8,0x38,0x18,0x18,0x18,0x18,0x18,0x38,0x38,0x30,0x00,0x00,0x00,0x03,0x07,0x0F,0x0F,0x1E,0x1C,0x1C,0x3C,0x38,0x78,0xF8,0xF0,0xF0,0xE0,0x00,0x00,0x0E,0x1C,0x1C,0x1C,0x18,0x18,0x18,0x18,0x1C,0x1E,0x0F,0x0F,0x07,0x03,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // S
+0x18,0x18,0x18,0x18,0x18,0x18,0xF8,0xF8,0xF8,0xF8,0xF8,0x18,0x18,0x18,0x18,0x18,0x00,0x00,0x00,0x00,0x00,0x00,0xFF,0xFF,0xFF,0xFF,0xFF,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x1F,0x1F,0x1F,0x1F,0x1F,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // T
+0x00,0xF8,0xF8,0xF8,0xF8,0xF8,0x00,0x00,0x00,0x00,0x00,0x00,0xF8,0xF8,0xF8,0xF8,0x00,0xFF,0xFF,0xFF,0xFF,0xFF,0x00,0x00,0x00,0x00,0x00,0x00,0xFF,0xFF,0xFF,0xFF,0x00,0x00,0x07,0x0F,0x0F,0x1F,0x1C,0x18,0x18,0x18,0x1C,0x1F,0x0F,0x0F,0x07,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // U
+0x38,0xF8,0xF8,0xF8,0xE0,0x80,0x00,0x00,0x00,0x00,0x00,0x00,0xC0,0xF8,0xF8,0xF8,0x00,0x00,0x07,0x3F,0xFF,0xFF,0xFC,0xF0,0x80,0xE0,0xF8,0xFF,0xFF,0x1F,0x07,0x00,0x00,0x00,0x00,0x00,0x00,0x07,0x1F,0x1F,0x1F,0x1F,0x1F,0x07,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // V
+0xF8,0xF8,0xF8,0xF0,0x00,0x00,0x80,0x80,0x80,0x80,0x80,0x00,0x00,0xC0,0xF8,0xF8,0x03,0xFF,0xFF,0xFF,0xF8,0xF0,0xFF,0xFF,0x3F,0xFF,0xFF,0xF8,0xE0,0xFF,0xFF,0xFF,0x00,0x01,0x1F,0x1F,0x1F,0x1F,0x1F,0x03,0x00,0x03,0x1F,0x1F,0x1F,0x1F,0x1F,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // W
+0x08,0x18,0x78,0xF8,0xF8,0xF0,0xE0,0x80,0x00,0x00,0xC0,0xE0,0xF0,0xF8,0x78,0x18,0x00,0x00,0x00,0x00,0xC1,0xE7,0xFF,0xFF,0x7F,0xFF,0xFF,0xE3,0xC1,0x80,0x00,0x00,0x10,0x1C,0x1E,0x1F,0x0F,0x03,0x01,0x00,0x00,0x01,0x03,0x07,0x1F,0x1F,0x1E,0x1C,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // X
+0x08,0x38,0xF8,0xF8,0xF8,0xE0,0x80,0x00,0x00,0x00,0x00,0xC0,0xE0,0xF8,0xF8,0x38,0x00,0x00,0x00,0x01,0x07,0x0F,0xFF,0xFF,0xFC,0xFE,0xFF,0x0F,0x07,0x01,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x1F,0x1F,0x1F,0x1F,0x1F,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // Y
+0x00,0x18,0x18,0x18,0x18,0x18,0x18,0x18,0x18,0x18,0x98,0xD8,0xF8,0xF8,0xF8,0x78,0x00,0x00,0x00,0x00,0xC0,0xE0,0xF0,0xF8,0x7E,0x3F,0x1F,0x07,0x03,0x01,0x00,0x00,0x00,0x1C,0x1E,0x1F,0x1F,0x1F,0x1B,0x18,0x18,0x18,0x18,0x18,0x18,0x18,0x18,0x18,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // Z
+0x00,0x00,0x00,0x00,0x00,0xFF,0xFF,0xFF,0xFF,0x01,0x01,0x01,0x01,0x01,0x01,0x01,0x00,0x00,0x00,0x00,0x00,0xFF,0xFF,0xFF,0xFF,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0xFF,0xFF,0xFF,0xFF,0x80,0x80,0x80,0x80,0x80,0x80,0x80,0x00,0x00,0x00,0x00,0x00,0x01,0x01,0x01,0x01,0x01,0x01,0x01,0x01,0x01,0x01,0x01,  // [
+0x00,0x03,0x0F,0x3F,0xFF,0xFC,0xF0,0xC0,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x03,0x0F,0x3F,0xFF,0xFC,0xF0,0xC0,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x03,0x0F,0x3F,0xFF,0xFC,0xF0,0xC0,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x01,0x01,0x01,  // backslash
+0x00,0x01,0x01,0x01,0x01,0x01,0x01,0x01,0xFF,0xFF,0xFF,0xFF,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0xFF,0xFF,0xFF,0xFF,0x00,0x00,0x00,0x00,0x00,0x80,0x80,0x80,0x80,0x80,0x80,0x80,0xFF,0xFF,0xFF,0xFF,0x00,0x00,0x00,0x00,0x00,0x01,0x01,0x01,0x01,0x01,0x01,0x01,0x01,0x01,0x01,0x01,0x00,0x00,0x00,0x00,  // ]
+0x00,0x00,0x00,0x00,0x00,0xE0,0xF8,0xFE,0x7F,0xFF,0xF8,0xE0,0x80,0x00,0x00,0x00,0x00,0x80,0xF0,0xFC,0xFF,0x3F,0x0F,0x03,0x00,0x01,0x0F,0x3F,0xFF,0xFC,0xF0,0xC0,0x00,0x01,0x01,0x01,0x01,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x01,0x01,0x01,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // ^
+0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x60,0x60,0x60,0x60,0x60,0x60,0x60,0x60,0x60,0x60,0x60,0x60,0x60,0x60,0x60,0x60,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // _
+0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x01,0x01,0x01,0x01,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // `
+0x00,0x00,0x80,0x80,0xC0,0xC0,0xC0,0xC0,0xC0,0xC0,0xC0,0xC0,0xC0,0x80,0x00,0x00,0x00,0x80,0xC1,0xE1,0xE1,0xF1,0x70,0x30,0x30,0x31,0xFF,0xFF,0xFF,0xFF,0xFE,0x00,0x00,0x07,0x0F,0x1F,0x1F,0x1E,0x18,0x18,0x18,0x1C,0x0F,0x0F,0x1F,0x1F,0x1F,0x18,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // a
+0x00,0x00,0xFF,0xFF,0xFF,0xFF,0x80,0xC0,0xC0,0xC0,0xC0,0xC0,0xC0,0x80,0x80,0x00,0x00,0x00,0xFF,0xFF,0xFF,0xFF,0x03,0x01,0x00,0x00,0x01,0x03,0xFF,0xFF,0xFF,0xFE,0x00,0x00,0x1F,0x1F,0x1F,0x0F,0x1C,0x1C,0x18,0x18,0x1C,0x1F,0x0F,0x0F,0x07,0x01,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // b
+0x00,0x00,0x00,0x00,0x80,0x80,0xC0,0xC0,0xC0,0xC0,0xC0,0xC0,0xC0,0xC0,0xC0,0x80,0x00,0x70,0xFE,0xFF,0xFF,0xFF,0x07,0x01,0x01,0x00,0x00,0x00,0x00,0x01,0x01,0x01,0x00,0x00,0x03,0x07,0x0F,0x0F,0x1F,0x1C,0x1C,0x18,0x18,0x18,0x18,0x1C,0x1C,0x0C,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // c
+0x00,0x00,0x00,0x80,0x80,0xC0,0xC0,0xC0,0xC0,0xC0,0xC0,0xFF,0xFF,0xFF,0xFF,0xFF,0x00,0xFC,0xFF,0xFF,0xFF,0x9F,0x01,0x00,0x00,0x00,0x01,0xFF,0xFF,0xFF,0xFF,0xFF,0x00,0x01,0x07,0x0F,0x1F,0x1F,0x1C,0x18,0x18,0x1C,0x0E,0x1F,0x1F,0x1F,0x1F,0x1F,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // d
+0x00,0x00,0x00,0x00,0x80,0x80,0xC0,0xC0,0xC0,0xC0,0xC0,0xC0,0xC0,0x80,0x00,0x00,0x00,0xF8,0xFE,0xFF,0xFF,0xFF,0x33,0x31,0x30,0x30,0x31,0x3F,0x3F,0x3F,0x3F,0x3C,0x00,0x00,0x03,0x07,0x0F,0x0F,0x1E,0x1C,0x18,0x18,0x18,0x18,0x18,0x1C,0x1C,0x0C,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // e
+0x00,0xC0,0xC0,0xC0,0xC0,0xF8,0xFE,0xFF,0xFF,0xFF,0xC3,0xC1,0xC1,0xC1,0xC1,0xC3,0x00,0x00,0x00,0x00,0x00,0xFF,0xFF,0xFF,0xFF,0xFF,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x1F,0x1F,0x1F,0x1F,0x1F,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // f
+0x00,0x00,0x00,0x80,0x80,0xC0,0xC0,0xC0,0xC0,0xC0,0xC0,0x80,0xC0,0xC0,0xC0,0xC0,0x00,0xFC,0xFF,0xFF,0xFF,0x8F,0x01,0x00,0x00,0x01,0x01,0xFF,0xFF,0xFF,0xFF,0xFF,0x00,0x01,0x07,0x0F,0x1F,0x1F,0x1C,0x18,0x18,0x1C,0x0E,0xFF,0xFF,0xFF,0xFF,0x1F,0x00,0x00,0x03,0x03,0x03,0x02,0x02,0x02,0x02,0x03,0x03,0x03,0x03,0x01,0x00,0x00,  // g
+0x00,0x00,0xFF,0xFF,0xFF,0xFF,0x80,0xC0,0xC0,0xC0,0xC0,0xC0,0xC0,0xC0,0x80,0x00,0x00,0x00,0xFF,0xFF,0xFF,0xFF,0x07,0x03,0x01,0x00,0x00,0xFF,0xFF,0xFF,0xFF,0xFE,0x00,0x00,0x1F,0x1F,0x1F,0x1F,0x00,0x00,0x00,0x00,0x00,0x1F,0x1F,0x1F,0x1F,0x1F,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // h
+0x00,0xC0,0xC0,0xC0,0xC0,0xC0,0xC0,0xC3,0xC3,0xC3,0xC3,0x03,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0xFF,0xFF,0xFF,0xFF,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x1F,0x1F,0x1F,0x1F,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // i
+0x00,0x00,0xC0,0xC0,0xC0,0xC0,0xC0,0xC0,0xC3,0xC3,0xC3,0xC3,0xC3,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0xFF,0xFF,0xFF,0xFF,0xFF,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0xFF,0xFF,0xFF,0xFF,0x7F,0x00,0x00,0x00,0x00,0x03,0x03,0x03,0x02,0x02,0x02,0x03,0x03,0x03,0x03,0x01,0x00,0x00,0x00,0x00,  // j
+0x00,0x00,0xFF,0xFF,0xFF,0xFF,0x00,0x00,0x00,0x00,0x80,0xC0,0xC0,0xC0,0xC0,0x40,0x00,0x00,0xFF,0xFF,0xFF,0xFF,0x70,0xFC,0xFE,0xFF,0xCF,0x87,0x03,0x01,0x00,0x00,0x00,0x00,0x1F,0x1F,0x1F,0x1F,0x00,0x00,0x01,0x03,0x07,0x1F,0x1F,0x1E,0x1C,0x18,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // k
+0x00,0x01,0x01,0x01,0x01,0x01,0x01,0xFF,0xFF,0xFF,0xFF,0xFF,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0xFF,0xFF,0xFF,0xFF,0xFF,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x1F,0x1F,0x1F,0x1F,0x1F,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // l
+0xC0,0xC0,0xC0,0xC0,0x80,0xC0,0xC0,0xC0,0xC0,0x80,0x80,0xC0,0xC0,0xC0,0xC0,0x80,0xFF,0xFF,0xFF,0xFF,0x0F,0x03,0x07,0xFF,0xFF,0xFF,0x0F,0x03,0x03,0xFF,0xFF,0xFF,0x1F,0x1F,0x1F,0x1F,0x00,0x00,0x00,0x1F,0x1F,0x1F,0x00,0x00,0x00,0x1F,0x1F,0x1F,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // m
+0x00,0x00,0xC0,0xC0,0xC0,0xC0,0x80,0xC0,0xC0,0xC0,0xC0,0xC0,0xC0,0xC0,0x80,0x00,0x00,0x00,0xFF,0xFF,0xFF,0xFF,0x07,0x03,0x01,0x00,0x00,0xFF,0xFF,0xFF,0xFF,0xFE,0x00,0x00,0x1F,0x1F,0x1F,0x1F,0x00,0x00,0x00,0x00,0x00,0x1F,0x1F,0x1F,0x1F,0x1F,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // n
+0x00,0x00,0x00,0x80,0x80,0xC0,0xC0,0xC0,0xC0,0xC0,0xC0,0xC0,0x80,0x80,0x00,0x00,0x00,0xFC,0xFF,0xFF,0xFF,0x07,0x01,0x00,0x00,0x00,0x01,0x07,0xFF,0xFF,0xFF,0xFE,0x00,0x01,0x07,0x0F,0x0F,0x1F,0x1C,0x18,0x18,0x18,0x1C,0x1F,0x0F,0x0F,0x07,0x03,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // o
+0x00,0x00,0xC0,0xC0,0xC0,0xC0,0x80,0xC0,0xC0,0xC0,0xC0,0xC0,0xC0,0x80,0x80,0x00,0x00,0x00,0xFF,0xFF,0xFF,0xFF,0x03,0x01,0x00,0x00,0x01,0x03,0xFF,0xFF,0xFF,0xFE,0x00,0x00,0xFF,0xFF,0xFF,0xFF,0x1E,0x1C,0x18,0x18,0x1C,0x1F,0x1F,0x0F,0x07,0x01,0x00,0x00,0x03,0x03,0x03,0x03,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // p
+0x00,0x00,0x00,0x80,0x80,0xC0,0xC0,0xC0,0xC0,0xC0,0xC0,0x80,0xC0,0xC0,0xC0,0x00,0x00,0xFC,0xFF,0xFF,0xFF,0x07,0x01,0x00,0x00,0x01,0x01,0xFF,0xFF,0xFF,0xFF,0x00,0x00,0x03,0x07,0x0F,0x1F,0x1F,0x1C,0x18,0x18,0x1C,0x0E,0xFF,0xFF,0xFF,0xFF,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x03,0x03,0x03,0x03,0x00,  // q
+0x00,0x00,0x00,0xC0,0xC0,0xC0,0xC0,0xC0,0x80,0xC0,0xC0,0xC0,0xC0,0xC0,0xC0,0xC0,0x00,0x00,0x00,0xFF,0xFF,0xFF,0xFF,0xFF,0x07,0x03,0x01,0x00,0x00,0x07,0x07,0x07,0x00,0x00,0x00,0x1F,0x1F,0x1F,0x1F,0x1F,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // r
+0x00,0x00,0x00,0x80,0x80,0xC0,0xC0,0xC0,0xC0,0xC0,0xC0,0xC0,0xC0,0xC0,0x80,0x00,0x00,0x00,0x0E,0x1F,0x1F,0x3F,0x3F,0x38,0x70,0x70,0xF0,0xE0,0xE1,0xE1,0xC1,0x00,0x00,0x00,0x0C,0x1C,0x1C,0x1C,0x18,0x18,0x18,0x18,0x1C,0x1F,0x0F,0x0F,0x07,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // s
+0x00,0xC0,0xC0,0xC0,0xC0,0xF8,0xF8,0xF8,0xF8,0xC0,0xC0,0xC0,0xC0,0xC0,0xC0,0xC0,0x00,0x00,0x00,0x00,0x00,0xFF,0xFF,0xFF,0xFF,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x07,0x0F,0x1F,0x1F,0x1C,0x18,0x18,0x18,0x18,0x18,0x18,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // t
+0x00,0x00,0xC0,0xC0,0xC0,0xC0,0x00,0x00,0x00,0x00,0x00,0xC0,0xC0,0xC0,0xC0,0x00,0x00,0x00,0xFF,0xFF,0xFF,0xFF,0x00,0x00,0x00,0x00,0x00,0xFF,0xFF,0xFF,0xFF,0x00,0x00,0x00,0x07,0x0F,0x1F,0x1F,0x1C,0x18,0x1C,0x1E,0x0F,0x1F,0x1F,0x1F,0x1F,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // u
+0x40,0xC0,0xC0,0xC0,0x80,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x80,0xC0,0xC0,0xC0,0x00,0x01,0x0F,0x3F,0xFF,0xFE,0xF8,0xC0,0x00,0xC0,0xF0,0xFE,0xFF,0x3F,0x0F,0x01,0x00,0x00,0x00,0x00,0x01,0x07,0x1F,0x1F,0x1F,0x1F,0x1F,0x07,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // v
+0xC0,0xC0,0xC0,0xC0,0x00,0x00,0x00,0x80,0x80,0x80,0x80,0x00,0x00,0x00,0xC0,0xC0,0x0F,0xFF,0xFF,0xFF,0xF0,0xF0,0xFF,0xFF,0x1F,0xFF,0xFF,0xFC,0xC0,0xFE,0xFF,0xFF,0x00,0x01,0x1F,0x1F,0x1F,0x1F,0x1F,0x01,0x00,0x01,0x1F,0x1F,0x1F,0x1F,0x1F,0x01,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // w
+0x00,0x40,0xC0,0xC0,0xC0,0xC0,0x80,0x00,0x00,0x00,0x00,0x80,0xC0,0xC0,0xC0,0x40,0x00,0x00,0x01,0x03,0x07,0xDF,0xFF,0xFE,0xFC,0xFC,0xFF,0xDF,0x87,0x03,0x00,0x00,0x00,0x10,0x1C,0x1E,0x1F,0x0F,0x07,0x01,0x01,0x03,0x07,0x1F,0x1F,0x1E,0x1C,0x18,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // x
+0x40,0xC0,0xC0,0xC0,0xC0,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x80,0xC0,0xC0,0xC0,0x00,0x01,0x07,0x3F,0xFF,0xFF,0xF8,0xE0,0x80,0xC0,0xF8,0xFE,0xFF,0x3F,0x07,0x01,0x00,0x00,0x00,0x00,0x00,0x83,0xFF,0xFF,0xFF,0x7F,0x0F,0x03,0x00,0x00,0x00,0x00,0x00,0x02,0x02,0x02,0x03,0x03,0x03,0x03,0x01,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // y
+0x00,0x00,0xC0,0xC0,0xC0,0xC0,0xC0,0xC0,0xC0,0xC0,0xC0,0xC0,0xC0,0xC0,0xC0,0xC0,0x00,0x00,0x00,0x00,0x80,0xC0,0xE0,0xF0,0xF8,0x7C,0x3E,0x1F,0x0F,0x07,0x03,0x01,0x00,0x18,0x1C,0x1F,0x1F,0x1F,0x1B,0x19,0x18,0x18,0x18,0x18,0x18,0x18,0x18,0x18,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // z
+0x00,0x00,0x00,0x00,0x00,0x00,0x3E,0xFF,0xFF,0xFF,0xC3,0x01,0x01,0x01,0x01,0x00,0x00,0x00,0x18,0x18,0x18,0x18,0x3C,0xFF,0xFF,0xE7,0x81,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x7C,0xFF,0xFF,0xFF,0xC3,0x80,0x80,0x80,0x80,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x01,0x01,0x01,0x01,0x01,0x01,0x00,  // {
+0x00,0x00,0x00,0x00,0x00,0x00,0x00,0xFF,0xFF,0xFF,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0xFF,0xFF,0xFF,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0xFF,0xFF,0xFF,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x01,0x01,0x01,0x00,0x00,0x00,0x00,0x00,0x00,  // |
+0x00,0x00,0x01,0x01,0x01,0x01,0x83,0xFF,0xFF,0xFF,0x3E,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x81,0xE7,0xFF,0xFF,0x3C,0x18,0x18,0x18,0x18,0x00,0x00,0x00,0x80,0x80,0x80,0x80,0xC1,0xFF,0xFF,0xFF,0x7C,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x01,0x01,0x01,0x01,0x01,0x01,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // }
+0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0xC0,0xF0,0xF8,0xF8,0x18,0x18,0x38,0x78,0x70,0xF0,0xE0,0xC0,0xC0,0xF8,0xF8,0x78,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // ~
+};
+
+const SSD1306_PageFont_t PageFont_16x26 = {16, 26, 4, Font16x26_pages, NULL};
+#endif
+
+#ifdef SSD1306_INCLUDE_FONT_16x24
+static const uint8_t Font16x24_pages [] = {
+0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // sp
+0x00,0x00,0x00,0x00,0x00,0x00,0xFF,0xFF,0xFF,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x0F,0x0F,0x0F,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x1C,0x1C,0x1C,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // !
+0x00,0x00,0x00,0xFF,0xFF,0xFF,0x00,0x00,0x00,0xFF,0xFF,0xFF,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x01,0x01,0x01,0x00,0x00,0x00,0x01,0x01,0x01,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // "
+0xC0,0xC0,0xC0,0xFF,0xFF,0xFF,0xC0,0xC0,0xC0,0xFF,0xFF,0xFF,0xC0,0xC0,0xC0,0x00,0x71,0x71,0x71,0xFF,0xFF,0xFF,0x71,0x71,0x71,0xFF,0xFF,0xFF,0x71,0x71,0x71,0x00,0x00,0x00,0x00,0x1F,0x1F,0x1F,0x00,0x00,0x00,0x1F,0x1F,0x1F,0x00,0x00,0x00,0x00,  // #
+0xC0,0xC0,0xC0,0x38,0x38,0x38,0xFF,0xFF,0xFF,0x38,0x38,0x38,0x38,0x38,0x38,0x00,0x81,0x81,0x81,0x8E,0x8E,0x8E,0xFF,0xFF,0xFF,0x8E,0x8E,0x8E,0x70,0x70,0x70,0x00,0x03,0x03,0x03,0x03,0x03,0x03,0x1F,0x1F,0x1F,0x03,0x03,0x03,0x00,0x00,0x00,0x00,  // $
+0x3F,0x3F,0x3F,0x3F,0x3F,0x3F,0x00,0x00,0x00,0xC0,0xC0,0xC0,0x38,0x38,0x38,0x00,0x80,0x80,0x80,0x70,0x70,0x70,0x0E,0x0E,0x0E,0x81,0x81,0x81,0x80,0x80,0x80,0x00,0x03,0x03,0x03,0x00,0x00,0x00,0x00,0x00,0x00,0x1F,0x1F,0x1F,0x1F,0x1F,0x1F,0x00,  // %
+0xF8,0xF8,0xF8,0x07,0x07,0x07,0xC7,0xC7,0xC7,0x38,0x38,0x38,0x00,0x00,0x00,0x00,0xF1,0xF1,0xF1,0x0E,0x0E,0x0E,0x71,0x71,0x71,0x80,0x80,0x80,0x70,0x70,0x70,0x00,0x03,0x03,0x03,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x03,0x03,0x03,0x1C,0x1C,0x1C,0x00,  // &
+0x00,0x00,0x00,0x00,0x00,0x00,0xC7,0xC7,0xC7,0x3F,0x3F,0x3F,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x01,0x01,0x01,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // '
+0x00,0x00,0x00,0xC0,0xC0,0xC0,0x38,0x38,0x38,0x07,0x07,0x07,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x7F,0x7F,0x7F,0x80,0x80,0x80,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x03,0x03,0x03,0x1C,0x1C,0x1C,0x00,0x00,0x00,0x00,  // (
+0x00,0x00,0x00,0x07,0x07,0x07,0x38,0x38,0x38,0xC0,0xC0,0xC0,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x80,0x80,0x80,0x7F,0x7F,0x7F,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x1C,0x1C,0x1C,0x03,0x03,0x03,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // )
+0xC0,0xC0,0xC0,0x00,0x00,0x00,0xF8,0xF8,0xF8,0x00,0x00,0x00,0xC0,0xC0,0xC0,0x00,0x71,0x71,0x71,0x0E,0x0E,0x0E,0xFF,0xFF,0xFF,0x0E,0x0E,0x0E,0x71,0x71,0x71,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x03,0x03,0x03,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // *
+0x00,0x00,0x00,0x00,0x00,0x00,0xF8,0xF8,0xF8,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x0E,0x0E,0x0E,0x0E,0x0E,0x0E,0xFF,0xFF,0xFF,0x0E,0x0E,0x0E,0x0E,0x0E,0x0E,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x03,0x03,0x03,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // +
+0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x70,0x70,0x70,0xF0,0xF0,0xF0,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x1C,0x1C,0x1C,0x03,0x03,0x03,0x00,0x00,0x00,0x00,  // ,
+0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x0E,0x0E,0x0E,0x0E,0x0E,0x0E,0x0E,0x0E,0x0E,0x0E,0x0E,0x0E,0x0E,0x0E,0x0E,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // -
+0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x80,0x80,0x80,0x80,0x80,0x80,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x1F,0x1F,0x1F,0x1F,0x1F,0x1F,0x00,0x00,0x00,0x00,  // .
+0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0xC0,0xC0,0xC0,0x38,0x38,0x38,0x00,0x80,0x80,0x80,0x70,0x70,0x70,0x0E,0x0E,0x0E,0x01,0x01,0x01,0x00,0x00,0x00,0x00,0x03,0x03,0x03,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // /
+0xF8,0xF8,0xF8,0x07,0x07,0x07,0x07,0x07,0x07,0xC7,0xC7,0xC7,0xF8,0xF8,0xF8,0x00,0xFF,0xFF,0xFF,0x70,0x70,0x70,0x0E,0x0E,0x0E,0x01,0x01,0x01,0xFF,0xFF,0xFF,0x00,0x03,0x03,0x03,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x03,0x03,0x03,0x00,  // 0
+0x00,0x00,0x00,0x38,0x38,0x38,0xFF,0xFF,0xFF,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0xFF,0xFF,0xFF,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x1C,0x1C,0x1C,0x1F,0x1F,0x1F,0x1C,0x1C,0x1C,0x00,0x00,0x00,0x00,  // 1
+0x38,0x38,0x38,0x07,0x07,0x07,0x07,0x07,0x07,0x07,0x07,0x07,0xF8,0xF8,0xF8,0x00,0x00,0x00,0x00,0x80,0x80,0x80,0x70,0x70,0x70,0x0E,0x0E,0x0E,0x01,0x01,0x01,0x00,0x1C,0x1C,0x1C,0x1F,0x1F,0x1F,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x00,  // 2
+0x07,0x07,0x07,0x07,0x07,0x07,0xC7,0xC7,0xC7,0x3F,0x3F,0x3F,0x07,0x07,0x07,0x00,0x80,0x80,0x80,0x00,0x00,0x00,0x01,0x01,0x01,0x0E,0x0E,0x0E,0xF0,0xF0,0xF0,0x00,0x03,0x03,0x03,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x03,0x03,0x03,0x00,  // 3
+0x00,0x00,0x00,0xC0,0xC0,0xC0,0x38,0x38,0x38,0xFF,0xFF,0xFF,0x00,0x00,0x00,0x00,0x7E,0x7E,0x7E,0x71,0x71,0x71,0x70,0x70,0x70,0xFF,0xFF,0xFF,0x70,0x70,0x70,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x1F,0x1F,0x1F,0x00,0x00,0x00,0x00,  // 4
+0xFF,0xFF,0xFF,0xC7,0xC7,0xC7,0xC7,0xC7,0xC7,0xC7,0xC7,0xC7,0x07,0x07,0x07,0x00,0x81,0x81,0x81,0x01,0x01,0x01,0x01,0x01,0x01,0x01,0x01,0x01,0xFE,0xFE,0xFE,0x00,0x03,0x03,0x03,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x03,0x03,0x03,0x00,  // 5
+0xC0,0xC0,0xC0,0x38,0x38,0x38,0x07,0x07,0x07,0x07,0x07,0x07,0x00,0x00,0x00,0x00,0xFF,0xFF,0xFF,0x0E,0x0E,0x0E,0x0E,0x0E,0x0E,0x0E,0x0E,0x0E,0xF0,0xF0,0xF0,0x00,0x03,0x03,0x03,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x03,0x03,0x03,0x00,  // 6
+0x3F,0x3F,0x3F,0x07,0x07,0x07,0x07,0x07,0x07,0x07,0x07,0x07,0xFF,0xFF,0xFF,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0xF0,0xF0,0xF0,0x0E,0x0E,0x0E,0x01,0x01,0x01,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x1F,0x1F,0x1F,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // 7
+0xF8,0xF8,0xF8,0x07,0x07,0x07,0x07,0x07,0x07,0x07,0x07,0x07,0xF8,0xF8,0xF8,0x00,0xF1,0xF1,0xF1,0x0E,0x0E,0x0E,0x0E,0x0E,0x0E,0x0E,0x0E,0x0E,0xF1,0xF1,0xF1,0x00,0x03,0x03,0x03,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x03,0x03,0x03,0x00,  // 8
+0xF8,0xF8,0xF8,0x07,0x07,0x07,0x07,0x07,0x07,0x07,0x07,0x07,0xF8,0xF8,0xF8,0x00,0x01,0x01,0x01,0x0E,0x0E,0x0E,0x0E,0x0E,0x0E,0x8E,0x8E,0x8E,0x7F,0x7F,0x7F,0x00,0x00,0x00,0x00,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x03,0x03,0x03,0x00,0x00,0x00,0x00,  // 9
+0x00,0x00,0x00,0xF8,0xF8,0xF8,0xF8,0xF8,0xF8,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0xF1,0xF1,0xF1,0xF1,0xF1,0xF1,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x03,0x03,0x03,0x03,0x03,0x03,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // :
+0x00,0x00,0x00,0xF8,0xF8,0xF8,0xF8,0xF8,0xF8,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x71,0x71,0x71,0xF1,0xF1,0xF1,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x1C,0x1C,0x1C,0x03,0x03,0x03,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // ;
+0x00,0x00,0x00,0xC0,0xC0,0xC0,0x38,0x38,0x38,0x07,0x07,0x07,0x00,0x00,0x00,0x00,0x0E,0x0E,0x0E,0x71,0x71,0x71,0x80,0x80,0x80,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x03,0x03,0x03,0x1C,0x1C,0x1C,0x00,0x00,0x00,0x00,  // <
+0xC0,0xC0,0xC0,0xC0,0xC0,0xC0,0xC0,0xC0,0xC0,0xC0,0xC0,0xC0,0xC0,0xC0,0xC0,0x00,0x71,0x71,0x71,0x71,0x71,0x71,0x71,0x71,0x71,0x71,0x71,0x71,0x71,0x71,0x71,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // =
+0x07,0x07,0x07,0x38,0x38,0x38,0xC0,0xC0,0xC0,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x80,0x80,0x80,0x71,0x71,0x71,0x0E,0x0E,0x0E,0x00,0x00,0x00,0x00,0x1C,0x1C,0x1C,0x03,0x03,0x03,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // >
+0x38,0x38,0x38,0x07,0x07,0x07,0x07,0x07,0x07,0x07,0x07,0x07,0xF8,0xF8,0xF8,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x70,0x70,0x70,0x0E,0x0E,0x0E,0x01,0x01,0x01,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x1C,0x1C,0x1C,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // ?
+0x38,0x38,0x38,0x07,0x07,0x07,0x07,0x07,0x07,0x07,0x07,0x07,0xF8,0xF8,0xF8,0x00,0xF0,0xF0,0xF0,0x0E,0x0E,0x0E,0xFE,0xFE,0xFE,0x00,0x00,0x00,0xFF,0xFF,0xFF,0x00,0x03,0x03,0x03,0x1C,0x1C,0x1C,0x1F,0x1F,0x1F,0x1C,0x1C,0x1C,0x03,0x03,0x03,0x00,  // @
+0xC0,0xC0,0xC0,0x38,0x38,0x38,0x07,0x07,0x07,0x38,0x38,0x38,0xC0,0xC0,0xC0,0x00,0xFF,0xFF,0xFF,0x70,0x70,0x70,0x70,0x70,0x70,0x70,0x70,0x70,0xFF,0xFF,0xFF,0x00,0x1F,0x1F,0x1F,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x1F,0x1F,0x1F,0x00,  // A
+0xFF,0xFF,0xFF,0x07,0x07,0x07,0x07,0x07,0x07,0x07,0x07,0x07,0xF8,0xF8,0xF8,0x00,0xFF,0xFF,0xFF,0x0E,0x0E,0x0E,0x0E,0x0E,0x0E,0x0E,0x0E,0x0E,0xF1,0xF1,0xF1,0x00,0x1F,0x1F,0x1F,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x03,0x03,0x03,0x00,  // B
+0xF8,0xF8,0xF8,0x07,0x07,0x07,0x07,0x07,0x07,0x07,0x07,0x07,0x38,0x38,0x38,0x00,0xFF,0xFF,0xFF,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x80,0x80,0x80,0x00,0x03,0x03,0x03,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x03,0x03,0x03,0x00,  // C
+0xFF,0xFF,0xFF,0x07,0x07,0x07,0x07,0x07,0x07,0x38,0x38,0x38,0xC0,0xC0,0xC0,0x00,0xFF,0xFF,0xFF,0x00,0x00,0x00,0x00,0x00,0x00,0x80,0x80,0x80,0x7F,0x7F,0x7F,0x00,0x1F,0x1F,0x1F,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x03,0x03,0x03,0x00,0x00,0x00,0x00,  // D
+0xFF,0xFF,0xFF,0x07,0x07,0x07,0x07,0x07,0x07,0x07,0x07,0x07,0x07,0x07,0x07,0x00,0xFF,0xFF,0xFF,0x0E,0x0E,0x0E,0x0E,0x0E,0x0E,0x0E,0x0E,0x0E,0x00,0x00,0x00,0x00,0x1F,0x1F,0x1F,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x00,  // E
+0xFF,0xFF,0xFF,0x07,0x07,0x07,0x07,0x07,0x07,0x07,0x07,0x07,0x07,0x07,0x07,0x00,0xFF,0xFF,0xFF,0x0E,0x0E,0x0E,0x0E,0x0E,0x0E,0x0E,0x0E,0x0E,0x00,0x00,0x00,0x00,0x1F,0x1F,0x1F,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // F
+0xF8,0xF8,0xF8,0x07,0x07,0x07,0x07,0x07,0x07,0x07,0x07,0x07,0x38,0x38,0x38,0x00,0xFF,0xFF,0xFF,0x00,0x00,0x00,0x0E,0x0E,0x0E,0x0E,0x0E,0x0E,0xFE,0xFE,0xFE,0x00,0x03,0x03,0x03,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x1F,0x1F,0x1F,0x00,  // G
+0xFF,0xFF,0xFF,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0xFF,0xFF,0xFF,0x00,0xFF,0xFF,0xFF,0x0E,0x0E,0x0E,0x0E,0x0E,0x0E,0x0E,0x0E,0x0E,0xFF,0xFF,0xFF,0x00,0x1F,0x1F,0x1F,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x1F,0x1F,0x1F,0x00,  // H
+0x00,0x00,0x00,0x07,0x07,0x07,0xFF,0xFF,0xFF,0x07,0x07,0x07,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0xFF,0xFF,0xFF,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x1C,0x1C,0x1C,0x1F,0x1F,0x1F,0x1C,0x1C,0x1C,0x00,0x00,0x00,0x00,  // I
+0x00,0x00,0x00,0x00,0x00,0x00,0x07,0x07,0x07,0xFF,0xFF,0xFF,0x07,0x07,0x07,0x00,0x80,0x80,0x80,0x00,0x00,0x00,0x00,0x00,0x00,0xFF,0xFF,0xFF,0x00,0x00,0x00,0x00,0x03,0x03,0x03,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x03,0x03,0x03,0x00,0x00,0x00,0x00,  // J
+0xFF,0xFF,0xFF,0x00,0x00,0x00,0xC0,0xC0,0xC0,0x38,0x38,0x38,0x07,0x07,0x07,0x00,0xFF,0xFF,0xFF,0x0E,0x0E,0x0E,0x71,0x71,0x71,0x80,0x80,0x80,0x00,0x00,0x00,0x00,0x1F,0x1F,0x1F,0x00,0x00,0x00,0x00,0x00,0x00,0x03,0x03,0x03,0x1C,0x1C,0x1C,0x00,  // K
+0xFF,0xFF,0xFF,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0xFF,0xFF,0xFF,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x1F,0x1F,0x1F,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x00,  // L
+0xFF,0xFF,0xFF,0x38,0x38,0x38,0xC0,0xC0,0xC0,0x38,0x38,0x38,0xFF,0xFF,0xFF,0x00,0xFF,0xFF,0xFF,0x00,0x00,0x00,0x0F,0x0F,0x0F,0x00,0x00,0x00,0xFF,0xFF,0xFF,0x00,0x1F,0x1F,0x1F,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x1F,0x1F,0x1F,0x00,  // M
+0xFF,0xFF,0xFF,0xC0,0xC0,0xC0,0x00,0x00,0x00,0x00,0x00,0x00,0xFF,0xFF,0xFF,0x00,0xFF,0xFF,0xFF,0x01,0x01,0x01,0x0E,0x0E,0x0E,0x70,0x70,0x70,0xFF,0xFF,0xFF,0x00,0x1F,0x1F,0x1F,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x1F,0x1F,0x1F,0x00,  // N
+0xF8,0xF8,0xF8,0x07,0x07,0x07,0x07,0x07,0x07,0x07,0x07,0x07,0xF8,0xF8,0xF8,0x00,0xFF,0xFF,0xFF,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0xFF,0xFF,0xFF,0x00,0x03,0x03,0x03,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x03,0x03,0x03,0x00,  // O
+0xFF,0xFF,0xFF,0x07,0x07,0x07,0x07,0x07,0x07,0x07,0x07,0x07,0xF8,0xF8,0xF8,0x00,0xFF,0xFF,0xFF,0x0E,0x0E,0x0E,0x0E,0x0E,0x0E,0x0E,0x0E,0x0E,0x01,0x01,0x01,0x00,0x1F,0x1F,0x1F,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // P
+0xF8,0xF8,0xF8,0x07,0x07,0x07,0x07,0x07,0x07,0x07,0x07,0x07,0xF8,0xF8,0xF8,0x00,0xFF,0xFF,0xFF,0x00,0x00,0x00,0x70,0x70,0x70,0x80,0x80,0x80,0x7F,0x7F,0x7F,0x00,0x03,0x03,0x03,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x03,0x03,0x03,0x1C,0x1C,0x1C,0x00,  // Q
+0xFF,0xFF,0xFF,0x07,0x07,0x07,0x07,0x07,0x07,0x07,0x07,0x07,0xF8,0xF8,0xF8,0x00,0xFF,0xFF,0xFF,0x0E,0x0E,0x0E,0x7E,0x7E,0x7E,0x8E,0x8E,0x8E,0x01,0x01,0x01,0x00,0x1F,0x1F,0x1F,0x00,0x00,0x00,0x00,0x00,0x00,0x03,0x03,0x03,0x1C,0x1C,0x1C,0x00,  // R
+0xF8,0xF8,0xF8,0x07,0x07,0x07,0x07,0x07,0x07,0x07,0x07,0x07,0x38,0x38,0x38,0x00,0x81,0x81,0x81,0x0E,0x0E,0x0E,0x0E,0x0E,0x0E,0x0E,0x0E,0x0E,0xF0,0xF0,0xF0,0x00,0x03,0x03,0x03,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x03,0x03,0x03,0x00,  // S
+0x07,0x07,0x07,0x07,0x07,0x07,0xFF,0xFF,0xFF,0x07,0x07,0x07,0x07,0x07,0x07,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0xFF,0xFF,0xFF,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x1F,0x1F,0x1F,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // T
+0xFF,0xFF,0xFF,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0xFF,0xFF,0xFF,0x00,0xFF,0xFF,0xFF,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0xFF,0xFF,0xFF,0x00,0x03,0x03,0x03,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x03,0x03,0x03,0x00,  // U
+0xFF,0xFF,0xFF,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0xFF,0xFF,0xFF,0x00,0x7F,0x7F,0x7F,0x80,0x80,0x80,0x00,0x00,0x00,0x80,0x80,0x80,0x7F,0x7F,0x7F,0x00,0x00,0x00,0x00,0x03,0x03,0x03,0x1C,0x1C,0x1C,0x03,0x03,0x03,0x00,0x00,0x00,0x00,  // V
+0xFF,0xFF,0xFF,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0xFF,0xFF,0xFF,0x00,0xFF,0xFF,0xFF,0x00,0x00,0x00,0xFE,0xFE,0xFE,0x00,0x00,0x00,0xFF,0xFF,0xFF,0x00,0x03,0x03,0x03,0x1C,0x1C,0x1C,0x03,0x03,0x03,0x1C,0x1C,0x1C,0x03,0x03,0x03,0x00,  // W
+0x3F,0x3F,0x3F,0xC0,0xC0,0xC0,0x00,0x00,0x00,0xC0,0xC0,0xC0,0x3F,0x3F,0x3F,0x00,0x80,0x80,0x80,0x71,0x71,0x71,0x0E,0x0E,0x0E,0x71,0x71,0x71,0x80,0x80,0x80,0x00,0x1F,0x1F,0x1F,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x1F,0x1F,0x1F,0x00,  // X
+0xFF,0xFF,0xFF,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0xFF,0xFF,0xFF,0x00,0x01,0x01,0x01,0x0E,0x0E,0x0E,0xF0,0xF0,0xF0,0x0E,0x0E,0x0E,0x01,0x01,0x01,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x1F,0x1F,0x1F,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // Y
+0x07,0x07,0x07,0x07,0x07,0x07,0x07,0x07,0x07,0xC7,0xC7,0xC7,0x3F,0x3F,0x3F,0x00,0x80,0x80,0x80,0x70,0x70,0x70,0x0E,0x0E,0x0E,0x01,0x01,0x01,0x00,0x00,0x00,0x00,0x1F,0x1F,0x1F,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x00,  // Z
+0x00,0x00,0x00,0xFF,0xFF,0xFF,0x07,0x07,0x07,0x07,0x07,0x07,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0xFF,0xFF,0xFF,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x1F,0x1F,0x1F,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x00,0x00,0x00,0x00,  // [
+0x38,0x38,0x38,0xC0,0xC0,0xC0,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x01,0x01,0x01,0x0E,0x0E,0x0E,0x70,0x70,0x70,0x80,0x80,0x80,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x03,0x03,0x03,0x00,  // backslash
+0x00,0x00,0x00,0x07,0x07,0x07,0x07,0x07,0x07,0xFF,0xFF,0xFF,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0xFF,0xFF,0xFF,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x1F,0x1F,0x1F,0x00,0x00,0x00,0x00,  // ]
+0xC0,0xC0,0xC0,0x38,0x38,0x38,0x07,0x07,0x07,0x38,0x38,0x38,0xC0,0xC0,0xC0,0x00,0x01,0x01,0x01,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x01,0x01,0x01,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // ^
+0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x00,  // _
+0x00,0x00,0x00,0x07,0x07,0x07,0x38,0x38,0x38,0xC0,0xC0,0xC0,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x01,0x01,0x01,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // `
+0x00,0x00,0x00,0xC0,0xC0,0xC0,0xC0,0xC0,0xC0,0xC0,0xC0,0xC0,0x00,0x00,0x00,0x00,0x80,0x80,0x80,0x71,0x71,0x71,0x71,0x71,0x71,0x71,0x71,0x71,0xFE,0xFE,0xFE,0x00,0x03,0x03,0x03,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x1F,0x1F,0x1F,0x00,  // a
+0xFF,0xFF,0xFF,0x00,0x00,0x00,0xC0,0xC0,0xC0,0xC0,0xC0,0xC0,0x00,0x00,0x00,0x00,0xFF,0xFF,0xFF,0x0E,0x0E,0x0E,0x01,0x01,0x01,0x01,0x01,0x01,0xFE,0xFE,0xFE,0x00,0x1F,0x1F,0x1F,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x03,0x03,0x03,0x00,  // b
+0x00,0x00,0x00,0xC0,0xC0,0xC0,0xC0,0xC0,0xC0,0xC0,0xC0,0xC0,0x00,0x00,0x00,0x00,0xFE,0xFE,0xFE,0x01,0x01,0x01,0x01,0x01,0x01,0x01,0x01,0x01,0x80,0x80,0x80,0x00,0x03,0x03,0x03,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x03,0x03,0x03,0x00,  // c
+0x00,0x00,0x00,0xC0,0xC0,0xC0,0xC0,0xC0,0xC0,0x00,0x00,0x00,0xFF,0xFF,0xFF,0x00,0xFE,0xFE,0xFE,0x01,0x01,0x01,0x01,0x01,0x01,0x0E,0x0E,0x0E,0xFF,0xFF,0xFF,0x00,0x03,0x03,0x03,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x1F,0x1F,0x1F,0x00,  // d
+0x00,0x00,0x00,0xC0,0xC0,0xC0,0xC0,0xC0,0xC0,0xC0,0xC0,0xC0,0x00,0x00,0x00,0x00,0xFE,0xFE,0xFE,0x71,0x71,0x71,0x71,0x71,0x71,0x71,0x71,0x71,0x7E,0x7E,0x7E,0x00,0x03,0x03,0x03,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x00,0x00,0x00,0x00,  // e
+0x00,0x00,0x00,0xF8,0xF8,0xF8,0x07,0x07,0x07,0x07,0x07,0x07,0x38,0x38,0x38,0x00,0x0E,0x0E,0x0E,0xFF,0xFF,0xFF,0x0E,0x0E,0x0E,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x1F,0x1F,0x1F,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // f
+0x00,0x00,0x00,0xC0,0xC0,0xC0,0xC0,0xC0,0xC0,0xC0,0xC0,0xC0,0xC0,0xC0,0xC0,0x00,0x0E,0x0E,0x0E,0x71,0x71,0x71,0x71,0x71,0x71,0x71,0x71,0x71,0xFF,0xFF,0xFF,0x00,0x00,0x00,0x00,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x03,0x03,0x03,0x00,  // g
+0xFF,0xFF,0xFF,0x00,0x00,0x00,0xC0,0xC0,0xC0,0xC0,0xC0,0xC0,0x00,0x00,0x00,0x00,0xFF,0xFF,0xFF,0x0E,0x0E,0x0E,0x01,0x01,0x01,0x01,0x01,0x01,0xFE,0xFE,0xFE,0x00,0x1F,0x1F,0x1F,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x1F,0x1F,0x1F,0x00,  // h
+0x00,0x00,0x00,0x00,0x00,0x00,0xC7,0xC7,0xC7,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x0E,0x0E,0x0E,0xFF,0xFF,0xFF,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x1C,0x1C,0x1C,0x1F,0x1F,0x1F,0x1C,0x1C,0x1C,0x00,0x00,0x00,0x00,  // i
+0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0xC0,0xC0,0xC0,0xC7,0xC7,0xC7,0x00,0x00,0x00,0x00,0x80,0x80,0x80,0x00,0x00,0x00,0x01,0x01,0x01,0xFF,0xFF,0xFF,0x00,0x00,0x00,0x00,0x03,0x03,0x03,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x03,0x03,0x03,0x00,  // j
+0xFF,0xFF,0xFF,0x00,0x00,0x00,0x00,0x00,0x00,0xC0,0xC0,0xC0,0x00,0x00,0x00,0x00,0xFF,0xFF,0xFF,0x70,0x70,0x70,0x8E,0x8E,0x8E,0x01,0x01,0x01,0x00,0x00,0x00,0x00,0x1F,0x1F,0x1F,0x00,0x00,0x00,0x03,0x03,0x03,0x1C,0x1C,0x1C,0x00,0x00,0x00,0x00,  // k
+0x00,0x00,0x00,0x00,0x00,0x00,0x07,0x07,0x07,0xFF,0xFF,0xFF,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0xFF,0xFF,0xFF,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x1C,0x1C,0x1C,0x1F,0x1F,0x1F,0x1C,0x1C,0x1C,0x00,  // l
+0xC0,0xC0,0xC0,0xC0,0xC0,0xC0,0x00,0x00,0x00,0xC0,0xC0,0xC0,0x00,0x00,0x00,0x00,0xFF,0xFF,0xFF,0x01,0x01,0x01,0xFE,0xFE,0xFE,0x01,0x01,0x01,0xFE,0xFE,0xFE,0x00,0x1F,0x1F,0x1F,0x00,0x00,0x00,0x1F,0x1F,0x1F,0x00,0x00,0x00,0x1F,0x1F,0x1F,0x00,  // m
+0xC0,0xC0,0xC0,0x00,0x00,0x00,0xC0,0xC0,0xC0,0xC0,0xC0,0xC0,0x00,0x00,0x00,0x00,0xFF,0xFF,0xFF,0x0E,0x0E,0x0E,0x01,0x01,0x01,0x01,0x01,0x01,0xFE,0xFE,0xFE,0x00,0x1F,0x1F,0x1F,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x1F,0x1F,0x1F,0x00,  // n
+0x00,0x00,0x00,0xC0,0xC0,0xC0,0xC0,0xC0,0xC0,0xC0,0xC0,0xC0,0x00,0x00,0x00,0x00,0xFE,0xFE,0xFE,0x01,0x01,0x01,0x01,0x01,0x01,0x01,0x01,0x01,0xFE,0xFE,0xFE,0x00,0x03,0x03,0x03,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x03,0x03,0x03,0x00,  // o
+0xC0,0xC0,0xC0,0xC0,0xC0,0xC0,0xC0,0xC0,0xC0,0xC0,0xC0,0xC0,0x00,0x00,0x00,0x00,0xFF,0xFF,0xFF,0x71,0x71,0x71,0x71,0x71,0x71,0x71,0x71,0x71,0x0E,0x0E,0x0E,0x00,0x1F,0x1F,0x1F,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // p
+0x00,0x00,0x00,0xC0,0xC0,0xC0,0xC0,0xC0,0xC0,0x00,0x00,0x00,0xC0,0xC0,0xC0,0x00,0x0E,0x0E,0x0E,0x71,0x71,0x71,0x71,0x71,0x71,0x7E,0x7E,0x7E,0xFF,0xFF,0xFF,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x1F,0x1F,0x1F,0x00,  // q
+0xC0,0xC0,0xC0,0x00,0x00,0x00,0xC0,0xC0,0xC0,0xC0,0xC0,0xC0,0x00,0x00,0x00,0x00,0xFF,0xFF,0xFF,0x0E,0x0E,0x0E,0x01,0x01,0x01,0x01,0x01,0x01,0x0E,0x0E,0x0E,0x00,0x1F,0x1F,0x1F,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // r
+0x00,0x00,0x00,0xC0,0xC0,0xC0,0xC0,0xC0,0xC0,0xC0,0xC0,0xC0,0x00,0x00,0x00,0x00,0x0E,0x0E,0x0E,0x71,0x71,0x71,0x71,0x71,0x71,0x71,0x71,0x71,0x80,0x80,0x80,0x00,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x03,0x03,0x03,0x00,  // s
+0xC0,0xC0,0xC0,0xFF,0xFF,0xFF,0xC0,0xC0,0xC0,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x01,0x01,0x01,0xFF,0xFF,0xFF,0x01,0x01,0x01,0x00,0x00,0x00,0x80,0x80,0x80,0x00,0x00,0x00,0x00,0x03,0x03,0x03,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x03,0x03,0x03,0x00,  // t
+0xC0,0xC0,0xC0,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0xC0,0xC0,0xC0,0x00,0xFF,0xFF,0xFF,0x00,0x00,0x00,0x00,0x00,0x00,0x80,0x80,0x80,0xFF,0xFF,0xFF,0x00,0x03,0x03,0x03,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x03,0x03,0x03,0x1F,0x1F,0x1F,0x00,  // u
+0xC0,0xC0,0xC0,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0xC0,0xC0,0xC0,0x00,0x7F,0x7F,0x7F,0x80,0x80,0x80,0x00,0x00,0x00,0x80,0x80,0x80,0x7F,0x7F,0x7F,0x00,0x00,0x00,0x00,0x03,0x03,0x03,0x1C,0x1C,0x1C,0x03,0x03,0x03,0x00,0x00,0x00,0x00,  // v
+0xC0,0xC0,0xC0,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0xC0,0xC0,0xC0,0x00,0xFF,0xFF,0xFF,0x00,0x00,0x00,0xF0,0xF0,0xF0,0x00,0x00,0x00,0xFF,0xFF,0xFF,0x00,0x03,0x03,0x03,0x1C,0x1C,0x1C,0x03,0x03,0x03,0x1C,0x1C,0x1C,0x03,0x03,0x03,0x00,  // w
+0xC0,0xC0,0xC0,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0xC0,0xC0,0xC0,0x00,0x01,0x01,0x01,0x8E,0x8E,0x8E,0x70,0x70,0x70,0x8E,0x8E,0x8E,0x01,0x01,0x01,0x00,0x1C,0x1C,0x1C,0x03,0x03,0x03,0x00,0x00,0x00,0x03,0x03,0x03,0x1C,0x1C,0x1C,0x00,  // x
+0xC0,0xC0,0xC0,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0xC0,0xC0,0xC0,0x00,0x0F,0x0F,0x0F,0x70,0x70,0x70,0x70,0x70,0x70,0x70,0x70,0x70,0xFF,0xFF,0xFF,0x00,0x00,0x00,0x00,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x03,0x03,0x03,0x00,  // y
+0xC0,0xC0,0xC0,0xC0,0xC0,0xC0,0xC0,0xC0,0xC0,0xC0,0xC0,0xC0,0xC0,0xC0,0xC0,0x00,0x01,0x01,0x01,0x81,0x81,0x81,0x71,0x71,0x71,0x0F,0x0F,0x0F,0x01,0x01,0x01,0x00,0x1C,0x1C,0x1C,0x1F,0x1F,0x1F,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x1C,0x00,  // z
+0x00,0x00,0x00,0x00,0x00,0x00,0xF8,0xF8,0xF8,0x07,0x07,0x07,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x0E,0x0E,0x0E,0xF1,0xF1,0xF1,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x03,0x03,0x03,0x1C,0x1C,0x1C,0x00,0x00,0x00,0x00,  // {
+0x00,0x00,0x00,0x00,0x00,0x00,0xFF,0xFF,0xFF,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0xFF,0xFF,0xFF,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x1F,0x1F,0x1F,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // |
+0x00,0x00,0x00,0x07,0x07,0x07,0xF8,0xF8,0xF8,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0xF1,0xF1,0xF1,0x0E,0x0E,0x0E,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x1C,0x1C,0x1C,0x03,0x03,0x03,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // }
+0x00,0x00,0x00,0xC0,0xC0,0xC0,0xC0,0xC0,0xC0,0x00,0x00,0x00,0xC0,0xC0,0xC0,0x00,0x0E,0x0E,0x0E,0x01,0x01,0x01,0x01,0x01,0x01,0x0E,0x0E,0x0E,0x01,0x01,0x01,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // ~
+};
+
+const SSD1306_PageFont_t PageFont_16x24 = {16, 24, 3, Font16x24_pages, NULL};
+#endif
+
+#ifdef SSD1306_INCLUDE_FONT_16x15
+static const uint8_t Font16x15_pages [] = {
+0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // sp
+0x00,0x00,0x00,0xFE,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x09,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // !
+0x00,0x00,0x00,0x0E,0x0E,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // "
+0x00,0x00,0x00,0x10,0xF0,0x1E,0x10,0xF0,0x1E,0x10,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x01,0x0D,0x03,0x01,0x0D,0x03,0x01,0x01,0x00,0x00,0x00,0x00,0x00,0x00,  // #
+0x00,0x00,0x00,0x1C,0x22,0x43,0x42,0x42,0x8C,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x06,0x08,0x18,0x08,0x08,0x07,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // $
+0x00,0x00,0x00,0x3E,0x22,0x22,0x9C,0x60,0x18,0x84,0x80,0x80,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x04,0x03,0x00,0x00,0x07,0x08,0x08,0x0F,0x00,0x00,0x00,0x00,  // %
+0x00,0x00,0x00,0x98,0x64,0x62,0x92,0x0C,0x00,0x80,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x07,0x08,0x08,0x08,0x09,0x06,0x0B,0x08,0x00,0x00,0x00,0x00,0x00,  // &
+0x00,0x00,0x0E,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // '
+0x00,0x00,0x00,0xFC,0x02,0x01,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x1F,0x20,0x40,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // (
+0x00,0x00,0x01,0x02,0x3C,0xC0,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x40,0x20,0x1E,0x01,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // )
+0x00,0x00,0x08,0x70,0x1E,0x30,0x50,0x08,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // *
+0x00,0x00,0x80,0x80,0x80,0xF8,0x80,0x80,0x80,0x80,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x0F,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // +
+0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x38,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // ,
+0x00,0x00,0x80,0x80,0x80,0x80,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // -
+0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x08,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // .
+0x00,0x00,0x00,0x00,0xC0,0x38,0x06,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x1E,0x01,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // /
+0x00,0x00,0x00,0xFC,0x02,0x02,0x02,0x02,0xFC,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x07,0x08,0x08,0x08,0x08,0x07,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // 0
+0x00,0x00,0x00,0x04,0x04,0x02,0xFE,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x0F,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // 1
+0x00,0x00,0x00,0x0C,0x02,0x02,0x82,0x62,0x1C,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x0C,0x0A,0x09,0x08,0x08,0x08,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // 2
+0x00,0x00,0x00,0x0C,0x02,0x42,0x42,0xC2,0xBC,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x06,0x08,0x08,0x08,0x08,0x07,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // 3
+0x00,0x00,0x00,0x80,0x60,0x18,0x04,0xFE,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x03,0x02,0x02,0x02,0x02,0x0F,0x02,0x02,0x00,0x00,0x00,0x00,0x00,0x00,  // 4
+0x00,0x00,0x00,0x5C,0x22,0x22,0x22,0x22,0xC2,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x02,0x04,0x08,0x08,0x08,0x07,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // 5
+0x00,0x00,0x00,0xF8,0x24,0x24,0x22,0x22,0xC0,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x07,0x08,0x08,0x08,0x08,0x07,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // 6
+0x00,0x00,0x02,0x02,0x02,0x02,0xC2,0x3A,0x06,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x0C,0x03,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // 7
+0x00,0x00,0x00,0xBC,0xC2,0x42,0x42,0xC2,0xBC,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x07,0x08,0x08,0x08,0x08,0x07,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // 8
+0x00,0x00,0x00,0x7C,0x82,0x82,0x82,0x82,0xFC,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x08,0x08,0x08,0x04,0x03,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // 9
+0x00,0x00,0x00,0x10,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x08,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // :
+0x00,0x00,0x00,0x10,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x38,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // ;
+0x00,0x00,0x00,0x80,0x40,0x40,0x20,0x20,0x10,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x01,0x01,0x02,0x02,0x04,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // <
+0x00,0x00,0x00,0x20,0x20,0x20,0x20,0x20,0x20,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x01,0x01,0x01,0x01,0x01,0x01,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // =
+0x00,0x00,0x00,0x10,0x20,0x20,0x40,0x40,0x80,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x04,0x02,0x02,0x01,0x01,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // >
+0x00,0x00,0x00,0x0C,0x02,0x82,0x42,0x3C,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x09,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // ?
+0x00,0x00,0x00,0xE0,0x10,0x08,0x88,0x44,0x24,0x24,0xE4,0x04,0x08,0x18,0xE0,0x00,0x00,0x00,0x00,0x0F,0x10,0x20,0x47,0x48,0x48,0x48,0x27,0x08,0x08,0x0C,0x03,0x00,  // @
+0x00,0x00,0x00,0x80,0x70,0x0E,0x06,0x38,0xC0,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x0C,0x02,0x01,0x01,0x01,0x01,0x01,0x06,0x08,0x00,0x00,0x00,0x00,0x00,  // A
+0x00,0x00,0x00,0xFE,0x42,0x42,0x42,0x42,0xA6,0x98,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x0F,0x08,0x08,0x08,0x08,0x08,0x07,0x00,0x00,0x00,0x00,0x00,0x00,  // B
+0x00,0x00,0x00,0xF8,0x04,0x02,0x02,0x02,0x02,0x04,0x08,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x03,0x04,0x08,0x08,0x08,0x08,0x04,0x02,0x00,0x00,0x00,0x00,0x00,  // C
+0x00,0x00,0x00,0x00,0xFE,0x02,0x02,0x02,0x02,0x0C,0xF0,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x0F,0x08,0x08,0x08,0x08,0x06,0x01,0x00,0x00,0x00,0x00,0x00,  // D
+0x00,0x00,0x00,0x00,0xFE,0x42,0x42,0x42,0x42,0x02,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x0F,0x08,0x08,0x08,0x08,0x08,0x00,0x00,0x00,0x00,0x00,0x00,  // E
+0x00,0x00,0x00,0x00,0xFE,0x42,0x42,0x42,0x42,0x02,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x0F,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // F
+0x00,0x00,0x00,0xF8,0x04,0x02,0x02,0x82,0x82,0x84,0x88,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x03,0x04,0x08,0x08,0x08,0x08,0x08,0x07,0x00,0x00,0x00,0x00,0x00,  // G
+0x00,0x00,0x00,0x00,0xFE,0x40,0x40,0x40,0x40,0x40,0xFE,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x0F,0x00,0x00,0x00,0x00,0x00,0x0F,0x00,0x00,0x00,0x00,0x00,  // H
+0x00,0x00,0x00,0x00,0xFE,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x0F,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // I
+0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0xFE,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x07,0x08,0x08,0x08,0x04,0x03,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // J
+0x00,0x00,0x00,0x00,0xFE,0x20,0xD0,0x08,0x04,0x02,0x02,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x0F,0x00,0x00,0x01,0x02,0x04,0x08,0x00,0x00,0x00,0x00,0x00,  // K
+0x00,0x00,0x00,0x00,0xFE,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x0F,0x08,0x08,0x08,0x08,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // L
+0x00,0x00,0x00,0x00,0xFE,0x70,0x80,0x00,0x00,0x00,0xE0,0x18,0xFE,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x0F,0x00,0x01,0x06,0x0C,0x03,0x00,0x00,0x0F,0x00,0x00,0x00,  // M
+0x00,0x00,0x00,0x00,0xFE,0x18,0x20,0xC0,0x00,0x00,0xFE,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x0F,0x00,0x00,0x00,0x01,0x06,0x0F,0x00,0x00,0x00,0x00,0x00,  // N
+0x00,0x00,0x00,0xF8,0x04,0x02,0x02,0x02,0x02,0x04,0xF8,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x03,0x04,0x08,0x08,0x08,0x08,0x04,0x03,0x00,0x00,0x00,0x00,0x00,  // O
+0x00,0x00,0x00,0xFE,0x82,0x82,0x82,0x82,0x82,0x7C,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x0F,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // P
+0x00,0x00,0x00,0xF8,0x04,0x02,0x02,0x02,0x02,0x04,0xF8,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x03,0x04,0x08,0x08,0x08,0x08,0x14,0x23,0x00,0x00,0x00,0x00,0x00,  // Q
+0x00,0x00,0x00,0x00,0xFE,0x82,0x82,0x82,0x42,0x3C,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x0F,0x00,0x00,0x00,0x03,0x04,0x08,0x00,0x00,0x00,0x00,0x00,  // R
+0x00,0x00,0x00,0x1C,0x22,0x22,0x62,0x42,0x42,0x8C,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x06,0x08,0x08,0x08,0x08,0x08,0x07,0x00,0x00,0x00,0x00,0x00,0x00,  // S
+0x00,0x00,0x02,0x02,0x02,0x02,0xFE,0x02,0x02,0x02,0x02,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x0F,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // T
+0x00,0x00,0x00,0xFE,0x00,0x00,0x00,0x00,0x00,0x00,0xFE,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x03,0x04,0x08,0x08,0x08,0x08,0x04,0x03,0x00,0x00,0x00,0x00,0x00,  // U
+0x00,0x00,0x06,0x38,0xC0,0x00,0x00,0x80,0x70,0x0C,0x02,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x01,0x0E,0x0C,0x03,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // V
+0x00,0x00,0x00,0x3E,0xC0,0x00,0x80,0x78,0x06,0x1C,0xE0,0x00,0x00,0xF0,0x0E,0x00,0x00,0x00,0x00,0x00,0x03,0x0C,0x03,0x00,0x00,0x00,0x01,0x02,0x0F,0x00,0x00,0x00,  // W
+0x00,0x00,0x02,0x04,0x18,0xA0,0x60,0x90,0x0C,0x02,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x08,0x04,0x03,0x00,0x00,0x01,0x02,0x0C,0x08,0x00,0x00,0x00,0x00,0x00,  // X
+0x00,0x00,0x02,0x0C,0x30,0x40,0xC0,0x20,0x18,0x06,0x02,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x0F,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // Y
+0x00,0x00,0x00,0x02,0x02,0x82,0x62,0x12,0x0E,0x02,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x0E,0x09,0x08,0x08,0x08,0x08,0x08,0x00,0x00,0x00,0x00,0x00,0x00,  // Z
+0x00,0x00,0x00,0xFF,0x01,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x3F,0x20,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // [
+0x00,0x00,0x06,0x18,0xE0,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x07,0x18,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // backslash
+0x00,0x01,0xFF,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x20,0x3F,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // ]
+0x00,0x00,0x00,0x38,0x06,0x0C,0x30,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // ^
+0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x10,0x10,0x10,0x10,0x10,0x10,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // _
+0x00,0x00,0x00,0x02,0x04,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // `
+0x00,0x00,0x00,0x20,0x90,0x90,0x90,0x90,0xE0,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x07,0x08,0x08,0x08,0x04,0x0F,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // a
+0x00,0x00,0x00,0xFE,0x10,0x10,0x10,0x10,0xE0,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x0F,0x08,0x08,0x08,0x08,0x07,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // b
+0x00,0x00,0x00,0xE0,0x10,0x10,0x10,0x10,0x60,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x07,0x08,0x08,0x08,0x08,0x04,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // c
+0x00,0x00,0x00,0xE0,0x10,0x10,0x10,0x10,0xFE,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x07,0x08,0x08,0x08,0x08,0x0F,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // d
+0x00,0x00,0x00,0xE0,0x90,0x90,0x90,0x90,0xE0,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x03,0x04,0x08,0x08,0x08,0x08,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // e
+0x00,0x00,0x00,0xFC,0x12,0x11,0x01,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x0F,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // f
+0x00,0x00,0x00,0xE0,0x10,0x10,0x10,0x10,0xF0,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x27,0x48,0x48,0x48,0x68,0x1F,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // g
+0x00,0x00,0x00,0xFE,0x20,0x10,0x10,0x10,0xE0,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x0F,0x00,0x00,0x00,0x00,0x0F,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // h
+0x00,0x00,0x00,0xF2,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x0F,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // i
+0x00,0x00,0xF2,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x40,0x40,0x3F,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // j
+0x00,0x00,0x00,0xFE,0x80,0x40,0x20,0x10,0x10,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x0F,0x00,0x01,0x02,0x04,0x08,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // k
+0x00,0x00,0x00,0xFE,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x0F,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // l
+0x00,0x00,0x00,0xF0,0x20,0x10,0x10,0x10,0xE0,0x20,0x10,0x10,0x10,0xE0,0x00,0x00,0x00,0x00,0x00,0x0F,0x00,0x00,0x00,0x00,0x0F,0x00,0x00,0x00,0x00,0x0F,0x00,0x00,  // m
+0x00,0x00,0x00,0xF0,0x20,0x10,0x10,0x10,0xE0,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x0F,0x00,0x00,0x00,0x00,0x0F,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // n
+0x00,0x00,0x00,0xE0,0x10,0x10,0x10,0x10,0xE0,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x07,0x08,0x08,0x08,0x08,0x07,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // o
+0x00,0x00,0x00,0xF0,0x10,0x10,0x10,0x10,0xE0,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x7F,0x08,0x08,0x08,0x08,0x07,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // p
+0x00,0x00,0x00,0xE0,0x10,0x10,0x10,0x10,0xF0,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x07,0x08,0x08,0x08,0x08,0x7F,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // q
+0x00,0x00,0x00,0xF0,0x20,0x10,0x10,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x0F,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // r
+0x00,0x00,0x00,0x60,0x90,0x90,0x10,0x20,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x04,0x08,0x08,0x09,0x07,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // s
+0x00,0x00,0x10,0xFC,0x10,0x10,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x07,0x08,0x08,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // t
+0x00,0x00,0x00,0xF0,0x00,0x00,0x00,0x00,0xF0,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x07,0x08,0x08,0x08,0x08,0x0F,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // u
+0x00,0x00,0x30,0xC0,0x00,0x00,0x80,0x60,0x10,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x01,0x06,0x0C,0x03,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // v
+0x00,0x00,0x30,0xC0,0x00,0x00,0xE0,0x70,0x80,0x00,0x80,0x70,0x10,0x00,0x00,0x00,0x00,0x00,0x00,0x03,0x0C,0x07,0x00,0x00,0x03,0x0C,0x07,0x00,0x00,0x00,0x00,0x00,  // w
+0x00,0x00,0x10,0x20,0xC0,0x80,0x60,0x10,0x10,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x08,0x04,0x03,0x01,0x02,0x0C,0x08,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // x
+0x00,0x00,0x30,0xC0,0x00,0x00,0x80,0x60,0x10,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x41,0x66,0x1C,0x03,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // y
+0x00,0x00,0x00,0x10,0x10,0x90,0x50,0x30,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x0E,0x09,0x08,0x08,0x08,0x08,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // z
+0x00,0x00,0x00,0x80,0x7E,0x01,0x01,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x3F,0x40,0x40,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // {
+0x00,0x00,0x00,0xFE,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x3F,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // |
+0x00,0x00,0x01,0x06,0x78,0x80,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x40,0x30,0x0F,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,  // }
+0x00,0x00,0x00,0x80,0x40,0x40,0x80,0x80,0x00,0x00,0xC0,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x00,0x01,0x00,0x00,0x00,0x01,0x01,0x01,0x00,0x00,0x00,0x00,0x00,0x00,  // ~
+};
+
+static const uint8_t Font16x15_page_char_width[] = {
+  6,  // sp
+  5,  // !
+  6,  // "
+  11,  // #
+  10,  // $
+  13,  // %
+  11,  // &
+  4,  // '
+  7,  // (
+  7,  // )
+  8,  // *
+  10,  // +
+  5,  // ,
+  6,  // -
+  5,  // .
+  8,  // /
+  10,  // 0
+  10,  // 1
+  10,  // 2
+  10,  // 3
+  10,  // 4
+  10,  // 5
+  10,  // 6
+  10,  // 7
+  10,  // 8
+  10,  // 9
+  5,  // :
+  5,  // ;
+  10,  // <
+  10,  // =
+  10,  // >
+  9,  // ?
+  16,  // @
+  11,  // A
+  11,  // B
+  12,  // C
+  12,  // D
+  11,  // E
+  11,  // F
+  12,  // G
+  13,  // H
+  6,  // I
+  10,  // J
+  12,  // K
+  10,  // L
+  15,  // M
+  13,  // N
+  12,  // O
+  11,  // P
+  12,  // Q
+  12,  // R
+  11,  // S
+  11,  // T
+  12,  // U
+  11,  // V
+  16,  // W
+  11,  // X
+  11,  // Y
+  11,  // Z
+  6,  // [
+  8,  // backslash
+  5,  // ]
+  8,  // ^
+  8,  // _
+  6,  // `
+  10,  // a
+  10,  // b
+  10,  // c
+  10,  // d
+  10,  // e
+  8,  // f
+  10,  // g
+  10,  // h
+  5,  // i
+  5,  // j
+  9,  // k
+  5,  // l
+  15,  // m
+  10,  // n
+  10,  // o
+  10,  // p
+  10,  // q
+  7,  // r
+  9,  // s
+  7,  // t
+  10,  // u
+  9,  // v
+  13,  // w
+  9,  // x
+  9,  // y
+  9,  // z
+  7,  // {
+  5,  // |
+  7,  // }
+  12,  // ~
+};
+
+const SSD1306_PageFont_t PageFont_16x15 = {16, 15, 2, Font16x15_pages, Font16x15_page_char_width};
+#endif
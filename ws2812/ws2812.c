@@ -8,36 +8,115 @@
 #define Code1   66
 #define CodeReset   0
 
-void ws2812_update(void){
-    static uint16_t data1[] = {
-        Code0, Code0,Code0, Code0,Code0, Code0,Code0, Code0,
-        Code0, Code0,Code0, Code0,Code0, Code0,Code0, Code0,
-        Code0, Code0,Code0, Code0,Code0, Code0,Code0, Code0,
-    };
+// Duty values per ring half, one per bit
+#define WS2812_HALF_SLOTS   (WS2812_RING_LEDS / 2 * 24)
+// Low slots after the last bit that latch the frame (64 x 1.25us = 80us)
+#define WS2812_RESET_SLOTS  64
+
+typedef struct {
+    uint32_t channel;
+    // Circular DMA source: the timer plays one half while the other is refilled
+    uint16_t ring[2 * WS2812_HALF_SLOTS];
+    const uint8_t* grb;
+    uint16_t bytes;
+    uint16_t pos;
+    // Trailing CodeReset slots of each half and of the line since the last bit
+    uint16_t tail[2];
+    uint16_t low;
+    volatile uint8_t busy;
+} ws2812_strip_t;
+
+static ws2812_strip_t strip3 = { .channel = TIM_CHANNEL_3 };
+static ws2812_strip_t strip4 = { .channel = TIM_CHANNEL_4 };
 
-    static uint16_t data2[] = {
-        Code0, Code0,Code0, Code0,Code0, Code0,Code0, Code0,
-        Code0, Code0,Code0, Code0,Code0, Code0,Code0, Code0,
-        Code0, Code0,Code0, Code0,Code0, Code0,Code0, Code0,
-    };
+static void ws2812_expand(uint16_t* duty, uint8_t byte) {
+    for (uint8_t mask = 0x80; mask; mask >>= 1) {
+        *duty++ = (byte & mask) ? Code1 : Code0;
+    }
+}
 
-    static uint16_t reset[] = {
-        CodeReset,CodeReset,CodeReset,CodeReset,CodeReset,CodeReset,CodeReset,CodeReset,
-        CodeReset,CodeReset,CodeReset,CodeReset,CodeReset,CodeReset,CodeReset,CodeReset,
-        CodeReset,CodeReset,CodeReset,CodeReset,CodeReset,CodeReset,CodeReset,CodeReset,
-    };
+/* Expands the next GRB bytes into one half, CodeReset once the frame is out */
+static void ws2812_fill(ws2812_strip_t* strip, uint8_t half) {
+    uint16_t* duty = &strip->ring[half * WS2812_HALF_SLOTS];
+    uint16_t n = 0;
 
-    // HAL_TIM_PWM_Start_DMA(&htim3, TIM_CHANNEL_3, (uint32_t *)data1, sizeof(data1)/sizeof(uint16_t));
-    // HAL_TIM_PWM_Start_DMA(&htim3, TIM_CHANNEL_4, (uint32_t *)data2, sizeof(data2)/sizeof(uint16_t));
+    while (n < WS2812_HALF_SLOTS && strip->pos < strip->bytes) {
+        ws2812_expand(&duty[n], strip->grb[strip->pos++]);
+        n += 8;
+    }
+    strip->tail[half] = WS2812_HALF_SLOTS - n;
+    while (n < WS2812_HALF_SLOTS) {
+        duty[n++] = CodeReset;
+    }
+}
 
-    HAL_TIM_PWM_Start_DMA(&htim3, TIM_CHANNEL_3, (uint32_t *)reset, sizeof(reset)/sizeof(uint16_t));
-    HAL_TIM_PWM_Start_DMA(&htim3, TIM_CHANNEL_4, (uint32_t *)reset, sizeof(reset)/sizeof(uint16_t));
+static void ws2812_start(ws2812_strip_t* strip, const uint8_t* grb, uint16_t count) {
+    if (strip->busy) {
+        return;
+    }
+    strip->grb = grb;
+    strip->bytes = grb ? count * 3 : 0;
+    strip->pos = 0;
+    strip->low = 0;
+    ws2812_fill(strip, 0);
+    ws2812_fill(strip, 1);
+    strip->busy = 1;
+    if (HAL_TIM_PWM_Start_DMA(&htim3, strip->channel, (uint32_t *)strip->ring, 2 * WS2812_HALF_SLOTS) != HAL_OK) {
+        strip->busy = 0;
+    }
 }
 
+/* Called after the DMA has read one half; the timer is playing the other one */
+static void ws2812_half_done(TIM_HandleTypeDef* htim, uint8_t half) {
+    ws2812_strip_t* strip;
 
+    if (htim->Instance != TIM3) {
+        return;
+    }
+    if (htim->Channel == HAL_TIM_ACTIVE_CHANNEL_3) {
+        strip = &strip3;
+    } else if (htim->Channel == HAL_TIM_ACTIVE_CHANNEL_4) {
+        strip = &strip4;
+    } else {
+        return;
+    }
+    if (!strip->busy) {
+        return;
+    }
 
+    strip->low = (strip->tail[half] == WS2812_HALF_SLOTS) ? strip->low + WS2812_HALF_SLOTS : strip->tail[half];
+    if (strip->low >= WS2812_RESET_SLOTS) {
+        // CCR keeps the last CodeReset, so the line stays low after stopping
+        HAL_TIM_PWM_Stop_DMA(htim, strip->channel);
+        strip->busy = 0;
+        return;
+    }
+    ws2812_fill(strip, half);
+}
 
+void ws2812_update(void){
+    // Reset pulse only: both strips latch and wait for the first frame
+    ws2812_start(&strip3, NULL, 0);
+    ws2812_start(&strip4, NULL, 0);
+}
 
+void ws2812_show(const uint8_t* grb3, const uint8_t* grb4, uint16_t count) {
+    if (grb3) {
+        ws2812_start(&strip3, grb3, count);
+    }
+    if (grb4) {
+        ws2812_start(&strip4, grb4, count);
+    }
+}
 
+uint8_t ws2812_busy(void) {
+    return strip3.busy || strip4.busy;
+}
 
+void HAL_TIM_PWM_PulseFinishedHalfCpltCallback(TIM_HandleTypeDef *htim) {
+    ws2812_half_done(htim, 0);
+}
 
+void HAL_TIM_PWM_PulseFinishedCallback(TIM_HandleTypeDef *htim) {
+    ws2812_half_done(htim, 1);
+}
@@ -4,6 +4,26 @@
 #include "main.h"
 #include "tim.h"
 
+// LEDs held in each channel's DMA ring (2 bytes per bit, refilled half by half
+// from the GRB frame), must be even. Strip length is not limited by it.
+#ifndef WS2812_RING_LEDS
+#define WS2812_RING_LEDS 4
+#endif
+
 void ws2812_update(void);
+
+/**
+ * @brief Sends one frame of 3-byte G, R, B values (generated by ws2812_gen.py)
+ *        to the strips on TIM3 CH3 and CH4. Either pointer may be NULL.
+ *        The frame is read while it is sent, keep it unchanged until
+ *        ws2812_busy() returns 0. A channel that is still busy skips the frame.
+ * @param count LEDs per strip
+ */
+void ws2812_show(const uint8_t* grb3, const uint8_t* grb4, uint16_t count);
+
+/**
+ * @brief Returns 1 while either strip is still sending its frame or reset pulse.
+ */
+uint8_t ws2812_busy(void);
 #endif // WS2812_H    
 